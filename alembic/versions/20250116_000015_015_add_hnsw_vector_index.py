@@ -0,0 +1,44 @@
+"""Replace the IVFFlat embedding index with HNSW.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2025-01-16
+
+This migration:
+1. Builds the global HNSW index on embedding_chunks.embedding (cosine)
+2. Drops the IVFFlat index from the initial schema
+
+Both statements run CONCURRENTLY outside the migration transaction so
+ingestion is not blocked. Per-project partial indexes are managed at
+runtime by VectorIndexService (see `evidence-vector-index`).
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embedding_chunks_embedding_hnsw
+            ON embedding_chunks
+            USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_embedding_chunks_embedding")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embedding_chunks_embedding
+            ON embedding_chunks
+            USING ivfflat (embedding vector_cosine_ops)
+            WITH (lists = 100)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_embedding_chunks_embedding_hnsw")
@@ -0,0 +1,43 @@
+"""Add content-addressed embedding store.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2025-01-16
+
+This migration adds:
+1. New embedding_vectors table keyed by (model, dimensions, text_hash)
+
+Embedding paths check this table before calling OpenAI, so unchanged spans
+in new document versions and repeated boilerplate reuse stored vectors.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision = "016"
+down_revision = "015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_vectors",
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("dimensions", sa.Integer, nullable=False),
+        sa.Column("text_hash", sa.String(64), nullable=False),
+        sa.Column("embedding", Vector(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("model", "dimensions", "text_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_vectors")
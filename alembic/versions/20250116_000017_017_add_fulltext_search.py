@@ -0,0 +1,55 @@
+"""Add Postgres full-text search columns and GIN indexes.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2025-01-16
+
+This migration adds:
+1. Stored generated tsvector column text_search on embedding_chunks (text)
+2. Stored generated tsvector column text_search on spans (text_content)
+3. GIN indexes on both, built CONCURRENTLY
+
+Keyword and hybrid search match these columns with @@ instead of ILIKE
+scans. Adding a stored generated column rewrites the table, so run this
+migration in a maintenance window on large installations.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "017"
+down_revision = "016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE embedding_chunks
+        ADD COLUMN IF NOT EXISTS text_search tsvector
+        GENERATED ALWAYS AS (to_tsvector('english'::regconfig, text)) STORED
+    """)
+    op.execute("""
+        ALTER TABLE spans
+        ADD COLUMN IF NOT EXISTS text_search tsvector
+        GENERATED ALWAYS AS (to_tsvector('english'::regconfig, text_content)) STORED
+    """)
+
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embedding_chunks_text_search
+            ON embedding_chunks USING gin (text_search)
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_spans_text_search
+            ON spans USING gin (text_search)
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_spans_text_search")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_embedding_chunks_text_search")
+
+    op.execute("ALTER TABLE spans DROP COLUMN IF EXISTS text_search")
+    op.execute("ALTER TABLE embedding_chunks DROP COLUMN IF EXISTS text_search")
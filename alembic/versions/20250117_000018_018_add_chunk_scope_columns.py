@@ -0,0 +1,151 @@
+"""Add denormalized scope columns to embedding_chunks.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2025-01-17
+
+This migration adds:
+1. document_id, span_type and project_ids columns on embedding_chunks
+2. Backfill from document_versions, spans and project_documents
+3. BEFORE INSERT trigger on embedding_chunks filling the columns when the
+   writer did not set them
+4. AFTER INSERT/UPDATE/DELETE trigger on project_documents keeping
+   project_ids in sync as documents are attached and detached
+5. Indexes: btree on document_id and span_type, GIN on project_ids
+
+Project/document/span-type search filters become simple predicates on the
+chunk row that pgvector can apply during the ANN scan, instead of nested
+ProjectDocument -> DocumentVersion subqueries.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "018"
+down_revision = "017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE embedding_chunks
+        ADD COLUMN document_id uuid REFERENCES documents(id) ON DELETE CASCADE,
+        ADD COLUMN span_type spantype,
+        ADD COLUMN project_ids uuid[] NOT NULL DEFAULT '{}'
+    """)
+
+    # Backfill
+    op.execute("""
+        UPDATE embedding_chunks ec
+        SET document_id = dv.document_id
+        FROM document_versions dv
+        WHERE dv.id = ec.document_version_id
+    """)
+    op.execute("""
+        UPDATE embedding_chunks ec
+        SET span_type = s.span_type
+        FROM spans s
+        WHERE s.id = ec.span_id
+    """)
+    op.execute("""
+        UPDATE embedding_chunks ec
+        SET project_ids = pd.project_ids
+        FROM (
+            SELECT document_id, array_agg(DISTINCT project_id ORDER BY project_id) AS project_ids
+            FROM project_documents
+            GROUP BY document_id
+        ) pd
+        WHERE pd.document_id = ec.document_id
+    """)
+
+    # Fill scope columns on insert (writers may set them to skip the lookups)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION embedding_chunks_fill_scope() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.document_id IS NULL THEN
+                SELECT document_id INTO NEW.document_id
+                FROM document_versions WHERE id = NEW.document_version_id;
+            END IF;
+            IF NEW.span_type IS NULL AND NEW.span_id IS NOT NULL THEN
+                SELECT span_type INTO NEW.span_type FROM spans WHERE id = NEW.span_id;
+            END IF;
+            IF NEW.project_ids IS NULL OR cardinality(NEW.project_ids) = 0 THEN
+                SELECT coalesce(array_agg(DISTINCT project_id ORDER BY project_id), '{}')
+                INTO NEW.project_ids
+                FROM project_documents WHERE document_id = NEW.document_id;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_embedding_chunks_fill_scope
+        BEFORE INSERT ON embedding_chunks
+        FOR EACH ROW EXECUTE FUNCTION embedding_chunks_fill_scope()
+    """)
+
+    # Keep project_ids in sync with attach/detach (including cascades)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION project_documents_sync_chunk_scope() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE embedding_chunks
+                SET project_ids = array_remove(project_ids, OLD.project_id)
+                WHERE document_id = OLD.document_id
+                  AND project_ids @> ARRAY[OLD.project_id]
+                  AND NOT EXISTS (
+                      SELECT 1 FROM project_documents
+                      WHERE project_id = OLD.project_id AND document_id = OLD.document_id
+                  );
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE embedding_chunks
+                SET project_ids = array_append(project_ids, NEW.project_id)
+                WHERE document_id = NEW.document_id
+                  AND NOT project_ids @> ARRAY[NEW.project_id];
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_project_documents_sync_chunk_scope
+        AFTER INSERT OR DELETE OR UPDATE OF project_id, document_id ON project_documents
+        FOR EACH ROW EXECUTE FUNCTION project_documents_sync_chunk_scope()
+    """)
+
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embedding_chunks_document_id
+            ON embedding_chunks (document_id)
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embedding_chunks_span_type
+            ON embedding_chunks (span_type)
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embedding_chunks_project_ids
+            ON embedding_chunks USING gin (project_ids)
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_embedding_chunks_project_ids")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_embedding_chunks_span_type")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_embedding_chunks_document_id")
+
+    op.execute(
+        "DROP TRIGGER IF EXISTS trg_project_documents_sync_chunk_scope ON project_documents"
+    )
+    op.execute("DROP FUNCTION IF EXISTS project_documents_sync_chunk_scope()")
+    op.execute("DROP TRIGGER IF EXISTS trg_embedding_chunks_fill_scope ON embedding_chunks")
+    op.execute("DROP FUNCTION IF EXISTS embedding_chunks_fill_scope()")
+
+    op.execute("""
+        ALTER TABLE embedding_chunks
+        DROP COLUMN IF EXISTS project_ids,
+        DROP COLUMN IF EXISTS span_type,
+        DROP COLUMN IF EXISTS document_id
+    """)
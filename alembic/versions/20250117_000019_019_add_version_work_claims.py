@@ -0,0 +1,58 @@
+"""Add work-claim lease columns to document_versions.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2025-01-17
+
+This migration adds:
+1. claimed_by, lease_expires_at and claim_attempts on document_versions
+2. Partial index on created_at for PENDING versions (claim order)
+3. Partial index on lease_expires_at for PROCESSING versions (reclaim scan)
+
+Polling workers and the cron processor claim versions with
+UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING and
+renew the lease while processing (see digestion.claims), so several
+workers can poll the same table without processing a version twice.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "019"
+down_revision = "018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE document_versions
+        ADD COLUMN claimed_by varchar(255),
+        ADD COLUMN lease_expires_at timestamptz,
+        ADD COLUMN claim_attempts integer NOT NULL DEFAULT 0
+    """)
+
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_versions_pending_created
+            ON document_versions (created_at)
+            WHERE extraction_status = 'pending'
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_versions_processing_lease
+            ON document_versions (lease_expires_at)
+            WHERE extraction_status = 'processing'
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_versions_processing_lease")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_versions_pending_created")
+
+    op.execute("""
+        ALTER TABLE document_versions
+        DROP COLUMN IF EXISTS claim_attempts,
+        DROP COLUMN IF EXISTS lease_expires_at,
+        DROP COLUMN IF EXISTS claimed_by
+    """)
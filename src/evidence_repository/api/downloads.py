@@ -0,0 +1,174 @@
+"""HTTP responses for stored document files.
+
+Downloads stream from storage instead of buffering the whole file:
+- The ETag is the version's SHA-256 file hash; a matching If-None-Match
+  answers 304 without touching storage.
+- A single byte range (``Range``, honoured only when ``If-Range`` is absent
+  or matches the ETag) answers 206 with Content-Range; an unsatisfiable
+  range answers 416. Multi-range and malformed headers get the full file,
+  which RFC 9110 allows.
+- Local storage is served with FileResponse, which sends the file from disk
+  and applies Range/If-Range itself against the same ETag.
+"""
+
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from evidence_repository.storage.base import StorageBackend
+
+# Bytes per chunk streamed from storage
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiableError(ValueError):
+    """Requested byte range starts beyond the end of the file."""
+
+
+def make_etag(file_hash: str) -> str:
+    """Strong ETag for a stored file."""
+    return f'"{file_hash}"'
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in header.split(",")
+    )
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single ``bytes=`` range into inclusive offsets.
+
+    Args:
+        header: Range header value.
+        size: File size in bytes.
+
+    Returns:
+        (start, end) offsets, or None to serve the full file.
+
+    Raises:
+        RangeNotSatisfiableError: If the range starts past the end of the file.
+    """
+    if not header:
+        return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, separator, last = spec.strip().partition("-")
+    if not separator:
+        return None
+
+    try:
+        start = int(first) if first else None
+        end = int(last) if last else None
+    except ValueError:
+        return None
+
+    if start is None:
+        # Suffix range: the last N bytes
+        if end is None:
+            return None
+        if end <= 0 or size == 0:
+            raise RangeNotSatisfiableError(header)
+        return max(size - end, 0), size - 1
+
+    if end is not None and end < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiableError(header)
+    return start, min(end if end is not None else size - 1, size - 1)
+
+
+async def file_download_response(
+    request: Request,
+    storage: StorageBackend,
+    storage_path: str,
+    size: int,
+    file_hash: str,
+    media_type: str,
+    filename: str,
+) -> Response:
+    """Build a streaming, range-aware response for a stored file.
+
+    Args:
+        request: Incoming request (conditional and Range headers).
+        storage: Storage backend.
+        storage_path: Stored key or URI (DocumentVersion.storage_path).
+        size: File size in bytes.
+        file_hash: SHA-256 of the content (ETag).
+        media_type: Content type.
+        filename: Download filename.
+
+    Returns:
+        304, 206, 416 or 200 response.
+
+    Raises:
+        FileNotFoundError: If the file is missing from storage.
+    """
+    etag = make_etag(file_hash)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    }
+    file_uri = storage.resolve_uri(storage_path)
+
+    local_path = storage.local_path(file_uri)
+    if local_path is not None:
+        if not await asyncio.to_thread(local_path.is_file):
+            raise FileNotFoundError(f"File not found: {file_uri}")
+        return FileResponse(local_path, media_type=media_type, headers=headers)
+
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range.strip() == etag:
+        try:
+            byte_range = parse_range(request.headers.get("range"), size)
+        except RangeNotSatisfiableError:
+            return Response(
+                status_code=416,
+                headers={"ETag": etag, "Content-Range": f"bytes */{size}"},
+            )
+
+    if byte_range:
+        start, end = byte_range
+        chunks = storage.get_stream(file_uri, DOWNLOAD_CHUNK_SIZE, start=start, end=end)
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        status_code = 206
+    else:
+        start, end = 0, size - 1
+        chunks = storage.get_stream(file_uri, DOWNLOAD_CHUNK_SIZE)
+        status_code = 200
+    headers["Content-Length"] = str(end - start + 1)
+
+    # Open the object before sending a status line, so a missing file is a 404
+    first = await anext(chunks, b"")
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            if first:
+                yield first
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    return StreamingResponse(
+        body(),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
@@ -1,18 +1,20 @@
 """FastAPI middleware for audit logging and error handling."""
 
 import logging
+import os
 import time
+import traceback
 import uuid
-from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from sqlalchemy import insert
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from evidence_repository.db.session import get_session_factory
-from evidence_repository.models.audit import AuditAction, AuditLog
+from evidence_repository.models.audit import AuditAction
+from evidence_repository.services.audit_sink import get_audit_sink, write_audit_entries
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +50,99 @@ AUDIT_ACTION_MAP: dict[tuple[str, str], AuditAction] = {
 }
 
 
+@dataclass
+class _RouteNode:
+    """Trie node for one path segment."""
+
+    children: dict[str, "_RouteNode"] = field(default_factory=dict)
+    placeholder: "_RouteNode | None" = None  # Child matching any segment
+    action: AuditAction | None = None
+    param_names: tuple[str, ...] = ()  # Placeholder names, in path order
+
+
+class AuditRouteTrie:
+    """Audit actions by HTTP method and path, compiled into a segment trie.
+
+    Patterns are split once when added. Matching walks one node per path
+    segment, so its cost depends on the path length rather than on the
+    number of audited routes. Literal segments take precedence over
+    ``{param}`` placeholders.
+    """
+
+    def __init__(self, routes: dict[tuple[str, str], AuditAction] | None = None):
+        """Initialize trie.
+
+        Args:
+            routes: (method, path pattern) -> action, e.g. AUDIT_ACTION_MAP.
+        """
+        self._roots: dict[str, _RouteNode] = {}
+        for (method, pattern), action in (routes or {}).items():
+            self.add(method, pattern, action)
+
+    def add(self, method: str, pattern: str, action: AuditAction) -> None:
+        """Add a route; the first action added for a pattern wins."""
+        node = self._roots.setdefault(method, _RouteNode())
+        param_names = []
+
+        for segment in pattern.split("/"):
+            if segment.startswith("{") and segment.endswith("}"):
+                param_names.append(segment[1:-1])
+                if node.placeholder is None:
+                    node.placeholder = _RouteNode()
+                node = node.placeholder
+            else:
+                node = node.children.setdefault(segment, _RouteNode())
+
+        if node.action is None:
+            node.action = action
+            node.param_names = tuple(param_names)
+
+    def match(self, method: str, path: str) -> tuple[AuditAction | None, dict[str, str]]:
+        """Match a request to an audit action.
+
+        Args:
+            method: HTTP method.
+            path: Request path.
+
+        Returns:
+            Tuple of (AuditAction, path_params) or (None, {}).
+        """
+        root = self._roots.get(method)
+        if root is None:
+            return None, {}
+
+        segments = path.split("/")
+        values: list[str] = []
+        node = self._find(root, segments, 0, values)
+        if node is None:
+            return None, {}
+        return node.action, dict(zip(node.param_names, values))
+
+    def _find(
+        self, node: _RouteNode, segments: list[str], index: int, values: list[str]
+    ) -> _RouteNode | None:
+        if index == len(segments):
+            return node if node.action is not None else None
+
+        child = node.children.get(segments[index])
+        if child is not None:
+            found = self._find(child, segments, index + 1, values)
+            if found is not None:
+                return found
+
+        if node.placeholder is not None:
+            values.append(segments[index])
+            found = self._find(node.placeholder, segments, index + 1, values)
+            if found is not None:
+                return found
+            values.pop()
+
+        return None
+
+
+AUDIT_ROUTES = AuditRouteTrie(AUDIT_ACTION_MAP)
+
+
 def match_route_pattern(method: str, path: str) -> tuple[AuditAction | None, dict[str, str]]:
     """Match a request path to an audit action.
 
@@ -58,68 +153,68 @@ def match_route_pattern(method: str, path: str) -> tuple[AuditAction | None, dic
     Returns:
         Tuple of (AuditAction, path_params) or (None, {}).
     """
-    for (pattern_method, pattern_path), action in AUDIT_ACTION_MAP.items():
-        if method != pattern_method:
-            continue
+    return AUDIT_ROUTES.match(method, path)
 
-        # Simple pattern matching with {param} placeholders
-        pattern_parts = pattern_path.split("/")
-        path_parts = path.split("/")
 
-        if len(pattern_parts) != len(path_parts):
-            continue
+class AuditLoggingMiddleware:
+    """Middleware that logs auditable actions to the database.
 
-        params: dict[str, str] = {}
-        match = True
+    Pure ASGI: requests that are not audited go straight to the app, and
+    response messages (including streamed bodies) pass through unbuffered;
+    only the status code is captured.
+    """
 
-        for pattern_part, path_part in zip(pattern_parts, path_parts):
-            if pattern_part.startswith("{") and pattern_part.endswith("}"):
-                param_name = pattern_part[1:-1]
-                params[param_name] = path_part
-            elif pattern_part != path_part:
-                match = False
-                break
+    def __init__(self, app: ASGIApp, routes: AuditRouteTrie | None = None):
+        """Initialize middleware.
 
-        if match:
-            return action, params
+        Args:
+            app: Wrapped ASGI application.
+            routes: Audited routes (defaults to AUDIT_ACTION_MAP).
+        """
+        self.app = app
+        self.routes = routes or AUDIT_ROUTES
 
-    return None, {}
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and log audit entry if applicable."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        start_time = time.time()
 
-class AuditLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware that logs auditable actions to the database."""
+        # Generate request ID (read back through request.state)
+        scope.setdefault("state", {})["request_id"] = str(uuid.uuid4())
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Any]
-    ) -> Response:
-        """Process request and log audit entry if applicable."""
-        start_time = time.time()
+        # Check if this action should be audited
+        action, path_params = self.routes.match(scope["method"], scope["path"])
+        if action is None:
+            await self.app(scope, receive, send)
+            return
 
-        # Generate request ID
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        status_code = 500
 
-        # Process request
-        response = await call_next(request)
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-        # Check if this action should be audited
-        action, path_params = match_route_pattern(request.method, request.url.path)
+        # Process request
+        await self.app(scope, receive, send_with_status)
 
-        if action and response.status_code < 400:
+        if status_code < 400:
             # Log successful auditable actions
             try:
                 await self._log_audit(
-                    request=request,
+                    request=Request(scope),
                     action=action,
                     path_params=path_params,
-                    response_status=response.status_code,
+                    response_status=status_code,
                     duration_ms=(time.time() - start_time) * 1000,
                 )
             except Exception as e:
                 logger.error(f"Failed to log audit entry: {e}")
 
-        return response
-
     async def _log_audit(
         self,
         request: Request,
@@ -128,7 +223,33 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
         response_status: int,
         duration_ms: float,
     ) -> None:
-        """Write audit log entry to database."""
+        """Hand an audit log entry to the audit sink.
+
+        Entries are bulk-inserted in the background. If the sink is not
+        running (disabled, or the lifespan hook did not start it) the entry
+        is written inline.
+        """
+        entry = self._build_audit_entry(
+            request, action, path_params, response_status, duration_ms
+        )
+
+        sink = get_audit_sink()
+        if sink.running:
+            # A full queue drops the entry (counted in the sink's stats)
+            # rather than holding up the response
+            sink.offer(entry)
+        else:
+            await write_audit_entries([entry])
+
+    def _build_audit_entry(
+        self,
+        request: Request,
+        action: AuditAction,
+        path_params: dict[str, str],
+        response_status: int,
+        duration_ms: float,
+    ) -> dict[str, Any]:
+        """Build AuditLog column values for a request."""
         # Get user from request state (set by auth dependency)
         user = getattr(request.state, "user", None)
         actor_id = user.id if user else None
@@ -177,44 +298,60 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
         ip_address = request.client.host if request.client else None
         user_agent = request.headers.get("user-agent")
 
-        # Insert audit log
-        session_factory = get_session_factory()
-        async with session_factory() as session:
-            await session.execute(
-                insert(AuditLog).values(
-                    action=action,
-                    entity_type=entity_type,
-                    entity_id=entity_id,
-                    actor_id=actor_id,
-                    details=details,
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                )
-            )
-            await session.commit()
+        return {
+            # Set here rather than by the server default, so buffered
+            # entries keep the time of the request
+            "timestamp": datetime.now(timezone.utc),
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "actor_id": actor_id,
+            "details": details,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+        }
+
 
+class ErrorHandlingMiddleware:
+    """Middleware for consistent error response formatting (pure ASGI)."""
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    """Middleware for consistent error response formatting."""
+    def __init__(self, app: ASGIApp):
+        """Initialize middleware.
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Any]
-    ) -> Response:
+        Args:
+            app: Wrapped ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and handle exceptions."""
-        import os
-        import traceback
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_tracking_start)
         except Exception as e:
             logger.exception(f"Unhandled exception: {e}")
 
+            # A response (e.g. a stream) already under way cannot be replaced
+            if response_started:
+                raise
+
             # In debug mode or serverless, include more error details for debugging
             is_debug = os.environ.get("DEBUG", "").lower() in ("true", "1")
             is_serverless = os.environ.get("VERCEL") == "1"
 
             details: dict[str, Any] = {
-                "request_id": getattr(request.state, "request_id", None),
+                "request_id": scope.get("state", {}).get("request_id"),
             }
 
             # Include error details in serverless mode to help debug deployment issues
@@ -223,7 +360,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
                 details["error_message"] = str(e)
                 details["traceback"] = traceback.format_exc().split("\n")[-10:]
 
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=500,
                 content={
                     "error": "internal_server_error",
@@ -231,6 +368,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
                     "details": details,
                 },
             )
+            await response(scope, receive, send)
 
 
 def setup_middleware(app: FastAPI) -> None:
@@ -17,7 +17,16 @@ from evidence_repository.schemas.integration_key import (
     TestIntegrationRequest,
     TestIntegrationResponse,
 )
+from evidence_repository.schemas.vector_index import (
+    VectorIndexBuildRequest,
+    VectorIndexListResponse,
+    VectorIndexResponse,
+)
 from evidence_repository.services.integration_key_service import IntegrationKeyService
+from evidence_repository.services.vector_index_service import (
+    VectorIndexError,
+    VectorIndexService,
+)
 
 router = APIRouter()
 
@@ -514,3 +523,105 @@ async def _test_aws_integration(
             success=False,
             message=f"Failed to connect to AWS: {str(e)}",
         )
+
+
+# =============================================================================
+# Vector Index Management
+# =============================================================================
+
+
+@router.get(
+    "/vector-indexes",
+    response_model=VectorIndexListResponse,
+    summary="List vector indexes",
+    description="Report HNSW/IVFFlat indexes on embedding chunks, including stale project indexes.",
+)
+async def list_vector_indexes(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> VectorIndexListResponse:
+    """List all vector indexes with size, validity and staleness."""
+    service = VectorIndexService(db)
+    indexes = await service.list_indexes()
+
+    return VectorIndexListResponse(
+        items=[VectorIndexResponse.model_validate(i) for i in indexes],
+        total=len(indexes),
+        stale_count=sum(1 for i in indexes if i.stale),
+    )
+
+
+@router.post(
+    "/vector-indexes",
+    response_model=VectorIndexResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Build vector index",
+    description="""
+Build (or rebuild) an HNSW index on embedding chunks.
+
+Omit `project_id` to build the global index. With `project_id`, builds a
+partial index covering only that project's document versions; project-scoped
+searches use it until the project's documents change.
+
+Builds run concurrently and do not block writes, but can take minutes on
+large corpora.
+    """,
+)
+async def build_vector_index(
+    data: VectorIndexBuildRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> VectorIndexResponse:
+    """Build or rebuild a vector index."""
+    service = VectorIndexService(db)
+
+    try:
+        if data.project_id:
+            info = await service.build_project_index(
+                data.project_id,
+                m=data.m,
+                ef_construction=data.ef_construction,
+                rebuild=data.rebuild,
+            )
+        else:
+            info = await service.build_global_index(
+                m=data.m,
+                ef_construction=data.ef_construction,
+                rebuild=data.rebuild,
+            )
+    except VectorIndexError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
+
+    return VectorIndexResponse.model_validate(info)
+
+
+@router.delete(
+    "/vector-indexes/{index_name}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Drop vector index",
+    description="Drop a managed HNSW index (global or per-project).",
+)
+async def drop_vector_index(
+    index_name: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> None:
+    """Drop a managed vector index."""
+    service = VectorIndexService(db)
+
+    try:
+        dropped = await service.drop_index(index_name)
+    except VectorIndexError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    if not dropped:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Vector index {index_name} not found",
+        )
@@ -9,10 +9,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from evidence_repository.api.dependencies import User, get_current_user, get_storage
+from evidence_repository.api.downloads import file_download_response
 from evidence_repository.config import get_settings
 from evidence_repository.db.session import get_db_session
 from evidence_repository.extraction.service import ExtractionService
-from evidence_repository.ingestion.service import IngestionService
+from evidence_repository.ingestion.service import IngestionService, UploadTooLargeError, spool_upload
 from evidence_repository.models.audit import AuditAction, AuditLog
 from evidence_repository.models.document import Document, DocumentVersion, ExtractionStatus, ProcessingStatus, UploadStatus
 from evidence_repository.models.job import JobType
@@ -108,20 +109,20 @@ async def upload_document(
             detail=f"Unsupported file type: {extension}. Supported: {settings.supported_extensions}",
         )
 
-    # Read file content
-    content = await file.read()
-    if not content:
+    # Read file content in chunks (hash computed and size limit enforced as we go)
+    max_size = settings.max_file_size_mb * 1024 * 1024
+    try:
+        upload = await spool_upload(file, max_size)
+    except UploadTooLargeError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Empty file",
+            detail=str(e),
         )
 
-    # Check file size
-    max_size = settings.max_file_size_mb * 1024 * 1024
-    if len(content) > max_size:
+    if not upload.size:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large ({len(content)} bytes). Maximum: {max_size} bytes",
+            detail="Empty file",
         )
 
     # Validate profile_code
@@ -137,7 +138,7 @@ async def upload_document(
     document, version = await ingestion.ingest_document(
         filename=file.filename,
         content_type=file.content_type or "application/octet-stream",
-        data=content,
+        data=upload,
         metadata={"uploaded_by": user.id},
         profile_code=profile_code,
     )
@@ -152,7 +153,7 @@ async def upload_document(
         details={
             "filename": file.filename,
             "content_type": file.content_type,
-            "file_size": len(content),
+            "file_size": upload.size,
             "version_id": str(version.id),
             "version_number": version.version_number,
         },
@@ -325,27 +326,27 @@ async def upload_document_version(
             detail=f"Unsupported file type: {extension}. Supported: {settings.supported_extensions}",
         )
 
-    # Read file content
-    content = await file.read()
-    if not content:
+    # Read file content in chunks (hash computed and size limit enforced as we go)
+    max_size = settings.max_file_size_mb * 1024 * 1024
+    try:
+        upload = await spool_upload(file, max_size)
+    except UploadTooLargeError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Empty file",
+            detail=str(e),
         )
 
-    # Check file size
-    max_size = settings.max_file_size_mb * 1024 * 1024
-    if len(content) > max_size:
+    if not upload.size:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large ({len(content)} bytes). Maximum: {max_size} bytes",
+            detail="Empty file",
         )
 
     # Create new version
     ingestion = IngestionService(storage=storage, db=db)
     version = await ingestion.create_version(
         document=document,
-        data=content,
+        data=upload,
         content_type=file.content_type or document.content_type,
         metadata={"uploaded_by": user.id},
     )
@@ -361,7 +362,7 @@ async def upload_document_version(
             "document_id": str(document_id),
             "filename": file.filename,
             "content_type": file.content_type,
-            "file_size": len(content),
+            "file_size": upload.size,
             "version_number": version.version_number,
         },
         request=request,
@@ -452,9 +453,17 @@ async def download_document(
             detail=f"Document {document_id} has no versions",
         )
 
-    # Download from storage
+    # Stream from storage (Range / conditional requests handled here)
     try:
-        content = await storage.download(version.storage_path)
+        response = await file_download_response(
+            request,
+            storage,
+            version.storage_path,
+            size=version.file_size,
+            file_hash=version.file_hash,
+            media_type=document.content_type,
+            filename=document.filename,
+        )
     except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -471,20 +480,14 @@ async def download_document(
         details={
             "version_id": str(version.id),
             "version_number": version.version_number,
-            "file_size": len(content),
+            "file_size": version.file_size,
+            "range": request.headers.get("range"),
         },
         request=request,
     )
     await db.commit()
 
-    return Response(
-        content=content,
-        media_type=document.content_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{document.filename}"',
-            "Content-Length": str(len(content)),
-        },
-    )
+    return response
 
 
 @router.get(
@@ -518,9 +521,17 @@ async def download_document_version(
             detail=f"Version {version_id} not found for document {document_id}",
         )
 
-    # Download from storage
+    # Stream from storage (Range / conditional requests handled here)
     try:
-        content = await storage.download(version.storage_path)
+        response = await file_download_response(
+            request,
+            storage,
+            version.storage_path,
+            size=version.file_size,
+            file_hash=version.file_hash,
+            media_type=version.document.content_type,
+            filename=version.document.filename,
+        )
     except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -537,20 +548,14 @@ async def download_document_version(
         details={
             "document_id": str(document_id),
             "version_number": version.version_number,
-            "file_size": len(content),
+            "file_size": version.file_size,
+            "range": request.headers.get("range"),
         },
         request=request,
     )
     await db.commit()
 
-    return Response(
-        content=content,
-        media_type=version.document.content_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{version.document.filename}"',
-            "Content-Length": str(len(content)),
-        },
-    )
+    return response
 
 
 @router.post(
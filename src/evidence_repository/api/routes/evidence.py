@@ -1,14 +1,16 @@
 """Evidence endpoints (Spans, Claims, Metrics, Evidence Packs)."""
 
 import uuid
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from evidence_repository.api.dependencies import User, get_current_user
-from evidence_repository.db.session import get_db_session
+from evidence_repository.api.dependencies import User, get_current_user, get_storage
+from evidence_repository.db.session import get_db_session, get_session_factory
 from evidence_repository.models.document import DocumentVersion
 from evidence_repository.models.evidence import (
     Claim,
@@ -31,6 +33,13 @@ from evidence_repository.schemas.evidence import (
     SpanCreate,
     SpanResponse,
 )
+from evidence_repository.services.pack_export import (
+    NDJSON_MEDIA_TYPE,
+    ZIP_MEDIA_TYPE,
+    PackExporter,
+    pack_to_dict,
+)
+from evidence_repository.storage.base import StorageBackend
 
 router = APIRouter()
 
@@ -504,77 +513,56 @@ async def add_evidence_pack_item(
 @router.get(
     "/evidence-packs/{pack_id}/export",
     summary="Export Evidence Pack",
-    description="Export evidence pack as structured JSON.",
+    description=(
+        "Export evidence pack as structured JSON, streamed NDJSON (format=ndjson) "
+        "or a streamed ZIP bundle with the cited source documents (format=zip)."
+    ),
 )
 async def export_evidence_pack(
     pack_id: uuid.UUID,
     db: AsyncSession = Depends(get_db_session),
     user: User = Depends(get_current_user),
-) -> dict:
-    """Export evidence pack with full details."""
-    result = await db.execute(
-        select(EvidencePack)
-        .options(
-            selectinload(EvidencePack.items)
-            .selectinload(EvidencePackItem.span)
-            .selectinload(Span.document_version),
-            selectinload(EvidencePack.items)
-            .selectinload(EvidencePackItem.claim),
-            selectinload(EvidencePack.items)
-            .selectinload(EvidencePackItem.metric),
-        )
-        .where(EvidencePack.id == pack_id)
-    )
-    pack = result.scalar_one_or_none()
+    storage: StorageBackend = Depends(get_storage),
+    format: str = Query("json", pattern="^(json|ndjson|zip)$", description="json, ndjson or zip"),
+    include_sources: bool = Query(True, description="Add cited source documents to the ZIP"),
+) -> Any:
+    """Export evidence pack with full details.
+
+    NDJSON and ZIP exports page through the pack items and stream, so they
+    start immediately and use constant memory for any pack size. Streams
+    read on their own session, which holds a pooled connection and a read
+    transaction until the download completes.
+    """
+    exporter = await PackExporter.open(db, pack_id)
 
-    if not pack:
+    if not exporter:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Evidence pack {pack_id} not found",
         )
 
-    # Build export structure
-    export_items = []
-    for item in pack.items:
-        export_item = {
-            "order": item.order_index,
-            "notes": item.notes,
-            "span": {
-                "id": str(item.span.id),
-                "text": item.span.text_content,
-                "type": item.span.span_type.value,
-                "locator": item.span.start_locator,
-                "document_version_id": str(item.span.document_version_id),
-            },
-        }
-
-        if item.claim:
-            export_item["claim"] = {
-                "id": str(item.claim.id),
-                "text": item.claim.claim_text,
-                "type": item.claim.claim_type,
-                "confidence": item.claim.confidence,
-            }
+    if format == "ndjson":
+        return StreamingResponse(
+            exporter.stream(get_session_factory(), PackExporter.ndjson),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={"Content-Disposition": f'attachment; filename="evidence-pack-{pack_id}.ndjson"'},
+        )
 
-        if item.metric:
-            export_item["metric"] = {
-                "id": str(item.metric.id),
-                "name": item.metric.metric_name,
-                "value": item.metric.metric_value,
-                "unit": item.metric.unit,
-            }
+    if format == "zip":
+        return StreamingResponse(
+            exporter.stream(
+                get_session_factory(),
+                lambda stream: stream.zip(storage, include_sources=include_sources),
+            ),
+            media_type=ZIP_MEDIA_TYPE,
+            headers={"Content-Disposition": f'attachment; filename="evidence-pack-{pack_id}.zip"'},
+        )
 
-        export_items.append(export_item)
+    # Build export structure
+    export_items = [item async for item in exporter.iter_items()]
 
     return {
-        "evidence_pack": {
-            "id": str(pack.id),
-            "name": pack.name,
-            "description": pack.description,
-            "project_id": str(pack.project_id),
-            "created_at": pack.created_at.isoformat(),
-            "created_by": pack.created_by,
-        },
+        "evidence_pack": pack_to_dict(exporter.pack),
         "items": export_items,
         "item_count": len(export_items),
         "exported_at": datetime.utcnow().isoformat(),
@@ -640,18 +628,11 @@ async def get_evidence_pack_with_facts(
     - Insurance: insurance.underwriting, insurance.claims, insurance.compliance
     - General: general.research, general.compliance, general.audit
     """
-    from evidence_repository.models.extraction_level import (
-        ExtractionLevel,
-        ExtractionLevelCode,
-        ExtractionProfile,
-        ExtractionProfileCode,
-        ProcessContext,
-    )
-    from evidence_repository.models.facts import (
-        FactClaim,
-        FactMetric,
-        FactConstraint,
-        FactRisk,
+    from evidence_repository.models.extraction_level import ProcessContext
+    from evidence_repository.services.pack_facts import (
+        PackFactLoader,
+        empty_facts,
+        resolve_extraction_ids,
     )
 
     # Get the evidence pack
@@ -676,117 +657,27 @@ async def get_evidence_pack_with_facts(
             detail=f"Evidence pack {pack_id} not found",
         )
 
-    # Parse profile code
-    try:
-        pc = ExtractionProfileCode(profile_code)
-    except ValueError:
-        pc = ExtractionProfileCode.GENERAL
-
     # Parse process context
     try:
         proc_ctx = ProcessContext(process_context)
     except ValueError:
         proc_ctx = ProcessContext.UNSPECIFIED
 
-    profile_stmt = select(ExtractionProfile.id).where(ExtractionProfile.code == pc)
-    profile_result = await db.execute(profile_stmt)
-    profile_id = profile_result.scalar_one_or_none()
+    profile_id, level_id = await resolve_extraction_ids(db, profile_code, level)
 
-    level_mapping = {
-        1: ExtractionLevelCode.L1_BASIC,
-        2: ExtractionLevelCode.L2_STANDARD,
-        3: ExtractionLevelCode.L3_DEEP,
-        4: ExtractionLevelCode.L4_FORENSIC,
-    }
-    level_code = level_mapping.get(level, ExtractionLevelCode.L2_STANDARD)
-
-    level_stmt = select(ExtractionLevel.id).where(ExtractionLevel.code == level_code)
-    level_result = await db.execute(level_stmt)
-    level_id = level_result.scalar_one_or_none()
+    # Load facts for all versions in the pack (one query per fact type)
+    facts_by_version = {}
+    if profile_id and level_id:
+        loader = PackFactLoader(db, profile_id, level_id, proc_ctx)
+        facts_by_version = await loader.load(
+            item.span.document_version_id for item in pack.items
+        )
 
     # Build export structure with facts
     export_items = []
     for item in pack.items:
         version_id = item.span.document_version_id
-
-        # Get facts for this version at specified profile/process_context/level
-        fact_claims = []
-        fact_metrics = []
-        fact_constraints = []
-        fact_risks = []
-
-        if profile_id and level_id:
-            # Query facts with process_context filter
-            claims_stmt = select(FactClaim).where(
-                FactClaim.version_id == version_id,
-                FactClaim.profile_id == profile_id,
-                FactClaim.process_context == proc_ctx,
-                FactClaim.level_id == level_id,
-            ).limit(50)
-            claims_result = await db.execute(claims_stmt)
-            for claim in claims_result.scalars():
-                fact_claims.append({
-                    "id": str(claim.id),
-                    "subject": claim.subject,
-                    "predicate": claim.predicate,
-                    "object": claim.object,
-                    "claim_type": claim.claim_type,
-                    "certainty": claim.certainty.value,
-                    "evidence_quote": claim.evidence_quote,
-                    "process_context": claim.process_context.value,
-                })
-
-            metrics_stmt = select(FactMetric).where(
-                FactMetric.version_id == version_id,
-                FactMetric.profile_id == profile_id,
-                FactMetric.process_context == proc_ctx,
-                FactMetric.level_id == level_id,
-            ).limit(50)
-            metrics_result = await db.execute(metrics_stmt)
-            for metric in metrics_result.scalars():
-                fact_metrics.append({
-                    "id": str(metric.id),
-                    "metric_name": metric.metric_name,
-                    "value_numeric": metric.value_numeric,
-                    "value_raw": metric.value_raw,
-                    "unit": metric.unit,
-                    "currency": metric.currency,
-                    "certainty": metric.certainty.value,
-                    "process_context": metric.process_context.value,
-                })
-
-            constraints_stmt = select(FactConstraint).where(
-                FactConstraint.version_id == version_id,
-                FactConstraint.profile_id == profile_id,
-                FactConstraint.process_context == proc_ctx,
-                FactConstraint.level_id == level_id,
-            ).limit(20)
-            constraints_result = await db.execute(constraints_stmt)
-            for constraint in constraints_result.scalars():
-                fact_constraints.append({
-                    "id": str(constraint.id),
-                    "constraint_type": constraint.constraint_type.value,
-                    "statement": constraint.statement,
-                    "applies_to": constraint.applies_to,
-                    "process_context": constraint.process_context.value,
-                })
-
-            risks_stmt = select(FactRisk).where(
-                FactRisk.version_id == version_id,
-                FactRisk.profile_id == profile_id,
-                FactRisk.process_context == proc_ctx,
-                FactRisk.level_id == level_id,
-            ).limit(20)
-            risks_result = await db.execute(risks_stmt)
-            for risk in risks_result.scalars():
-                fact_risks.append({
-                    "id": str(risk.id),
-                    "risk_type": risk.risk_type,
-                    "severity": risk.severity.value,
-                    "statement": risk.statement,
-                    "rationale": risk.rationale,
-                    "process_context": risk.process_context.value,
-                })
+        facts = facts_by_version.get(version_id) or empty_facts()
 
         export_item = {
             "order": item.order_index,
@@ -798,12 +689,7 @@ async def get_evidence_pack_with_facts(
                 "locator": item.span.start_locator,
                 "document_version_id": str(item.span.document_version_id),
             },
-            "facts": {
-                "claims": fact_claims,
-                "metrics": fact_metrics,
-                "constraints": fact_constraints,
-                "risks": fact_risks,
-            },
+            "facts": facts,
         }
 
         if item.claim:
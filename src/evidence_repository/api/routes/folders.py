@@ -6,7 +6,6 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from evidence_repository.api.dependencies import User, get_current_user
 from evidence_repository.db.session import get_db_session
@@ -16,12 +15,12 @@ from evidence_repository.schemas.folder import (
     BulkMoveDocumentsRequest,
     FolderCreate,
     FolderResponse,
-    FolderTreeNode,
     FolderTreeResponse,
     FolderUpdate,
     MoveDocumentRequest,
     MoveFolderRequest,
 )
+from evidence_repository.services.folder_tree import FolderTreeService, invalidate_folder_tree
 
 router = APIRouter()
 
@@ -153,6 +152,7 @@ async def create_folder(
     )
     db.add(folder)
     await db.commit()
+    invalidate_folder_tree(project_id)
     await db.refresh(folder)
 
     return await _build_folder_response(db, folder)
@@ -202,60 +202,7 @@ async def get_folder_tree(
     """Get folder tree structure."""
     await _get_project_or_404(db, project_id)
 
-    # Get all folders for project with document counts
-    result = await db.execute(
-        select(Folder)
-        .options(selectinload(Folder.project_documents))
-        .where(
-            Folder.project_id == project_id,
-            Folder.deleted_at.is_(None),
-        )
-        .order_by(Folder.display_order, Folder.name)
-    )
-    all_folders = result.scalars().all()
-
-    # Count root documents (no folder)
-    root_doc_count = (
-        await db.scalar(
-            select(func.count()).where(
-                ProjectDocument.project_id == project_id,
-                ProjectDocument.folder_id.is_(None),
-            )
-        )
-        or 0
-    )
-
-    # Build tree structure
-    folder_map = {f.id: f for f in all_folders}
-
-    def build_node(folder: Folder) -> FolderTreeNode:
-        children = [
-            build_node(folder_map[child.id])
-            for child in all_folders
-            if child.parent_folder_id == folder.id
-        ]
-        return FolderTreeNode(
-            id=folder.id,
-            name=folder.name,
-            description=folder.description,
-            parent_folder_id=folder.parent_folder_id,
-            display_order=folder.display_order,
-            color=folder.color,
-            icon=folder.icon,
-            document_count=len(folder.project_documents),
-            children=children,
-        )
-
-    root_folders = []
-    for f in all_folders:
-        if f.parent_folder_id is None:
-            root_folders.append(build_node(f))
-
-    return FolderTreeResponse(
-        project_id=project_id,
-        root_document_count=root_doc_count,
-        folders=root_folders,
-    )
+    return await FolderTreeService(db).get_tree(project_id)
 
 
 @router.get(
@@ -337,6 +284,7 @@ async def update_folder(
 
     folder.updated_at = datetime.utcnow()
     await db.commit()
+    invalidate_folder_tree(project_id)
     await db.refresh(folder)
 
     return await _build_folder_response(db, folder)
@@ -380,6 +328,7 @@ async def delete_folder(
     # Soft delete
     folder.deleted_at = datetime.utcnow()
     await db.commit()
+    invalidate_folder_tree(project_id)
 
 
 # =============================================================================
@@ -427,6 +376,7 @@ async def move_document_to_folder(
 
     pd.folder_id = request.folder_id
     await db.commit()
+    invalidate_folder_tree(project_id)
 
     return {
         "status": "success",
@@ -470,6 +420,7 @@ async def bulk_move_documents(
         .values(folder_id=request.folder_id)
     )
     await db.commit()
+    invalidate_folder_tree(project_id)
 
     return {
         "status": "success",
@@ -548,6 +499,7 @@ async def move_folder(
     folder.parent_folder_id = request.parent_folder_id
     folder.updated_at = datetime.utcnow()
     await db.commit()
+    invalidate_folder_tree(project_id)
     await db.refresh(folder)
 
     return await _build_folder_response(db, folder)
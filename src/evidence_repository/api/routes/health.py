@@ -40,6 +40,30 @@ async def _check_redis() -> tuple[str, dict | None]:
         return f"unhealthy: {e}", None
 
 
+def _get_embedding_cache_stats() -> dict:
+    """Get query embedding cache hit/miss counters for this process."""
+    from evidence_repository.embeddings.cache import get_embedding_cache
+
+    cache = get_embedding_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.get_stats()}
+
+
+def _get_llm_cache_stats() -> dict:
+    """Get LLM response cache hit/miss counters for this process."""
+    from evidence_repository.extraction.llm_cache import get_llm_cache_stats
+
+    return get_llm_cache_stats()
+
+
+def _get_audit_sink_stats() -> dict:
+    """Get buffered audit writer counters for this process."""
+    from evidence_repository.services.audit_sink import get_audit_sink
+
+    return get_audit_sink().get_stats()
+
+
 async def _check_database(db: AsyncSession) -> tuple[str, dict | None]:
     """Check database connectivity and return status with info."""
     try:
@@ -110,6 +134,9 @@ async def health_check(
         details={
             "database": db_info,
             "redis": redis_info,
+            "embedding_cache": _get_embedding_cache_stats(),
+            "llm_cache": _get_llm_cache_stats(),
+            "audit_sink": _get_audit_sink_stats(),
             "app_name": settings.app_name,
             "debug": settings.debug,
         },
@@ -197,6 +224,36 @@ async def redis_health_check() -> dict:
     }
 
 
+@router.get(
+    "/health/embedding-cache",
+    summary="Embedding Cache Stats",
+    description="Query embedding cache hit/miss counters for this API process.",
+)
+async def embedding_cache_health_check() -> dict:
+    """Embedding cache statistics."""
+    return _get_embedding_cache_stats()
+
+
+@router.get(
+    "/health/llm-cache",
+    summary="LLM Cache Stats",
+    description="LLM response cache hit/miss counters for this API process.",
+)
+async def llm_cache_health_check() -> dict:
+    """LLM response cache statistics."""
+    return _get_llm_cache_stats()
+
+
+@router.get(
+    "/health/audit-sink",
+    summary="Audit Sink Stats",
+    description="Buffered audit log writer queue depth and drop counters for this API process.",
+)
+async def audit_sink_health_check() -> dict:
+    """Audit sink statistics."""
+    return _get_audit_sink_stats()
+
+
 @router.get(
     "/ready",
     summary="Readiness Check",
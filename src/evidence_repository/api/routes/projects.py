@@ -38,6 +38,7 @@ from evidence_repository.schemas.project import (
     ProjectResponse,
     ProjectUpdate,
 )
+from evidence_repository.services.folder_tree import invalidate_folder_tree
 from evidence_repository.services.quality_analysis import QualityAnalysisService
 
 router = APIRouter()
@@ -348,6 +349,7 @@ async def attach_document(
     )
     db.add(project_document)
     await db.commit()
+    invalidate_folder_tree(project_id)
     await db.refresh(project_document)
 
     return ProjectDocumentResponse.model_validate(project_document)
@@ -426,6 +428,7 @@ async def detach_document(
 
     await db.delete(project_document)
     await db.commit()
+    invalidate_folder_tree(project_id)
 
 
 # =============================================================================
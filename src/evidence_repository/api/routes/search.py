@@ -150,6 +150,8 @@ async def search_documents(
             keywords=query.keywords,
             exclude_keywords=query.exclude_keywords,
             spans_only=query.spans_only,
+            ef_search=query.ef_search,
+            offset=query.offset,
         )
     except Exception as e:
         raise HTTPException(
@@ -300,6 +302,8 @@ async def search_project(
             keywords=query.keywords,
             exclude_keywords=query.exclude_keywords,
             spans_only=query.spans_only,
+            ef_search=query.ef_search,
+            offset=query.offset,
         )
     except Exception as e:
         raise HTTPException(
@@ -141,9 +141,15 @@ async def get_worker_status(
     recent activity metrics.
     """
     if detailed:
+        from evidence_repository.digestion.parser_pool import get_parser_pool_stats
         from evidence_repository.digestion.status import get_processing_stats
+        from evidence_repository.extraction.llm_cache import get_llm_cache_stats
         stats = await get_processing_stats(db)
-        return stats.to_dict()
+        return {
+            **stats.to_dict(),
+            "parser_pool": get_parser_pool_stats(),
+            "llm_cache": get_llm_cache_stats(),
+        }
     else:
         from evidence_repository.digestion.status import get_queue_status
         return await get_queue_status(db)
@@ -419,67 +425,87 @@ async def cron_process_pending(
     #     )
 
     # Process pending documents
-    from evidence_repository.models.document import Document, DocumentVersion, ExtractionStatus
+    from sqlalchemy import inspect
+
+    from evidence_repository.models.document import Document
+    from evidence_repository.digestion.claims import (
+        LeaseHeartbeat,
+        claim_versions,
+        fail_exhausted_claims,
+        finish_claim,
+        make_worker_id,
+        unclaim_versions,
+    )
     from evidence_repository.digestion.pipeline import DigestionPipeline, DigestResult
+    from evidence_repository.db.session import get_session_factory
 
-    # Find pending documents
-    result = await db.execute(
-        select(DocumentVersion)
-        .where(DocumentVersion.extraction_status == ExtractionStatus.PENDING)
-        .order_by(DocumentVersion.created_at.asc())
-        .limit(3)
-    )
-    pending_versions = result.scalars().all()
+    # Claim pending documents atomically so overlapping cron runs and
+    # polling workers never process the same version
+    worker_id = make_worker_id("cron")
+    await fail_exhausted_claims(db)
+    pending_versions = await claim_versions(db, worker_id, limit=3)
 
     if not pending_versions:
         return {"status": "idle", "message": "No pending documents", "processed": 0}
 
     pipeline = DigestionPipeline(db=db)
+    session_factory = get_session_factory()
     processed = 0
     failed = 0
+    version_ids = [v.id for v in pending_versions]
 
-    for version in pending_versions:
+    for version_id, version in zip(version_ids, pending_versions):
         try:
+            if inspect(version).expired:
+                # An earlier rollback in this run expired the instance
+                await db.refresh(version)
+
             doc_result = await db.execute(
                 select(Document).where(Document.id == version.document_id)
             )
             document = doc_result.scalar_one_or_none()
             if not document:
+                await unclaim_versions(db, [version_id], worker_id)
                 continue
 
             logger.info(f"Cron processing: {document.filename}")
 
-            version.extraction_status = ExtractionStatus.PROCESSING
-            await db.commit()
-
-            # Download with retry for R2 eventual consistency
-            file_data = await _download_with_retry(pipeline.storage, version.storage_path)
-
-            digest_result = DigestResult(
-                document_id=document.id,
-                version_id=version.id,
-                started_at=datetime.utcnow(),
-            )
-
-            await pipeline._step_parse(document, version, file_data, digest_result)
-            await pipeline._step_extract_metadata(document, version, digest_result)
-            # Commit metadata changes explicitly
-            await db.commit()
-            await pipeline._step_build_sections(version, digest_result)
-            await pipeline._step_generate_embeddings(version, digest_result)
+            async with LeaseHeartbeat(session_factory, version_id, worker_id) as hb:
+                # Download with retry for R2 eventual consistency
+                file_data = await _download_with_retry(pipeline.storage, version.storage_path)
+
+                digest_result = DigestResult(
+                    document_id=document.id,
+                    version_id=version_id,
+                    started_at=datetime.utcnow(),
+                )
+
+                await pipeline._step_parse(document, version, file_data, digest_result)
+                await pipeline._step_extract_metadata(document, version, digest_result)
+                await pipeline._step_build_sections(version, digest_result)
+                await pipeline._step_generate_embeddings(version, digest_result)
+
+            if hb.lost or not await finish_claim(
+                db, version_id, worker_id, ExtractionStatus.COMPLETED
+            ):
+                # Another worker reclaimed the version; discard this run
+                await db.rollback()
+                logger.warning(f"Cron discarded version {version_id} after losing its claim")
+                continue
 
-            version.extraction_status = ExtractionStatus.COMPLETED
             await db.commit()
 
             processed += 1
             logger.info(f"Cron completed: {document.filename}")
 
         except Exception as e:
-            logger.error(f"Cron failed for version {version.id}: {e}")
+            logger.error(f"Cron failed for version {version_id}: {e}")
             failed += 1
             try:
-                version.extraction_status = ExtractionStatus.FAILED
-                version.extraction_error = str(e)[:500]
+                await db.rollback()
+                await finish_claim(
+                    db, version_id, worker_id, ExtractionStatus.FAILED, str(e)[:500]
+                )
                 await db.commit()
             except Exception:
                 await db.rollback()
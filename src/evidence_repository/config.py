@@ -1,11 +1,16 @@
 """Application configuration using pydantic-settings."""
 
+import os
 from functools import lru_cache
 from typing import Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Vercel functions have no /dev/shm for worker pools and may be frozen as
+# soon as a response is sent
+IS_SERVERLESS = os.environ.get("VERCEL") == "1"
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -64,10 +69,68 @@ class Settings(BaseSettings):
     openai_embedding_model: str = "text-embedding-3-small"
     openai_embedding_dimensions: int = 1536
 
+    # Query embedding cache
+    embedding_cache_enabled: bool = True
+    embedding_cache_max_entries: int = 10000  # In-process LRU size
+    embedding_cache_ttl_seconds: int = 86400  # 24 hours
+    embedding_cache_redis_enabled: bool = False  # Shared tier via redis_url
+
+    # Content-addressed embedding reuse (embedding_vectors table)
+    embedding_reuse_enabled: bool = True
+
+    # Embedding request scheduling
+    embedding_max_concurrency: int = 8  # Ceiling for in-flight API requests
+    embedding_initial_concurrency: int = 4  # Halved on 429, grows back on success
+    embedding_batch_max_tokens: int = 100000  # Estimated tokens per request
+    embedding_batch_max_items: int = 512  # Inputs per request (API limit 2048)
+
+    # Structured extraction (span-level metric/claim LLM calls)
+    structured_extraction_concurrency: int = 8  # Chat completions in flight
+    structured_extraction_batch_tokens: int = 1500  # Short spans packed per prompt up to this
+    structured_extraction_batch_max_spans: int = 8  # Spans per packed prompt
+
+    # Multilevel extraction over span windows (map-reduce for long documents)
+    multilevel_map_reduce_min_tokens: int = 8000  # Documents this long are windowed
+    multilevel_window_tokens: int = 6000  # Estimated span tokens per window prompt
+    multilevel_window_concurrency: int = 4  # Window prompts in flight per run
+
+    # LLM response cache (extraction prompts; local SQLite file per host)
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = "./data/llm_cache.sqlite3"
+    llm_cache_max_mb: int = 512  # Least recently used entries evicted beyond this
+    llm_cache_bypass: bool = False  # Skip lookups (fresh responses are still stored)
+
+    # Folder tree cache (per API process; invalidated on folder/document moves)
+    folder_tree_cache_ttl_seconds: int = 5  # Bounds staleness across instances (0 disables)
+    folder_tree_cache_max_projects: int = 1000
+
+    # Audit log writer (buffered per API process, bulk-inserted in the background).
+    # Buffering takes the audit INSERT off the request path, but entries wait
+    # up to audit_flush_interval_seconds and are only flushed on a clean
+    # shutdown. Serverless instances can be frozen or recycled without one,
+    # so on Vercel the default is inline writes: one INSERT per audited
+    # request, but nothing is lost.
+    audit_sink_enabled: bool = not IS_SERVERLESS  # False writes each entry inline
+    audit_queue_max_size: int = 10000  # Entries beyond this are dropped (and counted)
+    audit_batch_size: int = 200  # Entries per INSERT
+    audit_flush_interval_seconds: float = 1.0  # Max wait before a partial batch is written
+
     # Chunking
     chunk_size: int = 1000
     chunk_overlap: int = 200
 
+    # Vector index (pgvector HNSW)
+    hnsw_m: int = 16  # Max graph connections per layer
+    hnsw_ef_construction: int = 64  # Candidate list size at build time
+    hnsw_ef_search: int | None = None  # Default per-query ef_search (None = pgvector default)
+    hnsw_iterative_scan: bool = True  # Filtered searches scan past ef_search (pgvector >= 0.8)
+
+    # Hybrid search (reciprocal rank fusion in SQL)
+    hybrid_candidate_depth: int = 100  # Top-k per leg before fusion
+    hybrid_rrf_k: int = 60  # RRF rank constant
+    hybrid_semantic_weight: float = 1.0
+    hybrid_keyword_weight: float = 1.0
+
     # CORS
     cors_origins: list[str] = Field(default_factory=lambda: ["http://localhost:3000"])
     cors_allow_credentials: bool = True
@@ -80,6 +143,20 @@ class Settings(BaseSettings):
     redis_job_timeout: int = 3600  # 1 hour default timeout
     redis_result_ttl: int = 86400  # 24 hours result retention
 
+    # Polling worker claims (SKIP LOCKED + lease)
+    worker_lease_seconds: int = 300  # Claimed version is reclaimable after this
+    worker_heartbeat_seconds: int = 60  # Lease renewal interval while processing
+    worker_max_claim_attempts: int = 3  # Expired claims before a version is failed
+
+    # Parser process pool (CPU-bound document parsing)
+    parser_pool_enabled: bool = not IS_SERVERLESS  # Off on Vercel: parse in-process
+    parser_pool_workers: int | None = None  # None = min(4, CPU count)
+    parser_timeout_seconds: int = 120  # Per-document parse deadline
+    parser_max_rss_mb: int = 1024  # Recycle workers whose peak RSS exceeds this
+    parser_max_tasks_per_worker: int = 50  # Jobs before a worker is replaced
+    pdf_parallel_min_pages: int = 100  # Shard PDFs with at least this many pages
+    pdf_pages_per_shard: int = 50  # Pages extracted per pool job
+
     # Bulk Ingestion
     bulk_ingestion_batch_size: int = 50
     url_download_timeout: int = 300  # 5 minutes for URL downloads
@@ -0,0 +1,330 @@
+"""Atomic work claiming for document versions.
+
+Polling workers used to SELECT pending versions and mark them PROCESSING
+later, so two pollers could pick up the same version. Claims here are a
+single statement::
+
+    UPDATE document_versions SET extraction_status = 'processing', ...
+    WHERE id IN (SELECT id ... FOR UPDATE SKIP LOCKED LIMIT n)
+    RETURNING *
+
+Concurrent claimers skip each other's rows instead of blocking on them.
+Each claim carries a lease (``lease_expires_at``) that the worker renews
+while processing (``LeaseHeartbeat``). A PROCESSING version whose lease has
+expired (worker crashed or was killed) is claimable again, up to
+``worker_max_claim_attempts`` times; after that it is marked FAILED.
+
+Versions set to PROCESSING by other paths (RQ tasks, /process-sync) have no
+lease and are never reclaimed.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from contextlib import suppress
+from datetime import timedelta
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from evidence_repository.config import get_settings
+from evidence_repository.models.document import DocumentVersion, ExtractionStatus
+
+logger = logging.getLogger(__name__)
+
+
+def make_worker_id(prefix: str | None = None) -> str:
+    """Build a worker identity unique across hosts, processes and restarts."""
+    parts = [prefix] if prefix else []
+    parts += [socket.gethostname(), str(os.getpid()), uuid.uuid4().hex[:8]]
+    return ":".join(parts)
+
+
+def _lease_expiry(lease_seconds: int):
+    return func.now() + timedelta(seconds=lease_seconds)
+
+
+def _lease_expired():
+    return and_(
+        DocumentVersion.extraction_status == ExtractionStatus.PROCESSING,
+        DocumentVersion.lease_expires_at < func.now(),
+    )
+
+
+def claim_statement(
+    worker_id: str,
+    limit: int,
+    lease_seconds: int,
+    max_attempts: int,
+):
+    """Build the claim UPDATE ... RETURNING statement."""
+    claimable = or_(
+        DocumentVersion.extraction_status == ExtractionStatus.PENDING,
+        and_(_lease_expired(), DocumentVersion.claim_attempts < max_attempts),
+    )
+    candidates = (
+        select(DocumentVersion.id)
+        .where(claimable)
+        .order_by(DocumentVersion.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        update(DocumentVersion)
+        .where(DocumentVersion.id.in_(candidates.scalar_subquery()))
+        .values(
+            extraction_status=ExtractionStatus.PROCESSING,
+            claimed_by=worker_id,
+            lease_expires_at=_lease_expiry(lease_seconds),
+            claim_attempts=DocumentVersion.claim_attempts + 1,
+        )
+        .returning(DocumentVersion)
+    )
+
+
+async def claim_versions(
+    db: AsyncSession,
+    worker_id: str,
+    limit: int,
+    lease_seconds: int | None = None,
+    max_attempts: int | None = None,
+) -> list[DocumentVersion]:
+    """Claim up to ``limit`` pending (or lease-expired) versions.
+
+    The claim is committed before returning so other workers see it.
+
+    Args:
+        db: Database session.
+        worker_id: Identity recorded in ``claimed_by``.
+        limit: Maximum versions to claim.
+        lease_seconds: Lease duration (default from settings).
+        max_attempts: Claims allowed per version (default from settings).
+
+    Returns:
+        Claimed versions, oldest first.
+    """
+    settings = get_settings()
+    stmt = claim_statement(
+        worker_id,
+        limit,
+        lease_seconds or settings.worker_lease_seconds,
+        max_attempts or settings.worker_max_claim_attempts,
+    )
+    result = await db.execute(
+        stmt,
+        execution_options={"synchronize_session": False, "populate_existing": True},
+    )
+    versions = sorted(result.scalars().all(), key=lambda v: v.created_at)
+    await db.commit()
+
+    for version in versions:
+        if version.claim_attempts > 1:
+            logger.warning(
+                f"Reclaimed version {version.id} after expired lease "
+                f"(attempt {version.claim_attempts})"
+            )
+    return versions
+
+
+async def fail_exhausted_claims(
+    db: AsyncSession,
+    max_attempts: int | None = None,
+) -> int:
+    """Mark versions FAILED whose lease expired on their last allowed attempt.
+
+    Returns:
+        Number of versions failed.
+    """
+    max_attempts = max_attempts or get_settings().worker_max_claim_attempts
+    result = await db.execute(
+        update(DocumentVersion)
+        .where(_lease_expired(), DocumentVersion.claim_attempts >= max_attempts)
+        .values(
+            extraction_status=ExtractionStatus.FAILED,
+            extraction_error=f"Processing lease expired after {max_attempts} attempts",
+            claimed_by=None,
+            lease_expires_at=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+    if result.rowcount:
+        logger.warning(f"Failed {result.rowcount} versions with exhausted claims")
+    return result.rowcount or 0
+
+
+async def renew_lease(
+    db: AsyncSession,
+    version_id: uuid.UUID,
+    worker_id: str,
+    lease_seconds: int | None = None,
+) -> bool:
+    """Extend the lease on a version this worker still holds.
+
+    Returns:
+        False if the claim was lost (reclaimed by another worker or finished).
+    """
+    lease_seconds = lease_seconds or get_settings().worker_lease_seconds
+    result = await db.execute(
+        update(DocumentVersion)
+        .where(
+            DocumentVersion.id == version_id,
+            DocumentVersion.claimed_by == worker_id,
+            DocumentVersion.extraction_status == ExtractionStatus.PROCESSING,
+        )
+        .values(lease_expires_at=_lease_expiry(lease_seconds))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def unclaim_versions(
+    db: AsyncSession,
+    version_ids: list[uuid.UUID],
+    worker_id: str,
+) -> int:
+    """Return claimed but unprocessed versions to PENDING (e.g. on shutdown)."""
+    if not version_ids:
+        return 0
+    result = await db.execute(
+        update(DocumentVersion)
+        .where(
+            DocumentVersion.id.in_(version_ids),
+            DocumentVersion.claimed_by == worker_id,
+            DocumentVersion.extraction_status == ExtractionStatus.PROCESSING,
+        )
+        .values(
+            extraction_status=ExtractionStatus.PENDING,
+            claimed_by=None,
+            lease_expires_at=None,
+            claim_attempts=DocumentVersion.claim_attempts - 1,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount or 0
+
+
+async def finish_claim(
+    db: AsyncSession,
+    version_id: uuid.UUID,
+    worker_id: str,
+    status: ExtractionStatus,
+    error: str | None = None,
+) -> bool:
+    """Record the final status of a version this worker still holds.
+
+    The update is conditional on ``claimed_by``, so a worker that lost its
+    claim cannot overwrite the state written by the new claimant. The
+    caller commits, keeping the status in the processing transaction.
+
+    Args:
+        db: Database session.
+        version_id: Claimed version.
+        worker_id: Identity recorded in ``claimed_by``.
+        status: COMPLETED or FAILED.
+        error: Error message stored with a FAILED status.
+
+    Returns:
+        False if the claim was lost; the caller should roll back.
+    """
+    values = {
+        "extraction_status": status,
+        "claimed_by": None,
+        "lease_expires_at": None,
+    }
+    if status == ExtractionStatus.COMPLETED:
+        values["claim_attempts"] = 0
+    if error is not None:
+        values["extraction_error"] = error
+
+    result = await db.execute(
+        update(DocumentVersion)
+        .where(
+            DocumentVersion.id == version_id,
+            DocumentVersion.claimed_by == worker_id,
+            DocumentVersion.extraction_status == ExtractionStatus.PROCESSING,
+        )
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def release_claim(version: DocumentVersion, completed: bool = False) -> None:
+    """Clear the lease on a version; the caller commits with its status change.
+
+    Args:
+        version: Claimed version.
+        completed: Reset the attempt counter (processing succeeded).
+    """
+    version.claimed_by = None
+    version.lease_expires_at = None
+    if completed:
+        version.claim_attempts = 0
+
+
+class LeaseHeartbeat:
+    """Renew a version's lease in the background while it is processed.
+
+    Renewals use their own short sessions so they commit independently of
+    the processing transaction.
+
+    Usage:
+        async with LeaseHeartbeat(session_factory, version.id, worker_id) as hb:
+            ...
+        if hb.lost:
+            ...
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        version_id: uuid.UUID,
+        worker_id: str,
+        interval: float | None = None,
+        lease_seconds: int | None = None,
+    ):
+        settings = get_settings()
+        self.session_factory = session_factory
+        self.version_id = version_id
+        self.worker_id = worker_id
+        self.interval = interval or settings.worker_heartbeat_seconds
+        self.lease_seconds = lease_seconds or settings.worker_lease_seconds
+        self.renewals = 0
+        self.lost = False
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "LeaseHeartbeat":
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                async with self.session_factory() as session:
+                    renewed = await renew_lease(
+                        session, self.version_id, self.worker_id, self.lease_seconds
+                    )
+            except Exception as e:
+                logger.warning(f"Lease renewal failed for version {self.version_id}: {e}")
+                continue
+
+            if not renewed:
+                self.lost = True
+                logger.warning(
+                    f"Lost claim on version {self.version_id} (worker {self.worker_id})"
+                )
+                return
+            self.renewals += 1
@@ -10,6 +10,7 @@ from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from evidence_repository.config import get_settings
+from evidence_repository.embeddings.scheduler import WINDOW_SIZE
 from evidence_repository.models.document import DocumentVersion
 from evidence_repository.models.embedding import EmbeddingChunk
 from evidence_repository.models.evidence import Span, SpanType
@@ -29,7 +30,7 @@ async def generate_embeddings(
     db: AsyncSession,
     version: DocumentVersion,
     force_regenerate: bool = False,
-    batch_size: int = 50,
+    batch_size: int = WINDOW_SIZE,
 ) -> int:
     """Generate embeddings for all embeddable spans.
 
@@ -37,12 +38,15 @@ async def generate_embeddings(
         db: Async database session.
         version: DocumentVersion to embed.
         force_regenerate: Delete existing embeddings first.
-        batch_size: Embeddings to generate per batch.
+        batch_size: Spans per embedding scheduler run; requests within a
+            window are packed by tokens and sent concurrently.
 
     Returns:
         Number of embeddings created.
     """
     from evidence_repository.embeddings.openai_client import OpenAIEmbeddingClient
+    from evidence_repository.embeddings.store import EmbeddingStore
+    from evidence_repository.embeddings.writer import chunk_row, write_chunks
 
     # Get embeddable spans
     spans_result = await db.execute(
@@ -90,8 +94,9 @@ async def generate_embeddings(
         logger.info(f"All spans already embedded for version {version.id}")
         return len(spans)
 
-    # Generate embeddings in batches
+    # Generate embeddings in scheduler windows
     client = OpenAIEmbeddingClient()
+    store = EmbeddingStore(client)
     created = 0
 
     for batch_start in range(0, len(spans_to_embed), batch_size):
@@ -101,24 +106,24 @@ async def generate_embeddings(
         texts = [s.text_content for s in batch_spans]
 
         try:
-            embeddings = await client.embed_texts(texts)
+            embeddings = await store.embed_texts(db, texts)
 
-            for span, embedding in zip(batch_spans, embeddings):
-                chunk = EmbeddingChunk(
+            created += await write_chunks(db, [
+                chunk_row(
                     document_version_id=version.id,
+                    document_id=version.document_id,
                     span_id=span.id,
-                    chunk_index=created,
+                    span_type=span.span_type,
+                    chunk_index=created + idx,
                     text=span.text_content,
                     embedding=embedding,
-                    metadata_={
+                    metadata={
                         "span_type": span.span_type.value,
                         "span_hash": span.span_hash,
                     },
                 )
-                db.add(chunk)
-                created += 1
-
-            await db.flush()
+                for idx, (span, embedding) in enumerate(zip(batch_spans, embeddings))
+            ])
 
         except Exception as e:
             logger.error(f"Batch embedding failed: {e}")
@@ -126,7 +131,7 @@ async def generate_embeddings(
 
     logger.info(
         f"Created {created} embeddings for version {version.id} "
-        f"(tokens: {client.get_token_usage()})"
+        f"({store.stats.reused} reused; tokens: {client.get_token_usage()})"
     )
 
     return created
@@ -22,9 +22,21 @@ from datetime import datetime
 from typing import Any
 
 from evidence_repository.config import get_settings
+from evidence_repository.extraction.llm_cache import (
+    get_cached_response,
+    llm_cache_key,
+    store_response,
+)
 
 logger = logging.getLogger(__name__)
 
+LLM_MODEL = "gpt-4o-mini"
+LLM_TEMPERATURE = 0.1
+LLM_SYSTEM_PROMPT = "You are a document analysis expert. Extract metadata accurately and return valid JSON."
+
+# LLM cache schema version; bump when the prompt's response shape changes
+CACHE_SCHEMA_VERSION = "metadata-1"
+
 # Document type classifications
 DOCUMENT_TYPES = [
     "academic_paper",
@@ -180,8 +192,6 @@ async def _extract_with_llm(text: str, filename: str, api_key: str) -> dict[str,
     """
     import openai
 
-    client = openai.AsyncOpenAI(api_key=api_key)
-
     # Prepare prompt
     prompt = f"""Analyze this document and extract comprehensive metadata. Return a JSON object.
 
@@ -211,21 +221,25 @@ Extract the following fields (use null if not determinable):
 
 Return ONLY valid JSON, no markdown formatting."""
 
+    cache_key = llm_cache_key(LLM_MODEL, LLM_TEMPERATURE, LLM_SYSTEM_PROMPT, prompt, CACHE_SCHEMA_VERSION)
+
     try:
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a document analysis expert. Extract metadata accurately and return valid JSON."
-                },
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,
-            max_tokens=2000,
-        )
-
-        content = response.choices[0].message.content.strip()
+        raw_content = await get_cached_response(cache_key)
+        from_cache = raw_content is not None
+        if not from_cache:
+            client = openai.AsyncOpenAI(api_key=api_key)
+            response = await client.chat.completions.create(
+                model=LLM_MODEL,
+                messages=[
+                    {"role": "system", "content": LLM_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=LLM_TEMPERATURE,
+                max_tokens=2000,
+            )
+            raw_content = response.choices[0].message.content
+
+        content = raw_content.strip()
 
         # Clean up response
         if content.startswith("```"):
@@ -234,6 +248,8 @@ Return ONLY valid JSON, no markdown formatting."""
                 content = content[4:]
 
         metadata = json.loads(content)
+        if not from_cache:
+            await store_response(cache_key, LLM_MODEL, raw_content)
 
         # Validate and clean
         if isinstance(metadata.get("main_topics"), list):
@@ -242,7 +258,7 @@ Return ONLY valid JSON, no markdown formatting."""
             metadata["sectors"] = [s for s in metadata["sectors"] if s in SECTORS]
 
         metadata["llm_extracted"] = True
-        metadata["llm_model"] = "gpt-4o-mini"
+        metadata["llm_model"] = LLM_MODEL
 
         return metadata
 
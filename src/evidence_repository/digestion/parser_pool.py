@@ -0,0 +1,370 @@
+"""Process pool for CPU-bound document parsers.
+
+pypdf, python-docx, python-pptx, openpyxl and BeautifulSoup are pure CPU
+work; run on the event loop, one large PDF stalls every other coroutine in
+the polling worker or the API process. ParserPool runs them in a
+ProcessPoolExecutor instead:
+
+- Sized by ``parser_pool_workers`` (default min(4, CPU count)).
+- Each job has a deadline (``parser_timeout_seconds``) enforced inside the
+  worker with SIGALRM. A worker stuck in C code that misses it is killed by
+  the parent after a grace period, and the pool is restarted.
+- At most ``max_workers`` jobs are handed to the executor at a time, so the
+  parent's deadline runs from when a worker is free, not from submission;
+  jobs queued behind busy workers are never mistaken for stuck ones.
+- Workers are replaced after ``parser_max_tasks_per_worker`` jobs, so
+  memory fragmented by large files is handed back to the OS.
+- Every job reports the worker's peak RSS; above ``parser_max_rss_mb`` the
+  pool is recycled (a process's peak RSS never goes down).
+- ParserPoolStats separates time spent waiting for a free worker from
+  time spent parsing.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import resource
+import signal
+import sys
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from evidence_repository.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Time the parent waits past the deadline before killing the workers
+TIMEOUT_GRACE_SECONDS = 10.0
+
+# max_tasks_per_child is not supported with the "fork" start method
+START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+class ParserPoolError(Exception):
+    """Document could not be parsed in the pool."""
+
+
+class ParserTimeoutError(ParserPoolError):
+    """Parsing exceeded its deadline."""
+
+
+class ParserPoolUnavailableError(ParserPoolError):
+    """The pool could not be started or the job could not be submitted."""
+
+
+class _Deadline(BaseException):
+    """Raised by SIGALRM in a worker.
+
+    A BaseException, so the parsers' ``except Exception`` fallbacks do not
+    swallow it.
+    """
+
+
+@dataclass
+class JobOutcome:
+    """Result of one pool job, returned from a worker."""
+
+    result: Any
+    started_at: float  # Wall clock, comparable across processes
+    run_seconds: float
+    peak_rss_mb: float
+
+
+@dataclass
+class ParserPoolStats:
+    """Counters and timings for a parser pool."""
+
+    workers: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    timeouts: int = 0
+    in_flight: int = 0
+    pool_starts: int = 0
+    rss_recycles: int = 0
+
+    queue_wait_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    max_queue_wait_seconds: float = 0.0
+    max_parse_seconds: float = 0.0
+    peak_rss_mb: float = 0.0
+
+    def record(self, queue_wait: float, parse_seconds: float, peak_rss_mb: float) -> None:
+        """Record a completed job."""
+        self.completed += 1
+        self.queue_wait_seconds += queue_wait
+        self.parse_seconds += parse_seconds
+        self.max_queue_wait_seconds = max(self.max_queue_wait_seconds, queue_wait)
+        self.max_parse_seconds = max(self.max_parse_seconds, parse_seconds)
+        self.peak_rss_mb = max(self.peak_rss_mb, peak_rss_mb)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        completed = self.completed or 1
+        return {
+            "workers": self.workers,
+            "jobs": {
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "timeouts": self.timeouts,
+                "in_flight": self.in_flight,
+            },
+            "timing": {
+                "avg_queue_wait_ms": round(self.queue_wait_seconds / completed * 1000, 2),
+                "avg_parse_ms": round(self.parse_seconds / completed * 1000, 2),
+                "max_queue_wait_ms": round(self.max_queue_wait_seconds * 1000, 2),
+                "max_parse_ms": round(self.max_parse_seconds * 1000, 2),
+            },
+            "workers_lifecycle": {
+                "pool_starts": self.pool_starts,
+                "rss_recycles": self.rss_recycles,
+                "peak_rss_mb": round(self.peak_rss_mb, 1),
+            },
+        }
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _on_deadline(signum, frame) -> None:
+    raise _Deadline()
+
+
+def run_job(
+    fn: Callable[..., Any],
+    args: tuple,
+    timeout: float | None = None,
+) -> JobOutcome:
+    """Run a job function under a deadline (executed in a pool worker).
+
+    Args:
+        fn: Module-level function (picklable by reference).
+        args: Positional arguments for ``fn``.
+        timeout: Deadline in seconds (None for no deadline).
+
+    Returns:
+        JobOutcome with the function's result and timings.
+
+    Raises:
+        ParserTimeoutError: If the deadline passed.
+    """
+    started_at = time.time()
+    start = time.perf_counter()
+    use_alarm = bool(timeout) and hasattr(signal, "SIGALRM")
+
+    try:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, _on_deadline)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            result = fn(*args)
+        finally:
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    except _Deadline:
+        raise ParserTimeoutError(f"Job exceeded {timeout}s") from None
+
+    return JobOutcome(
+        result=result,
+        started_at=started_at,
+        run_seconds=time.perf_counter() - start,
+        peak_rss_mb=_peak_rss_mb(),
+    )
+
+
+class ParserPool:
+    """Run document parsers in a recycled process pool.
+
+    Usage:
+        pool = ParserPool()
+        text, metadata = await pool.parse("pdf", file_data, "report.pdf")
+        pages = await pool.run(extract_page_texts, path, 0, 50, label="report.pdf")
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        max_rss_mb: float | None = None,
+        max_tasks_per_worker: int | None = None,
+    ):
+        settings = get_settings()
+        self.max_workers = (
+            max_workers or settings.parser_pool_workers or min(4, os.cpu_count() or 1)
+        )
+        self.timeout = timeout or settings.parser_timeout_seconds
+        self.max_rss_mb = max_rss_mb or settings.parser_max_rss_mb
+        self.max_tasks_per_worker = (
+            max_tasks_per_worker or settings.parser_max_tasks_per_worker
+        )
+        self.stats = ParserPoolStats(workers=self.max_workers)
+        self._executor: ProcessPoolExecutor | None = None
+        # One worker slot semaphore per event loop using the pool
+        self._slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(START_METHOD),
+                max_tasks_per_child=self.max_tasks_per_worker,
+            )
+            self.stats.pool_starts += 1
+        return self._executor
+
+    def _worker_slots(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self.max_workers)
+        return slots
+
+    def _recycle(self, executor: ProcessPoolExecutor, terminate: bool = False) -> None:
+        """Retire an executor; the next job starts a fresh one.
+
+        Without ``terminate`` running jobs finish and idle workers exit.
+        With it, workers are killed and their other jobs fail.
+        """
+        if self._executor is not executor:
+            return  # Already replaced by a concurrent job
+        self._executor = None
+        if terminate:
+            # Stuck workers never see shutdown(), so kill them directly
+            for process in list((executor._processes or {}).values()):
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=terminate)
+
+    async def run(self, fn: Callable[..., Any], *args: Any, label: str) -> Any:
+        """Run a module-level function in the pool.
+
+        Args:
+            fn: Function to run; must be importable by the workers.
+            *args: Positional arguments (pickled to the worker).
+            label: Job description for logs and errors (e.g. the filename).
+
+        Returns:
+            The function's result.
+
+        Raises:
+            ParserTimeoutError: If the job exceeded the deadline.
+            ParserPoolUnavailableError: If the workers could not be started.
+            ParserPoolError: If the worker died.
+        """
+        loop = asyncio.get_running_loop()
+        submitted_at = time.time()
+        self.stats.submitted += 1
+        self.stats.in_flight += 1
+
+        try:
+            # Wait for a free worker before starting the deadline
+            async with self._worker_slots(loop):
+                try:
+                    executor = self._get_executor()
+                    job = loop.run_in_executor(executor, run_job, fn, args, self.timeout)
+                except OSError as e:
+                    # e.g. no /dev/shm for the executor's semaphores
+                    raise ParserPoolUnavailableError(f"Parser pool unavailable: {e}") from e
+                outcome = await asyncio.wait_for(job, self.timeout + TIMEOUT_GRACE_SECONDS)
+        except ParserTimeoutError:
+            self.stats.failed += 1
+            self.stats.timeouts += 1
+            raise ParserTimeoutError(f"Parsing {label} exceeded {self.timeout}s") from None
+        except asyncio.TimeoutError:
+            self.stats.failed += 1
+            self.stats.timeouts += 1
+            logger.error(f"Parser worker unresponsive on {label}; restarting pool")
+            self._recycle(executor, terminate=True)
+            raise ParserTimeoutError(f"Parsing {label} exceeded {self.timeout}s") from None
+        except BrokenProcessPool as e:
+            self.stats.failed += 1
+            self._recycle(executor)
+            raise ParserPoolError(f"Parser worker died while parsing {label}") from e
+        except Exception:
+            self.stats.failed += 1
+            raise
+        finally:
+            self.stats.in_flight -= 1
+
+        self.stats.record(
+            queue_wait=max(outcome.started_at - submitted_at, 0.0),
+            parse_seconds=outcome.run_seconds,
+            peak_rss_mb=outcome.peak_rss_mb,
+        )
+
+        if outcome.peak_rss_mb > self.max_rss_mb and self._executor is executor:
+            logger.warning(
+                f"Parser worker peak RSS {outcome.peak_rss_mb:.0f}MB exceeds "
+                f"{self.max_rss_mb}MB after {label}; recycling pool"
+            )
+            self.stats.rss_recycles += 1
+            self._recycle(executor)
+
+        return outcome.result
+
+    async def parse(
+        self,
+        parser_type: str,
+        file_data: bytes,
+        filename: str,
+    ) -> tuple[str, dict[str, Any]]:
+        """Parse a whole document in one worker.
+
+        Args:
+            parser_type: Key in parsers.SYNC_PARSERS.
+            file_data: Raw file bytes.
+            filename: Original filename.
+
+        Returns:
+            Tuple of (extracted_text, metadata_dict).
+
+        Raises:
+            ParserTimeoutError: If parsing exceeded the deadline.
+            ParserPoolError: If the worker died.
+        """
+        from evidence_repository.digestion.parsers import SYNC_PARSERS
+
+        return await self.run(
+            SYNC_PARSERS[parser_type], file_data, filename, label=filename
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool's workers."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_parser_pool: ParserPool | None = None
+
+
+def get_parser_pool() -> ParserPool:
+    """Get the process-wide parser pool (started on first use)."""
+    global _parser_pool
+    if _parser_pool is None:
+        _parser_pool = ParserPool()
+    return _parser_pool
+
+
+def get_parser_pool_stats() -> dict[str, Any] | None:
+    """Stats for the process-wide pool, or None if it was never used."""
+    return _parser_pool.stats.to_dict() if _parser_pool is not None else None
+
+
+def shutdown_parser_pool(wait: bool = True) -> None:
+    """Stop the process-wide parser pool's workers."""
+    global _parser_pool
+    if _parser_pool is not None:
+        _parser_pool.shutdown(wait=wait)
+        _parser_pool = None
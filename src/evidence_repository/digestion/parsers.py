@@ -11,6 +11,10 @@ Supported formats:
 - Images: Vision API for OCR
 - HTML: BeautifulSoup with link extraction
 - Plain text: encoding detection
+
+Each format has a synchronous ``_parse_*`` implementation (run in parser
+pool workers, see digestion.parser_pool) and an async ``parse_*`` wrapper
+that runs it in the calling process.
 """
 
 import io
@@ -19,6 +23,19 @@ import re
 from pathlib import Path
 from typing import Any
 
+from evidence_repository.config import get_settings
+from evidence_repository.digestion.parser_pool import (
+    ParserPoolError,
+    ParserPoolUnavailableError,
+    get_parser_pool,
+)
+from evidence_repository.digestion.pdf_pages import (
+    iter_pdf_pages,
+    pdf_on_disk,
+    read_pdf_info,
+    use_page_shards,
+)
+
 logger = logging.getLogger(__name__)
 
 # MIME type to parser mapping
@@ -41,6 +58,9 @@ PARSER_MAP = {
     "image/gif": "image",
 }
 
+# Parsers heavy enough to run in the process pool
+POOLED_PARSERS = frozenset({"pdf", "docx", "pptx", "xlsx", "html"})
+
 
 async def parse_document(
     file_data: bytes,
@@ -49,6 +69,10 @@ async def parse_document(
 ) -> tuple[str, dict[str, Any]]:
     """Parse document and extract text content.
 
+    CPU-bound formats (see POOLED_PARSERS) run in the parser process pool
+    so they do not block the event loop; the rest run in-process. Large
+    PDFs are split into page shards parsed in parallel.
+
     Args:
         file_data: Raw file bytes.
         content_type: MIME type of the file.
@@ -84,19 +108,26 @@ async def parse_document(
         parser_type = ext_map.get(ext, "text")
 
     # Dispatch to appropriate parser
-    parsers = {
-        "pdf": parse_pdf,
-        "docx": parse_docx,
-        "pptx": parse_pptx,
-        "xlsx": parse_xlsx,
-        "csv": parse_csv,
-        "text": parse_text,
-        "html": parse_html,
-        "image": parse_image,
-    }
-
-    parser_func = parsers.get(parser_type, parse_text)
-    text, metadata = await parser_func(file_data, filename)
+    runner = parser_type if parser_type in SYNC_PARSERS else "text"
+
+    if runner in POOLED_PARSERS and get_settings().parser_pool_enabled:
+        try:
+            if runner == "pdf":
+                text, metadata = await _parse_pdf_in_pool(file_data, filename)
+            else:
+                text, metadata = await get_parser_pool().parse(runner, file_data, filename)
+        except ParserPoolUnavailableError as e:
+            logger.warning(f"{e}; parsing {filename} in-process")
+            text, metadata = SYNC_PARSERS[runner](file_data, filename)
+        except ParserPoolError as e:
+            logger.error(f"{runner.upper()} parsing failed for {filename}: {e}")
+            text, metadata = f"[{runner.upper()} parsing error: {e}]", {}
+        except Exception as e:
+            # Pool-side failure (e.g. the job could not be pickled)
+            logger.warning(f"Parser pool failed on {filename} ({e!r}); parsing in-process")
+            text, metadata = SYNC_PARSERS[runner](file_data, filename)
+    else:
+        text, metadata = SYNC_PARSERS[runner](file_data, filename)
 
     metadata["parser"] = parser_type
     metadata["word_count"] = len(text.split()) if text else 0
@@ -105,7 +136,7 @@ async def parse_document(
     return text, metadata
 
 
-async def parse_pdf(file_data: bytes, filename: str) -> tuple[str, dict]:
+def _parse_pdf(file_data: bytes, filename: str) -> tuple[str, dict]:
     """Parse PDF document.
 
     Uses pypdf as primary parser with fallback for scanned documents.
@@ -113,39 +144,80 @@ async def parse_pdf(file_data: bytes, filename: str) -> tuple[str, dict]:
     import pypdf
 
     metadata = {"page_count": 0}
-    text_parts = []
 
     try:
         reader = pypdf.PdfReader(io.BytesIO(file_data))
         metadata["page_count"] = len(reader.pages)
 
-        for page_num, page in enumerate(reader.pages):
-            page_text = page.extract_text() or ""
-            if page_text.strip():
-                text_parts.append(f"--- Page {page_num + 1} ---\n{page_text}")
-
-        full_text = "\n\n".join(text_parts)
-
-        # Check if we got meaningful text
-        if len(full_text.strip()) < 100 and metadata["page_count"] > 0:
-            logger.info(f"PDF appears to be scanned, attempting OCR: {filename}")
-            # Could integrate with LovePDF or other OCR service here
-            metadata["needs_ocr"] = True
-
-        return full_text, metadata
+        page_texts = [page.extract_text() or "" for page in reader.pages]
+        return _join_pdf_pages(page_texts, metadata, filename), metadata
 
     except Exception as e:
         logger.error(f"PDF parsing failed for {filename}: {e}")
         return f"[PDF parsing error: {e}]", metadata
 
 
-async def parse_docx(file_data: bytes, filename: str) -> tuple[str, dict]:
+def _join_pdf_pages(page_texts: list[str], metadata: dict, filename: str) -> str:
+    """Join page texts under page headers, flagging scanned PDFs for OCR.
+
+    Sets ``metadata["page_breaks"]`` to the offset of each page's header in
+    the joined text. Pages without text are skipped, so their break is the
+    start of the next page that has text.
+    """
+    separator = "\n\n"
+    parts: list[str] = []
+    page_breaks: list[int] = []
+    offset = 0
+    for page_num, page_text in enumerate(page_texts, 1):
+        start = offset + len(separator) if parts else offset
+        page_breaks.append(start)
+        if page_text.strip():
+            part = f"--- Page {page_num} ---\n{page_text}"
+            parts.append(part)
+            offset = start + len(part)
+
+    full_text = separator.join(parts)
+    metadata["page_breaks"] = [min(start, len(full_text)) for start in page_breaks]
+
+    # Check if we got meaningful text
+    if len(full_text.strip()) < 100 and metadata["page_count"] > 0:
+        logger.info(f"PDF appears to be scanned, attempting OCR: {filename}")
+        # Could integrate with LovePDF or other OCR service here
+        metadata["needs_ocr"] = True
+
+    return full_text
+
+
+async def _parse_pdf_in_pool(file_data: bytes, filename: str) -> tuple[str, dict]:
+    """Parse a PDF in the parser pool, page-parallel when it is large."""
+    pool = get_parser_pool()
+
+    async with pdf_on_disk(file_data) as path:
+        try:
+            info = await pool.run(read_pdf_info, str(path), label=filename)
+        except ParserPoolError:
+            raise
+        except Exception:
+            info = None  # Unreadable; the whole-file parser reports the error
+
+        if info is None or not use_page_shards(info["page_count"]):
+            return await pool.parse("pdf", file_data, filename)
+
+        metadata = {"page_count": info["page_count"]}
+        page_texts = [
+            page.text async for page in iter_pdf_pages(path, info["page_count"], pool)
+        ]
+
+    return _join_pdf_pages(page_texts, metadata, filename), metadata
+
+
+def _parse_docx(file_data: bytes, filename: str) -> tuple[str, dict]:
     """Parse DOCX document with structure extraction."""
     try:
         from docx import Document
     except ImportError:
         logger.warning("python-docx not installed, falling back to basic extraction")
-        return await parse_text(file_data, filename)
+        return _parse_text(file_data, filename)
 
     metadata = {"page_count": None}
     text_parts = []
@@ -188,13 +260,13 @@ async def parse_docx(file_data: bytes, filename: str) -> tuple[str, dict]:
         return f"[DOCX parsing error: {e}]", metadata
 
 
-async def parse_pptx(file_data: bytes, filename: str) -> tuple[str, dict]:
+def _parse_pptx(file_data: bytes, filename: str) -> tuple[str, dict]:
     """Parse PowerPoint document with slide structure."""
     try:
         from pptx import Presentation
     except ImportError:
         logger.warning("python-pptx not installed, falling back to basic extraction")
-        return await parse_text(file_data, filename)
+        return _parse_text(file_data, filename)
 
     metadata = {"page_count": 0}
     text_parts = []
@@ -227,7 +299,7 @@ async def parse_pptx(file_data: bytes, filename: str) -> tuple[str, dict]:
         return f"[PPTX parsing error: {e}]", metadata
 
 
-async def parse_xlsx(file_data: bytes, filename: str) -> tuple[str, dict]:
+def _parse_xlsx(file_data: bytes, filename: str) -> tuple[str, dict]:
     """Parse Excel spreadsheet with structure analysis."""
     try:
         import openpyxl
@@ -239,7 +311,8 @@ async def parse_xlsx(file_data: bytes, filename: str) -> tuple[str, dict]:
     text_parts = []
 
     try:
-        wb = openpyxl.load_workbook(io.BytesIO(file_data), data_only=True)
+        # Read-only mode streams rows instead of building every cell object
+        wb = openpyxl.load_workbook(io.BytesIO(file_data), data_only=True, read_only=True)
         metadata["sheet_count"] = len(wb.worksheets)
         metadata["sheet_names"] = wb.sheetnames
 
@@ -248,6 +321,8 @@ async def parse_xlsx(file_data: bytes, filename: str) -> tuple[str, dict]:
             empty_rows = 0
             max_empty = 5  # Stop after 5 consecutive empty rows
 
+            # Don't trust the declared <dimension>; many writers leave it stale
+            sheet.reset_dimensions()
             for row in sheet.iter_rows(values_only=True):
                 row_values = [str(cell) if cell is not None else "" for cell in row]
 
@@ -262,6 +337,7 @@ async def parse_xlsx(file_data: bytes, filename: str) -> tuple[str, dict]:
             if len(sheet_text) > 1:
                 text_parts.append("\n".join(sheet_text))
 
+        wb.close()
         return "\n\n".join(text_parts), metadata
 
     except Exception as e:
@@ -269,7 +345,7 @@ async def parse_xlsx(file_data: bytes, filename: str) -> tuple[str, dict]:
         return f"[XLSX parsing error: {e}]", metadata
 
 
-async def parse_csv(file_data: bytes, filename: str) -> tuple[str, dict]:
+def _parse_csv(file_data: bytes, filename: str) -> tuple[str, dict]:
     """Parse CSV file with structure detection."""
     import csv
 
@@ -313,7 +389,7 @@ async def parse_csv(file_data: bytes, filename: str) -> tuple[str, dict]:
         return f"[CSV parsing error: {e}]", metadata
 
 
-async def parse_text(file_data: bytes, filename: str) -> tuple[str, dict]:
+def _parse_text(file_data: bytes, filename: str) -> tuple[str, dict]:
     """Parse plain text file with encoding detection."""
     metadata = {}
 
@@ -332,7 +408,7 @@ async def parse_text(file_data: bytes, filename: str) -> tuple[str, dict]:
     return text, metadata
 
 
-async def parse_html(file_data: bytes, filename: str) -> tuple[str, dict]:
+def _parse_html(file_data: bytes, filename: str) -> tuple[str, dict]:
     """Parse HTML with link extraction."""
     try:
         from bs4 import BeautifulSoup
@@ -386,7 +462,7 @@ async def parse_html(file_data: bytes, filename: str) -> tuple[str, dict]:
         return f"[HTML parsing error: {e}]", metadata
 
 
-async def parse_image(file_data: bytes, filename: str) -> tuple[str, dict]:
+def _parse_image(file_data: bytes, filename: str) -> tuple[str, dict]:
     """Parse image using OCR.
 
     Note: Full OCR requires additional setup (Tesseract or cloud API).
@@ -415,3 +491,55 @@ async def parse_image(file_data: bytes, filename: str) -> tuple[str, dict]:
     metadata["needs_ocr"] = True
 
     return text, metadata
+
+
+SYNC_PARSERS = {
+    "pdf": _parse_pdf,
+    "docx": _parse_docx,
+    "pptx": _parse_pptx,
+    "xlsx": _parse_xlsx,
+    "csv": _parse_csv,
+    "text": _parse_text,
+    "html": _parse_html,
+    "image": _parse_image,
+}
+
+
+async def parse_pdf(file_data: bytes, filename: str) -> tuple[str, dict]:
+    """Parse PDF document in-process."""
+    return _parse_pdf(file_data, filename)
+
+
+async def parse_docx(file_data: bytes, filename: str) -> tuple[str, dict]:
+    """Parse DOCX document in-process."""
+    return _parse_docx(file_data, filename)
+
+
+async def parse_pptx(file_data: bytes, filename: str) -> tuple[str, dict]:
+    """Parse PowerPoint document in-process."""
+    return _parse_pptx(file_data, filename)
+
+
+async def parse_xlsx(file_data: bytes, filename: str) -> tuple[str, dict]:
+    """Parse Excel spreadsheet in-process."""
+    return _parse_xlsx(file_data, filename)
+
+
+async def parse_csv(file_data: bytes, filename: str) -> tuple[str, dict]:
+    """Parse CSV file in-process."""
+    return _parse_csv(file_data, filename)
+
+
+async def parse_text(file_data: bytes, filename: str) -> tuple[str, dict]:
+    """Parse plain text file in-process."""
+    return _parse_text(file_data, filename)
+
+
+async def parse_html(file_data: bytes, filename: str) -> tuple[str, dict]:
+    """Parse HTML in-process."""
+    return _parse_html(file_data, filename)
+
+
+async def parse_image(file_data: bytes, filename: str) -> tuple[str, dict]:
+    """Parse image in-process."""
+    return _parse_image(file_data, filename)
@@ -0,0 +1,167 @@
+"""Page-sharded PDF text extraction.
+
+Large PDFs are split into page ranges (``pdf_pages_per_shard``) that are
+extracted in parallel by the parser pool; every worker opens the same
+temporary file, so the document bytes are written once rather than pickled
+per shard. Pages are yielded in order as soon as their shard finishes, each
+with the offset it starts at in the joined text, so span generation
+(spans.text_span_generator.PageSpanStream) can start before the last page
+is extracted.
+
+Joined text is pages separated by PAGE_SEPARATOR; ``page_breaks`` lists the
+offset where each page starts (page 1 at 0), which TextSpanGenerator uses
+for ``page_hint``.
+"""
+
+import asyncio
+import tempfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from evidence_repository.config import get_settings
+from evidence_repository.digestion.parser_pool import ParserPool, get_parser_pool
+
+PAGE_SEPARATOR = "\n\n"
+
+
+@dataclass
+class PdfPage:
+    """Text of one PDF page."""
+
+    number: int  # 1-indexed
+    text: str
+    offset: int  # Start offset in the joined text
+
+
+def read_pdf_info(path: str) -> dict[str, Any]:
+    """Read page count and document metadata (runs in a pool worker)."""
+    import pypdf
+
+    reader = pypdf.PdfReader(path)
+    info: dict[str, Any] = {"page_count": len(reader.pages)}
+    if reader.metadata:
+        info["metadata"] = {
+            key: value
+            for key, value in {
+                "title": reader.metadata.title,
+                "author": reader.metadata.author,
+                "subject": reader.metadata.subject,
+                "creator": reader.metadata.creator,
+                "producer": reader.metadata.producer,
+            }.items()
+            if value
+        }
+    return info
+
+
+def extract_page_texts(path: str, start: int, end: int) -> list[str]:
+    """Extract text of pages [start, end) (runs in a pool worker)."""
+    import pypdf
+
+    reader = pypdf.PdfReader(path)
+    return [reader.pages[index].extract_text() or "" for index in range(start, end)]
+
+
+def page_shards(page_count: int, shard_size: int) -> list[tuple[int, int]]:
+    """Split pages into [start, end) ranges of at most ``shard_size`` pages."""
+    return [
+        (start, min(start + shard_size, page_count))
+        for start in range(0, page_count, shard_size)
+    ]
+
+
+def join_pages(texts: list[str], separator: str = PAGE_SEPARATOR) -> tuple[str, list[int]]:
+    """Join page texts and compute page_breaks.
+
+    Returns:
+        Tuple of (text, page_breaks) where page_breaks are the offsets at
+        which each page starts.
+    """
+    page_breaks: list[int] = []
+    offset = 0
+    for index, text in enumerate(texts):
+        if index:
+            offset += len(separator)
+        page_breaks.append(offset)
+        offset += len(text)
+    return separator.join(texts), page_breaks
+
+
+def use_page_shards(page_count: int) -> bool:
+    """Whether a PDF is large enough to extract page-parallel."""
+    settings = get_settings()
+    return settings.parser_pool_enabled and page_count >= settings.pdf_parallel_min_pages
+
+
+def _write_temp_pdf(data: bytes) -> Path:
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        f.write(data)
+        return Path(f.name)
+
+
+@asynccontextmanager
+async def pdf_on_disk(data: bytes) -> AsyncIterator[Path]:
+    """Write PDF bytes to a temporary file shared with pool workers."""
+    path = await asyncio.to_thread(_write_temp_pdf, data)
+    try:
+        yield path
+    finally:
+        await asyncio.to_thread(path.unlink, True)
+
+
+async def iter_pdf_pages(
+    path: Path,
+    page_count: int,
+    pool: ParserPool | None = None,
+    shard_size: int | None = None,
+    separator: str = PAGE_SEPARATOR,
+) -> AsyncIterator[PdfPage]:
+    """Extract pages in parallel shards, yielding them in page order.
+
+    All shards are submitted up front; pages are yielded as soon as every
+    earlier shard has completed.
+
+    Args:
+        path: PDF on disk (see pdf_on_disk).
+        page_count: Number of pages (see read_pdf_info).
+        pool: Parser pool (default: the process-wide pool).
+        shard_size: Pages per job (default from settings).
+        separator: Separator the caller joins pages with (for offsets).
+
+    Yields:
+        PdfPage for each page, in order.
+
+    Raises:
+        ParserPoolError: If a shard timed out or its worker died.
+    """
+    pool = pool or get_parser_pool()
+    shard_size = shard_size or get_settings().pdf_pages_per_shard
+    shards = page_shards(page_count, shard_size)
+    jobs = [
+        asyncio.ensure_future(
+            pool.run(
+                extract_page_texts,
+                str(path),
+                start,
+                end,
+                label=f"{path.name} pages {start + 1}-{end}",
+            )
+        )
+        for start, end in shards
+    ]
+
+    try:
+        offset = 0
+        for (start, _), job in zip(shards, jobs):
+            for index, text in enumerate(await job):
+                number = start + index + 1
+                if number > 1:
+                    offset += len(separator)
+                yield PdfPage(number=number, text=text, offset=offset)
+                offset += len(text)
+    finally:
+        for job in jobs:
+            job.cancel()
+        await asyncio.gather(*jobs, return_exceptions=True)
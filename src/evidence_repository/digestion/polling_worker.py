@@ -5,6 +5,8 @@ documents without external queue dependencies.
 
 Key features:
 - Polls database for PENDING documents
+- Atomic SKIP LOCKED claims with lease renewal, so several workers can
+  poll the same database (see digestion.claims)
 - Processes documents using shared DigestionPipeline
 - Self-triggering for batch processing
 - Graceful shutdown handling
@@ -19,12 +21,22 @@ import sys
 from datetime import datetime
 from typing import Callable
 
-from sqlalchemy import select, update, func
+from sqlalchemy import inspect, select, func
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
 from evidence_repository.config import get_settings
 from evidence_repository.models.document import Document, DocumentVersion, ExtractionStatus
+from evidence_repository.digestion.claims import (
+    LeaseHeartbeat,
+    claim_versions,
+    fail_exhausted_claims,
+    finish_claim,
+    make_worker_id,
+    unclaim_versions,
+)
+from evidence_repository.digestion.parser_pool import get_parser_pool_stats, shutdown_parser_pool
+from evidence_repository.extraction.llm_cache import get_llm_cache_stats
 from evidence_repository.digestion.pipeline import DigestionPipeline, DigestResult
 
 logger = logging.getLogger(__name__)
@@ -64,10 +76,13 @@ class PollingWorker:
         self._shutdown_requested = False
         self._current_job: str | None = None
         self._hostname = socket.gethostname()
+        self._worker_id = make_worker_id()
         self._stats = {
             "started_at": None,
             "documents_processed": 0,
             "documents_failed": 0,
+            "claims_lost": 0,
+            "claims_exhausted": 0,
             "iterations": 0,
             "last_poll_at": None,
         }
@@ -107,6 +122,7 @@ class PollingWorker:
         logger.info("Evidence Repository Polling Worker")
         logger.info("=" * 60)
         logger.info(f"Hostname: {self._hostname}")
+        logger.info(f"Worker ID: {self._worker_id}")
         logger.info(f"Poll interval: {self.poll_interval}s")
         logger.info(f"Batch size: {self.batch_size}")
         logger.info(f"Max iterations: {self.max_iterations or 'unlimited'}")
@@ -143,38 +159,46 @@ class PollingWorker:
             await asyncio.sleep(self.poll_interval)
 
         logger.info(f"[{self._hostname}] Worker shutting down")
+        self._stats["parser_pool"] = get_parser_pool_stats()
+        self._stats["llm_cache"] = get_llm_cache_stats()
+        shutdown_parser_pool()
         logger.info(f"Stats: {self._stats}")
 
         return self._stats
 
     async def _poll_and_process(self) -> int:
-        """Poll for pending documents and process them.
+        """Claim pending documents and process them.
+
+        Versions are claimed atomically (FOR UPDATE SKIP LOCKED), so
+        concurrent workers never receive the same version.
 
         Returns:
             Number of documents processed.
         """
         async with await self._get_session() as session:
-            # Find pending documents
-            pending = await session.execute(
-                select(DocumentVersion)
-                .where(DocumentVersion.extraction_status == ExtractionStatus.PENDING)
-                .order_by(DocumentVersion.created_at)
-                .limit(self.batch_size)
-            )
-            versions = pending.scalars().all()
+            self._stats["claims_exhausted"] += await fail_exhausted_claims(session)
+
+            versions = await claim_versions(session, self._worker_id, self.batch_size)
 
             if not versions:
                 return 0
 
-            logger.info(f"[{self._hostname}] Found {len(versions)} pending documents")
+            logger.info(f"[{self._hostname}] Claimed {len(versions)} pending documents")
+            version_ids = [v.id for v in versions]
 
             processed = 0
-            for version in versions:
+            for index, version in enumerate(versions):
                 if self._shutdown_requested:
+                    # Hand unprocessed claims back instead of waiting for lease expiry
+                    await unclaim_versions(session, version_ids[index:], self._worker_id)
                     break
 
                 try:
-                    await self._process_version(session, version)
+                    if inspect(version).expired:
+                        # An earlier rollback in this batch expired the instance
+                        await session.refresh(version)
+                    if await self._process_version(session, version) is None:
+                        continue
                     processed += 1
                     self._stats["documents_processed"] += 1
                 except Exception as e:
@@ -187,7 +211,7 @@ class PollingWorker:
         self,
         session: AsyncSession,
         version: DocumentVersion,
-    ) -> DigestResult:
+    ) -> DigestResult | None:
         """Process a single document version.
 
         Args:
@@ -195,57 +219,38 @@ class PollingWorker:
             version: DocumentVersion to process.
 
         Returns:
-            DigestResult from processing.
+            DigestResult from processing, or None if the claim was lost and
+            the work was rolled back.
         """
-        logger.info(f"[{self._hostname}] Processing version {version.id}")
-        self._current_job = str(version.id)
-
-        try:
-            # Mark as processing (prevents duplicate processing)
-            await session.execute(
-                update(DocumentVersion)
-                .where(DocumentVersion.id == version.id)
-                .values(extraction_status=ExtractionStatus.PROCESSING)
-            )
-            await session.commit()
-
-            # Get document
-            doc_result = await session.execute(
-                select(Document).where(Document.id == version.document_id)
-            )
-            document = doc_result.scalar_one()
-
-            # Initialize pipeline
-            pipeline = DigestionPipeline(db=session)
-
-            # Download file
-            file_data = await pipeline.storage.download(version.storage_path)
-
-            # Run pipeline steps
-            result = DigestResult(
-                document_id=document.id,
-                version_id=version.id,
-                started_at=datetime.utcnow(),
-            )
+        version_id = version.id
+        logger.info(f"[{self._hostname}] Processing version {version_id}")
+        self._current_job = str(version_id)
 
-            # Parse
-            await pipeline._step_parse(document, version, file_data, result)
+        heartbeat = LeaseHeartbeat(self._session_maker, version_id, self._worker_id)
 
-            # Build sections
-            await pipeline._step_build_sections(version, result)
-
-            # Generate embeddings
-            await pipeline._step_generate_embeddings(version, result)
+        try:
+            async with heartbeat:
+                result = await self._run_pipeline(session, version)
+
+            if heartbeat.lost or not await finish_claim(
+                session, version_id, self._worker_id, ExtractionStatus.COMPLETED
+            ):
+                # Another worker reclaimed the version; drop this run's
+                # pending work so the next commit in the batch skips it
+                await session.rollback()
+                self._stats["claims_lost"] += 1
+                logger.warning(
+                    f"[{self._hostname}] Discarded version {version_id} after losing its claim"
+                )
+                return None
 
-            # Mark complete
-            version.extraction_status = ExtractionStatus.COMPLETED
             await session.commit()
 
             result.status = "ready"
             result.completed_at = datetime.utcnow()
 
             logger.info(
-                f"[{self._hostname}] Completed version {version.id} - "
+                f"[{self._hostname}] Completed version {version_id} - "
                 f"text: {result.text_length} chars, "
                 f"sections: {result.section_count}, "
                 f"embeddings: {result.embedding_count}"
@@ -254,29 +259,71 @@ class PollingWorker:
             return result
 
         except Exception as e:
-            # Mark as failed
-            await session.execute(
-                update(DocumentVersion)
-                .where(DocumentVersion.id == version.id)
-                .values(
-                    extraction_status=ExtractionStatus.FAILED,
-                    extraction_error=str(e),
-                )
+            # Drop partial output, then mark as failed (unless another
+            # worker has reclaimed it)
+            await session.rollback()
+            await finish_claim(
+                session, version_id, self._worker_id, ExtractionStatus.FAILED, str(e)
             )
             await session.commit()
 
-            logger.error(f"[{self._hostname}] Version {version.id} failed: {e}")
+            logger.error(f"[{self._hostname}] Version {version_id} failed: {e}")
             raise
 
         finally:
             self._current_job = None
 
+    async def _run_pipeline(
+        self,
+        session: AsyncSession,
+        version: DocumentVersion,
+    ) -> DigestResult:
+        """Run the digestion steps for a claimed version.
+
+        Args:
+            session: Database session.
+            version: Claimed DocumentVersion.
+
+        Returns:
+            DigestResult from processing.
+        """
+        # Get document
+        doc_result = await session.execute(
+            select(Document).where(Document.id == version.document_id)
+        )
+        document = doc_result.scalar_one()
+
+        # Initialize pipeline
+        pipeline = DigestionPipeline(db=session)
+
+        # Download file
+        file_data = await pipeline.storage.download(version.storage_path)
+
+        # Run pipeline steps
+        result = DigestResult(
+            document_id=document.id,
+            version_id=version.id,
+            started_at=datetime.utcnow(),
+        )
+
+        # Parse
+        await pipeline._step_parse(document, version, file_data, result)
+
+        # Build sections
+        await pipeline._step_build_sections(version, result)
+
+        # Generate embeddings
+        await pipeline._step_generate_embeddings(version, result)
+
+        return result
+
     @property
     def stats(self) -> dict:
         """Get current worker statistics."""
         return {
             **self._stats,
             "hostname": self._hostname,
+            "worker_id": self._worker_id,
             "current_job": self._current_job,
             "shutdown_requested": self._shutdown_requested,
         }
@@ -15,9 +15,21 @@ import logging
 from typing import Any
 
 from evidence_repository.config import get_settings
+from evidence_repository.extraction.llm_cache import (
+    get_cached_response,
+    llm_cache_key,
+    store_response,
+)
 
 logger = logging.getLogger(__name__)
 
+LLM_MODEL = "gpt-4o-mini"
+LLM_TEMPERATURE = 0.2
+LLM_SYSTEM_PROMPT = "You are a fact-checking and credibility assessment expert. Analyze documents objectively."
+
+# LLM cache schema version; bump when the prompt's response shape changes
+CACHE_SCHEMA_VERSION = "truthfulness-1"
+
 
 async def assess_truthfulness(
     text: str,
@@ -126,9 +138,6 @@ async def _llm_assessment(
     """
     import openai
 
-    settings = get_settings()
-    client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
-
     prompt = f"""Analyze this document for truthfulness and credibility. Return a JSON assessment.
 
 Document (first 15000 chars):
@@ -165,20 +174,24 @@ Return ONLY valid JSON with these fields:
   "summary": "Brief assessment summary"
 }}"""
 
-    response = await client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {
-                "role": "system",
-                "content": "You are a fact-checking and credibility assessment expert. Analyze documents objectively."
-            },
-            {"role": "user", "content": prompt}
-        ],
-        temperature=0.2,
-        max_tokens=2000,
-    )
-
-    content = response.choices[0].message.content.strip()
+    cache_key = llm_cache_key(LLM_MODEL, LLM_TEMPERATURE, LLM_SYSTEM_PROMPT, prompt, CACHE_SCHEMA_VERSION)
+    raw_content = await get_cached_response(cache_key)
+    from_cache = raw_content is not None
+    if not from_cache:
+        settings = get_settings()
+        client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
+        response = await client.chat.completions.create(
+            model=LLM_MODEL,
+            messages=[
+                {"role": "system", "content": LLM_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=LLM_TEMPERATURE,
+            max_tokens=2000,
+        )
+        raw_content = response.choices[0].message.content
+
+    content = raw_content.strip()
 
     # Clean up response
     if content.startswith("```"):
@@ -187,7 +200,9 @@ Return ONLY valid JSON with these fields:
             content = content[4:]
 
     assessment = json.loads(content)
+    if not from_cache:
+        await store_response(cache_key, LLM_MODEL, raw_content)
     assessment["method"] = "llm"
-    assessment["llm_model"] = "gpt-4o-mini"
+    assessment["llm_model"] = LLM_MODEL
 
     return assessment
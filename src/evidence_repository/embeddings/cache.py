@@ -0,0 +1,275 @@
+"""Query embedding cache.
+
+Search traffic reissues the same queries constantly, and every one of them
+costs an OpenAI round trip to embed. This module provides a small cache that
+``OpenAIEmbeddingClient.embed_text`` consults before calling the API.
+
+Tiers:
+- ``InMemoryEmbeddingCache``: per-process LRU with TTL (always on when
+  caching is enabled). Vectors are held packed as float32 (~6 KB for 1536
+  dimensions instead of ~49 KB as a list of Python floats).
+- ``RedisEmbeddingCache``: optional shared tier so API replicas and workers
+  share hits. Vectors are stored as packed float32.
+- ``TieredEmbeddingCache``: memory first, then Redis (hits are promoted).
+
+Keys combine model, dimensions and a hash of the normalized text, so a
+model or dimension change never returns a stale vector. Cache failures are
+counted and logged, never raised: a broken cache must not break search.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+
+from evidence_repository.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keying (Unicode NFC, collapsed whitespace).
+
+    Case is preserved: embeddings are case-sensitive.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def make_cache_key(model: str, dimensions: int, text: str) -> str:
+    """Build the cache key for an embedding request."""
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"emb:{model}:{dimensions}:{digest}"
+
+
+def pack_embedding(embedding: list[float]) -> bytes:
+    """Pack an embedding as float32 bytes."""
+    return array("f", embedding).tobytes()
+
+
+def unpack_embedding(data: bytes) -> list[float]:
+    """Unpack float32 bytes into an embedding."""
+    values = array("f")
+    values.frombytes(data)
+    return values.tolist()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for an embedding cache."""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to JSON-serializable dict."""
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class EmbeddingCache(ABC):
+    """Abstract embedding cache."""
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+
+    @abstractmethod
+    async def get(self, key: str) -> list[float] | None:
+        """Get a cached embedding, or None on miss."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, embedding: list[float]) -> None:
+        """Store an embedding."""
+        pass
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        return {"backend": self.__class__.__name__, **self.stats.to_dict()}
+
+
+class InMemoryEmbeddingCache(EmbeddingCache):
+    """Per-process LRU cache with TTL."""
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 86400):
+        """Initialize in-memory cache.
+
+        Args:
+            max_entries: Maximum cached embeddings before LRU eviction.
+            ttl_seconds: Entry lifetime in seconds.
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        # Clients are shared across threads in sync worker paths
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> list[float] | None:
+        """Get a cached embedding, or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            expires_at, packed = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return unpack_embedding(packed)
+
+    async def set(self, key: str, embedding: list[float]) -> None:
+        """Store an embedding, evicting the least recently used entry if full."""
+        packed = pack_embedding(embedding)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, packed)
+            self._entries.move_to_end(key)
+            self.stats.sets += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        """Get cache statistics including current size."""
+        return {**super().get_stats(), "size": len(self), "max_entries": self.max_entries}
+
+
+class RedisEmbeddingCache(EmbeddingCache):
+    """Shared Redis cache storing packed float32 vectors."""
+
+    def __init__(self, redis_url: str, ttl_seconds: int = 86400):
+        """Initialize Redis cache.
+
+        Args:
+            redis_url: Redis connection URL.
+            ttl_seconds: Key expiry in seconds.
+        """
+        super().__init__()
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self._client = None
+
+    @property
+    def client(self):
+        """Lazy-create the async Redis client."""
+        if self._client is None:
+            from redis.asyncio import Redis
+
+            self._client = Redis.from_url(self.redis_url, decode_responses=False)
+        return self._client
+
+    async def get(self, key: str) -> list[float] | None:
+        """Get a cached embedding from Redis."""
+        try:
+            data = await self.client.get(key)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.debug(f"Redis embedding cache get failed: {e}")
+            return None
+
+        if data is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return unpack_embedding(data)
+
+    async def set(self, key: str, embedding: list[float]) -> None:
+        """Store an embedding in Redis with expiry."""
+        try:
+            await self.client.set(key, pack_embedding(embedding), ex=self.ttl_seconds)
+            self.stats.sets += 1
+        except Exception as e:
+            self.stats.errors += 1
+            logger.debug(f"Redis embedding cache set failed: {e}")
+
+
+class TieredEmbeddingCache(EmbeddingCache):
+    """Memory tier backed by a shared tier; shared hits are promoted."""
+
+    def __init__(self, memory: InMemoryEmbeddingCache, shared: EmbeddingCache):
+        """Initialize tiered cache.
+
+        Args:
+            memory: Fast per-process tier.
+            shared: Slower shared tier (e.g. Redis).
+        """
+        super().__init__()
+        self.memory = memory
+        self.shared = shared
+
+    async def get(self, key: str) -> list[float] | None:
+        """Get from memory, then the shared tier."""
+        embedding = await self.memory.get(key)
+        if embedding is None:
+            embedding = await self.shared.get(key)
+            if embedding is not None:
+                await self.memory.set(key, embedding)
+
+        if embedding is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return embedding
+
+    async def set(self, key: str, embedding: list[float]) -> None:
+        """Write through to both tiers."""
+        await self.memory.set(key, embedding)
+        await self.shared.set(key, embedding)
+        self.stats.sets += 1
+
+    def get_stats(self) -> dict:
+        """Get combined and per-tier statistics."""
+        return {
+            **super().get_stats(),
+            "memory": self.memory.get_stats(),
+            "shared": self.shared.get_stats(),
+        }
+
+
+@lru_cache
+def get_embedding_cache() -> EmbeddingCache | None:
+    """Get the process-wide query embedding cache.
+
+    Returns:
+        Configured cache, or None when caching is disabled.
+    """
+    settings = get_settings()
+    if not settings.embedding_cache_enabled:
+        return None
+
+    memory = InMemoryEmbeddingCache(
+        max_entries=settings.embedding_cache_max_entries,
+        ttl_seconds=settings.embedding_cache_ttl_seconds,
+    )
+    if not settings.embedding_cache_redis_enabled:
+        return memory
+
+    return TieredEmbeddingCache(
+        memory=memory,
+        shared=RedisEmbeddingCache(
+            redis_url=settings.redis_url,
+            ttl_seconds=settings.embedding_cache_ttl_seconds,
+        ),
+    )
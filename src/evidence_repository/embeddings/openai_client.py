@@ -8,6 +8,12 @@ from typing import Sequence
 from openai import AsyncOpenAI, RateLimitError, APIError, APIConnectionError, APITimeoutError
 
 from evidence_repository.config import get_settings
+from evidence_repository.embeddings.cache import (
+    EmbeddingCache,
+    get_embedding_cache,
+    make_cache_key,
+)
+from evidence_repository.embeddings.scheduler import EmbeddingScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -35,15 +41,15 @@ class OpenAIEmbeddingClient:
     Features:
     - Exponential backoff retry for transient errors
     - Rate limit handling with retry-after
-    - Automatic batching for large requests
+    - Token-aware batching with bounded, adaptive request concurrency
     - Token tracking for cost estimation
+    - Query embedding cache in front of embed_text
     """
 
     # Retry configuration
     MAX_RETRIES = 5
     BASE_DELAY = 1.0  # seconds
     MAX_DELAY = 60.0  # seconds
-    BATCH_SIZE = 100  # Max texts per API call (OpenAI limit is 2048)
 
     # Retryable errors
     RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError)
@@ -54,6 +60,9 @@ class OpenAIEmbeddingClient:
         model: str | None = None,
         dimensions: int | None = None,
         max_retries: int | None = None,
+        cache: EmbeddingCache | None = None,
+        use_cache: bool = True,
+        scheduler: EmbeddingScheduler | None = None,
     ):
         """Initialize OpenAI embeddings client.
 
@@ -62,6 +71,11 @@ class OpenAIEmbeddingClient:
             model: Embedding model name (uses settings if not provided).
             dimensions: Embedding dimensions (uses settings if not provided).
             max_retries: Maximum retry attempts for transient errors.
+            cache: Embedding cache for embed_text (uses the process-wide
+                cache if not provided).
+            use_cache: Set False to bypass the cache entirely.
+            scheduler: Batch scheduler for embed_texts (packs by tokens and
+                shares the process-wide concurrency limiter if not provided).
         """
         settings = get_settings()
 
@@ -69,6 +83,8 @@ class OpenAIEmbeddingClient:
         self.model = model or settings.openai_embedding_model
         self.dimensions = dimensions or settings.openai_embedding_dimensions
         self.max_retries = max_retries or self.MAX_RETRIES
+        self.cache = (cache or get_embedding_cache()) if use_cache else None
+        self.scheduler = scheduler or EmbeddingScheduler()
 
         # Track total tokens used (for cost estimation)
         self.total_tokens_used = 0
@@ -96,6 +112,9 @@ class OpenAIEmbeddingClient:
     async def embed_text(self, text: str) -> list[float]:
         """Generate embedding for a single text.
 
+        Consults the embedding cache first, so repeated search queries skip
+        the API round trip.
+
         Args:
             text: Text to embed.
 
@@ -105,14 +124,26 @@ class OpenAIEmbeddingClient:
         Raises:
             OpenAIEmbeddingError: If embedding generation fails.
         """
+        if self.cache is None or not self._clean_text(text):
+            embeddings = await self.embed_texts([text])
+            return embeddings[0]
+
+        key = make_cache_key(self.model, self.dimensions, text)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+
         embeddings = await self.embed_texts([text])
+        await self.cache.set(key, embeddings[0])
         return embeddings[0]
 
     async def embed_texts(self, texts: Sequence[str]) -> list[list[float]]:
         """Generate embeddings for multiple texts with retry logic.
 
-        Batches requests to OpenAI API for efficiency. Handles rate limits
-        and transient errors with exponential backoff.
+        Packs texts into token-bounded requests and sends them concurrently
+        through the scheduler. Handles rate limits (which also throttle the
+        shared concurrency limit) and transient errors with exponential
+        backoff.
 
         Args:
             texts: List of texts to embed.
@@ -137,22 +168,18 @@ class OpenAIEmbeddingClient:
             # All texts were empty, return zero vectors
             return [[0.0] * self.dimensions for _ in texts]
 
-        # Process in batches if needed
-        all_embeddings: list[list[float]] = []
-
-        for batch_start in range(0, len(non_empty_texts), self.BATCH_SIZE):
-            batch_end = min(batch_start + self.BATCH_SIZE, len(non_empty_texts))
-            batch = non_empty_texts[batch_start:batch_end]
-
-            batch_embeddings = await self._embed_batch_with_retry(batch)
-            all_embeddings.extend(batch_embeddings)
+        # Process packed batches concurrently
+        all_embeddings = await self.scheduler.run(
+            non_empty_texts, self._embed_batch_with_retry
+        )
 
         # Reconstruct full list with zero vectors for empty texts
         result: list[list[float]] = []
         api_idx = 0
 
+        non_empty_set = set(non_empty_indices)
         for i in range(len(texts)):
-            if i in non_empty_indices:
+            if i in non_empty_set:
                 result.append(all_embeddings[api_idx])
                 api_idx += 1
             else:
@@ -173,16 +200,22 @@ class OpenAIEmbeddingClient:
             OpenAIEmbeddingError: If all retries fail.
         """
         last_error: Exception | None = None
+        limiter = self.scheduler.limiter
 
         for attempt in range(self.max_retries + 1):
             try:
-                return await self._call_embedding_api(texts)
+                async with limiter.slot():
+                    embeddings = await self._call_embedding_api(texts)
+                limiter.record_success()
+                return embeddings
 
             except RateLimitError as e:
                 last_error = e
                 # Extract retry-after if available
                 retry_after = self._get_retry_after(e)
                 delay = retry_after or self._calculate_backoff(attempt)
+                # Throttle every in-flight caller, not just this batch
+                limiter.record_rate_limit(delay)
 
                 logger.warning(
                     f"Rate limit hit (attempt {attempt + 1}/{self.max_retries + 1}), "
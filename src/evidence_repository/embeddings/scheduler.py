@@ -0,0 +1,252 @@
+"""Concurrent embedding scheduler.
+
+``OpenAIEmbeddingClient.embed_texts`` hands its (non-empty) texts to an
+``EmbeddingScheduler``, which:
+
+- packs texts into request batches by estimated token count instead of a
+  fixed item count (``pack_batches``),
+- runs the batches concurrently, bounded by an ``AdaptiveConcurrencyLimiter``,
+- shrinks concurrency and pauses all senders on 429s (honouring
+  ``retry-after``), then grows it back one slot at a time as requests
+  succeed (AIMD).
+
+The limiter is shared per process (``get_embedding_limiter``) so every
+embedding call site in an API replica or worker backs off together.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Awaitable, Callable, Sequence
+
+from evidence_repository.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Rough estimate used for packing: 1 token ~= 4 characters
+CHARS_PER_TOKEN = 4
+
+# Texts per scheduler run for call sites embedding a whole version; large
+# enough that a window packs into several requests sent concurrently
+WINDOW_SIZE = 1000
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text (no tokenizer dependency)."""
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+def pack_batches(
+    texts: Sequence[str],
+    max_batch_tokens: int,
+    max_batch_items: int,
+) -> list[list[int]]:
+    """Greedily pack texts into batches bounded by tokens and item count.
+
+    Input order is preserved and each batch holds consecutive indices. A
+    text larger than ``max_batch_tokens`` gets a batch of its own.
+
+    Args:
+        texts: Texts to pack.
+        max_batch_tokens: Estimated token budget per request.
+        max_batch_items: Maximum inputs per request.
+
+    Returns:
+        Batches as lists of indices into ``texts``.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+
+    for index, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if current and (
+            current_tokens + tokens > max_batch_tokens
+            or len(current) >= max_batch_items
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+@dataclass
+class LimiterStats:
+    """Counters for an adaptive concurrency limiter."""
+
+    limit: int
+    in_flight: int = 0
+    requests: int = 0
+    rate_limited: int = 0
+    max_in_flight: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to JSON-serializable dict."""
+        return asdict(self)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit driven by rate-limit feedback.
+
+    Usage:
+        async with limiter.slot():
+            response = await call_api()
+        limiter.record_success()
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 16):
+        """Initialize limiter.
+
+        Args:
+            initial: Starting concurrency limit.
+            minimum: Floor for the limit after backoffs.
+            maximum: Ceiling for the limit.
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self._in_flight = 0
+        self._successes = 0
+        self._resume_at = 0.0
+        self._condition: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.stats = LimiterStats(limit=self.limit)
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Worker tasks create a fresh event loop per job; rebind when it changes
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._in_flight = 0
+        return self._condition
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one in-flight request slot."""
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                pause = self._resume_at - time.monotonic()
+                if pause > 0:
+                    # Cooldown after a 429: release the lock while sleeping
+                    condition.release()
+                    try:
+                        await asyncio.sleep(pause)
+                    finally:
+                        await condition.acquire()
+                    continue
+                if self._in_flight < self.limit:
+                    break
+                await condition.wait()
+
+            self._in_flight += 1
+            self.stats.requests += 1
+            self.stats.in_flight = self._in_flight
+            self.stats.max_in_flight = max(self.stats.max_in_flight, self._in_flight)
+
+        try:
+            yield
+        finally:
+            async with condition:
+                self._in_flight -= 1
+                self.stats.in_flight = self._in_flight
+                condition.notify_all()
+
+    def record_success(self) -> None:
+        """Additive increase: +1 slot after ``limit`` consecutive successes."""
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.maximum:
+            self.limit += 1
+            self._successes = 0
+            self.stats.limit = self.limit
+
+    def record_rate_limit(self, retry_after: float | None) -> None:
+        """Multiplicative decrease and a shared pause before the next request."""
+        self.stats.rate_limited += 1
+        self._successes = 0
+        new_limit = max(self.minimum, self.limit // 2)
+        if new_limit != self.limit:
+            logger.info(f"Embedding concurrency reduced {self.limit} -> {new_limit}")
+        self.limit = new_limit
+        self.stats.limit = self.limit
+        if retry_after:
+            self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+
+    def get_stats(self) -> dict:
+        """Get limiter statistics."""
+        return self.stats.to_dict()
+
+
+@lru_cache
+def get_embedding_limiter() -> AdaptiveConcurrencyLimiter:
+    """Get the process-wide embedding concurrency limiter."""
+    settings = get_settings()
+    return AdaptiveConcurrencyLimiter(
+        initial=settings.embedding_initial_concurrency,
+        maximum=settings.embedding_max_concurrency,
+    )
+
+
+class EmbeddingScheduler:
+    """Pack texts into token-bounded batches and embed them concurrently."""
+
+    def __init__(
+        self,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+        max_batch_tokens: int | None = None,
+        max_batch_items: int | None = None,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            limiter: Concurrency limiter (process-wide limiter if not provided).
+            max_batch_tokens: Estimated tokens per request (uses settings).
+            max_batch_items: Inputs per request (uses settings).
+        """
+        settings = get_settings()
+        self.limiter = limiter or get_embedding_limiter()
+        self.max_batch_tokens = max_batch_tokens or settings.embedding_batch_max_tokens
+        self.max_batch_items = max_batch_items or settings.embedding_batch_max_items
+
+    async def run(
+        self,
+        texts: Sequence[str],
+        embed_batch: Callable[[list[str]], Awaitable[list[list[float]]]],
+    ) -> list[list[float]]:
+        """Embed texts using concurrent packed batches.
+
+        Args:
+            texts: Non-empty, cleaned texts.
+            embed_batch: Coroutine embedding one batch (handles retries and
+                reports to ``self.limiter``).
+
+        Returns:
+            Embeddings in input order.
+        """
+        batches = pack_batches(texts, self.max_batch_tokens, self.max_batch_items)
+        tasks = [
+            asyncio.ensure_future(embed_batch([texts[i] for i in batch]))
+            for batch in batches
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Don't leave sibling requests running after a failure
+            for task in tasks:
+                task.cancel()
+            raise
+
+        embeddings: list[list[float]] = [None] * len(texts)  # type: ignore[list-item]
+        for batch, vectors in zip(batches, results):
+            for index, vector in zip(batch, vectors):
+                embeddings[index] = vector
+        return embeddings
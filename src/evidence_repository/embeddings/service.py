@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from evidence_repository.config import get_settings
 from evidence_repository.embeddings.chunker import TextChunk, TextChunker
 from evidence_repository.embeddings.openai_client import OpenAIEmbeddingClient
+from evidence_repository.embeddings.writer import chunk_row, row_to_chunk, write_chunks
 from evidence_repository.models.document import DocumentVersion
 from evidence_repository.models.embedding import EmbeddingChunk
 from evidence_repository.models.evidence import Span
@@ -107,21 +108,22 @@ class EmbeddingService:
             # Get embeddings from OpenAI
             embeddings = await self.embedding_client.embed_texts(texts)
 
-            # Create embedding chunk records
-            for chunk, embedding in zip(batch, embeddings):
-                embedding_chunk = EmbeddingChunk(
+            # Write embedding chunk records (binary COPY)
+            rows = [
+                chunk_row(
                     document_version_id=version.id,
+                    document_id=version.document_id,
                     chunk_index=chunk.index,
                     text=chunk.text,
                     embedding=embedding,
                     char_start=chunk.char_start,
                     char_end=chunk.char_end,
-                    metadata_=chunk.metadata,
+                    metadata=chunk.metadata,
                 )
-                self.db.add(embedding_chunk)
-                embedding_chunks.append(embedding_chunk)
-
-        await self.db.flush()
+                for chunk, embedding in zip(batch, embeddings)
+            ]
+            await write_chunks(self.db, rows)
+            embedding_chunks.extend(row_to_chunk(row) for row in rows)
 
         logger.info(
             f"Created {len(embedding_chunks)} embeddings for version {version.id}"
@@ -142,21 +144,21 @@ class EmbeddingService:
         """
         embedding = await self.embedding_client.embed_text(span.text_content)
 
-        embedding_chunk = EmbeddingChunk(
+        row = chunk_row(
             document_version_id=span.document_version_id,
             span_id=span.id,
+            span_type=span.span_type,
             chunk_index=0,
             text=span.text_content,
             embedding=embedding,
-            metadata_={
+            metadata={
                 "span_id": str(span.id),
                 "span_type": span.span_type.value,
             },
         )
-        self.db.add(embedding_chunk)
-        await self.db.flush()
+        await write_chunks(self.db, [row])
 
-        return embedding_chunk
+        return row_to_chunk(row)
 
     async def embed_text(self, text: str) -> list[float]:
         """Generate embedding for arbitrary text.
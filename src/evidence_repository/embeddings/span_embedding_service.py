@@ -10,6 +10,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from evidence_repository.embeddings.openai_client import OpenAIEmbeddingClient
+from evidence_repository.embeddings.scheduler import WINDOW_SIZE
+from evidence_repository.embeddings.store import EmbeddingStore
+from evidence_repository.embeddings.writer import chunk_row, row_to_chunk, write_chunks
 from evidence_repository.models.document import DocumentVersion
 from evidence_repository.models.embedding import EmbeddingChunk
 from evidence_repository.models.evidence import Span, SpanType
@@ -28,6 +31,7 @@ class SpanEmbeddingService:
     - Re-embedding support per version
     - Link embeddings to source spans
     - Skip non-text spans
+    - Reuse stored vectors for text already embedded (see embeddings.store)
     """
 
     # Span types to embed (only text content)
@@ -37,17 +41,18 @@ class SpanEmbeddingService:
         self,
         db: AsyncSession,
         embedding_client: OpenAIEmbeddingClient | None = None,
-        batch_size: int = 50,
+        batch_size: int = WINDOW_SIZE,
     ):
         """Initialize span embedding service.
 
         Args:
             db: Database session.
             embedding_client: OpenAI client (created if not provided).
-            batch_size: Number of spans to embed per batch.
+            batch_size: Spans per embedding scheduler run.
         """
         self.db = db
         self.embedding_client = embedding_client or OpenAIEmbeddingClient()
+        self.embedding_store = EmbeddingStore(self.embedding_client)
         self.batch_size = batch_size
 
     async def embed_spans_for_version(
@@ -97,7 +102,8 @@ class SpanEmbeddingService:
 
         logger.info(
             f"Created {len(all_chunks)} embeddings for version {version.id} "
-            f"(tokens used: {self.embedding_client.get_token_usage()})"
+            f"({self.embedding_store.stats.reused} reused; "
+            f"tokens used: {self.embedding_client.get_token_usage()})"
         )
 
         return all_chunks
@@ -128,23 +134,23 @@ class SpanEmbeddingService:
         # Generate embedding
         embedding = await self.embedding_client.embed_text(span.text_content)
 
-        # Create chunk record
-        chunk = EmbeddingChunk(
+        # Write chunk record
+        row = chunk_row(
             document_version_id=span.document_version_id,
             span_id=span.id,
+            span_type=span.span_type,
             chunk_index=0,
             text=span.text_content,
             embedding=embedding,
-            metadata_={
+            metadata={
                 "span_type": span.span_type.value,
                 "span_hash": span.span_hash,
                 "locator": span.start_locator,
             },
         )
-        self.db.add(chunk)
-        await self.db.flush()
+        await write_chunks(self.db, [row])
 
-        return chunk
+        return row_to_chunk(row)
 
     async def reembed_version(
         self,
@@ -228,27 +234,28 @@ class SpanEmbeddingService:
 
         # Generate embeddings
         texts = [s.text_content for s in valid_spans]
-        embeddings = await self.embedding_client.embed_texts(texts)
+        embeddings = await self.embedding_store.embed_texts(self.db, texts)
 
-        # Create chunk records
-        chunks: list[EmbeddingChunk] = []
-        for span, embedding, idx in zip(valid_spans, embeddings, range(len(valid_spans))):
-            chunk = EmbeddingChunk(
+        # Write chunk records (binary COPY)
+        rows = [
+            chunk_row(
                 document_version_id=version_id,
                 span_id=span.id,
+                span_type=span.span_type,
                 chunk_index=idx,
                 text=span.text_content,
                 embedding=embedding,
-                metadata_={
+                metadata={
                     "span_type": span.span_type.value,
                     "span_hash": span.span_hash,
                     "locator": span.start_locator,
                 },
             )
-            self.db.add(chunk)
-            chunks.append(chunk)
+            for idx, (span, embedding) in enumerate(zip(valid_spans, embeddings))
+        ]
+        await write_chunks(self.db, rows)
 
-        return chunks
+        return [row_to_chunk(row) for row in rows]
 
     async def _get_span_embedding(self, span_id: UUID) -> EmbeddingChunk | None:
         """Get existing embedding for a span.
@@ -0,0 +1,237 @@
+"""Content-addressed embedding store.
+
+Spans that are unchanged between document versions keep the same text, and
+boilerplate (disclaimers, footers) repeats across thousands of documents.
+``EmbeddingStore`` keys vectors by (model, dimensions, text hash) in the
+``embedding_vectors`` table; embedding paths resolve texts through it and
+only send the misses to OpenAI. Re-uploads and new versions then embed just
+the delta.
+
+Both async (API/services) and sync (RQ worker tasks) sessions are supported.
+"""
+
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from evidence_repository.config import get_settings
+from evidence_repository.embeddings.cache import normalize_text
+from evidence_repository.embeddings.openai_client import OpenAIEmbeddingClient
+from evidence_repository.models.embedding import EmbeddingVector
+
+logger = logging.getLogger(__name__)
+
+# Hashes per lookup query (keeps IN lists reasonable)
+LOOKUP_BATCH_SIZE = 1000
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of the normalized text (see embeddings.cache.normalize_text)."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ReuseStats:
+    """Counts from resolving a batch of texts through the store."""
+
+    total: int = 0
+    reused: int = 0  # Served from the store
+    deduplicated: int = 0  # Repeats within the batch, embedded once
+    embedded: int = 0  # Sent to the API
+
+    def merge(self, other: "ReuseStats") -> None:
+        """Accumulate counts from another batch."""
+        self.total += other.total
+        self.reused += other.reused
+        self.deduplicated += other.deduplicated
+        self.embedded += other.embedded
+
+    def to_dict(self) -> dict:
+        """Convert to JSON-serializable dict."""
+        return {
+            "total": self.total,
+            "reused": self.reused,
+            "deduplicated": self.deduplicated,
+            "embedded": self.embedded,
+        }
+
+
+def plan_embeddings(
+    texts: Sequence[str],
+    known: dict[str, list[float]],
+) -> tuple[list[str], dict[str, str]]:
+    """Work out which texts still need embedding.
+
+    Args:
+        texts: Texts to embed.
+        known: Vectors already available, by content hash.
+
+    Returns:
+        Tuple of (content hash per text, {hash: text} for unique misses).
+    """
+    hashes = [content_hash(t) for t in texts]
+    missing: dict[str, str] = {}
+    for text_hash, text in zip(hashes, texts):
+        if text_hash not in known and text_hash not in missing:
+            missing[text_hash] = text
+    return hashes, missing
+
+
+def _to_list(vector) -> list[float]:
+    """Convert a pgvector result (numpy array or list) to a list of floats."""
+    return [float(x) for x in vector]
+
+
+class EmbeddingStore:
+    """Resolve texts to embeddings, reusing stored vectors where possible."""
+
+    def __init__(self, client: OpenAIEmbeddingClient, enabled: bool | None = None):
+        """Initialize embedding store.
+
+        Args:
+            client: Client used for texts not yet in the store; its model and
+                dimensions scope the lookup.
+            enabled: Override settings.embedding_reuse_enabled.
+        """
+        self.client = client
+        self.enabled = (
+            get_settings().embedding_reuse_enabled if enabled is None else enabled
+        )
+        self.stats = ReuseStats()
+
+    @property
+    def model(self) -> str:
+        """Embedding model (from the client)."""
+        return self.client.model
+
+    @property
+    def dimensions(self) -> int:
+        """Embedding dimensions (from the client)."""
+        return self.client.dimensions
+
+    def _lookup_statement(self, hashes: Sequence[str]):
+        return select(EmbeddingVector.text_hash, EmbeddingVector.embedding).where(
+            EmbeddingVector.model == self.model,
+            EmbeddingVector.dimensions == self.dimensions,
+            EmbeddingVector.text_hash.in_(hashes),
+        )
+
+    def _save_statement(self, vectors: dict[str, list[float]]):
+        return (
+            pg_insert(EmbeddingVector)
+            .values(
+                [
+                    {
+                        "model": self.model,
+                        "dimensions": self.dimensions,
+                        "text_hash": text_hash,
+                        "embedding": embedding,
+                    }
+                    for text_hash, embedding in vectors.items()
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
+
+    def _finish(
+        self,
+        texts: Sequence[str],
+        hashes: list[str],
+        known: dict[str, list[float]],
+        missing: dict[str, str],
+        reused_hashes: set[str],
+    ) -> list[list[float]]:
+        """Assemble results in input order and record stats."""
+        stats = ReuseStats(
+            total=len(texts),
+            reused=sum(1 for h in hashes if h in reused_hashes),
+            embedded=len(missing),
+        )
+        stats.deduplicated = stats.total - stats.reused - stats.embedded
+        self.stats.merge(stats)
+        return [known[h] for h in hashes]
+
+    async def embed_texts(
+        self,
+        db: AsyncSession,
+        texts: Sequence[str],
+    ) -> list[list[float]]:
+        """Resolve texts to embeddings using an async session.
+
+        Args:
+            db: Async database session.
+            texts: Non-empty texts to embed.
+
+        Returns:
+            Embedding vectors in input order.
+        """
+        if not self.enabled:
+            embeddings = await self.client.embed_texts(texts)
+            self.stats.merge(ReuseStats(total=len(texts), embedded=len(texts)))
+            return embeddings
+
+        unique_hashes = list(dict.fromkeys(content_hash(t) for t in texts))
+        known: dict[str, list[float]] = {}
+        for start in range(0, len(unique_hashes), LOOKUP_BATCH_SIZE):
+            result = await db.execute(
+                self._lookup_statement(unique_hashes[start:start + LOOKUP_BATCH_SIZE])
+            )
+            known.update((h, _to_list(v)) for h, v in result.all())
+        reused_hashes = set(known)
+
+        hashes, missing = plan_embeddings(texts, known)
+        if missing:
+            vectors = await self.client.embed_texts(list(missing.values()))
+            new = dict(zip(missing.keys(), vectors))
+            await db.execute(self._save_statement(new))
+            known.update(new)
+
+        return self._finish(texts, hashes, known, missing, reused_hashes)
+
+    def embed_texts_sync(
+        self,
+        db: Session,
+        texts: Sequence[str],
+        loop: asyncio.AbstractEventLoop,
+    ) -> list[list[float]]:
+        """Resolve texts to embeddings using a sync session (worker tasks).
+
+        Args:
+            db: Sync database session.
+            texts: Non-empty texts to embed.
+            loop: Event loop used to drive the async OpenAI client.
+
+        Returns:
+            Embedding vectors in input order.
+        """
+        if not self.enabled:
+            embeddings = loop.run_until_complete(self.client.embed_texts(texts))
+            self.stats.merge(ReuseStats(total=len(texts), embedded=len(texts)))
+            return embeddings
+
+        unique_hashes = list(dict.fromkeys(content_hash(t) for t in texts))
+        known: dict[str, list[float]] = {}
+        for start in range(0, len(unique_hashes), LOOKUP_BATCH_SIZE):
+            result = db.execute(
+                self._lookup_statement(unique_hashes[start:start + LOOKUP_BATCH_SIZE])
+            )
+            known.update((h, _to_list(v)) for h, v in result.all())
+        reused_hashes = set(known)
+
+        hashes, missing = plan_embeddings(texts, known)
+        if missing:
+            vectors = loop.run_until_complete(
+                self.client.embed_texts(list(missing.values()))
+            )
+            new = dict(zip(missing.keys(), vectors))
+            db.execute(self._save_statement(new))
+            known.update(new)
+
+        return self._finish(texts, hashes, known, missing, reused_hashes)
@@ -0,0 +1,270 @@
+"""Bulk writer for embedding_chunks rows.
+
+Persisting embeddings one ``db.add(EmbeddingChunk(...))`` at a time makes the
+ORM track and flush every 1536-float vector individually. This module streams
+rows to Postgres with ``COPY embedding_chunks (...) FROM STDIN (FORMAT
+BINARY)`` instead, encoding vectors in pgvector's binary format so nothing is
+rendered as text and nothing lands in the session identity map.
+
+Drivers:
+- asyncpg (API / async services): ``Connection.copy_to_table``.
+- psycopg 3 / psycopg2 (sync worker tasks): ``cursor.copy`` / ``copy_expert``.
+- anything else: a plain executemany ``INSERT`` of the same rows.
+
+COPY fires the table's BEFORE INSERT trigger, so ``project_ids`` (and
+``document_id`` / ``span_type`` when omitted) are still filled by the
+database (see migration 018).
+"""
+
+import json
+import struct
+import sys
+import uuid
+from array import array
+from enum import Enum
+from typing import Any, Callable, Iterable, Iterator
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from evidence_repository.models.embedding import EmbeddingChunk
+
+# Columns written by COPY; created_at, project_ids and text_search come from
+# defaults, triggers and the generated column.
+COPY_COLUMNS = (
+    "id",
+    "document_version_id",
+    "document_id",
+    "span_id",
+    "span_type",
+    "chunk_index",
+    "text",
+    "embedding",
+    "metadata",
+    "char_start",
+    "char_end",
+)
+
+COPY_SQL = (
+    f"COPY {EmbeddingChunk.__tablename__} ({', '.join(COPY_COLUMNS)}) "
+    "FROM STDIN (FORMAT BINARY)"
+)
+
+# Encoded bytes buffered before handing a block to the driver
+COPY_BUFFER_BYTES = 1 << 20
+
+COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+COPY_TRAILER = struct.pack(">h", -1)
+NULL_FIELD = struct.pack(">i", -1)
+
+
+def chunk_row(
+    *,
+    document_version_id: uuid.UUID,
+    chunk_index: int,
+    text: str,
+    embedding: list[float],
+    document_id: uuid.UUID | None = None,
+    span_id: uuid.UUID | None = None,
+    span_type: Enum | str | None = None,
+    metadata: dict[str, Any] | None = None,
+    char_start: int | None = None,
+    char_end: int | None = None,
+) -> dict[str, Any]:
+    """Build an embedding_chunks row keyed by column name."""
+    return {
+        "id": uuid.uuid4(),
+        "document_version_id": document_version_id,
+        "document_id": document_id,
+        "span_id": span_id,
+        "span_type": span_type,
+        "chunk_index": chunk_index,
+        "text": text,
+        "embedding": embedding,
+        "metadata": metadata or {},
+        "char_start": char_start,
+        "char_end": char_end,
+    }
+
+
+def row_to_chunk(row: dict[str, Any]) -> EmbeddingChunk:
+    """Build a transient (not session-attached) EmbeddingChunk for a written row."""
+    return EmbeddingChunk(
+        id=row["id"],
+        document_version_id=row["document_version_id"],
+        document_id=row["document_id"],
+        span_id=row["span_id"],
+        span_type=row["span_type"],
+        chunk_index=row["chunk_index"],
+        text=row["text"],
+        embedding=row["embedding"],
+        metadata_=row["metadata"],
+        char_start=row["char_start"],
+        char_end=row["char_end"],
+    )
+
+
+def encode_vector(values: list[float]) -> bytes:
+    """Encode a vector in pgvector's binary format.
+
+    Layout: int16 dimensions, int16 unused, then big-endian float32 values.
+    """
+    floats = array("f", values)
+    if sys.byteorder == "little":
+        floats.byteswap()
+    return struct.pack(">hh", len(floats), 0) + floats.tobytes()
+
+
+def _encode_uuid(value: uuid.UUID) -> bytes:
+    return value.bytes
+
+
+def _encode_int4(value: int) -> bytes:
+    return struct.pack(">i", value)
+
+
+def _encode_text(value: str) -> bytes:
+    return value.encode("utf-8")
+
+
+def _encode_enum(value: Enum | str) -> bytes:
+    # Enum labels travel as text in the binary protocol
+    return _encode_text(value.value if isinstance(value, Enum) else value)
+
+
+def _encode_json(value: Any) -> bytes:
+    return _encode_text(json.dumps(value))
+
+
+_ENCODERS: dict[str, Callable[[Any], bytes]] = {
+    "id": _encode_uuid,
+    "document_version_id": _encode_uuid,
+    "document_id": _encode_uuid,
+    "span_id": _encode_uuid,
+    "span_type": _encode_enum,
+    "chunk_index": _encode_int4,
+    "text": _encode_text,
+    "embedding": encode_vector,
+    "metadata": _encode_json,
+    "char_start": _encode_int4,
+    "char_end": _encode_int4,
+}
+
+_FIELD_COUNT = struct.pack(">h", len(COPY_COLUMNS))
+
+
+def encode_copy_rows(
+    rows: Iterable[dict[str, Any]],
+    buffer_bytes: int = COPY_BUFFER_BYTES,
+) -> Iterator[bytes]:
+    """Encode rows as a binary COPY stream, yielded in blocks."""
+    buffer = bytearray(COPY_HEADER)
+    for row in rows:
+        buffer += _FIELD_COUNT
+        for column in COPY_COLUMNS:
+            value = row[column]
+            if value is None:
+                buffer += NULL_FIELD
+                continue
+            data = _ENCODERS[column](value)
+            buffer += struct.pack(">i", len(data))
+            buffer += data
+        if len(buffer) >= buffer_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += COPY_TRAILER
+    yield bytes(buffer)
+
+
+class _CopyReader:
+    """File-like view over encoded blocks (for psycopg2 copy_expert)."""
+
+    def __init__(self, blocks: Iterator[bytes]):
+        self._blocks = blocks
+        self._pending = b""
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._pending) < size:
+            block = next(self._blocks, None)
+            if block is None:
+                break
+            self._pending += block
+        if size < 0:
+            data, self._pending = self._pending, b""
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+
+def _driver_name(driver_connection: Any) -> str:
+    return type(driver_connection).__module__.split(".")[0]
+
+
+async def write_chunks(db: AsyncSession, rows: list[dict[str, Any]]) -> int:
+    """Write embedding_chunks rows in the session's transaction.
+
+    Pending ORM changes are flushed first so COPY sees referenced spans.
+
+    Args:
+        db: Database session.
+        rows: Rows built with ``chunk_row``.
+
+    Returns:
+        Number of rows written.
+    """
+    if not rows:
+        return 0
+
+    await db.flush()
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+
+    if _driver_name(driver) == "asyncpg":
+
+        async def source():
+            for block in encode_copy_rows(rows):
+                yield block
+
+        await driver.copy_to_table(
+            EmbeddingChunk.__tablename__,
+            source=source(),
+            columns=list(COPY_COLUMNS),
+            format="binary",
+        )
+    else:
+        await db.execute(insert(EmbeddingChunk.__table__), rows)
+
+    return len(rows)
+
+
+def write_chunks_sync(db: Session, rows: list[dict[str, Any]]) -> int:
+    """Write embedding_chunks rows in the session's transaction (sync).
+
+    Args:
+        db: Database session.
+        rows: Rows built with ``chunk_row``.
+
+    Returns:
+        Number of rows written.
+    """
+    if not rows:
+        return 0
+
+    db.flush()
+    driver = db.connection().connection.driver_connection
+    driver_name = _driver_name(driver)
+
+    if driver_name == "psycopg":
+        with driver.cursor() as cursor:
+            with cursor.copy(COPY_SQL) as copy:
+                for block in encode_copy_rows(rows):
+                    copy.write(block)
+    elif driver_name == "psycopg2":
+        with driver.cursor() as cursor:
+            cursor.copy_expert(COPY_SQL, _CopyReader(encode_copy_rows(rows)))
+    else:
+        db.execute(insert(EmbeddingChunk.__table__), rows)
+
+    return len(rows)
@@ -0,0 +1,283 @@
+"""Chunked, columnar CSV reading.
+
+CsvExtractor used to decode the whole file into one string and convert every
+cell with its own try/except. ChunkedCsvReader instead:
+
+- decodes fixed-size byte blocks with an incremental decoder, so only one
+  block of text is alive at a time;
+- groups rows into chunks of ``chunk_rows`` and infers each column's type
+  once per chunk, storing numeric columns in stdlib ``array`` buffers
+  (``array('q')`` / ``array('d')``) built by a single C-level conversion
+  pass;
+- falls back to per-cell parsing (parse_cell) only for mixed columns, so the
+  values are the same as cell-by-cell parsing.
+
+Chunks expose rows in order, so row-range spans can be generated as the file
+is read (CsvSpanGenerator.iter_table_spans).
+"""
+
+import codecs
+import csv
+import io
+import re
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+# Bytes decoded per block
+CSV_BLOCK_SIZE = 1 << 22  # 4 MB
+
+# Rows per columnar chunk
+CSV_CHUNK_ROWS = 10000
+
+UTF8_BOM = b"\xef\xbb\xbf"
+
+# Characters int() never accepts but float() may ("1.5", "1e3", "inf", "nan")
+_NON_INTEGER = re.compile(r"[.eEnN]")
+
+# Prefix every int()/float()-parseable cell starts with; cells that do not
+# match are plain strings and skip parse_cell's try/except
+_NUMBER_START = re.compile(r"[-+]?(?:\d|\.\d|inf|nan)", re.IGNORECASE)
+
+
+def parse_cell(cell: str) -> Any:
+    """Parse a cell value, converting to appropriate type.
+
+    Args:
+        cell: Raw cell string.
+
+    Returns:
+        Parsed value (int, float, or string), None for empty cells.
+    """
+    cell = cell.strip()
+
+    if not cell:
+        return None
+
+    # Try integer
+    try:
+        return int(cell)
+    except ValueError:
+        pass
+
+    # Try float
+    try:
+        return float(cell)
+    except ValueError:
+        pass
+
+    return cell
+
+
+@dataclass
+class CsvColumn:
+    """One column of a chunk.
+
+    ``values`` is an ``array`` for int/float columns (empty cells hold 0 and
+    are flagged in ``nulls``) and a list of parsed values otherwise.
+    """
+
+    kind: str  # "int", "float" or "object"
+    values: array | list[Any]
+    nulls: bytearray | None = None
+
+    def to_list(self) -> list[Any]:
+        """Column values as Python objects (None for empty cells)."""
+        if self.kind == "object":
+            return self.values
+        if self.nulls is None:
+            return self.values.tolist()
+        present = iter(self.values.tolist())
+        return [None if null else next(present) for null in self.nulls]
+
+
+def build_column(cells: list[str]) -> CsvColumn:
+    """Infer a column's type once and convert all of its cells.
+
+    Args:
+        cells: Raw cell strings of one column in a chunk.
+
+    Returns:
+        CsvColumn; typed array when every non-empty cell is an int (or every
+        one is a non-integer float), otherwise per-cell parsed values.
+    """
+    stripped = list(map(str.strip, cells))
+    present = list(filter(None, stripped))
+    nulls = None if len(present) == len(stripped) else bytearray(not cell for cell in stripped)
+
+    try:
+        return CsvColumn("int", array("q", map(int, present)), nulls)
+    except (ValueError, OverflowError):
+        pass
+
+    # Only when no cell is int-like, so "1" stays an int as with parse_cell
+    if all(map(_NON_INTEGER.search, present)):
+        try:
+            return CsvColumn("float", array("d", map(float, present)), nulls)
+        except ValueError:
+            pass
+
+    number_start = _NUMBER_START.match
+    return CsvColumn(
+        "object",
+        [
+            (parse_cell(cell) if number_start(cell) else cell) if cell else None
+            for cell in stripped
+        ],
+    )
+
+
+@dataclass
+class CsvChunk:
+    """A block of consecutive data rows stored column-wise."""
+
+    row_start: int  # Index of the first row among all data rows
+    row_count: int
+    columns: list[CsvColumn] = field(default_factory=list)
+
+    def rows(self) -> Iterator[list[Any]]:
+        """Yield the chunk's rows as lists."""
+        if not self.columns:
+            for _ in range(self.row_count):
+                yield []
+            return
+        yield from map(list, zip(*(column.to_list() for column in self.columns)))
+
+
+def detect_encoding(data: bytes, encodings: list[str], block_size: int = CSV_BLOCK_SIZE) -> str:
+    """Find the first encoding that decodes the whole file.
+
+    Decodes block by block and discards the output, so memory stays bounded.
+    """
+    if data.startswith(UTF8_BOM):
+        return "utf-8-sig"
+
+    view = memoryview(data)
+    for encoding in encodings:
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            for start in range(0, len(view), block_size):
+                decoder.decode(view[start:start + block_size])
+            decoder.decode(b"", final=True)
+            return encoding
+        except (UnicodeDecodeError, LookupError):
+            continue
+
+    return "utf-8-fallback"
+
+
+def iter_text_lines(
+    data: bytes,
+    encoding: str,
+    block_size: int = CSV_BLOCK_SIZE,
+) -> Iterator[str]:
+    """Decode ``data`` block by block and yield lines with their endings.
+
+    Lines split on ``\\n`` only, as when reading the decoded text through
+    io.StringIO; the csv module handles ``\\r`` itself.
+    """
+    if encoding == "utf-8-fallback":
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    else:
+        decoder = codecs.getincrementaldecoder(encoding)()
+
+    view = memoryview(data)
+    pending = ""
+    for start in range(0, len(view), block_size):
+        pending += decoder.decode(view[start:start + block_size])
+        # Hand over complete lines; the rest may continue in the next block
+        end = pending.rfind("\n") + 1
+        if end:
+            yield from io.StringIO(pending[:end])
+            pending = pending[end:]
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield from io.StringIO(pending)
+
+
+class ChunkedCsvReader:
+    """Read a CSV file as header + columnar row chunks.
+
+    Usage:
+        reader = ChunkedCsvReader(data, delimiter=",", encoding="utf-8")
+        for chunk in reader.chunks():
+            for row in chunk.rows():
+                ...
+    """
+
+    def __init__(
+        self,
+        data: bytes,
+        delimiter: str,
+        encoding: str,
+        chunk_rows: int = CSV_CHUNK_ROWS,
+        block_size: int = CSV_BLOCK_SIZE,
+    ):
+        """Initialize reader.
+
+        Args:
+            data: Raw CSV bytes.
+            delimiter: Field delimiter.
+            encoding: Encoding (see detect_encoding).
+            chunk_rows: Rows per chunk.
+            block_size: Bytes decoded per block.
+        """
+        self.data = data
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.chunk_rows = chunk_rows
+        self.block_size = block_size
+        self.headers: list[str] = []
+        self.row_count = 0
+        self.warnings: list[str] = []
+
+    def chunks(self) -> Iterator[CsvChunk]:
+        """Yield data rows in columnar chunks.
+
+        The first row becomes ``headers``; data rows are padded or truncated
+        to the header width. A CSV syntax error ends the file with a warning
+        (rows before it are kept).
+        """
+        reader = csv.reader(
+            iter_text_lines(self.data, self.encoding, self.block_size),
+            delimiter=self.delimiter,
+        )
+        pending: list[list[str]] = []
+        width = 0
+
+        try:
+            for index, row in enumerate(reader):
+                if index == 0:
+                    # First row is headers
+                    self.headers = [str(h).strip() for h in row]
+                    width = len(self.headers)
+                    continue
+
+                # Pad or truncate to match headers
+                if len(row) != width:
+                    row = (row + [""] * width)[:width]
+                pending.append(row)
+
+                if len(pending) == self.chunk_rows:
+                    yield self._build_chunk(pending, width)
+                    pending = []
+        except csv.Error as e:
+            self.warnings.append(f"CSV parsing error: {e}")
+
+        if pending:
+            yield self._build_chunk(pending, width)
+
+    def rows(self) -> Iterator[list[Any]]:
+        """Yield all data rows in order."""
+        for chunk in self.chunks():
+            yield from chunk.rows()
+
+    def _build_chunk(self, rows: list[list[str]], width: int) -> CsvChunk:
+        chunk = CsvChunk(
+            row_start=self.row_count,
+            row_count=len(rows),
+            columns=[build_column(list(cells)) for cells in zip(*rows)] if width else [],
+        )
+        self.row_count += len(rows)
+        return chunk
@@ -1,13 +1,18 @@
 """CSV file extractor."""
 
+import codecs
 import csv
-import io
 import logging
 import time
 from pathlib import Path
 from typing import Any
 
 from evidence_repository.extraction.base import BaseExtractor, ExtractionArtifact, TableData
+from evidence_repository.extraction.csv_columnar import (
+    CSV_BLOCK_SIZE,
+    ChunkedCsvReader,
+    detect_encoding,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +24,7 @@ class CsvExtractor(BaseExtractor):
     - Automatic delimiter detection
     - Header row detection
     - Multiple encoding support
+    - Chunked, column-typed parsing (see csv_columnar)
     """
 
     # Common encodings to try
@@ -64,14 +70,11 @@ class CsvExtractor(BaseExtractor):
         start_time = time.time()
         artifact = self._create_artifact()
 
-        # Decode the file
-        text, encoding = self._decode_text(data)
-
-        # Detect delimiter
-        delimiter = self._detect_delimiter(text)
+        # Detect encoding and delimiter from the raw bytes
+        reader = self.read_chunks(data)
 
         # Parse CSV
-        table_data, parse_warnings = self._parse_csv(text, delimiter)
+        table_data, parse_warnings = self._parse_csv(reader)
 
         # Generate text representation
         text_content = self._table_to_text(table_data)
@@ -84,8 +87,8 @@ class CsvExtractor(BaseExtractor):
         artifact.tables = [table_data] if table_data.rows else []
         artifact.metadata = {
             "filename": filename,
-            "encoding": encoding,
-            "delimiter": delimiter,
+            "encoding": reader.encoding,
+            "delimiter": reader.delimiter,
             "row_count": len(table_data.rows),
             "column_count": len(table_data.headers),
         }
@@ -94,26 +97,37 @@ class CsvExtractor(BaseExtractor):
 
         return artifact
 
-    def _decode_text(self, data: bytes) -> tuple[str, str]:
-        """Decode bytes to string.
+    def read_chunks(self, data: bytes) -> ChunkedCsvReader:
+        """Create a chunked reader with detected encoding and delimiter.
+
+        Only the first block is decoded to detect the delimiter; rows are
+        read lazily from the returned reader's chunks().
 
         Args:
-            data: Raw bytes.
+            data: Raw CSV bytes.
 
         Returns:
-            Tuple of (decoded text, encoding used).
+            ChunkedCsvReader positioned before the header row.
         """
-        # Handle BOM
-        if data.startswith(b"\xef\xbb\xbf"):
-            return data[3:].decode("utf-8"), "utf-8-sig"
+        encoding = detect_encoding(data, self.ENCODINGS)
+        delimiter = self._detect_delimiter(self._decode_sample(data, encoding))
+        return ChunkedCsvReader(data, delimiter=delimiter, encoding=encoding)
 
-        for encoding in self.ENCODINGS:
-            try:
-                return data.decode(encoding), encoding
-            except (UnicodeDecodeError, LookupError):
-                continue
+    def _decode_sample(self, data: bytes, encoding: str) -> str:
+        """Decode the first block of the file for delimiter detection.
 
-        return data.decode("utf-8", errors="replace"), "utf-8-fallback"
+        Args:
+            data: Raw bytes.
+            encoding: Encoding from detect_encoding.
+
+        Returns:
+            Decoded text of the first block.
+        """
+        if encoding == "utf-8-fallback":
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        else:
+            decoder = codecs.getincrementaldecoder(encoding)()
+        return decoder.decode(data[:CSV_BLOCK_SIZE])
 
     def _detect_delimiter(self, text: str) -> str:
         """Detect the CSV delimiter.
@@ -150,44 +164,17 @@ class CsvExtractor(BaseExtractor):
         # Default to comma
         return ","
 
-    def _parse_csv(self, text: str, delimiter: str) -> tuple[TableData, list[str]]:
-        """Parse CSV text into TableData.
+    def _parse_csv(self, reader: ChunkedCsvReader) -> tuple[TableData, list[str]]:
+        """Parse CSV chunks into TableData.
 
         Args:
-            text: CSV text content.
-            delimiter: Field delimiter.
+            reader: Chunked reader over the CSV bytes.
 
         Returns:
             Tuple of (TableData, list of warnings).
         """
-        warnings: list[str] = []
-        rows: list[list[Any]] = []
-        headers: list[str] = []
-
-        try:
-            reader = csv.reader(io.StringIO(text), delimiter=delimiter)
-
-            for i, row in enumerate(reader):
-                if i == 0:
-                    # First row is headers
-                    headers = [str(h).strip() for h in row]
-                else:
-                    # Normalize row to match header count
-                    normalized_row: list[Any] = []
-                    for j, cell in enumerate(row):
-                        # Try to parse as number
-                        normalized_row.append(self._parse_cell(cell))
-
-                    # Pad or truncate to match headers
-                    while len(normalized_row) < len(headers):
-                        normalized_row.append(None)
-                    if len(normalized_row) > len(headers):
-                        normalized_row = normalized_row[: len(headers)]
-
-                    rows.append(normalized_row)
-
-        except csv.Error as e:
-            warnings.append(f"CSV parsing error: {e}")
+        rows: list[list[Any]] = list(reader.rows())
+        headers = reader.headers
 
         # If no headers were found, generate default ones
         if not headers and rows:
@@ -196,36 +183,8 @@ class CsvExtractor(BaseExtractor):
         return TableData(
             headers=headers,
             rows=rows,
-            metadata={"delimiter": delimiter},
-        ), warnings
-
-    def _parse_cell(self, cell: str) -> Any:
-        """Parse a cell value, converting to appropriate type.
-
-        Args:
-            cell: Raw cell string.
-
-        Returns:
-            Parsed value (int, float, or string).
-        """
-        cell = cell.strip()
-
-        if not cell:
-            return None
-
-        # Try integer
-        try:
-            return int(cell)
-        except ValueError:
-            pass
-
-        # Try float
-        try:
-            return float(cell)
-        except ValueError:
-            pass
-
-        return cell
+            metadata={"delimiter": reader.delimiter},
+        ), reader.warnings
 
     def _table_to_text(self, table: TableData) -> str:
         """Convert table to text representation.
@@ -1,11 +1,11 @@
 """Excel file extractor."""
 
 import asyncio
+import io
 import logging
-import tempfile
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from evidence_repository.extraction.base import BaseExtractor, ExtractionArtifact, TableData
 
@@ -17,6 +17,7 @@ class ExcelExtractor(BaseExtractor):
 
     Parses Excel workbooks into structured tables with:
     - Multiple sheet support
+    - Streaming sheet rows (iter_sheets) for large workbooks
     - Cell value type preservation
     - Sheet metadata extraction
     """
@@ -100,14 +101,8 @@ class ExcelExtractor(BaseExtractor):
             warnings: list[str] = []
             tables: list[TableData] = []
 
-            # Write to temp file (openpyxl needs a file)
-            with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
-                f.write(data)
-                temp_path = Path(f.name)
-
+            workbook = self._open_workbook(data)
             try:
-                workbook = openpyxl.load_workbook(temp_path, data_only=True, read_only=True)
-
                 # Extract workbook metadata
                 metadata: dict[str, Any] = {
                     "filename": filename,
@@ -125,16 +120,82 @@ class ExcelExtractor(BaseExtractor):
                     except Exception as e:
                         warnings.append(f"Error parsing sheet '{sheet_name}': {e}")
                         logger.warning(f"Error parsing sheet '{sheet_name}': {e}")
-
-                workbook.close()
-
             finally:
-                temp_path.unlink(missing_ok=True)
+                workbook.close()
 
             return tables, metadata, warnings
 
         return await asyncio.to_thread(parse)
 
+    def iter_sheets(
+        self,
+        data: bytes,
+    ) -> Iterator[tuple[str, list[str], Iterator[list[Any]]]]:
+        """Stream sheets of a workbook without materializing their rows.
+
+        Rows come from openpyxl's read-only iterator over an in-memory
+        buffer, so memory stays bounded by what the consumer holds. Each
+        sheet's row iterator must be consumed before advancing to the next
+        sheet. Blocking; run in a worker thread.
+
+        Args:
+            data: Raw Excel bytes.
+
+        Yields:
+            Tuples of (sheet_name, headers, rows).
+        """
+        workbook = self._open_workbook(data)
+        try:
+            for sheet_name in workbook.sheetnames:
+                headers, rows = self._read_sheet(workbook[sheet_name])
+                yield sheet_name, headers, rows
+        finally:
+            workbook.close()
+
+    def _open_workbook(self, data: bytes) -> Any:
+        """Open a workbook read-only over the bytes (no temp file copy)."""
+        import openpyxl
+
+        # BytesIO shares the bytes buffer until written to
+        return openpyxl.load_workbook(io.BytesIO(data), data_only=True, read_only=True)
+
+    def _read_sheet(self, sheet: Any) -> tuple[list[str], Iterator[list[Any]]]:
+        """Read a sheet's headers and return an iterator over its data rows.
+
+        The first row is the header row unless it is empty. Empty rows are
+        skipped and data rows are padded to the header width.
+
+        Args:
+            sheet: openpyxl worksheet object.
+
+        Returns:
+            Tuple of (headers, data row iterator).
+        """
+        # Read-only sheets trust the declared <dimension>, which many writers
+        # leave stale; reset it so rows are read until the sheet data ends
+        sheet.reset_dimensions()
+        row_iter = sheet.iter_rows(values_only=True)
+        headers: list[str] = []
+
+        first = next(row_iter, None)
+        if first is not None and not all(cell is None for cell in first):
+            headers = [
+                str(cell) if cell is not None else f"Column_{i + 1}"
+                for i, cell in enumerate(first)
+            ]
+
+        def data_rows() -> Iterator[list[Any]]:
+            for row in row_iter:
+                # Skip completely empty rows
+                if all(cell is None for cell in row):
+                    continue
+                normalized_row = [self._normalize_cell(cell) for cell in row]
+                if len(normalized_row) < len(headers):
+                    normalized_row.extend([None] * (len(headers) - len(normalized_row)))
+                yield normalized_row
+
+        return headers, data_rows()
+
     def _parse_sheet(
         self,
         sheet: Any,
@@ -151,32 +212,8 @@ class ExcelExtractor(BaseExtractor):
         Returns:
             TableData representing the sheet.
         """
-        rows_data: list[list[Any]] = []
-        headers: list[str] = []
-        max_col = 0
-
-        for row_idx, row in enumerate(sheet.iter_rows(values_only=True)):
-            # Skip completely empty rows
-            if all(cell is None for cell in row):
-                continue
-
-            # Track max columns
-            row_list = list(row)
-            if len(row_list) > max_col:
-                max_col = len(row_list)
-
-            if row_idx == 0:
-                # First non-empty row is headers
-                headers = [str(cell) if cell is not None else f"Column_{i + 1}" for i, cell in enumerate(row_list)]
-            else:
-                # Data row
-                normalized_row = [self._normalize_cell(cell) for cell in row_list]
-                rows_data.append(normalized_row)
-
-        # Ensure all rows have same length
-        for row in rows_data:
-            while len(row) < len(headers):
-                row.append(None)
+        headers, rows = self._read_sheet(sheet)
+        rows_data = list(rows)
 
         return TableData(
             headers=headers,
@@ -0,0 +1,260 @@
+"""Persistent cache for deterministic LLM responses.
+
+Structured extraction, multilevel extraction, metadata extraction and
+truthfulness assessment send byte-identical prompts again on reprocess, on
+retried jobs, for duplicate spans and when a document is attached under
+several profiles. ``LlmResponseCache`` stores response content on local disk
+(SQLite, shared by every worker process on the host) keyed by:
+
+    (model, temperature, system-prompt hash, user-prompt hash, schema version)
+
+Call sites bump their schema version whenever the expected response shape
+changes, so stale entries are never parsed with a newer schema. The file is
+size-bounded: once it grows past ``llm_cache_max_mb`` the least recently used
+entries are evicted.
+
+Usage:
+    key = llm_cache_key(model, 0.1, system_prompt, user_prompt, "structured-1")
+    content = await get_cached_response(key)
+    if content is None:
+        content = await call_api()
+        ...  # parse; store only responses that parsed
+        await store_response(key, model, content)
+
+Like the embedding cache, failures are counted and logged, never raised.
+Setting ``llm_cache_bypass`` (or passing ``bypass=True``) skips lookups but
+still stores fresh responses, which refreshes the cache.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from evidence_repository.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Evict down to this fraction of the size limit, so eviction is not run on
+# every insert once the cache is full
+EVICTION_TARGET = 0.9
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def llm_cache_key(
+    model: str,
+    temperature: float,
+    system_prompt: str,
+    user_prompt: str,
+    schema_version: str,
+) -> str:
+    """Build the cache key for a chat completion."""
+    parts = [model, repr(float(temperature)), _sha256(system_prompt), _sha256(user_prompt), schema_version]
+    return _sha256("\x1f".join(parts))
+
+
+@dataclass
+class LlmCacheStats:
+    """Hit/miss counters for the LLM response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    sets: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to JSON-serializable dict."""
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class LlmResponseCache:
+    """Size-bounded LLM response store in a local SQLite file."""
+
+    def __init__(self, path: str | Path, max_bytes: int):
+        """Initialize cache.
+
+        Args:
+            path: SQLite database file (created if missing).
+            max_bytes: Total content size before LRU eviction.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.stats = LlmCacheStats()
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    # WAL lets worker processes read while another writes
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS llm_responses ("
+                        " key TEXT PRIMARY KEY,"
+                        " model TEXT NOT NULL,"
+                        " content TEXT NOT NULL,"
+                        " size INTEGER NOT NULL,"
+                        " created_at REAL NOT NULL,"
+                        " accessed_at REAL NOT NULL)"
+                    )
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS ix_llm_responses_accessed_at"
+                        " ON llm_responses (accessed_at)"
+                    )
+                    self._initialized = True
+        return conn
+
+    def _get(self, key: str) -> str | None:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT content FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE llm_responses SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+            return row[0] if row else None
+        finally:
+            conn.close()
+
+    def _set(self, key: str, model: str, content: str) -> int:
+        size = len(content.encode("utf-8"))
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses"
+                " (key, model, content, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, content, size, now, now),
+            )
+            return self._evict(conn)
+        finally:
+            conn.close()
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Delete least recently used entries while over the size limit."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        excess = total - int(self.max_bytes * EVICTION_TARGET)
+        keys: list[str] = []
+        freed = 0
+        for key, size in conn.execute(
+            "SELECT key, size FROM llm_responses ORDER BY accessed_at"
+        ):
+            keys.append(key)
+            freed += size
+            if freed >= excess:
+                break
+
+        conn.executemany("DELETE FROM llm_responses WHERE key = ?", [(k,) for k in keys])
+        return len(keys)
+
+    async def get(self, key: str) -> str | None:
+        """Get cached response content, or None on miss."""
+        try:
+            content = await asyncio.to_thread(self._get, key)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.debug(f"LLM cache get failed: {e}")
+            return None
+
+        if content is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return content
+
+    async def set(self, key: str, model: str, content: str) -> None:
+        """Store response content, evicting old entries if over the limit."""
+        try:
+            evicted = await asyncio.to_thread(self._set, key, model, content)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.debug(f"LLM cache set failed: {e}")
+            return
+
+        self.stats.sets += 1
+        self.stats.evictions += evicted
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        return {
+            "backend": self.__class__.__name__,
+            "path": str(self.path),
+            "max_bytes": self.max_bytes,
+            **self.stats.to_dict(),
+        }
+
+
+@lru_cache
+def get_llm_cache() -> LlmResponseCache | None:
+    """Get the process-wide LLM response cache.
+
+    Returns:
+        Configured cache, or None when caching is disabled.
+    """
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return None
+    return LlmResponseCache(
+        path=settings.llm_cache_path,
+        max_bytes=settings.llm_cache_max_mb * 1024 * 1024,
+    )
+
+
+async def get_cached_response(key: str, bypass: bool = False) -> str | None:
+    """Look up a response, honouring the enabled and bypass settings.
+
+    Args:
+        key: Key from llm_cache_key.
+        bypass: Skip the lookup for this call.
+
+    Returns:
+        Cached content, or None (miss, disabled or bypassed).
+    """
+    cache = get_llm_cache()
+    if cache is None:
+        return None
+    if bypass or get_settings().llm_cache_bypass:
+        cache.stats.bypassed += 1
+        return None
+    return await cache.get(key)
+
+
+async def store_response(key: str, model: str, content: str) -> None:
+    """Store a response that parsed successfully (no-op when disabled)."""
+    cache = get_llm_cache()
+    if cache is not None and content:
+        await cache.set(key, model, content)
+
+
+def get_llm_cache_stats() -> dict:
+    """Get LLM cache statistics for this process."""
+    cache = get_llm_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.get_stats()}
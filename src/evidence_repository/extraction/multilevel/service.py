@@ -1,5 +1,6 @@
 """Multi-level extraction service for domain-specific fact extraction."""
 
+import asyncio
 import json
 import logging
 import uuid
@@ -11,13 +12,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from evidence_repository.config import get_settings
+from evidence_repository.embeddings.scheduler import estimate_tokens
+from evidence_repository.extraction.llm_cache import (
+    get_cached_response,
+    llm_cache_key,
+    store_response,
+)
 from evidence_repository.extraction.multilevel.prompts import (
     build_system_prompt,
     build_user_prompt,
 )
-
-# Get settings instance
-settings = get_settings()
 from evidence_repository.extraction.multilevel.schemas import (
     ExtractedFactClaim,
     ExtractedFactConstraint,
@@ -27,8 +31,16 @@ from evidence_repository.extraction.multilevel.schemas import (
     ExtractedQualityQuestion,
     MultiLevelExtractionResult,
 )
+from evidence_repository.extraction.multilevel.windows import (
+    SpanWindow,
+    build_span_windows,
+    merge_results,
+    resolve_span_refs,
+    span_order_key,
+)
 from evidence_repository.extraction.vocabularies import get_vocabulary
 from evidence_repository.models.document import DocumentVersion
+from evidence_repository.models.evidence import Span, SpanType
 from evidence_repository.models.extraction_level import (
     ExtractionLevel,
     ExtractionLevelCode,
@@ -55,6 +67,9 @@ from evidence_repository.models.quality import (
     QuestionCategory,
 )
 
+# Get settings instance
+settings = get_settings()
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,13 +80,21 @@ class MultiLevelExtractionService:
     profile-specific vocabularies and LLM-based extraction.
     """
 
-    def __init__(self, openai_client: Any | None = None):
+    # LLM temperature (part of the response cache key)
+    TEMPERATURE = 0.1
+
+    # Span types that carry extractable content in map-reduce mode
+    WINDOW_SPAN_TYPES = [SpanType.TEXT, SpanType.TABLE, SpanType.HEADING]
+
+    def __init__(self, openai_client: Any | None = None, bypass_cache: bool = False):
         """Initialize extraction service.
 
         Args:
             openai_client: OpenAI client instance (optional, will create if not provided)
+            bypass_cache: Skip LLM response cache lookups (responses are still stored)
         """
         self._openai_client = openai_client
+        self.bypass_cache = bypass_cache
         self._model = settings.openai_model if hasattr(settings, "openai_model") else "gpt-4o"
 
     @property
@@ -92,9 +115,15 @@ class MultiLevelExtractionService:
         triggered_by: str | None = None,
         schema_version: str = "1.0",
         vocab_version: str = "1.0",
+        map_reduce: bool | None = None,
     ) -> FactExtractionRun:
         """Run extraction for a document version at specified profile/context/level.
 
+        Long documents are extracted in map-reduce mode: the version's spans
+        are packed into token-bounded windows, each window is extracted
+        concurrently and the results are merged, with span_refs pointing at
+        the spans each fact came from.
+
         Args:
             session: Database session
             version_id: Document version ID
@@ -104,6 +133,8 @@ class MultiLevelExtractionService:
             triggered_by: User who triggered extraction
             schema_version: Schema version for output
             vocab_version: Vocabulary version used
+            map_reduce: Force (True) or disable (False) windowed extraction;
+                None decides from the document length
 
         Returns:
             ExtractionRun record
@@ -172,14 +203,33 @@ class MultiLevelExtractionService:
                     session, version_id, profile.id, level - 1
                 )
 
-            user_prompt = build_user_prompt(
-                document_text,
-                spans=None,  # TODO: Add span support
-                previous_extraction=previous_extraction,
-            )
+            spans = []
+            if map_reduce or (
+                map_reduce is None
+                and estimate_tokens(document_text) >= settings.multilevel_map_reduce_min_tokens
+            ):
+                spans = await self._get_window_spans(session, version_id)
+
+            if spans:
+                # Map-reduce over span windows
+                result, window_stats = await self._extract_windows(
+                    system_prompt,
+                    spans,
+                    previous_extraction,
+                    schema_version,
+                    profile_code,
+                    level,
+                )
+            else:
+                user_prompt = build_user_prompt(
+                    document_text,
+                    spans=None,
+                    previous_extraction=previous_extraction,
+                )
 
-            # Call LLM
-            result = await self._call_llm(system_prompt, user_prompt)
+                # Call LLM
+                result = await self._call_llm(system_prompt, user_prompt, schema_version)
+                window_stats = {"extraction_mode": "single"}
 
             # Parse and persist results
             await self._persist_results(session, run, result)
@@ -194,6 +244,7 @@ class MultiLevelExtractionService:
                 "risks_count": len(result.risks),
                 "conflicts_count": len(result.conflicts),
                 "questions_count": len(result.open_questions),
+                **window_stats,
             }
 
         except Exception as e:
@@ -342,12 +393,89 @@ class MultiLevelExtractionService:
             ],
         }
 
+    async def _get_window_spans(
+        self, session: AsyncSession, version_id: uuid.UUID
+    ) -> list[dict[str, Any]]:
+        """Load a version's extractable spans in document order."""
+        result = await session.execute(
+            select(Span.id, Span.text_content, Span.span_type, Span.start_locator).where(
+                Span.document_version_id == version_id,
+                Span.span_type.in_(self.WINDOW_SPAN_TYPES),
+            )
+        )
+        rows = sorted(result.all(), key=lambda row: span_order_key(row.start_locator))
+        return [
+            {
+                "id": str(row.id),
+                "text": row.text_content,
+                "page": (row.start_locator or {}).get("page_hint"),
+                "type": row.span_type.value,
+            }
+            for row in rows
+            if row.text_content and row.text_content.strip()
+        ]
+
+    async def _extract_windows(
+        self,
+        system_prompt: str,
+        spans: list[dict[str, Any]],
+        previous_extraction: dict[str, Any] | None,
+        schema_version: str,
+        profile_code: str,
+        level: int,
+    ) -> tuple[MultiLevelExtractionResult, dict[str, Any]]:
+        """Extract span windows concurrently and merge the results.
+
+        A failed window is logged and skipped; extraction fails only when
+        every window fails.
+
+        Returns:
+            Tuple of (merged result, window statistics for run metadata).
+        """
+        windows = build_span_windows(spans, settings.multilevel_window_tokens)
+        semaphore = asyncio.Semaphore(settings.multilevel_window_concurrency)
+
+        async def extract_window(window: SpanWindow) -> MultiLevelExtractionResult:
+            user_prompt = build_user_prompt(
+                window.text,
+                spans=window.span_references,
+                previous_extraction=previous_extraction,
+            )
+            async with semaphore:
+                result = await self._call_llm(system_prompt, user_prompt, schema_version)
+            resolve_span_refs(result, window)
+            return result
+
+        outcomes = await asyncio.gather(
+            *(extract_window(window) for window in windows), return_exceptions=True
+        )
+
+        results = []
+        failed = 0
+        for window, outcome in zip(windows, outcomes):
+            if isinstance(outcome, BaseException):
+                failed += 1
+                logger.warning(f"Extraction window {window.index} failed: {outcome}")
+            else:
+                results.append(outcome)
+
+        if not results:
+            raise ValueError(f"All {len(windows)} extraction windows failed: {outcomes[0]}")
+
+        return merge_results(results, profile_code, level), {
+            "extraction_mode": "map_reduce",
+            "windows": len(windows),
+            "failed_windows": failed,
+        }
+
     async def _call_llm(
-        self, system_prompt: str, user_prompt: str
+        self, system_prompt: str, user_prompt: str, schema_version: str = "1.0"
     ) -> MultiLevelExtractionResult:
-        """Call LLM for extraction."""
-        import asyncio
+        """Call LLM for extraction.
 
+        Identical prompts for the same model and schema version are served
+        from the LLM response cache.
+        """
         # Run in executor since OpenAI client is sync
         def _sync_call():
             response = self.openai_client.chat.completions.create(
@@ -357,12 +485,22 @@ class MultiLevelExtractionService:
                     {"role": "user", "content": user_prompt},
                 ],
                 response_format={"type": "json_object"},
-                temperature=0.1,
+                temperature=self.TEMPERATURE,
             )
             return response.choices[0].message.content
 
-        loop = asyncio.get_event_loop()
-        response_text = await loop.run_in_executor(None, _sync_call)
+        cache_key = llm_cache_key(
+            self._model,
+            self.TEMPERATURE,
+            system_prompt,
+            user_prompt,
+            f"multilevel-{schema_version}",
+        )
+        response_text = await get_cached_response(cache_key, bypass=self.bypass_cache)
+        from_cache = response_text is not None
+        if not from_cache:
+            loop = asyncio.get_event_loop()
+            response_text = await loop.run_in_executor(None, _sync_call)
 
         # Parse response
         try:
@@ -371,7 +509,7 @@ class MultiLevelExtractionService:
             logger.error(f"Failed to parse LLM response: {e}")
             raise ValueError(f"Invalid JSON response from LLM: {e}")
 
-        return MultiLevelExtractionResult(
+        result = MultiLevelExtractionResult(
             profile_code=data.get("profile_code", "general"),
             level=data.get("level", 2),
             claims=[ExtractedFactClaim(**c) for c in data.get("claims", [])],
@@ -382,6 +520,10 @@ class MultiLevelExtractionService:
             open_questions=[ExtractedQualityQuestion(**q) for q in data.get("open_questions", [])],
         )
 
+        if not from_cache:
+            await store_response(cache_key, self._model, response_text)
+        return result
+
     async def _persist_results(
         self,
         session: AsyncSession,
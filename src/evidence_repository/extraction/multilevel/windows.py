@@ -0,0 +1,250 @@
+"""Span windows for map-reduce multilevel extraction.
+
+Long documents are not sent to the model in one prompt. Instead the version's
+spans are packed into token-bounded windows (``build_span_windows``), each
+window is extracted on its own (map) and the per-window results are merged
+(``merge_results``, reduce).
+
+Inside a window every span is introduced by a short label (``[S1]``, ``[S2]``,
+...) that the model cites in ``span_refs``; ``resolve_span_refs`` maps the
+labels back to span IDs, so every fact refers to the exact spans it came from.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Iterable, TypeVar
+
+from pydantic import BaseModel
+
+from evidence_repository.embeddings.scheduler import pack_batches
+from evidence_repository.extraction.multilevel.schemas import (
+    ExtractedFact,
+    ExtractedFactMetric,
+    ExtractedQualityConflict,
+    MultiLevelExtractionResult,
+)
+
+# Spans per window when packing (the token budget is the real bound)
+MAX_SPANS_PER_WINDOW = 200
+
+T = TypeVar("T", bound=BaseModel)
+
+
+@dataclass
+class SpanWindow:
+    """Consecutive spans extracted together in one prompt."""
+
+    index: int
+    spans: list[dict[str, Any]]  # {"id", "text", "page", "type"}
+    labels: dict[str, str] = field(default_factory=dict)  # label -> span ID
+
+    def __post_init__(self) -> None:
+        if not self.labels:
+            self.labels = {f"S{i + 1}": span["id"] for i, span in enumerate(self.spans)}
+
+    @property
+    def text(self) -> str:
+        """Window content with each span introduced by its label."""
+        return "\n\n".join(
+            f"[{label}]\n{span['text']}"
+            for label, span in zip(self.labels, self.spans)
+        )
+
+    @property
+    def span_references(self) -> list[dict[str, Any]]:
+        """Span list for build_user_prompt, keyed by label."""
+        return [
+            {"id": label, "page": span.get("page") or "N/A", "type": span.get("type", "text")}
+            for label, span in zip(self.labels, self.spans)
+        ]
+
+
+def span_order_key(locator: dict[str, Any] | None) -> tuple[int, int]:
+    """Document order of a span from its locator (page, then offset or row)."""
+    locator = locator or {}
+    page = locator.get("page_hint") or locator.get("page") or 0
+    position = locator.get("offset_start", locator.get("row_start", 0)) or 0
+    return page, position
+
+
+def build_span_windows(spans: list[dict[str, Any]], max_tokens: int) -> list[SpanWindow]:
+    """Pack spans (in document order) into token-bounded windows.
+
+    A span larger than ``max_tokens`` gets a window of its own.
+
+    Args:
+        spans: Span dicts with "id" and "text" (plus optional "page"/"type").
+        max_tokens: Estimated span tokens per window.
+
+    Returns:
+        Windows in document order.
+    """
+    batches = pack_batches([span["text"] for span in spans], max_tokens, MAX_SPANS_PER_WINDOW)
+    return [
+        SpanWindow(index=index, spans=[spans[i] for i in batch])
+        for index, batch in enumerate(batches)
+    ]
+
+
+def _normalize(value: Any) -> str:
+    """Case- and whitespace-insensitive form of a value for dedup keys."""
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, sort_keys=True, default=str)
+    return " ".join(str(value or "").lower().split())
+
+
+def resolve_span_refs(result: MultiLevelExtractionResult, window: SpanWindow) -> None:
+    """Replace window labels in span_refs with span IDs (in place).
+
+    Unknown references are dropped. A fact left without references is
+    attributed to the span containing its evidence quote, if any.
+    """
+    span_ids = set(window.labels.values())
+    facts: list[ExtractedFact] = [*result.claims, *result.metrics, *result.constraints, *result.risks]
+
+    for fact in facts:
+        refs = []
+        for ref in fact.span_refs:
+            ref = str(ref).strip().strip("[]")
+            span_id = window.labels.get(ref.upper(), ref if ref in span_ids else None)
+            if span_id and span_id not in refs:
+                refs.append(span_id)
+
+        if not refs and fact.evidence_quote:
+            quote = _normalize(fact.evidence_quote)
+            refs = [span["id"] for span in window.spans if quote and quote in _normalize(span["text"])][:1]
+
+        fact.span_refs = refs
+
+
+def _union(first: list[str], second: Iterable[str]) -> list[str]:
+    return first + [item for item in second if item not in first]
+
+
+def _merge_facts(facts: list[T], key) -> list[T]:
+    """Deduplicate facts by key, keeping the most confident and all span refs."""
+    merged: dict[Any, T] = {}
+    for fact in facts:
+        fact_key = key(fact)
+        existing = merged.get(fact_key)
+        if existing is None:
+            merged[fact_key] = fact.model_copy(deep=True)
+            continue
+
+        refs = _union(existing.span_refs, fact.span_refs)
+        if (fact.extraction_confidence or 0) > (existing.extraction_confidence or 0):
+            existing = merged[fact_key] = fact.model_copy(deep=True)
+        existing.span_refs = refs
+    return list(merged.values())
+
+
+def _metric_value_key(metric: ExtractedFactMetric) -> str:
+    if metric.value_numeric is not None:
+        return repr(float(metric.value_numeric))
+    return _normalize(metric.value_raw)
+
+
+def _metric_scope_key(metric: ExtractedFactMetric) -> tuple:
+    return (
+        _normalize(metric.metric_name),
+        _normalize(metric.entity_id),
+        metric.period_start,
+        metric.period_end,
+        metric.as_of,
+        _normalize(metric.period_type),
+    )
+
+
+def _cross_window_conflicts(metrics: list[ExtractedFactMetric]) -> list[ExtractedQualityConflict]:
+    """Conflicts for metrics reported with different values in the same scope.
+
+    Windows cannot see each other, so these are only found after merging.
+    """
+    values_by_scope: dict[tuple, dict[str, ExtractedFactMetric]] = {}
+    for metric in metrics:
+        values_by_scope.setdefault(_metric_scope_key(metric), {})[_metric_value_key(metric)] = metric
+
+    conflicts = []
+    for (name, entity, *_), values in values_by_scope.items():
+        if len(values) < 2:
+            continue
+        stated = ", ".join(m.value_raw or str(m.value_numeric) for m in values.values())
+        conflicts.append(
+            ExtractedQualityConflict(
+                topic=f"{name} ({entity})" if entity else name,
+                severity="medium",
+                metric_ids=[name],
+                reason=f"Different values reported for the same period: {stated}",
+            )
+        )
+    return conflicts
+
+
+def merge_results(
+    results: list[MultiLevelExtractionResult],
+    profile_code: str,
+    level: int,
+) -> MultiLevelExtractionResult:
+    """Consolidate per-window results into one result.
+
+    Facts stated in several windows are merged (span refs are unioned, the
+    most confident version is kept); metrics with conflicting values in the
+    same scope are kept and reported as conflicts.
+
+    Args:
+        results: Window results with resolved span refs.
+        profile_code: Extraction profile code.
+        level: Extraction level.
+
+    Returns:
+        Merged MultiLevelExtractionResult.
+    """
+    claims = _merge_facts(
+        [c for r in results for c in r.claims],
+        lambda c: (_normalize(c.subject), _normalize(c.predicate), _normalize(c.object)),
+    )
+    metrics = _merge_facts(
+        [m for r in results for m in r.metrics],
+        lambda m: (*_metric_scope_key(m), _metric_value_key(m)),
+    )
+    constraints = _merge_facts(
+        [c for r in results for c in r.constraints],
+        lambda c: (_normalize(c.constraint_type), _normalize(c.statement)),
+    )
+    risks = _merge_facts(
+        [r for result in results for r in result.risks],
+        lambda r: (_normalize(r.risk_type), _normalize(r.statement)),
+    )
+
+    conflicts: dict[tuple, ExtractedQualityConflict] = {}
+    for conflict in [*(c for r in results for c in r.conflicts), *_cross_window_conflicts(metrics)]:
+        key = (_normalize(conflict.topic), _normalize(conflict.reason))
+        if key in conflicts:
+            existing = conflicts[key]
+            existing.claim_ids = _union(existing.claim_ids, conflict.claim_ids)
+            existing.metric_ids = _union(existing.metric_ids, conflict.metric_ids)
+        else:
+            conflicts[key] = conflict.model_copy(deep=True)
+
+    questions = {}
+    for question in (q for r in results for q in r.open_questions):
+        key = _normalize(question.question)
+        if key in questions:
+            existing = questions[key]
+            existing.related_claim_ids = _union(existing.related_claim_ids, question.related_claim_ids)
+            existing.related_metric_ids = _union(existing.related_metric_ids, question.related_metric_ids)
+        else:
+            questions[key] = question.model_copy(deep=True)
+
+    return MultiLevelExtractionResult(
+        profile_code=profile_code,
+        level=level,
+        claims=claims,
+        metrics=metrics,
+        constraints=constraints,
+        risks=risks,
+        conflicts=list(conflicts.values()),
+        open_questions=list(questions.values()),
+        extraction_metadata={"windows": len(results)},
+    )
+
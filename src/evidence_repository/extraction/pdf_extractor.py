@@ -8,6 +8,14 @@ from pathlib import Path
 from typing import Any
 
 from evidence_repository.config import get_settings
+from evidence_repository.digestion.parser_pool import get_parser_pool
+from evidence_repository.digestion.pdf_pages import (
+    iter_pdf_pages,
+    join_pages,
+    pdf_on_disk,
+    read_pdf_info,
+    use_page_shards,
+)
 from evidence_repository.extraction.base import BaseExtractor, ExtractionArtifact, ExtractedImage
 from evidence_repository.extraction.lovepdf import LovePDFClient, LovePDFError
 
@@ -19,8 +27,8 @@ class PdfExtractor(BaseExtractor):
 
     Uses LovePDF API as the primary extraction method with pypdf as fallback.
     Supports:
-    - Text extraction from all pages
-    - Page count detection
+    - Text extraction from all pages (page-parallel for large PDFs)
+    - Page count detection and page_breaks offsets
     - Image extraction (optional)
     - Metadata extraction
     """
@@ -133,6 +141,11 @@ class PdfExtractor(BaseExtractor):
             logger.warning("pypdf not installed, cannot extract PDF")
             return "", 0, [], {"error": "pypdf not installed"}
 
+        if not (self._extract_images and output_dir) and get_settings().parser_pool_enabled:
+            sharded = await self._extract_pages_parallel(data)
+            if sharded is not None:
+                return sharded
+
         def extract() -> tuple[str, int, list[ExtractedImage], dict[str, Any]]:
             with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
                 f.write(data)
@@ -184,13 +197,42 @@ class PdfExtractor(BaseExtractor):
                     # Filter out None values
                     pdf_metadata = {k: v for k, v in pdf_metadata.items() if v}
 
-                return (
-                    "\n\n".join(text_parts),
-                    len(reader.pages),
-                    images,
-                    pdf_metadata,
-                )
+                text, pdf_metadata["page_breaks"] = join_pages(text_parts)
+                return text, len(reader.pages), images, pdf_metadata
             finally:
                 temp_path.unlink(missing_ok=True)
 
         return await asyncio.to_thread(extract)
+
+    async def _extract_pages_parallel(
+        self,
+        data: bytes,
+    ) -> tuple[str, int, list[ExtractedImage], dict[str, Any]] | None:
+        """Extract text in page shards across the parser pool.
+
+        Args:
+            data: PDF file content.
+
+        Returns:
+            Tuple of (text, page_count, images, metadata), or None when the
+            PDF is below ``pdf_parallel_min_pages`` or unreadable (the
+            sequential path handles it).
+        """
+        pool = get_parser_pool()
+
+        async with pdf_on_disk(data) as path:
+            try:
+                info = await pool.run(read_pdf_info, str(path), label=path.name)
+            except Exception as e:
+                logger.warning(f"Could not read PDF page count, extracting sequentially: {e}")
+                return None
+
+            page_count = info["page_count"]
+            if not use_page_shards(page_count):
+                return None
+
+            texts = [page.text async for page in iter_pdf_pages(path, page_count, pool)]
+
+        text, page_breaks = join_pages(texts)
+        pdf_metadata = {**info.get("metadata", {}), "page_breaks": page_breaks}
+        return text, page_count, [], pdf_metadata
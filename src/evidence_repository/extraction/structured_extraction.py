@@ -4,20 +4,28 @@ Extracts metrics and claims from document spans using LLM-based extraction
 with structured output parsing.
 """
 
+import asyncio
 import json
 import logging
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from openai import AsyncOpenAI
-from pydantic import BaseModel, Field
-from sqlalchemy import select
+from openai import AsyncOpenAI, RateLimitError
+from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from evidence_repository.config import get_settings
+from evidence_repository.embeddings.scheduler import AdaptiveConcurrencyLimiter, pack_batches
+from evidence_repository.extraction.llm_cache import (
+    get_cached_response,
+    llm_cache_key,
+    store_response,
+)
 from evidence_repository.models.evidence import (
     Certainty,
     Claim,
@@ -28,9 +36,19 @@ from evidence_repository.models.evidence import (
     Span,
     SpanType,
 )
+from evidence_repository.spans.bulk import chunked
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT (at most 13 bind parameters each)
+PERSIST_BATCH_SIZE = 1000
+
+# Spans shorter than this (stripped) are not sent to the model
+MIN_SPAN_CHARS = 20
+
+# LLM cache schema version; bump when the prompts' response shape changes
+CACHE_SCHEMA_VERSION = "structured-1"
+
 
 # =============================================================================
 # Extraction Output Schemas (Pydantic models for structured output)
@@ -177,6 +195,113 @@ Return a JSON object with this structure:
 
 If no metrics or claims are found, return empty arrays."""
 
+BATCH_USER_PROMPT_TEMPLATE = """Extract all metrics and claims from each of the following sections.
+Sections are independent excerpts; attribute every extraction to the section
+its evidence quote comes from.
+
+{sections}
+
+Return a JSON object with this structure:
+{{
+  "sections": [
+    {{
+      "section": "S1",
+      "metrics": [
+        {{
+          "metric_type": "arr|mrr|revenue|burn|runway|cash|headcount|churn|nrr|gross_margin|cac|ltv|ebitda|growth_rate|other",
+          "metric_name": "Human readable name",
+          "metric_value": "Value as stated",
+          "numeric_value": 1234.56,
+          "unit": "USD|%|months|etc",
+          "time_scope": "Q4 2024|FY2023|etc",
+          "certainty": "definite|probable|possible|speculative",
+          "reliability": "verified|official|internal|third_party|unknown",
+          "extraction_confidence": 0.95,
+          "evidence_quote": "exact quote from the section"
+        }}
+      ],
+      "claims": [
+        {{
+          "claim_type": "soc2|iso27001|gdpr|hipaa|ip_ownership|security_incident|compliance|certification|audit|policy|other",
+          "claim_text": "The claim statement",
+          "time_scope": "as of 2024|etc",
+          "certainty": "definite|probable|possible|speculative",
+          "reliability": "verified|official|internal|third_party|unknown",
+          "extraction_confidence": 0.90,
+          "evidence_quote": "exact quote from the section"
+        }}
+      ]
+    }}
+  ]
+}}
+
+Sections with no metrics or claims may be omitted."""
+
+
+def section_label(index: int) -> str:
+    """Label of the index-th (0-based) span in a packed prompt."""
+    return f"S{index + 1}"
+
+
+def build_batch_prompt(texts: list[str]) -> str:
+    """Build the user prompt for several spans packed into one request."""
+    sections = "\n\n".join(
+        f"=== {section_label(index)} ===\n{text}" for index, text in enumerate(texts)
+    )
+    return BATCH_USER_PROMPT_TEMPLATE.format(sections=sections)
+
+
+def parse_batch_response(data: dict[str, Any], count: int) -> list[ExtractionResult]:
+    """Attribute a packed response's extractions back to its spans.
+
+    Sections with unknown labels and items failing validation are skipped
+    (logged), so one malformed item does not discard the other spans.
+
+    Args:
+        data: Parsed JSON response.
+        count: Number of spans in the prompt.
+
+    Returns:
+        One ExtractionResult per span, in prompt order.
+    """
+    results = {section_label(index): ExtractionResult() for index in range(count)}
+
+    for section in data.get("sections") or []:
+        if not isinstance(section, dict):
+            continue
+        result = results.get(str(section.get("section", "")).strip())
+        if result is None:
+            logger.warning(f"Ignoring unknown section in extraction response: {section.get('section')!r}")
+            continue
+        for item in section.get("metrics") or []:
+            try:
+                result.metrics.append(ExtractedMetric(**item))
+            except (TypeError, ValidationError) as e:
+                logger.warning(f"Skipping invalid metric: {e}")
+        for item in section.get("claims") or []:
+            try:
+                result.claims.append(ExtractedClaim(**item))
+            except (TypeError, ValidationError) as e:
+                logger.warning(f"Skipping invalid claim: {e}")
+
+    return [results[section_label(index)] for index in range(count)]
+
+
+def _is_json(content: str) -> bool:
+    """Whether a response parses as JSON (only those are cached)."""
+    try:
+        json.loads(content)
+    except json.JSONDecodeError:
+        return False
+    return True
+
+
+@lru_cache
+def get_extraction_limiter() -> AdaptiveConcurrencyLimiter:
+    """Get the process-wide limiter for extraction chat completions."""
+    concurrency = get_settings().structured_extraction_concurrency
+    return AdaptiveConcurrencyLimiter(initial=concurrency, maximum=concurrency)
+
 
 # =============================================================================
 # Extraction Service
@@ -199,17 +324,33 @@ class StructuredExtractionService:
 
     Uses OpenAI GPT-4 for extraction with structured output parsing.
     All extractions reference source spans for traceability.
+
+    extract_from_version packs short spans into shared prompts (results are
+    attributed back per span by section label), runs the requests
+    concurrently under an AdaptiveConcurrencyLimiter and inserts the
+    resulting metrics and claims with multi-row INSERTs.
     """
 
     # Span types to process for extraction
     EXTRACTABLE_SPAN_TYPES = {SpanType.TEXT, SpanType.HEADING, SpanType.TABLE}
 
+    # Attempts per request when rate limited
+    MAX_RETRIES = 3
+    BASE_DELAY = 1.0
+
+    # Low temperature for consistent extraction
+    TEMPERATURE = 0.1
+
     def __init__(
         self,
         db: AsyncSession,
         api_key: str | None = None,
         model: str = "gpt-4o",
         max_tokens: int = 4096,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+        batch_tokens: int | None = None,
+        batch_max_spans: int | None = None,
+        bypass_cache: bool = False,
     ):
         """Initialize extraction service.
 
@@ -218,12 +359,21 @@ class StructuredExtractionService:
             api_key: OpenAI API key (uses settings if not provided).
             model: OpenAI model to use.
             max_tokens: Maximum tokens for response.
+            limiter: Concurrency limiter (process-wide limiter if not provided).
+            batch_tokens: Estimated span tokens packed per prompt (uses settings).
+            batch_max_spans: Spans per packed prompt (uses settings; 1 disables packing).
+            bypass_cache: Skip LLM cache lookups (responses are still stored).
         """
         self.db = db
         settings = get_settings()
         self.api_key = api_key or settings.openai_api_key
         self.model = model
         self.max_tokens = max_tokens
+        self.limiter = limiter or get_extraction_limiter()
+        self.batch_tokens = batch_tokens or settings.structured_extraction_batch_tokens
+        self.batch_max_spans = batch_max_spans or settings.structured_extraction_batch_max_spans
+        self.bypass_cache = bypass_cache
+        self.tokens_used = 0
         self._client: AsyncOpenAI | None = None
 
     @property
@@ -265,30 +415,58 @@ class StructuredExtractionService:
             await self._delete_existing_extractions(version_id, project_id)
 
         logger.info(f"Extracting from {len(spans)} spans for version {version_id}")
+        tokens_before = self.tokens_used
+
+        # Too-short spans are processed without a request
+        candidates = [span for span in spans if self._is_extractable(span)]
+        stats.spans_processed += len(spans) - len(candidates)
+
+        batches = [
+            [candidates[i] for i in batch]
+            for batch in pack_batches(
+                [span.text_content for span in candidates],
+                self.batch_tokens,
+                self.batch_max_spans,
+            )
+        ]
+        jobs = [asyncio.ensure_future(self._extract_batch(batch)) for batch in batches]
 
-        for span in spans:
-            try:
-                result = await self._extract_from_span(span)
-                if result:
-                    # Persist extractions
-                    metrics_created = await self._persist_metrics(
-                        result.metrics, span.id, project_id
-                    )
-                    claims_created = await self._persist_claims(
-                        result.claims, span.id, project_id
-                    )
-                    stats.metrics_extracted += metrics_created
-                    stats.claims_extracted += claims_created
-                stats.spans_processed += 1
-            except Exception as e:
-                logger.error(f"Extraction failed for span {span.id}: {e}")
-                stats.errors += 1
+        metric_rows: list[dict[str, Any]] = []
+        claim_rows: list[dict[str, Any]] = []
+        try:
+            for batch, job in zip(batches, jobs):
+                try:
+                    results = await job
+                except Exception as e:
+                    span_ids = ", ".join(str(span.id) for span in batch)
+                    logger.error(f"Extraction failed for spans {span_ids}: {e}")
+                    stats.errors += len(batch)
+                    continue
+
+                for span, result in zip(batch, results):
+                    if result:
+                        metric_rows.extend(
+                            self._metric_row(m, span.id, project_id) for m in result.metrics
+                        )
+                        claim_rows.extend(
+                            self._claim_row(c, span.id, project_id) for c in result.claims
+                        )
+                    stats.spans_processed += 1
+        finally:
+            # Don't leave requests running if we are cancelled
+            for job in jobs:
+                job.cancel()
+
+        stats.metrics_extracted = await self._insert_rows(Metric, metric_rows)
+        stats.claims_extracted = await self._insert_rows(Claim, claim_rows)
+        stats.tokens_used = self.tokens_used - tokens_before
 
         await self.db.flush()
 
         logger.info(
             f"Extraction complete: {stats.metrics_extracted} metrics, "
-            f"{stats.claims_extracted} claims from {stats.spans_processed} spans"
+            f"{stats.claims_extracted} claims from {stats.spans_processed} spans "
+            f"in {len(batches)} requests"
         )
 
         return stats
@@ -324,6 +502,34 @@ class StructuredExtractionService:
 
         return extraction
 
+    def _is_extractable(self, span: Span) -> bool:
+        """Whether a span has enough text to send to the model."""
+        return bool(span.text_content) and len(span.text_content.strip()) >= MIN_SPAN_CHARS
+
+    async def _extract_batch(self, spans: list[Span]) -> list[ExtractionResult | None]:
+        """Extract from spans sharing one request.
+
+        Args:
+            spans: Extractable spans (a single span uses the per-span prompt).
+
+        Returns:
+            One result per span, in order.
+        """
+        if len(spans) == 1:
+            return [await self._extract_from_span(spans[0])]
+
+        content = await self._complete(build_batch_prompt([span.text_content for span in spans]))
+        if not content:
+            return [None] * len(spans)
+
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse batched extraction response: {e}")
+            return [None] * len(spans)
+
+        return parse_batch_response(data, len(spans))
+
     async def _extract_from_span(self, span: Span) -> ExtractionResult | None:
         """Extract from a single span using LLM.
 
@@ -333,25 +539,11 @@ class StructuredExtractionService:
         Returns:
             ExtractionResult or None.
         """
-        if not span.text_content or len(span.text_content.strip()) < 20:
+        if not self._is_extractable(span):
             return None
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {
-                        "role": "user",
-                        "content": USER_PROMPT_TEMPLATE.format(text=span.text_content),
-                    },
-                ],
-                max_tokens=self.max_tokens,
-                temperature=0.1,  # Low temperature for consistent extraction
-                response_format={"type": "json_object"},
-            )
-
-            content = response.choices[0].message.content
+            content = await self._complete(USER_PROMPT_TEMPLATE.format(text=span.text_content))
             if not content:
                 return None
 
@@ -369,6 +561,74 @@ class StructuredExtractionService:
             logger.error(f"Extraction API call failed: {e}")
             raise
 
+    async def _complete(self, user_prompt: str) -> str | None:
+        """Run one extraction chat completion under the concurrency limiter.
+
+        Identical prompts are served from the LLM response cache without a
+        request. Rate-limited requests shrink the shared limit and are
+        retried after ``retry-after`` (or exponential backoff).
+
+        Args:
+            user_prompt: User message content.
+
+        Returns:
+            Response content (None if empty).
+        """
+        cache_key = llm_cache_key(
+            self.model, self.TEMPERATURE, SYSTEM_PROMPT, user_prompt, CACHE_SCHEMA_VERSION
+        )
+        cached = await get_cached_response(cache_key, bypass=self.bypass_cache)
+        if cached is not None:
+            return cached
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                async with self.limiter.slot():
+                    response = await self.client.chat.completions.create(
+                        model=self.model,
+                        messages=[
+                            {"role": "system", "content": SYSTEM_PROMPT},
+                            {"role": "user", "content": user_prompt},
+                        ],
+                        max_tokens=self.max_tokens,
+                        temperature=self.TEMPERATURE,
+                        response_format={"type": "json_object"},
+                    )
+                self.limiter.record_success()
+                break
+            except RateLimitError as e:
+                delay = self._get_retry_after(e) or self.BASE_DELAY * (2 ** attempt)
+                # Throttle every in-flight request, not just this one
+                self.limiter.record_rate_limit(delay)
+                if attempt >= self.MAX_RETRIES:
+                    raise
+                logger.warning(
+                    f"Extraction rate limited (attempt {attempt + 1}/{self.MAX_RETRIES + 1}), "
+                    f"waiting {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+        usage = getattr(response, "usage", None)
+        if usage is not None and isinstance(getattr(usage, "total_tokens", None), int):
+            self.tokens_used += usage.total_tokens
+
+        content = response.choices[0].message.content
+        if content and _is_json(content):
+            await store_response(cache_key, self.model, content)
+        return content
+
+    def _get_retry_after(self, error: RateLimitError) -> float | None:
+        """Extract the retry-after header from a rate limit error."""
+        response = getattr(error, "response", None)
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass
+        return None
+
     async def _persist_metrics(
         self,
         metrics: list[ExtractedMetric],
@@ -385,48 +645,8 @@ class StructuredExtractionService:
         Returns:
             Number of metrics created.
         """
-        created = 0
-
-        for extracted in metrics:
-            # Parse metric type
-            try:
-                metric_type = MetricType(extracted.metric_type.lower())
-            except ValueError:
-                metric_type = MetricType.OTHER
-
-            # Parse certainty
-            try:
-                certainty = Certainty(extracted.certainty.lower())
-            except ValueError:
-                certainty = Certainty.PROBABLE
-
-            # Parse reliability
-            try:
-                reliability = Reliability(extracted.reliability.lower())
-            except ValueError:
-                reliability = Reliability.UNKNOWN
-
-            metric = Metric(
-                project_id=project_id,
-                span_id=span_id,
-                metric_name=extracted.metric_name,
-                metric_type=metric_type,
-                metric_value=extracted.metric_value,
-                numeric_value=extracted.numeric_value,
-                unit=extracted.unit,
-                time_scope=extracted.time_scope,
-                certainty=certainty,
-                reliability=reliability,
-                extraction_confidence=extracted.extraction_confidence,
-                metadata_={
-                    "evidence_quote": extracted.evidence_quote,
-                    "extraction_model": self.model,
-                },
-            )
-            self.db.add(metric)
-            created += 1
-
-        return created
+        rows = [self._metric_row(m, span_id, project_id) for m in metrics]
+        return await self._insert_rows(Metric, rows)
 
     async def _persist_claims(
         self,
@@ -444,45 +664,107 @@ class StructuredExtractionService:
         Returns:
             Number of claims created.
         """
-        created = 0
+        rows = [self._claim_row(c, span_id, project_id) for c in claims]
+        return await self._insert_rows(Claim, rows)
 
-        for extracted in claims:
-            # Parse claim type
-            try:
-                claim_type = ClaimType(extracted.claim_type.lower())
-            except ValueError:
-                claim_type = ClaimType.OTHER
+    async def _insert_rows(self, model: type[Metric] | type[Claim], rows: list[dict[str, Any]]) -> int:
+        """Insert metric or claim rows with multi-row INSERTs.
 
-            # Parse certainty
-            try:
-                certainty = Certainty(extracted.certainty.lower())
-            except ValueError:
-                certainty = Certainty.PROBABLE
+        Args:
+            model: Metric or Claim.
+            rows: Rows from _metric_row / _claim_row.
 
-            # Parse reliability
-            try:
-                reliability = Reliability(extracted.reliability.lower())
-            except ValueError:
-                reliability = Reliability.UNKNOWN
-
-            claim = Claim(
-                project_id=project_id,
-                span_id=span_id,
-                claim_text=extracted.claim_text,
-                claim_type=claim_type,
-                time_scope=extracted.time_scope,
-                certainty=certainty,
-                reliability=reliability,
-                extraction_confidence=extracted.extraction_confidence,
-                metadata_={
-                    "evidence_quote": extracted.evidence_quote,
-                    "extraction_model": self.model,
-                },
-            )
-            self.db.add(claim)
-            created += 1
+        Returns:
+            Number of rows inserted.
+        """
+        for batch in chunked(rows, PERSIST_BATCH_SIZE):
+            await self.db.execute(insert(model.__table__).values(list(batch)))
+        return len(rows)
+
+    def _metric_row(
+        self,
+        extracted: ExtractedMetric,
+        span_id: UUID,
+        project_id: UUID,
+    ) -> dict[str, Any]:
+        """Build a metrics insert row from an extracted metric."""
+        # Parse metric type
+        try:
+            metric_type = MetricType(extracted.metric_type.lower())
+        except ValueError:
+            metric_type = MetricType.OTHER
+
+        # Parse certainty
+        try:
+            certainty = Certainty(extracted.certainty.lower())
+        except ValueError:
+            certainty = Certainty.PROBABLE
+
+        # Parse reliability
+        try:
+            reliability = Reliability(extracted.reliability.lower())
+        except ValueError:
+            reliability = Reliability.UNKNOWN
+
+        return {
+            "id": uuid4(),
+            "project_id": project_id,
+            "span_id": span_id,
+            "metric_name": extracted.metric_name,
+            "metric_type": metric_type,
+            "metric_value": extracted.metric_value,
+            "numeric_value": extracted.numeric_value,
+            "unit": extracted.unit,
+            "time_scope": extracted.time_scope,
+            "certainty": certainty,
+            "reliability": reliability,
+            "extraction_confidence": extracted.extraction_confidence,
+            "metadata": {
+                "evidence_quote": extracted.evidence_quote,
+                "extraction_model": self.model,
+            },
+        }
+
+    def _claim_row(
+        self,
+        extracted: ExtractedClaim,
+        span_id: UUID,
+        project_id: UUID,
+    ) -> dict[str, Any]:
+        """Build a claims insert row from an extracted claim."""
+        # Parse claim type
+        try:
+            claim_type = ClaimType(extracted.claim_type.lower())
+        except ValueError:
+            claim_type = ClaimType.OTHER
 
-        return created
+        # Parse certainty
+        try:
+            certainty = Certainty(extracted.certainty.lower())
+        except ValueError:
+            certainty = Certainty.PROBABLE
+
+        # Parse reliability
+        try:
+            reliability = Reliability(extracted.reliability.lower())
+        except ValueError:
+            reliability = Reliability.UNKNOWN
+
+        return {
+            "id": uuid4(),
+            "project_id": project_id,
+            "span_id": span_id,
+            "claim_text": extracted.claim_text,
+            "claim_type": claim_type,
+            "time_scope": extracted.time_scope,
+            "certainty": certainty,
+            "reliability": reliability,
+            "extraction_confidence": extracted.extraction_confidence,
+            "metadata": {
+                "evidence_quote": extracted.evidence_quote,
+                "extraction_model": self.model,
+            },
+        }
 
     async def _get_extractable_spans(self, version_id: UUID) -> list[Span]:
         """Get spans suitable for extraction.
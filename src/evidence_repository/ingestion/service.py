@@ -1,8 +1,11 @@
 """Document ingestion service."""
 
+import asyncio
 import hashlib
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
+from typing import TYPE_CHECKING, AsyncIterator, BinaryIO
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,6 +13,75 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from evidence_repository.models.document import Document, DocumentVersion, ExtractionStatus
 from evidence_repository.storage.base import StorageBackend
 
+if TYPE_CHECKING:
+    from fastapi import UploadFile
+
+# Bytes read per chunk when hashing and streaming uploads
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """Upload exceeds the configured size limit."""
+
+    def __init__(self, size: int, max_size: int):
+        self.size = size
+        self.max_size = max_size
+        super().__init__(f"File too large ({size} bytes). Maximum: {max_size} bytes")
+
+
+@dataclass
+class SpooledUpload:
+    """Upload content held in a (disk-backed) spool file.
+
+    Hash and size are computed while spooling, so ingestion can deduplicate
+    and stream the content to storage without loading it into memory.
+    """
+
+    file: BinaryIO
+    size: int
+    file_hash: str
+
+    async def iter_chunks(self, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Yield the content from the start of the spool file."""
+        await asyncio.to_thread(self.file.seek, 0)
+        while chunk := await asyncio.to_thread(self.file.read, chunk_size):
+            yield chunk
+
+
+async def spool_upload(
+    upload: "UploadFile",
+    max_size: int,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> SpooledUpload:
+    """Read an uploaded file in chunks, hashing it and enforcing the size limit.
+
+    Starlette spools multipart files to a temporary file (in memory only up
+    to 1 MB), so reading in chunks keeps memory bounded per upload.
+
+    Args:
+        upload: Uploaded file.
+        max_size: Maximum size in bytes.
+        chunk_size: Bytes per read.
+
+    Returns:
+        SpooledUpload backed by the upload's spool file.
+
+    Raises:
+        UploadTooLargeError: As soon as the content exceeds max_size.
+    """
+    if upload.size is not None and upload.size > max_size:
+        raise UploadTooLargeError(upload.size, max_size)
+
+    digest = hashlib.sha256()
+    size = 0
+    while chunk := await upload.read(chunk_size):
+        size += len(chunk)
+        if size > max_size:
+            raise UploadTooLargeError(size, max_size)
+        digest.update(chunk)
+
+    return SpooledUpload(file=upload.file, size=size, file_hash=digest.hexdigest())
+
 
 class IngestionService:
     """Service for ingesting documents into the repository.
@@ -43,6 +115,12 @@ class IngestionService:
         """
         return hashlib.sha256(data).hexdigest()
 
+    def _content_hash(self, data: bytes | SpooledUpload) -> str:
+        """SHA-256 of bytes, or the hash computed while spooling."""
+        if isinstance(data, SpooledUpload):
+            return data.file_hash
+        return self.compute_file_hash(data)
+
     def generate_storage_path(
         self,
         document_id: uuid.UUID,
@@ -94,7 +172,7 @@ class IngestionService:
         self,
         filename: str,
         content_type: str,
-        data: bytes,
+        data: bytes | SpooledUpload,
         metadata: dict | None = None,
         profile_code: str = "general",
     ) -> tuple[Document, DocumentVersion]:
@@ -103,14 +181,14 @@ class IngestionService:
         Args:
             filename: Original filename.
             content_type: MIME type.
-            data: File content.
+            data: File content, or a spooled upload to stream to storage.
             metadata: Optional document metadata.
             profile_code: Industry profile for extraction (vc, pharma, insurance, general).
 
         Returns:
             Tuple of (Document, DocumentVersion).
         """
-        file_hash = self.compute_file_hash(data)
+        file_hash = self._content_hash(data)
 
         # Check for existing document with same hash
         existing = await self.find_by_hash(file_hash)
@@ -146,7 +224,7 @@ class IngestionService:
     async def create_version(
         self,
         document: Document,
-        data: bytes,
+        data: bytes | SpooledUpload,
         content_type: str,
         metadata: dict | None = None,
     ) -> DocumentVersion:
@@ -154,7 +232,7 @@ class IngestionService:
 
         Args:
             document: Parent document.
-            data: File content.
+            data: File content, or a spooled upload to stream to storage.
             content_type: MIME type.
             metadata: Optional version metadata.
 
@@ -183,20 +261,31 @@ class IngestionService:
         )
 
         # Upload to storage
-        await self.storage.upload(
-            key=storage_path,
-            data=data,
-            content_type=content_type,
-            metadata={"document_id": str(document.id), "version": str(version_number)},
-        )
+        storage_metadata = {"document_id": str(document.id), "version": str(version_number)}
+        if isinstance(data, SpooledUpload):
+            await self.storage.put_stream(
+                storage_path,
+                data.iter_chunks(),
+                content_type,
+                metadata=storage_metadata,
+            )
+            file_size = data.size
+        else:
+            await self.storage.upload(
+                key=storage_path,
+                data=data,
+                content_type=content_type,
+                metadata=storage_metadata,
+            )
+            file_size = len(data)
 
         # Create version record
         version = DocumentVersion(
             document_id=document.id,
             version_number=version_number,
             storage_path=storage_path,
-            file_size=len(data),
-            file_hash=self.compute_file_hash(data),
+            file_size=file_size,
+            file_hash=self._content_hash(data),
             extraction_status=ExtractionStatus.PENDING,
             metadata_=metadata or {},
         )
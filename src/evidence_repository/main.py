@@ -11,6 +11,8 @@ from evidence_repository.api.middleware import setup_middleware
 from evidence_repository.api.routes import router
 from evidence_repository.config import get_settings
 from evidence_repository.db.engine import dispose_engine
+from evidence_repository.digestion.parser_pool import shutdown_parser_pool
+from evidence_repository.services.audit_sink import get_audit_sink
 
 # Configure logging
 logging.basicConfig(
@@ -31,13 +33,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings = get_settings()
     logger.info(f"Storage backend: {settings.storage_backend}")
     logger.info(f"Debug mode: {settings.debug}")
+    if settings.audit_sink_enabled:
+        get_audit_sink().start()
 
     yield
 
     # Shutdown
     logger.info("Shutting down Evidence Repository API...")
+    # Flush buffered audit entries while the engine is still available
+    await get_audit_sink().drain()
     await dispose_engine()
     logger.info("Database connections closed")
+    shutdown_parser_pool()
 
 
 def create_app() -> FastAPI:
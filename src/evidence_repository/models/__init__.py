@@ -24,7 +24,7 @@ from evidence_repository.models.document import (
     DocumentVersion,
     ExtractionStatus,
 )
-from evidence_repository.models.embedding import EmbeddingChunk
+from evidence_repository.models.embedding import EmbeddingChunk, EmbeddingVector
 from evidence_repository.models.extraction import ExtractionRun, ExtractionRunStatus
 from evidence_repository.models.evidence import (
     Certainty,
@@ -130,6 +130,7 @@ __all__ = [
     "QuestionStatus",
     # Embedding
     "EmbeddingChunk",
+    "EmbeddingVector",
     # Extraction (legacy)
     "ExtractionRun",
     "ExtractionRunStatus",
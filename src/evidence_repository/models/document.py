@@ -5,7 +5,7 @@ import uuid
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, Date, DateTime, Enum, Float, ForeignKey, Index, String, Text, func
+from sqlalchemy import BigInteger, Date, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import ARRAY, JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -257,6 +257,12 @@ class DocumentVersion(Base, UUIDMixin):
     extraction_error: Mapped[str | None] = mapped_column(Text)
     extracted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
+    # Work claim for polling workers (see digestion.claims). A PROCESSING
+    # version whose lease has expired is reclaimable by another worker.
+    claimed_by: Mapped[str | None] = mapped_column(String(255))
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    claim_attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
     # Page/sheet count (for PDFs, spreadsheets)
     page_count: Mapped[int | None] = mapped_column()
 
@@ -298,4 +304,14 @@ class DocumentVersion(Base, UUIDMixin):
     __table_args__ = (
         Index("ix_document_versions_document_version", "document_id", "version_number"),
         Index("ix_document_versions_extraction_status", "extraction_status"),
+        Index(
+            "ix_document_versions_pending_created",
+            "created_at",
+            postgresql_where=text("extraction_status = 'pending'"),
+        ),
+        Index(
+            "ix_document_versions_processing_lease",
+            "lease_expires_at",
+            postgresql_where=text("extraction_status = 'processing'"),
+        ),
     )
@@ -5,11 +5,12 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text, func
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import Computed, DateTime, Enum, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from evidence_repository.models.base import Base, UUIDMixin
+from evidence_repository.models.evidence import SpanType
 
 if TYPE_CHECKING:
     from evidence_repository.models.document import DocumentVersion
@@ -40,12 +41,35 @@ class EmbeddingChunk(Base, UUIDMixin):
         index=True,
     )
 
+    # Denormalized scope for filter pushdown (migration 018). Filled on insert
+    # and kept in sync with project_documents by database triggers, so
+    # project/document/span-type filters are plain indexed predicates.
+    document_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("documents.id", ondelete="CASCADE"),
+    )
+    span_type: Mapped[SpanType | None] = mapped_column(
+        Enum(SpanType, name="spantype", create_type=False, values_callable=lambda x: [e.value for e in x]),
+    )
+    project_ids: Mapped[list[uuid.UUID]] = mapped_column(
+        ARRAY(UUID(as_uuid=True)),
+        server_default="{}",
+        nullable=False,
+    )
+
     # Chunk position within document
     chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
 
     # Text content
     text: Mapped[str] = mapped_column(Text, nullable=False)
 
+    # Full-text search vector (generated by Postgres, GIN indexed)
+    text_search: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english'::regconfig, text)", persisted=True),
+        deferred=True,
+    )
+
     # Vector embedding (1536 dimensions for OpenAI text-embedding-3-small)
     # Can be adjusted via config
     embedding: Mapped[list[float]] = mapped_column(Vector(1536), nullable=False)
@@ -75,5 +99,36 @@ class EmbeddingChunk(Base, UUIDMixin):
     __table_args__ = (
         Index("ix_embedding_chunks_document_version", "document_version_id"),
         Index("ix_embedding_chunks_chunk_index", "document_version_id", "chunk_index"),
-        # Vector index will be created via migration with proper operator class
+        Index("ix_embedding_chunks_text_search", "text_search", postgresql_using="gin"),
+        Index("ix_embedding_chunks_document_id", "document_id"),
+        Index("ix_embedding_chunks_span_type", "span_type"),
+        Index("ix_embedding_chunks_project_ids", "project_ids", postgresql_using="gin"),
+        # HNSW vector indexes are created via migration and managed at runtime
+        # by services.vector_index_service (global + per-project partial)
+    )
+
+
+class EmbeddingVector(Base):
+    """Content-addressed embedding store.
+
+    Vectors keyed by (model, dimensions, text hash) so unchanged spans in new
+    document versions and boilerplate repeated across documents are copied
+    instead of re-embedded. See embeddings.store.
+    """
+
+    __tablename__ = "embedding_vectors"
+
+    model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    dimensions: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # SHA-256 of the normalized text
+    text_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    # Untyped vector: dimensions vary by model
+    embedding: Mapped[list[float]] = mapped_column(Vector(), nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
     )
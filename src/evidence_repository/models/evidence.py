@@ -5,8 +5,8 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, Index, String, Text, UniqueConstraint, func
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import Computed, DateTime, Enum, Float, ForeignKey, Index, String, Text, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSON, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from evidence_repository.models.base import Base, TimestampMixin, UUIDMixin
@@ -60,6 +60,13 @@ class Span(Base, UUIDMixin):
     # Extracted text content of the span
     text_content: Mapped[str] = mapped_column(Text, nullable=False)
 
+    # Full-text search vector (generated by Postgres, GIN indexed)
+    text_search: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english'::regconfig, text_content)", persisted=True),
+        deferred=True,
+    )
+
     # Classification
     span_type: Mapped[SpanType] = mapped_column(
         Enum(SpanType, name="spantype", create_type=False, values_callable=lambda x: [e.value for e in x]),
@@ -104,6 +111,7 @@ class Span(Base, UUIDMixin):
     # Indexes and constraints
     __table_args__ = (
         Index("ix_spans_span_type", "span_type"),
+        Index("ix_spans_text_search", "text_search", postgresql_using="gin"),
         # Unique constraint for idempotency
         UniqueConstraint(
             "document_version_id",
@@ -308,6 +308,7 @@ def task_embed_document(
     # Import here to avoid circular imports
     from evidence_repository.embeddings.chunker import TextChunker
     from evidence_repository.embeddings.openai_client import OpenAIEmbeddingClient
+    from evidence_repository.embeddings.writer import chunk_row, write_chunks_sync
     from evidence_repository.models.embedding import EmbeddingChunk
     from evidence_repository.models.evidence import Span, SpanType
 
@@ -410,18 +411,20 @@ def task_embed_document(
                 )
             )
 
-        # Store embedding chunks
-        for chunk, embedding in zip(chunks, embeddings):
-            embedding_chunk = EmbeddingChunk(
+        # Store embedding chunks (binary COPY)
+        write_chunks_sync(db, [
+            chunk_row(
                 document_version_id=version.id,
+                document_id=version.document_id,
                 chunk_index=chunk.index,
                 text=chunk.text,
                 embedding=embedding,
                 char_start=chunk.char_start,
                 char_end=chunk.char_end,
-                metadata_=chunk.metadata,
+                metadata=chunk.metadata,
             )
-            db.add(embedding_chunk)
+            for chunk, embedding in zip(chunks, embeddings)
+        ])
 
         db.commit()
         _update_progress(100, "Embeddings stored successfully")
@@ -459,10 +462,11 @@ def _embed_spans_sync(
         Dict with embedding results.
     """
     from evidence_repository.embeddings.openai_client import OpenAIEmbeddingClient
+    from evidence_repository.embeddings.scheduler import WINDOW_SIZE
+    from evidence_repository.embeddings.store import EmbeddingStore
+    from evidence_repository.embeddings.writer import chunk_row, write_chunks_sync
     from evidence_repository.models.embedding import EmbeddingChunk
 
-    BATCH_SIZE = 50
-
     # Filter spans with content and check for existing embeddings
     valid_spans = []
     existing_span_ids: set = set()
@@ -494,55 +498,62 @@ def _embed_spans_sync(
 
     # Generate embeddings in batches
     client = OpenAIEmbeddingClient()
+    store = EmbeddingStore(client)
     import asyncio
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
-    all_chunks = []
+    chunks_created = 0
 
     try:
-        for batch_start in range(0, len(valid_spans), BATCH_SIZE):
-            batch_end = min(batch_start + BATCH_SIZE, len(valid_spans))
+        for batch_start in range(0, len(valid_spans), WINDOW_SIZE):
+            batch_end = min(batch_start + WINDOW_SIZE, len(valid_spans))
             batch_spans = valid_spans[batch_start:batch_end]
 
             # Progress update
             progress = 15 + ((batch_start / len(valid_spans)) * 70)
-            _update_progress(progress, f"Embedding batch {batch_start // BATCH_SIZE + 1}")
+            _update_progress(progress, f"Embedding spans {batch_start + 1}-{batch_end}")
 
-            # Generate embeddings
+            # Generate embeddings (stored vectors are reused for unchanged text);
+            # the client's scheduler packs each window's requests by tokens and
+            # sends them concurrently
             texts = [s.text_content for s in batch_spans]
-            embeddings = loop.run_until_complete(client.embed_texts(texts))
+            embeddings = store.embed_texts_sync(db, texts, loop)
 
-            # Create embedding chunks
-            for span, embedding, idx in zip(batch_spans, embeddings, range(len(batch_spans))):
-                chunk = EmbeddingChunk(
+            # Create embedding chunks (binary COPY)
+            chunks_created += write_chunks_sync(db, [
+                chunk_row(
                     document_version_id=version.id,
+                    document_id=version.document_id,
                     span_id=span.id,
+                    span_type=span.span_type,
                     chunk_index=idx,
                     text=span.text_content,
                     embedding=embedding,
-                    metadata_={
+                    metadata={
                         "span_type": span.span_type.value,
                         "span_hash": span.span_hash,
                         "locator": span.start_locator,
                     },
                 )
-                db.add(chunk)
-                all_chunks.append(chunk)
+                for idx, (span, embedding) in enumerate(zip(batch_spans, embeddings))
+            ])
 
     finally:
         loop.close()
 
     logger.info(
-        f"Created {len(all_chunks)} span embeddings for version {version.id} "
-        f"(tokens used: {client.get_token_usage()})"
+        f"Created {chunks_created} span embeddings for version {version.id} "
+        f"({store.stats.reused} reused, {store.stats.embedded} embedded; "
+        f"tokens used: {client.get_token_usage()})"
     )
 
     return {
         "document_id": str(version.document_id),
         "version_id": str(version.id),
-        "spans_embedded": len(all_chunks),
+        "spans_embedded": chunks_created,
         "spans_skipped": len(spans) - len(valid_spans),
+        "embeddings_reused": store.stats.reused,
         "tokens_used": client.get_token_usage(),
         "mode": "spans",
     }
@@ -912,16 +923,22 @@ def _extract_xlsx_text(data: bytes) -> str:
     import openpyxl
     import io
 
-    wb = openpyxl.load_workbook(io.BytesIO(data), data_only=True)
+    # Read-only mode streams rows instead of building every cell object
+    wb = openpyxl.load_workbook(io.BytesIO(data), data_only=True, read_only=True)
     text_parts = []
 
-    for sheet in wb.worksheets:
-        sheet_text = [f"=== Sheet: {sheet.title} ==="]
-        for row in sheet.iter_rows(values_only=True):
-            row_text = [str(cell) if cell is not None else "" for cell in row]
-            if any(row_text):
-                sheet_text.append("\t".join(row_text))
-        text_parts.append("\n".join(sheet_text))
+    try:
+        for sheet in wb.worksheets:
+            sheet_text = [f"=== Sheet: {sheet.title} ==="]
+            # Don't trust the declared <dimension>; many writers leave it stale
+            sheet.reset_dimensions()
+            for row in sheet.iter_rows(values_only=True):
+                row_text = [str(cell) if cell is not None else "" for cell in row]
+                if any(row_text):
+                    sheet_text.append("\t".join(row_text))
+            text_parts.append("\n".join(sheet_text))
+    finally:
+        wb.close()
 
     return "\n\n".join(text_parts)
 
@@ -2153,10 +2170,22 @@ def _pipeline_step_build_spans(
 
 
 def _build_spans_from_text(db: Session, version) -> int:
-    """Build spans from extracted text using paragraph-based chunking."""
+    """Build spans from extracted text using paragraph-based chunking.
+
+    Spans are bulk-inserted with ON CONFLICT DO NOTHING on
+    (document_version_id, span_hash), so re-runs skip existing spans
+    without a lookup per paragraph.
+    """
     import hashlib
     import re
-    from evidence_repository.models.evidence import Span, SpanType
+    from evidence_repository.models.evidence import SpanType
+    from evidence_repository.spans.bulk import (
+        INSERT_BATCH_SIZE,
+        build_span_row,
+        chunked,
+        dedupe_rows,
+        insert_spans_statement,
+    )
 
     text = version.extracted_text
     if not text:
@@ -2165,7 +2194,7 @@ def _build_spans_from_text(db: Session, version) -> int:
     # Split by double newlines or page markers
     parts = re.split(r'\n\n+|\f', text)
 
-    spans_created = 0
+    rows = []
     current_pos = 0
 
     for i, part in enumerate(parts):
@@ -2179,18 +2208,6 @@ def _build_spans_from_text(db: Session, version) -> int:
             f"{version.id}:{i}:{part[:100]}".encode()
         ).hexdigest()[:64]
 
-        # Check if span with this hash already exists
-        existing = db.execute(
-            select(Span).where(
-                Span.document_version_id == version.id,
-                Span.span_hash == span_hash,
-            )
-        ).scalar_one_or_none()
-
-        if existing:
-            current_pos += len(part) + 2
-            continue
-
         # Determine span type based on content
         span_type = SpanType.TEXT
         if re.match(r'^#+\s|^[A-Z][A-Z\s]{2,}$', part):
@@ -2198,25 +2215,28 @@ def _build_spans_from_text(db: Session, version) -> int:
         elif '|' in part and part.count('|') > 2:
             span_type = SpanType.TABLE
 
-        # Create span
-        span = Span(
-            document_version_id=version.id,
-            span_hash=span_hash,
-            start_locator={
-                "type": "text",
-                "char_offset_start": current_pos,
-                "char_offset_end": current_pos + len(part),
-                "paragraph_index": i,
-            },
-            end_locator=None,
-            text_content=part,
-            span_type=span_type,
-            metadata_={"paragraph_index": i},
+        rows.append(
+            build_span_row(
+                version_id=version.id,
+                span_hash=span_hash,
+                text_content=part,
+                locator={
+                    "type": "text",
+                    "char_offset_start": current_pos,
+                    "char_offset_end": current_pos + len(part),
+                    "paragraph_index": i,
+                },
+                span_type=span_type,
+                metadata={"paragraph_index": i},
+            )
         )
-        db.add(span)
-        spans_created += 1
         current_pos += len(part) + 2
 
+    spans_created = 0
+    for batch in chunked(dedupe_rows(rows), INSERT_BATCH_SIZE):
+        result = db.execute(insert_spans_statement(list(batch)))
+        spans_created += max(result.rowcount or 0, 0)
+
     return spans_created
 
 
@@ -2230,6 +2250,9 @@ def _pipeline_step_build_embeddings(
     Idempotent: Skips spans that already have embeddings (unless reprocess=True).
     """
     from evidence_repository.embeddings.openai_client import OpenAIEmbeddingClient
+    from evidence_repository.embeddings.scheduler import WINDOW_SIZE
+    from evidence_repository.embeddings.store import EmbeddingStore
+    from evidence_repository.embeddings.writer import chunk_row, write_chunks_sync
     from evidence_repository.models.embedding import EmbeddingChunk
     from evidence_repository.models.evidence import Span, SpanType
 
@@ -2283,9 +2306,10 @@ def _pipeline_step_build_embeddings(
         if not valid_spans:
             return {"status": "skipped", "reason": "no_valid_span_content"}
 
-        # Generate embeddings in batches
+        # Generate embeddings in windows; the client's scheduler packs each
+        # window into token-bounded requests and sends them concurrently
         client = OpenAIEmbeddingClient()
-        BATCH_SIZE = 50
+        store = EmbeddingStore(client)
 
         import asyncio
         loop = asyncio.new_event_loop()
@@ -2293,27 +2317,29 @@ def _pipeline_step_build_embeddings(
 
         chunks_created = 0
         try:
-            for batch_start in range(0, len(valid_spans), BATCH_SIZE):
-                batch_end = min(batch_start + BATCH_SIZE, len(valid_spans))
+            for batch_start in range(0, len(valid_spans), WINDOW_SIZE):
+                batch_end = min(batch_start + WINDOW_SIZE, len(valid_spans))
                 batch_spans = valid_spans[batch_start:batch_end]
 
                 texts = [s.text_content for s in batch_spans]
-                embeddings = loop.run_until_complete(client.embed_texts(texts))
+                embeddings = store.embed_texts_sync(db, texts, loop)
 
-                for span, embedding, idx in zip(batch_spans, embeddings, range(len(batch_spans))):
-                    chunk = EmbeddingChunk(
+                chunks_created += write_chunks_sync(db, [
+                    chunk_row(
                         document_version_id=version.id,
+                        document_id=version.document_id,
                         span_id=span.id,
+                        span_type=span.span_type,
                         chunk_index=idx,
                         text=span.text_content,
                         embedding=embedding,
-                        metadata_={
+                        metadata={
                             "span_type": span.span_type.value,
                             "span_hash": span.span_hash,
                         },
                     )
-                    db.add(chunk)
-                    chunks_created += 1
+                    for idx, (span, embedding) in enumerate(zip(batch_spans, embeddings))
+                ])
         finally:
             loop.close()
 
@@ -2325,6 +2351,7 @@ def _pipeline_step_build_embeddings(
             "status": "completed",
             "spans_embedded": chunks_created,
             "spans_skipped": len(spans) - len(valid_spans),
+            "embeddings_reused": store.stats.reused,
             "tokens_used": client.get_token_usage(),
         }
 
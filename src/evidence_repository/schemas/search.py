@@ -10,6 +10,11 @@ from pydantic import BaseModel, Field
 from evidence_repository.schemas.common import BaseSchema
 
 
+# HNSW scans at most hnsw.ef_search (max 1000) candidates, so offset + limit
+# (max 100) must stay within it
+MAX_SEARCH_OFFSET = 900
+
+
 class SearchMode(str, Enum):
     """Search mode options."""
 
@@ -43,6 +48,9 @@ class SearchQuery(BaseModel):
         default=None, description="Limit search to specific documents"
     )
     limit: int = Field(default=10, ge=1, le=100, description="Maximum results to return")
+    offset: int = Field(
+        default=0, ge=0, le=MAX_SEARCH_OFFSET, description="Results to skip (pagination)"
+    )
     similarity_threshold: float = Field(
         default=0.7,
         ge=0.0,
@@ -72,6 +80,13 @@ class SearchQuery(BaseModel):
         default=False,
         description="Only return results that have associated spans",
     )
+    # Vector index tuning
+    ef_search: int | None = Field(
+        default=None,
+        ge=1,
+        le=1000,
+        description="HNSW ef_search for this query (higher = better recall, slower)",
+    )
 
     # Two-stage search metadata filters
     sectors: list[str] | None = Field(
@@ -194,6 +209,9 @@ class ProjectSearchQuery(BaseModel):
 
     query: str = Field(..., min_length=1, description="Search query text")
     limit: int = Field(default=10, ge=1, le=100, description="Maximum results")
+    offset: int = Field(
+        default=0, ge=0, le=MAX_SEARCH_OFFSET, description="Results to skip (pagination)"
+    )
     similarity_threshold: float = Field(
         default=0.7,
         ge=0.0,
@@ -221,6 +239,12 @@ class ProjectSearchQuery(BaseModel):
         default=False,
         description="Only return span-based results",
     )
+    ef_search: int | None = Field(
+        default=None,
+        ge=1,
+        le=1000,
+        description="HNSW ef_search for this query (higher = better recall, slower)",
+    )
     # Project-specific filters
     document_ids: list[UUID] | None = Field(
         default=None,
@@ -0,0 +1,49 @@
+"""Pydantic schemas for vector index management."""
+
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class VectorIndexBuildRequest(BaseModel):
+    """Request to build or rebuild an HNSW index."""
+
+    project_id: UUID | None = Field(
+        None,
+        description="Build a partial index for this project (omit for the global index)",
+    )
+    m: int | None = Field(
+        None, ge=2, le=100, description="Max graph connections per layer (default from settings)"
+    )
+    ef_construction: int | None = Field(
+        None, ge=4, le=1000, description="Build-time candidate list size (default from settings)"
+    )
+    rebuild: bool = Field(False, description="Replace the index if it already exists")
+
+
+class VectorIndexResponse(BaseModel):
+    """Report entry for a vector index."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str
+    method: str = Field(..., description="Index access method (hnsw, ivfflat)")
+    scope: str = Field(..., description="global or project")
+    project_id: UUID | None = None
+    size_bytes: int
+    is_valid: bool = Field(..., description="False while a concurrent build is incomplete")
+    definition: str
+    version_count: int | None = Field(None, description="Versions covered (project indexes)")
+    stale: bool | None = Field(
+        None, description="Project membership changed since the index was built"
+    )
+    build_params: dict = Field(default_factory=dict)
+    built_at: str | None = None
+
+
+class VectorIndexListResponse(BaseModel):
+    """Response for listing vector indexes."""
+
+    items: list[VectorIndexResponse]
+    total: int
+    stale_count: int = Field(0, description="Project indexes that need a rebuild")
@@ -0,0 +1,234 @@
+"""Buffered audit log writer.
+
+AuditLoggingMiddleware used to open a session and commit one
+``INSERT INTO audit_logs`` inline for every audited request, adding a round
+trip and a pool checkout to searches and uploads. Requests now hand their
+entries to an AuditSink instead:
+
+- entries go into a bounded in-process queue (``offer`` never waits; when the
+  queue is full the entry is dropped and counted);
+- a background flusher bulk-inserts a batch when ``batch_size`` entries are
+  waiting or ``flush_interval_seconds`` after the first one arrived;
+- ``drain()`` in the application lifespan stops the flusher and writes what
+  is left before the engine is disposed.
+
+Entries carry their own timestamp, taken when the request finished, so
+batching does not shift them to the flush time.
+
+Where the lifespan hook does not run (e.g. test clients), the sink is not
+started and the middleware writes entries inline as before. The sink is
+also off by default on Vercel (``audit_sink_enabled``), where an instance
+can be frozen after responding and recycled without a shutdown drain.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import insert
+
+from evidence_repository.config import get_settings
+from evidence_repository.db.session import get_session_factory
+from evidence_repository.models.audit import AuditLog
+
+logger = logging.getLogger(__name__)
+
+AuditWriter = Callable[[list[dict[str, Any]]], Awaitable[None]]
+
+# Log a warning for the first dropped entry and then every this many drops
+DROP_WARNING_EVERY = 1000
+
+
+async def write_audit_entries(entries: list[dict[str, Any]]) -> None:
+    """Insert audit log entries in one statement and commit.
+
+    Args:
+        entries: AuditLog column values, one dict per entry.
+    """
+    if not entries:
+        return
+
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        await session.execute(insert(AuditLog), entries)
+        await session.commit()
+
+
+class AuditSink:
+    """Bounded queue of audit entries with a background bulk-insert flusher."""
+
+    def __init__(
+        self,
+        writer: AuditWriter = write_audit_entries,
+        max_queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval_seconds: float = 1.0,
+    ):
+        """Initialize sink.
+
+        Args:
+            writer: Coroutine that persists a batch of entries.
+            max_queue_size: Entries buffered before new ones are dropped.
+            batch_size: Entries written per insert.
+            flush_interval_seconds: Longest time an entry waits for a batch.
+        """
+        self.writer = writer
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._task: asyncio.Task | None = None
+        self._batch: list[dict[str, Any]] = []
+        self._inflight: asyncio.Future | None = None
+
+        self._enqueued = 0
+        self._dropped = 0
+        self._written = 0
+        self._failed = 0
+        self._batches = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the flusher is accepting entries."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run(), name="audit-sink-flusher")
+        logger.info(
+            f"Audit sink started (queue={self.max_queue_size}, batch={self.batch_size}, "
+            f"interval={self.flush_interval_seconds}s)"
+        )
+
+    def offer(self, entry: dict[str, Any]) -> bool:
+        """Queue an entry without waiting.
+
+        Args:
+            entry: AuditLog column values.
+
+        Returns:
+            True if queued, False if the sink is not running or the queue is full.
+        """
+        if not self.running:
+            return False
+
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            self._dropped += 1
+            if self._dropped % DROP_WARNING_EVERY == 1:
+                logger.warning(
+                    f"Audit queue full ({self.max_queue_size} entries); "
+                    f"{self._dropped} audit entries dropped so far"
+                )
+            return False
+
+        self._enqueued += 1
+        return True
+
+    async def drain(self, timeout: float = 10.0) -> None:
+        """Stop the flusher and write all queued entries.
+
+        Args:
+            timeout: Seconds to wait for the final writes.
+        """
+        if self._task is None:
+            return
+
+        task, self._task = self._task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        remaining, self._batch = self._batch, []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+
+        try:
+            await asyncio.wait_for(self._finish(remaining), timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Audit sink drain timed out; up to {len(remaining)} entries lost")
+        else:
+            logger.info(f"Audit sink drained ({len(remaining)} entries flushed at shutdown)")
+
+    async def _finish(self, entries: list[dict[str, Any]]) -> None:
+        """Wait for an interrupted batch write, then write ``entries``."""
+        if self._inflight is not None:
+            await self._inflight
+            self._inflight = None
+        for start in range(0, len(entries), self.batch_size):
+            await self._write(entries[start:start + self.batch_size])
+
+    async def _run(self) -> None:
+        """Collect batches and write them until cancelled."""
+        while True:
+            # Entries collected so far stay in self._batch, where drain()
+            # picks them up if the flusher is cancelled mid-collection
+            self._batch.append(await self._queue.get())
+            deadline = time.monotonic() + self.flush_interval_seconds
+
+            while len(self._batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    self._batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            batch, self._batch = self._batch, []
+            # Shielded so drain() lets a started write finish instead of
+            # retrying (and possibly duplicating) it
+            self._inflight = asyncio.ensure_future(self._write(batch))
+            await asyncio.shield(self._inflight)
+            self._inflight = None
+
+    async def _write(self, batch: list[dict[str, Any]]) -> None:
+        """Write one batch, counting (not raising) failures."""
+        if not batch:
+            return
+        try:
+            await self.writer(batch)
+        except Exception as e:
+            self._failed += len(batch)
+            logger.error(f"Failed to write {len(batch)} audit entries: {e}")
+            return
+
+        self._written += len(batch)
+        self._batches += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get sink counters."""
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_size": self.max_queue_size,
+            "enqueued": self._enqueued,
+            "dropped": self._dropped,
+            "written": self._written,
+            "failed": self._failed,
+            "batches": self._batches,
+        }
+
+
+_sink: AuditSink | None = None
+
+
+def get_audit_sink() -> AuditSink:
+    """Get the process-wide audit sink."""
+    global _sink
+    if _sink is None:
+        settings = get_settings()
+        _sink = AuditSink(
+            max_queue_size=settings.audit_queue_max_size,
+            batch_size=settings.audit_batch_size,
+            flush_interval_seconds=settings.audit_flush_interval_seconds,
+        )
+    return _sink
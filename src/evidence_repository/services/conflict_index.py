@@ -0,0 +1,237 @@
+"""Interval-indexed search for conflicting metric observations.
+
+Two observations of the same metric conflict when their time windows overlap
+and their values differ (QualityAnalysisService._periods_overlap and
+_values_differ). Comparing every pair is quadratic, and one metric such as
+``revenue`` can have thousands of observations across a project.
+``find_conflicting_pairs`` returns the same pairs in O(n log n + k):
+
+- observations with an identical time window are grouped, and all pairs in a
+  group overlap;
+- group pairs that overlap are found by equality of ``as_of`` dates and by
+  sweeping ranges sorted by period start;
+- within each overlapping group pair, numeric values are sorted. A value's
+  near-equal neighbours (within 1%) form a contiguous block found by
+  bisection, so only the pairs that actually differ are visited.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Iterable, Protocol
+
+# Values within this relative difference are considered equal
+VALUE_TOLERANCE = 0.01
+
+
+class MetricObservation(Protocol):
+    """Fields used to compare metric observations (e.g. FactMetric)."""
+
+    value_numeric: float | None
+    value_raw: str | None
+    period_start: date | None
+    period_end: date | None
+    as_of: date | None
+
+
+def numbers_differ(a: float, b: float) -> bool:
+    """Check if two numeric values differ by more than VALUE_TOLERANCE."""
+    if a == 0 and b == 0:
+        return False
+    if a == 0 or b == 0:
+        return True
+    return abs(a - b) / max(abs(a), abs(b)) > VALUE_TOLERANCE
+
+
+def _near_bounds(value: float) -> tuple[float, float]:
+    """Approximate range of values that do not differ from ``value``."""
+    if value > 0:
+        return value * (1 - VALUE_TOLERANCE), value / (1 - VALUE_TOLERANCE)
+    if value < 0:
+        return value / (1 - VALUE_TOLERANCE), value * (1 - VALUE_TOLERANCE)
+    return 0.0, 0.0
+
+
+@dataclass
+class _WindowGroup:
+    """Observations sharing one time window, indexed by value."""
+
+    as_of: date | None
+    period_start: date | None
+    period_end: date | None
+    members: list[int] = field(default_factory=list)
+    values: list[float] = field(default_factory=list)  # Sorted numeric values
+    value_members: list[int] = field(default_factory=list)  # Aligned with values
+    by_raw: dict[Any, list[int]] = field(default_factory=dict)
+    non_numeric: list[tuple[int, Any]] = field(default_factory=list)  # (index, raw)
+
+    @property
+    def has_range(self) -> bool:
+        return self.period_start is not None and self.period_end is not None
+
+    @property
+    def is_undated(self) -> bool:
+        return self.as_of is None and not self.has_range
+
+    def index(self, observations: list[MetricObservation]) -> None:
+        numeric = sorted(
+            (observations[i].value_numeric, i)
+            for i in self.members
+            if observations[i].value_numeric is not None
+        )
+        self.values = [value for value, _ in numeric]
+        self.value_members = [i for _, i in numeric]
+        for i in self.members:
+            self.by_raw.setdefault(observations[i].value_raw, []).append(i)
+            if observations[i].value_numeric is None:
+                self.non_numeric.append((i, observations[i].value_raw))
+
+    def near_block(self, value: float) -> tuple[int, int]:
+        """Positions [lo, hi) of ``values`` that do not differ from ``value``."""
+        values = self.values
+        low, high = _near_bounds(value)
+        lo = bisect_left(values, low)
+        hi = bisect_right(values, high)
+
+        # Settle float rounding at the block edges with the exact check
+        while lo > 0 and not numbers_differ(value, values[lo - 1]):
+            lo -= 1
+        while lo < hi and numbers_differ(value, values[lo]):
+            lo += 1
+        while hi < len(values) and not numbers_differ(value, values[hi]):
+            hi += 1
+        while hi > lo and numbers_differ(value, values[hi - 1]):
+            hi -= 1
+        return lo, hi
+
+
+def _window_key(observation: MetricObservation) -> tuple:
+    has_range = observation.period_start is not None and observation.period_end is not None
+    return (
+        observation.as_of,
+        observation.period_start if has_range else None,
+        observation.period_end if has_range else None,
+    )
+
+
+def _pair(i: int, j: int) -> tuple[int, int]:
+    return (i, j) if i < j else (j, i)
+
+
+def _differing_within(group: _WindowGroup, pairs: set[tuple[int, int]]) -> None:
+    """Add pairs of differing values inside one group."""
+    for position, value in enumerate(group.values):
+        _, hi = group.near_block(value)
+        i = group.value_members[position]
+        for j in group.value_members[hi:]:
+            pairs.add(_pair(i, j))
+
+    _differing_raw(group.non_numeric, group, pairs)
+
+
+def _differing_across(a: _WindowGroup, b: _WindowGroup, pairs: set[tuple[int, int]]) -> None:
+    """Add pairs of differing values between two groups."""
+    for position, value in enumerate(a.values):
+        lo, hi = b.near_block(value)
+        i = a.value_members[position]
+        for j in b.value_members[:lo]:
+            pairs.add(_pair(i, j))
+        for j in b.value_members[hi:]:
+            pairs.add(_pair(i, j))
+
+    _differing_raw(a.non_numeric, b, pairs)
+    _differing_raw(b.non_numeric, a, pairs)
+
+
+def _differing_raw(
+    non_numeric: list[tuple[int, Any]], group: _WindowGroup, pairs: set[tuple[int, int]]
+) -> None:
+    """Add pairs of non-numeric observations with group members of another raw value."""
+    for i, raw in non_numeric:
+        for other_raw, members in group.by_raw.items():
+            if other_raw != raw:
+                for j in members:
+                    pairs.add(_pair(i, j))
+
+
+def _overlapping_groups(groups: list[_WindowGroup]) -> Iterable[tuple[_WindowGroup, _WindowGroup]]:
+    """Yield pairs of distinct groups whose time windows overlap.
+
+    Undated groups overlap everything. Two groups with ``as_of`` dates
+    compare those dates. Otherwise ranges are compared, with a bare
+    ``as_of`` date treated as a one-day range.
+    """
+    # All undated observations share one group
+    dated = [g for g in groups if not g.is_undated]
+    for group in groups:
+        if group.is_undated:
+            yield from ((group, other) for other in dated)
+
+    # Point-in-time values: equal as_of dates
+    by_as_of: dict[date, list[_WindowGroup]] = {}
+    for group in dated:
+        if group.as_of is not None:
+            by_as_of.setdefault(group.as_of, []).append(group)
+    for same_date in by_as_of.values():
+        for position, group in enumerate(same_date):
+            yield from ((group, other) for other in same_date[position + 1:])
+
+    # Ranges: sweep by start. Every remaining overlap involves a range-only
+    # group: against another range (its own or a dated group's) or containing
+    # a bare as_of date, which sweeps as a one-day range
+    intervals = sorted(
+        (
+            (g.period_start, g.period_end, position, g)
+            if g.has_range
+            else (g.as_of, g.as_of, position, g)
+        )
+        for position, g in enumerate(dated)
+    )
+    active_ranges: dict[int, _WindowGroup] = {}
+    active_dated: dict[int, _WindowGroup] = {}
+    ends: list[tuple[date, int]] = []
+
+    for start, end, position, group in intervals:
+        while ends and ends[0][0] < start:
+            _, ended = heapq.heappop(ends)
+            active_ranges.pop(ended, None)
+            active_dated.pop(ended, None)
+
+        yield from ((other, group) for other in active_ranges.values())
+        if group.as_of is None:
+            yield from ((other, group) for other in active_dated.values())
+            active_ranges[position] = group
+        else:
+            active_dated[position] = group
+        heapq.heappush(ends, (end, position))
+
+
+def find_conflicting_pairs(observations: list[MetricObservation]) -> list[tuple[int, int]]:
+    """Find pairs of observations with overlapping periods and differing values.
+
+    Args:
+        observations: Observations of one metric for one entity.
+
+    Returns:
+        Sorted (i, j) index pairs with i < j, as a pairwise comparison
+        in input order would produce them.
+    """
+    groups: dict[tuple, _WindowGroup] = {}
+    for i, observation in enumerate(observations):
+        key = _window_key(observation)
+        if key not in groups:
+            groups[key] = _WindowGroup(*key)
+        groups[key].members.append(i)
+
+    window_groups = list(groups.values())
+    for group in window_groups:
+        group.index(observations)
+
+    pairs: set[tuple[int, int]] = set()
+    for group in window_groups:
+        _differing_within(group, pairs)
+    for a, b in _overlapping_groups(window_groups):
+        _differing_across(a, b, pairs)
+
+    return sorted(pairs)
@@ -17,6 +17,7 @@ from evidence_repository.models.evidence import (
     SpanType,
 )
 from evidence_repository.models.project import Project
+from evidence_repository.services.pack_export import PackExporter
 
 
 @dataclass
@@ -320,46 +321,21 @@ class EvidenceService:
     ) -> EvidencePackExport | None:
         """Export an evidence pack to a structured format.
 
+        Builds the whole export in memory; for large packs stream it with
+        PackExporter (services.pack_export) instead.
+
         Args:
             pack_id: Pack ID.
 
         Returns:
             EvidencePackExport or None if not found.
         """
-        pack = await self.get_evidence_pack(pack_id)
-        if not pack:
+        exporter = await PackExporter.open(self.db, pack_id)
+        if not exporter:
             return None
 
-        items = []
-        for item in pack.items:
-            export_item = {
-                "order": item.order_index,
-                "notes": item.notes,
-                "span": {
-                    "id": str(item.span.id),
-                    "text": item.span.text_content,
-                    "type": item.span.span_type.value,
-                    "locator": item.span.start_locator,
-                },
-            }
-
-            if item.claim:
-                export_item["claim"] = {
-                    "id": str(item.claim.id),
-                    "text": item.claim.claim_text,
-                    "type": item.claim.claim_type,
-                    "confidence": item.claim.confidence,
-                }
-
-            if item.metric:
-                export_item["metric"] = {
-                    "id": str(item.metric.id),
-                    "name": item.metric.metric_name,
-                    "value": item.metric.metric_value,
-                    "unit": item.metric.unit,
-                }
-
-            items.append(export_item)
+        pack = exporter.pack
+        items = [item async for item in exporter.iter_items()]
 
         return EvidencePackExport(
             pack_id=pack.id,
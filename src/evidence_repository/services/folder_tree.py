@@ -0,0 +1,210 @@
+"""Project folder tree construction and caching.
+
+The folder tree used to eagerly load every ProjectDocument row to count
+documents and rescanned all folders for the children of each node (O(n^2)).
+FolderTreeService instead runs two queries:
+
+- the project's folders (columns only), in display order;
+- ``COUNT(*) ... GROUP BY folder_id`` over the project's documents (the NULL
+  group is the project root);
+
+and links the nodes through a parent-to-children map in O(n), without
+recursion, so deep trees are fine.
+
+Trees are cached per project and process (LRU with a TTL). Routes that
+create, move or delete folders, or attach, detach or move documents, call
+invalidate_folder_tree, but that only reaches the process that made the
+change. Other API instances and ingestion workers keep serving their copy
+until it expires, so the TTL is kept to a few seconds: long enough to absorb
+a burst of tree requests from one page load, short enough that a change made
+elsewhere shows up on the next refresh.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from evidence_repository.config import get_settings
+from evidence_repository.models.folder import Folder
+from evidence_repository.models.project import ProjectDocument
+from evidence_repository.schemas.folder import FolderTreeNode, FolderTreeResponse
+
+
+class FolderTreeCache:
+    """Per-process LRU cache of folder trees with TTL."""
+
+    def __init__(self, max_projects: int = 1000, ttl_seconds: float = 5):
+        """Initialize cache.
+
+        Args:
+            max_projects: Maximum cached trees before LRU eviction.
+            ttl_seconds: Tree lifetime in seconds.
+        """
+        self.max_projects = max_projects
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[uuid.UUID, tuple[float, FolderTreeResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, project_id: uuid.UUID) -> FolderTreeResponse | None:
+        """Get a cached tree, or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is None:
+                return None
+
+            expires_at, tree = entry
+            if expires_at < time.monotonic():
+                del self._entries[project_id]
+                return None
+
+            self._entries.move_to_end(project_id)
+            return tree
+
+    def set(self, project_id: uuid.UUID, tree: FolderTreeResponse) -> None:
+        """Store a tree, evicting the least recently used one if full."""
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[project_id] = (time.monotonic() + self.ttl_seconds, tree)
+            self._entries.move_to_end(project_id)
+            while len(self._entries) > self.max_projects:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, project_id: uuid.UUID) -> None:
+        """Drop a project's cached tree."""
+        with self._lock:
+            self._entries.pop(project_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached trees."""
+        with self._lock:
+            self._entries.clear()
+
+
+_cache: FolderTreeCache | None = None
+
+
+def get_folder_tree_cache() -> FolderTreeCache:
+    """Get the process-wide folder tree cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = FolderTreeCache(
+            max_projects=settings.folder_tree_cache_max_projects,
+            ttl_seconds=settings.folder_tree_cache_ttl_seconds,
+        )
+    return _cache
+
+
+def invalidate_folder_tree(project_id: uuid.UUID) -> None:
+    """Drop a project's cached folder tree after folders or documents change."""
+    get_folder_tree_cache().invalidate(project_id)
+
+
+def build_folder_tree(
+    folders: Iterable[Any],
+    document_counts: dict[uuid.UUID, int],
+) -> list[FolderTreeNode]:
+    """Link folders into a tree in O(n).
+
+    Args:
+        folders: Folder rows (id, name, description, parent_folder_id,
+            display_order, color, icon), in the order children should appear.
+        document_counts: Folder ID -> number of documents directly in it.
+
+    Returns:
+        Root nodes. Folders whose parent is not among ``folders`` are left out,
+        as they are unreachable from the root.
+    """
+    nodes: dict[uuid.UUID, FolderTreeNode] = {}
+    parents: list[tuple[FolderTreeNode, uuid.UUID | None]] = []
+
+    for folder in folders:
+        node = FolderTreeNode(
+            id=folder.id,
+            name=folder.name,
+            description=folder.description,
+            parent_folder_id=folder.parent_folder_id,
+            display_order=folder.display_order,
+            color=folder.color,
+            icon=folder.icon,
+            document_count=document_counts.get(folder.id, 0),
+            children=[],
+        )
+        nodes[folder.id] = node
+        parents.append((node, folder.parent_folder_id))
+
+    roots = []
+    for node, parent_id in parents:
+        if parent_id is None:
+            roots.append(node)
+        elif parent_id in nodes:
+            nodes[parent_id].children.append(node)
+
+    return roots
+
+
+class FolderTreeService:
+    """Build (and cache) a project's folder tree."""
+
+    def __init__(self, db: AsyncSession, cache: FolderTreeCache | None = None):
+        """Initialize folder tree service.
+
+        Args:
+            db: Database session.
+            cache: Tree cache (defaults to the process-wide cache).
+        """
+        self.db = db
+        self.cache = cache or get_folder_tree_cache()
+
+    async def get_tree(self, project_id: uuid.UUID) -> FolderTreeResponse:
+        """Get the folder tree for a project.
+
+        Args:
+            project_id: Project ID.
+
+        Returns:
+            FolderTreeResponse with root folders and the root document count.
+        """
+        tree = self.cache.get(project_id)
+        if tree is None:
+            tree = await self.build_tree(project_id)
+            self.cache.set(project_id, tree)
+        return tree
+
+    async def build_tree(self, project_id: uuid.UUID) -> FolderTreeResponse:
+        """Build the folder tree from the database (uncached)."""
+        folders_result = await self.db.execute(
+            select(
+                Folder.id,
+                Folder.name,
+                Folder.description,
+                Folder.parent_folder_id,
+                Folder.display_order,
+                Folder.color,
+                Folder.icon,
+            )
+            .where(
+                Folder.project_id == project_id,
+                Folder.deleted_at.is_(None),
+            )
+            .order_by(Folder.display_order, Folder.name)
+        )
+
+        counts_result = await self.db.execute(
+            select(ProjectDocument.folder_id, func.count())
+            .where(ProjectDocument.project_id == project_id)
+            .group_by(ProjectDocument.folder_id)
+        )
+        document_counts = {folder_id: count for folder_id, count in counts_result.all()}
+
+        return FolderTreeResponse(
+            project_id=project_id,
+            root_document_count=document_counts.get(None, 0),
+            folders=build_folder_tree(folders_result.all(), document_counts),
+        )
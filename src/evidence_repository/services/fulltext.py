@@ -0,0 +1,155 @@
+"""Postgres full-text search helpers.
+
+``embedding_chunks.text_search`` and ``spans.text_search`` are stored
+generated ``tsvector`` columns with GIN indexes (migration 017). This module
+turns user queries into ``tsquery`` expressions against them:
+
+- ``revenue growth``  -> every word must match (stemmed)
+- ``"annual recurring revenue"`` -> phrase match (adjacent lexemes)
+- ``recur*`` -> prefix match
+
+Highlights come from ``ts_headline`` with ``HighlightAll`` and sentinel
+markers, which ``parse_headline`` converts back to character offsets.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Literal
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.sql.elements import ColumnElement
+
+# Text search configuration; must match the generated columns in migration 017
+FTS_CONFIG = "english"
+
+# ts_rank_cd normalization 32: rank / (rank + 1), keeps scores in [0, 1)
+RANK_NORMALIZATION = 32
+
+# Sentinel highlight markers (unlikely to appear in document text)
+HEADLINE_START = "⟦"
+HEADLINE_STOP = "⟧"
+HEADLINE_OPTIONS = (
+    f'StartSel="{HEADLINE_START}", StopSel="{HEADLINE_STOP}", HighlightAll=true'
+)
+
+_TOKEN_PATTERN = re.compile(r'"([^"]+)"|(\S+)')
+_LEXEME_PATTERN = re.compile(r"[^\w]+")
+
+
+@dataclass(frozen=True)
+class QueryTerm:
+    """One term of a parsed search query."""
+
+    text: str
+    kind: Literal["word", "phrase", "prefix"] = "word"
+
+
+def parse_query(query: str) -> list[QueryTerm]:
+    """Parse a user query into words, quoted phrases and prefix terms.
+
+    Args:
+        query: Raw query text.
+
+    Returns:
+        Parsed terms (empty if the query has no searchable content).
+    """
+    terms: list[QueryTerm] = []
+    for match in _TOKEN_PATTERN.finditer(query):
+        phrase, token = match.groups()
+        if phrase is not None:
+            if phrase.strip():
+                terms.append(QueryTerm(phrase.strip(), "phrase"))
+            continue
+
+        if token.endswith("*"):
+            lexeme = _LEXEME_PATTERN.sub("", token)
+            if lexeme:
+                terms.append(QueryTerm(lexeme, "prefix"))
+            continue
+
+        if _LEXEME_PATTERN.sub("", token):
+            terms.append(QueryTerm(token, "word"))
+    return terms
+
+
+def _config() -> ColumnElement:
+    return literal_column(f"'{FTS_CONFIG}'::regconfig")
+
+
+def term_tsquery(term: QueryTerm) -> ColumnElement:
+    """Build the tsquery expression for a single term."""
+    if term.kind == "phrase":
+        return func.phraseto_tsquery(_config(), term.text)
+    if term.kind == "prefix":
+        # Lexeme is sanitized to word characters, so to_tsquery cannot fail
+        return func.to_tsquery(_config(), f"{term.text}:*")
+    return func.plainto_tsquery(_config(), term.text)
+
+
+def build_tsquery(terms: list[QueryTerm]) -> ColumnElement | None:
+    """AND together the tsqueries for all terms.
+
+    Returns:
+        Combined tsquery expression, or None if there are no terms.
+    """
+    tsquery = None
+    for term in terms:
+        expr = term_tsquery(term)
+        tsquery = expr if tsquery is None else tsquery.op("&&")(expr)
+    return tsquery
+
+
+def matches(column: ColumnElement, tsquery: ColumnElement) -> ColumnElement:
+    """``column @@ tsquery`` (GIN-indexable)."""
+    return column.op("@@")(tsquery)
+
+
+def rank(column: ColumnElement, tsquery: ColumnElement) -> ColumnElement:
+    """Cover-density rank normalized to [0, 1)."""
+    return func.ts_rank_cd(column, tsquery, RANK_NORMALIZATION)
+
+
+def headline(text_column: ColumnElement, tsquery: ColumnElement) -> ColumnElement:
+    """Full text with matches wrapped in sentinel markers."""
+    return func.ts_headline(_config(), text_column, tsquery, HEADLINE_OPTIONS)
+
+
+def parse_headline(
+    marked_text: str | None,
+    original_text: str,
+) -> list[dict[str, int]] | None:
+    """Convert a marked-up ts_headline result to highlight ranges.
+
+    Args:
+        marked_text: ts_headline output built with HEADLINE_OPTIONS.
+        original_text: Text the headline was built from.
+
+    Returns:
+        Merged {"start", "end"} ranges into original_text, or None if there
+        are no highlights or the headline does not line up with the text.
+    """
+    if not marked_text:
+        return None
+
+    ranges: list[dict[str, int]] = []
+    plain: list[str] = []
+    position = 0
+    start: int | None = None
+
+    for char in marked_text:
+        if char == HEADLINE_START:
+            start = position
+        elif char == HEADLINE_STOP:
+            if start is not None and position > start:
+                if ranges and ranges[-1]["end"] >= start:
+                    ranges[-1]["end"] = position
+                else:
+                    ranges.append({"start": start, "end": position})
+            start = None
+        else:
+            plain.append(char)
+            position += 1
+
+    if "".join(plain) != original_text:
+        return None
+    return ranges or None
@@ -0,0 +1,335 @@
+"""Streaming evidence pack export.
+
+The JSON export materializes every item (span text, claim, metric) in one
+dict before serializing it. PackExporter pages through the pack's items with
+keyset pagination on (order_index, id) and yields output as it goes, so the
+response starts immediately and memory stays flat regardless of pack size:
+
+- ``ndjson()``: one JSON object per line; a ``pack`` header, one ``item``
+  line per pack item and a closing ``summary`` line.
+- ``zip()``: a ZIP bundle with ``pack.json``, ``items.ndjson`` and the cited
+  source documents under ``sources/<version_id>/``, streamed from storage
+  with StorageBackend.get_stream, and a closing ``manifest.json``.
+
+Streams run on their own session (``stream``): a request-scoped session is
+closed before the body is sent on FastAPI < 0.118. The stream holds one
+pooled connection and a read transaction until the download finishes.
+
+Usage:
+    exporter = await PackExporter.open(db, pack_id)
+    return StreamingResponse(
+        exporter.stream(get_session_factory(), PackExporter.ndjson),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+"""
+
+import json
+import logging
+import uuid
+import zipfile
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import joinedload
+
+from evidence_repository.models.document import Document, DocumentVersion
+from evidence_repository.models.evidence import EvidencePack, EvidencePackItem
+from evidence_repository.storage.base import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ZIP_MEDIA_TYPE = "application/zip"
+
+# Pack items fetched per page
+PACK_EXPORT_PAGE_SIZE = 500
+
+# Bytes per chunk streamed from storage into the ZIP
+SOURCE_CHUNK_SIZE = 64 * 1024
+
+
+def pack_to_dict(pack: EvidencePack) -> dict[str, Any]:
+    """Serialize pack metadata for an export."""
+    return {
+        "id": str(pack.id),
+        "name": pack.name,
+        "description": pack.description,
+        "project_id": str(pack.project_id),
+        "created_at": pack.created_at.isoformat(),
+        "created_by": pack.created_by,
+    }
+
+
+def pack_item_to_dict(item: EvidencePackItem) -> dict[str, Any]:
+    """Serialize a pack item (span plus optional claim and metric)."""
+    export_item = {
+        "order": item.order_index,
+        "notes": item.notes,
+        "span": {
+            "id": str(item.span.id),
+            "text": item.span.text_content,
+            "type": item.span.span_type.value,
+            "locator": item.span.start_locator,
+            "document_version_id": str(item.span.document_version_id),
+        },
+    }
+
+    if item.claim:
+        export_item["claim"] = {
+            "id": str(item.claim.id),
+            "text": item.claim.claim_text,
+            "type": item.claim.claim_type,
+            "confidence": item.claim.confidence,
+        }
+
+    if item.metric:
+        export_item["metric"] = {
+            "id": str(item.metric.id),
+            "name": item.metric.metric_name,
+            "value": item.metric.metric_value,
+            "unit": item.metric.unit,
+        }
+
+    return export_item
+
+
+def _json_line(record: dict[str, Any]) -> bytes:
+    return (json.dumps(record, default=str) + "\n").encode("utf-8")
+
+
+def _safe_filename(name: str) -> str:
+    """File name usable as a ZIP entry (no directories)."""
+    name = name.replace("\\", "/").rsplit("/", 1)[-1].strip()
+    return name if name not in ("", ".", "..") else "source"
+
+
+class _ZipSink:
+    """Write-only file object that collects ZipFile output for streaming.
+
+    It has no tell/seek, so ZipFile writes entries with data descriptors
+    instead of seeking back to patch headers.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class PackExporter:
+    """Stream an evidence pack as NDJSON or a ZIP bundle."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        pack: EvidencePack,
+        page_size: int = PACK_EXPORT_PAGE_SIZE,
+    ):
+        """Initialize exporter.
+
+        Args:
+            db: Database session (must stay open while streaming).
+            pack: Evidence pack to export.
+            page_size: Items fetched per page.
+        """
+        self.db = db
+        self.pack = pack
+        self.page_size = page_size
+        self.item_count = 0
+
+    @classmethod
+    async def open(
+        cls, db: AsyncSession, pack_id: uuid.UUID, page_size: int = PACK_EXPORT_PAGE_SIZE
+    ) -> "PackExporter | None":
+        """Create an exporter for a pack.
+
+        Returns:
+            PackExporter, or None if the pack does not exist.
+        """
+        pack = await db.get(EvidencePack, pack_id)
+        if pack is None:
+            return None
+        return cls(db, pack, page_size)
+
+    async def stream(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        render: Callable[["PackExporter"], AsyncIterator[bytes]],
+    ) -> AsyncIterator[bytes]:
+        """Run a streaming export on a session owned by the stream.
+
+        The session opens when the response body starts and closes when it
+        ends, independent of the request's session. It holds a pooled
+        connection and a read transaction for the whole download.
+
+        Args:
+            session_factory: Factory for the stream's session.
+            render: Export to run, e.g. ``PackExporter.ndjson``.
+
+        Yields:
+            Export bytes.
+        """
+        async with session_factory() as db:
+            exporter = PackExporter(db, self.pack, self.page_size)
+            async for chunk in render(exporter):
+                yield chunk
+            self.item_count = exporter.item_count
+
+    async def iter_pages(self) -> AsyncIterator[list[EvidencePackItem]]:
+        """Yield pages of pack items in (order_index, id) order."""
+        after: tuple[int, uuid.UUID] | None = None
+        while True:
+            stmt = (
+                select(EvidencePackItem)
+                .options(
+                    joinedload(EvidencePackItem.span),
+                    joinedload(EvidencePackItem.claim),
+                    joinedload(EvidencePackItem.metric),
+                )
+                .where(EvidencePackItem.evidence_pack_id == self.pack.id)
+                .order_by(EvidencePackItem.order_index, EvidencePackItem.id)
+                .limit(self.page_size)
+            )
+            if after is not None:
+                stmt = stmt.where(
+                    tuple_(EvidencePackItem.order_index, EvidencePackItem.id) > after
+                )
+
+            result = await self.db.execute(stmt)
+            page = list(result.scalars().all())
+            if not page:
+                return
+
+            yield page
+
+            last = page[-1]
+            after = (last.order_index, last.id)
+            if len(page) < self.page_size:
+                return
+
+    async def iter_items(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield serialized pack items in order."""
+        self.item_count = 0
+        async for page in self.iter_pages():
+            for item in page:
+                self.item_count += 1
+                yield pack_item_to_dict(item)
+
+    async def ndjson(self) -> AsyncIterator[bytes]:
+        """Yield the export as NDJSON lines."""
+        self.item_count = 0
+        yield _json_line({"type": "pack", "evidence_pack": pack_to_dict(self.pack)})
+
+        async for page in self.iter_pages():
+            lines = [_json_line({"type": "item", **pack_item_to_dict(item)}) for item in page]
+            self.item_count += len(lines)
+            yield b"".join(lines)
+
+        yield _json_line({
+            "type": "summary",
+            "item_count": self.item_count,
+            "exported_at": datetime.utcnow().isoformat(),
+        })
+
+    async def zip(
+        self,
+        storage: StorageBackend,
+        include_sources: bool = True,
+    ) -> AsyncIterator[bytes]:
+        """Yield the export as a ZIP bundle.
+
+        Args:
+            storage: Storage backend for cited source documents.
+            include_sources: Add the cited source documents.
+
+        Yields:
+            ZIP file bytes.
+        """
+        self.item_count = 0
+        sink = _ZipSink()
+        version_ids: dict[uuid.UUID, None] = {}
+
+        with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as bundle:
+            bundle.writestr("pack.json", json.dumps(pack_to_dict(self.pack), indent=2))
+            yield sink.drain()
+
+            with bundle.open("items.ndjson", mode="w", force_zip64=True) as entry:
+                async for page in self.iter_pages():
+                    for item in page:
+                        version_ids[item.span.document_version_id] = None
+                        entry.write(_json_line(pack_item_to_dict(item)))
+                    self.item_count += len(page)
+                    yield sink.drain()
+
+            sources: list[dict[str, Any]] = []
+            if include_sources:
+                async for source in self._iter_sources(list(version_ids)):
+                    name = f"sources/{source['version_id']}/{_safe_filename(source['filename'])}"
+                    chunks = storage.get_stream(
+                        storage.resolve_uri(source["storage_path"]), SOURCE_CHUNK_SIZE
+                    )
+                    try:
+                        # Open the object before adding the entry, so a missing
+                        # file leaves no partial entry
+                        first = await anext(chunks, b"")
+                    except Exception as e:
+                        logger.warning(f"Source {source['version_id']} not exported: {e}")
+                        sources.append({"version_id": source["version_id"], "error": str(e)})
+                        continue
+
+                    try:
+                        with bundle.open(name, mode="w", force_zip64=True) as entry:
+                            entry.write(first)
+                            async for chunk in chunks:
+                                entry.write(chunk)
+                                yield sink.drain()
+                    finally:
+                        await chunks.aclose()
+                    sources.append({"version_id": source["version_id"], "path": name})
+
+            bundle.writestr(
+                "manifest.json",
+                json.dumps(
+                    {
+                        "evidence_pack_id": str(self.pack.id),
+                        "item_count": self.item_count,
+                        "sources": sources,
+                        "exported_at": datetime.utcnow().isoformat(),
+                    },
+                    indent=2,
+                ),
+            )
+
+        # Central directory
+        yield sink.drain()
+
+    async def _iter_sources(self, version_ids: list[uuid.UUID]) -> AsyncIterator[dict[str, Any]]:
+        """Yield storage details for cited document versions."""
+        for start in range(0, len(version_ids), self.page_size):
+            result = await self.db.execute(
+                select(
+                    DocumentVersion.id,
+                    DocumentVersion.storage_path,
+                    Document.original_filename,
+                )
+                .join(Document, Document.id == DocumentVersion.document_id)
+                .where(DocumentVersion.id.in_(version_ids[start:start + self.page_size]))
+            )
+            for row in result.all():
+                yield {
+                    "version_id": str(row.id),
+                    "storage_path": row.storage_path,
+                    "filename": row.original_filename,
+                }
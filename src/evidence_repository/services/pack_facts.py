@@ -0,0 +1,231 @@
+"""Batched fact loading for evidence packs.
+
+Enriching a pack with multi-level facts used to run four queries (claims,
+metrics, constraints, risks) per pack item. PackFactLoader instead collects
+the distinct document versions of a pack and fetches each fact table once
+with ``version_id IN (...)``. A window function keeps the per-version row
+limits in SQL, and the rows are grouped by version in memory.
+
+Profile and level IDs are resolved once per process (resolve_extraction_ids).
+
+Usage:
+    profile_id, level_id = await resolve_extraction_ids(db, "vc", 2)
+    loader = PackFactLoader(db, profile_id, level_id, ProcessContext(process_context))
+    facts_by_version = await loader.load(version_ids)
+"""
+
+import uuid
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from evidence_repository.models.extraction_level import (
+    ExtractionLevel,
+    ExtractionLevelCode,
+    ExtractionProfile,
+    ExtractionProfileCode,
+    ProcessContext,
+)
+from evidence_repository.models.facts import (
+    FactClaim,
+    FactConstraint,
+    FactMetric,
+    FactRisk,
+)
+
+LEVEL_CODES = {
+    1: ExtractionLevelCode.L1_BASIC,
+    2: ExtractionLevelCode.L2_STANDARD,
+    3: ExtractionLevelCode.L3_DEEP,
+    4: ExtractionLevelCode.L4_FORENSIC,
+}
+
+# (profile_code, level_code) -> (profile_id, level_id); only resolved pairs
+# are cached, so profiles created later are still picked up
+_extraction_ids: dict[tuple[str, str], tuple[uuid.UUID, uuid.UUID]] = {}
+
+
+async def resolve_extraction_ids(
+    db: AsyncSession, profile_code: str, level: int
+) -> tuple[uuid.UUID | None, uuid.UUID | None]:
+    """Resolve profile and level record IDs for a profile code and level.
+
+    Args:
+        db: Database session.
+        profile_code: Profile code (unknown codes map to general).
+        level: Extraction level 1-4 (unknown levels map to L2).
+
+    Returns:
+        Tuple of (profile_id, level_id); either may be None if not created yet.
+    """
+    try:
+        pc = ExtractionProfileCode(profile_code)
+    except ValueError:
+        pc = ExtractionProfileCode.GENERAL
+    level_code = LEVEL_CODES.get(level, ExtractionLevelCode.L2_STANDARD)
+
+    key = (pc.value, level_code.value)
+    if key in _extraction_ids:
+        return _extraction_ids[key]
+
+    profile_result = await db.execute(
+        select(ExtractionProfile.id).where(ExtractionProfile.code == pc)
+    )
+    profile_id = profile_result.scalar_one_or_none()
+
+    level_result = await db.execute(
+        select(ExtractionLevel.id).where(ExtractionLevel.code == level_code)
+    )
+    level_id = level_result.scalar_one_or_none()
+
+    if profile_id and level_id:
+        _extraction_ids[key] = (profile_id, level_id)
+    return profile_id, level_id
+
+
+def clear_extraction_id_cache() -> None:
+    """Forget resolved profile/level IDs (e.g. after profiles are reset)."""
+    _extraction_ids.clear()
+
+
+# =============================================================================
+# Fact serialization
+# =============================================================================
+
+
+def claim_to_dict(claim: FactClaim) -> dict[str, Any]:
+    """Serialize a claim for a pack item."""
+    return {
+        "id": str(claim.id),
+        "subject": claim.subject,
+        "predicate": claim.predicate,
+        "object": claim.object,
+        "claim_type": claim.claim_type,
+        "certainty": claim.certainty.value,
+        "evidence_quote": claim.evidence_quote,
+        "process_context": claim.process_context.value,
+    }
+
+
+def metric_to_dict(metric: FactMetric) -> dict[str, Any]:
+    """Serialize a metric for a pack item."""
+    return {
+        "id": str(metric.id),
+        "metric_name": metric.metric_name,
+        "value_numeric": metric.value_numeric,
+        "value_raw": metric.value_raw,
+        "unit": metric.unit,
+        "currency": metric.currency,
+        "certainty": metric.certainty.value,
+        "process_context": metric.process_context.value,
+    }
+
+
+def constraint_to_dict(constraint: FactConstraint) -> dict[str, Any]:
+    """Serialize a constraint for a pack item."""
+    return {
+        "id": str(constraint.id),
+        "constraint_type": constraint.constraint_type.value,
+        "statement": constraint.statement,
+        "applies_to": constraint.applies_to,
+        "process_context": constraint.process_context.value,
+    }
+
+
+def risk_to_dict(risk: FactRisk) -> dict[str, Any]:
+    """Serialize a risk for a pack item."""
+    return {
+        "id": str(risk.id),
+        "risk_type": risk.risk_type,
+        "severity": risk.severity.value,
+        "statement": risk.statement,
+        "rationale": risk.rationale,
+        "process_context": risk.process_context.value,
+    }
+
+
+# Fact type -> (model, max facts per version, serializer)
+FACT_TYPES: dict[str, tuple[type, int, Callable[[Any], dict[str, Any]]]] = {
+    "claims": (FactClaim, 50, claim_to_dict),
+    "metrics": (FactMetric, 50, metric_to_dict),
+    "constraints": (FactConstraint, 20, constraint_to_dict),
+    "risks": (FactRisk, 20, risk_to_dict),
+}
+
+
+def empty_facts() -> dict[str, list[dict[str, Any]]]:
+    """Fact lists for a version without facts."""
+    return {fact_type: [] for fact_type in FACT_TYPES}
+
+
+class PackFactLoader:
+    """Load facts for many document versions with one query per fact type."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        profile_id: uuid.UUID,
+        level_id: uuid.UUID,
+        process_context: ProcessContext,
+    ):
+        """Initialize loader.
+
+        Args:
+            db: Database session.
+            profile_id: Extraction profile ID.
+            level_id: Extraction level ID.
+            process_context: Business process context.
+        """
+        self.db = db
+        self.profile_id = profile_id
+        self.level_id = level_id
+        self.process_context = process_context
+
+    async def load(
+        self, version_ids: Iterable[uuid.UUID]
+    ) -> dict[uuid.UUID, dict[str, list[dict[str, Any]]]]:
+        """Load serialized facts for document versions.
+
+        Args:
+            version_ids: Document version IDs (duplicates are ignored).
+
+        Returns:
+            Dict of version ID -> {"claims", "metrics", "constraints", "risks"}
+            lists, with an entry (possibly empty) for every requested version.
+        """
+        unique_ids = list(dict.fromkeys(version_ids))
+        facts = {version_id: empty_facts() for version_id in unique_ids}
+        if not unique_ids:
+            return facts
+
+        for fact_type, (model, limit, serialize) in FACT_TYPES.items():
+            for fact in await self._fetch(model, unique_ids, limit):
+                facts[fact.version_id][fact_type].append(serialize(fact))
+
+        return facts
+
+    async def _fetch(self, model: type, version_ids: list[uuid.UUID], limit: int) -> list[Any]:
+        """Fetch up to ``limit`` facts of one type per version."""
+        ranked = (
+            select(
+                model.id,
+                func.row_number()
+                .over(partition_by=model.version_id, order_by=(model.created_at, model.id))
+                .label("rank"),
+            )
+            .where(
+                model.version_id.in_(version_ids),
+                model.profile_id == self.profile_id,
+                model.process_context == self.process_context,
+                model.level_id == self.level_id,
+            )
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(model)
+            .join(ranked, model.id == ranked.c.id)
+            .where(ranked.c.rank <= limit)
+            .order_by(model.version_id, ranked.c.rank)
+        )
+        return list(result.scalars().all())
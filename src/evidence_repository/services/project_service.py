@@ -9,6 +9,7 @@ from sqlalchemy.orm import selectinload
 
 from evidence_repository.models.document import Document, DocumentVersion
 from evidence_repository.models.project import Project, ProjectDocument
+from evidence_repository.services.folder_tree import invalidate_folder_tree
 
 
 class ProjectService:
@@ -127,6 +128,7 @@ class ProjectService:
         )
         self.db.add(project_document)
         await self.db.flush()
+        invalidate_folder_tree(project.id)
         return project_document
 
     async def detach_document(
@@ -156,6 +158,7 @@ class ProjectService:
 
         await self.db.delete(project_document)
         await self.db.flush()
+        invalidate_folder_tree(project.id)
         return True
 
     async def pin_document_version(
@@ -16,6 +16,7 @@ from evidence_repository.models.quality import (
     QualityOpenQuestion,
     QuestionCategory,
 )
+from evidence_repository.services.conflict_index import find_conflicting_pairs, numbers_differ
 
 
 # =============================================================================
@@ -183,6 +184,9 @@ class QualityAnalysisService:
         - Overlapping time periods
         - Different numeric values
 
+        Overlapping pairs with differing values are found with an interval
+        sweep (see conflict_index), so large groups are not compared pairwise.
+
         Args:
             metrics: List of extracted metrics.
 
@@ -204,25 +208,24 @@ class QualityAnalysisService:
             if len(group) < 2:
                 continue
 
-            # Check all pairs for overlapping periods with different values
-            for i, m1 in enumerate(group):
-                for m2 in group[i + 1:]:
-                    if self._periods_overlap(m1, m2) and self._values_differ(m1, m2):
-                        # Determine severity based on value difference
-                        severity = self._calculate_metric_conflict_severity(m1, m2)
-
-                        conflict = MetricConflict(
-                            metric_name=metric_name,
-                            entity_id=entity_id,
-                            metric_ids=[m1.id, m2.id],
-                            values=[
-                                self._metric_to_value_dict(m1),
-                                self._metric_to_value_dict(m2),
-                            ],
-                            severity=severity,
-                            reason=self._build_metric_conflict_reason(m1, m2),
-                        )
-                        conflicts.append(conflict)
+            for i, j in find_conflicting_pairs(group):
+                m1, m2 = group[i], group[j]
+
+                # Determine severity based on value difference
+                severity = self._calculate_metric_conflict_severity(m1, m2)
+
+                conflict = MetricConflict(
+                    metric_name=metric_name,
+                    entity_id=entity_id,
+                    metric_ids=[m1.id, m2.id],
+                    values=[
+                        self._metric_to_value_dict(m1),
+                        self._metric_to_value_dict(m2),
+                    ],
+                    severity=severity,
+                    reason=self._build_metric_conflict_reason(m1, m2),
+                )
+                conflicts.append(conflict)
 
         return conflicts
 
@@ -257,15 +260,7 @@ class QualityAnalysisService:
             return m1.value_raw != m2.value_raw
 
         # Check for significant difference (> 1% difference)
-        if m1.value_numeric == 0 and m2.value_numeric == 0:
-            return False
-        if m1.value_numeric == 0 or m2.value_numeric == 0:
-            return True
-
-        relative_diff = abs(m1.value_numeric - m2.value_numeric) / max(
-            abs(m1.value_numeric), abs(m2.value_numeric)
-        )
-        return relative_diff > 0.01  # More than 1% difference
+        return numbers_differ(m1.value_numeric, m2.value_numeric)
 
     def _calculate_metric_conflict_severity(
         self, m1: FactMetric, m2: FactMetric
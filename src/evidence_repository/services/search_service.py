@@ -1,6 +1,5 @@
 """Search business service layer."""
 
-import re
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -8,15 +7,25 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import Float, cast, func, null, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.elements import ColumnElement
 
+from evidence_repository.config import get_settings
 from evidence_repository.embeddings.openai_client import OpenAIEmbeddingClient
-from evidence_repository.models.document import Document, DocumentVersion
+from evidence_repository.models.document import DocumentVersion
 from evidence_repository.models.embedding import EmbeddingChunk
 from evidence_repository.models.evidence import Span, SpanType
-from evidence_repository.models.project import ProjectDocument
+from evidence_repository.services import fulltext
+from evidence_repository.services.vector_index_service import (
+    DEFAULT_EF_SEARCH,
+    MAX_EF_SEARCH,
+    ProjectSearchScope,
+    VectorIndexService,
+    apply_ef_search,
+    apply_iterative_scan,
+)
 
 
 class SearchMode(str, Enum):
@@ -94,6 +103,7 @@ class SearchService:
         """
         self.db = db
         self.embedding_client = embedding_client or OpenAIEmbeddingClient()
+        self._settings = get_settings()
 
     async def search(
         self,
@@ -107,6 +117,8 @@ class SearchService:
         keywords: list[str] | None = None,
         exclude_keywords: list[str] | None = None,
         spans_only: bool = False,
+        ef_search: int | None = None,
+        offset: int = 0,
     ) -> SearchResults:
         """Perform search across documents with citations.
 
@@ -121,6 +133,9 @@ class SearchService:
             keywords: Keywords that must appear in results (AND logic).
             exclude_keywords: Keywords to exclude from results.
             spans_only: Only return results with associated spans.
+            ef_search: HNSW candidate list size for this query (higher is
+                more accurate but slower; defaults to settings.hnsw_ef_search).
+            offset: Number of results to skip (for pagination).
 
         Returns:
             SearchResults with matching spans/chunks as citations.
@@ -128,18 +143,29 @@ class SearchService:
         start_time = time.time()
         filters_applied: dict[str, Any] = {}
 
+        # Resolve project scope once (partial index lookup)
+        project_scope = None
+        if project_id:
+            project_scope = await VectorIndexService(self.db).resolve_project_scope(project_id)
+
+        filters = self._build_filters(
+            project_scope=project_scope,
+            document_ids=document_ids,
+            span_types=span_types,
+            keywords=keywords,
+            exclude_keywords=exclude_keywords,
+            spans_only=spans_only,
+        )
+
         # Build base query depending on mode
         if mode == SearchMode.KEYWORD:
             # Keyword-only search
             results = await self._keyword_search(
                 query=query,
                 limit=limit,
-                project_id=project_id,
-                document_ids=document_ids,
-                span_types=span_types,
+                offset=offset,
+                filters=filters,
                 keywords=keywords,
-                exclude_keywords=exclude_keywords,
-                spans_only=spans_only,
             )
             filters_applied["mode"] = "keyword"
         elif mode == SearchMode.HYBRID:
@@ -147,13 +173,11 @@ class SearchService:
             results = await self._hybrid_search(
                 query=query,
                 limit=limit,
+                offset=offset,
                 similarity_threshold=similarity_threshold,
-                project_id=project_id,
-                document_ids=document_ids,
-                span_types=span_types,
+                filters=filters,
                 keywords=keywords,
-                exclude_keywords=exclude_keywords,
-                spans_only=spans_only,
+                ef_search=ef_search,
             )
             filters_applied["mode"] = "hybrid"
         else:
@@ -161,13 +185,11 @@ class SearchService:
             results = await self._semantic_search(
                 query=query,
                 limit=limit,
+                offset=offset,
                 similarity_threshold=similarity_threshold,
-                project_id=project_id,
-                document_ids=document_ids,
-                span_types=span_types,
+                filters=filters,
                 keywords=keywords,
-                exclude_keywords=exclude_keywords,
-                spans_only=spans_only,
+                ef_search=ef_search,
             )
             filters_applied["mode"] = "semantic"
 
@@ -184,6 +206,10 @@ class SearchService:
             filters_applied["exclude_keywords"] = exclude_keywords
         if spans_only:
             filters_applied["spans_only"] = True
+        if ef_search:
+            filters_applied["ef_search"] = ef_search
+        if offset:
+            filters_applied["offset"] = offset
 
         return SearchResults(
             query=query,
@@ -195,102 +221,117 @@ class SearchService:
             filters_applied=filters_applied,
         )
 
-    async def _semantic_search(
+    def _build_filters(
         self,
-        query: str,
-        limit: int,
-        similarity_threshold: float,
-        project_id: uuid.UUID | None,
+        project_scope: ProjectSearchScope | None,
         document_ids: list[uuid.UUID] | None,
         span_types: list[SpanType] | None,
         keywords: list[str] | None,
         exclude_keywords: list[str] | None,
         spans_only: bool,
-    ) -> list[SearchResultItem]:
-        """Perform vector similarity search with optional keyword filtering."""
-        # Generate query embedding
-        query_embedding = await self.embedding_client.embed_text(query)
+    ) -> list[ColumnElement]:
+        """Build WHERE conditions on EmbeddingChunk shared by all search modes.
 
-        # Build similarity expression
-        similarity_col = (
-            1 - EmbeddingChunk.embedding.cosine_distance(query_embedding)
-        ).label("similarity")
-
-        # Base query with eager loading - fetch more to allow for keyword filtering
-        fetch_limit = limit * 3 if (keywords or exclude_keywords) else limit
-
-        search_query = (
-            select(EmbeddingChunk, similarity_col)
-            .options(
-                selectinload(EmbeddingChunk.document_version).selectinload(
-                    DocumentVersion.document
-                ),
-                selectinload(EmbeddingChunk.span),
-            )
-            .where(similarity_col >= similarity_threshold)
-            .order_by(similarity_col.desc())
-            .limit(fetch_limit)
-        )
+        Keyword inclusion/exclusion is applied in SQL against the full-text
+        column, so LIMIT/OFFSET count only rows that pass every filter.
+        """
+        filters: list[ColumnElement] = []
 
         # Apply spans_only filter
         if spans_only:
-            search_query = search_query.where(EmbeddingChunk.span_id.isnot(None))
+            filters.append(EmbeddingChunk.span_id.isnot(None))
 
-        # Apply span type filter
+        # Apply span type filter (denormalized onto the chunk)
         if span_types:
-            span_type_subquery = select(Span.id).where(
-                Span.span_type.in_(span_types)
-            )
             if spans_only:
-                search_query = search_query.where(
-                    EmbeddingChunk.span_id.in_(span_type_subquery)
-                )
+                filters.append(EmbeddingChunk.span_type.in_(span_types))
             else:
-                search_query = search_query.where(
+                filters.append(
                     or_(
-                        EmbeddingChunk.span_id.in_(span_type_subquery),
+                        EmbeddingChunk.span_type.in_(span_types),
                         EmbeddingChunk.span_id.is_(None),
                     )
                 )
 
-        # Apply project filter
-        if project_id:
-            doc_ids_subquery = select(ProjectDocument.document_id).where(
-                ProjectDocument.project_id == project_id
-            )
-            version_ids_subquery = select(DocumentVersion.id).where(
-                DocumentVersion.document_id.in_(doc_ids_subquery)
-            )
-            search_query = search_query.where(
-                EmbeddingChunk.document_version_id.in_(version_ids_subquery)
-            )
+        # Apply project filter: the partial index predicate when one is
+        # current, otherwise the GIN-indexed project membership array
+        if project_scope:
+            if project_scope.index_predicate:
+                filters.append(text(project_scope.index_predicate))
+            else:
+                filters.append(
+                    EmbeddingChunk.project_ids.contains([project_scope.project_id])
+                )
 
         # Apply document filter
         if document_ids:
-            version_ids_subquery = select(DocumentVersion.id).where(
-                DocumentVersion.document_id.in_(document_ids)
-            )
-            search_query = search_query.where(
-                EmbeddingChunk.document_version_id.in_(version_ids_subquery)
-            )
+            filters.append(EmbeddingChunk.document_id.in_(document_ids))
+
+        # Apply keyword filters
+        for keyword in keywords or []:
+            if keyword.strip():
+                required = fulltext.term_tsquery(fulltext.QueryTerm(keyword, "phrase"))
+                filters.append(fulltext.matches(EmbeddingChunk.text_search, required))
+        for keyword in exclude_keywords or []:
+            if keyword.strip():
+                excluded = fulltext.term_tsquery(fulltext.QueryTerm(keyword, "phrase"))
+                filters.append(~fulltext.matches(EmbeddingChunk.text_search, excluded))
+
+        return filters
+
+    def _chunk_query(self, *columns):
+        """Select EmbeddingChunk (plus columns) with citation relationships loaded."""
+        return select(EmbeddingChunk, *columns).options(
+            selectinload(EmbeddingChunk.document_version).selectinload(
+                DocumentVersion.document
+            ),
+            selectinload(EmbeddingChunk.span),
+        )
+
+    async def _semantic_search(
+        self,
+        query: str,
+        limit: int,
+        offset: int,
+        similarity_threshold: float,
+        filters: list[ColumnElement],
+        keywords: list[str] | None,
+        ef_search: int | None = None,
+    ) -> list[SearchResultItem]:
+        """Perform vector similarity search with optional keyword filtering."""
+        # Generate query embedding
+        query_embedding = await self.embedding_client.embed_text(query)
+
+        # Order by the raw distance operator so pgvector can use the HNSW index
+        distance_col = EmbeddingChunk.embedding.cosine_distance(query_embedding)
+        similarity_col = (1 - distance_col).label("similarity")
+
+        # HNSW returns at most ef_search candidates, so never go below the
+        # page end (the schemas bound offset + limit to MAX_EF_SEARCH)
+        ef_search = ef_search or self._settings.hnsw_ef_search or DEFAULT_EF_SEARCH
+        await apply_ef_search(self.db, min(max(ef_search, offset + limit), MAX_EF_SEARCH))
+        if filters:
+            # Filters apply after the graph scan; keep scanning until the page
+            # fills, in exact distance order since pages come off the index
+            await apply_iterative_scan(self.db, "strict_order")
+
+        search_query = (
+            self._chunk_query(similarity_col)
+            .where(similarity_col >= similarity_threshold, *filters)
+            .order_by(distance_col, EmbeddingChunk.id)
+            .offset(offset)
+            .limit(limit)
+        )
 
         # Execute search
         result = await self.db.execute(search_query)
         rows = result.fetchall()
 
-        # Build results with keyword filtering
         results = []
         for chunk, similarity in rows:
-            if len(results) >= limit:
-                break
-
             text = chunk.text
             span = chunk.span
 
-            # Apply keyword filters
-            if not self._passes_keyword_filter(text, keywords, exclude_keywords):
-                continue
-
             # Build citation
             citation = self._build_citation(chunk, span)
 
@@ -310,187 +351,232 @@ class SearchService:
 
         return results
 
+    def _keyword_tsquery(self, query: str) -> tuple[list[fulltext.QueryTerm], ColumnElement | None]:
+        """Parse the query text into full-text terms and a combined tsquery."""
+        terms = fulltext.parse_query(query)
+        return terms, fulltext.build_tsquery(terms)
+
+    def _keyword_highlights(
+        self,
+        marked_text: str | None,
+        text: str,
+        terms: list[str],
+    ) -> list[dict[str, int]] | None:
+        """Highlights from ts_headline, falling back to substring matching."""
+        highlight_ranges = fulltext.parse_headline(marked_text, text)
+        if highlight_ranges is None:
+            highlight_ranges = self._calculate_highlights(text, terms)
+        return highlight_ranges
+
     async def _keyword_search(
         self,
         query: str,
         limit: int,
-        project_id: uuid.UUID | None,
-        document_ids: list[uuid.UUID] | None,
-        span_types: list[SpanType] | None,
+        offset: int,
+        filters: list[ColumnElement],
         keywords: list[str] | None,
-        exclude_keywords: list[str] | None,
-        spans_only: bool,
     ) -> list[SearchResultItem]:
-        """Perform full-text keyword search."""
-        # Combine query terms with keywords for search
-        search_terms = [query]
-        if keywords:
-            search_terms.extend(keywords)
+        """Perform full-text keyword search.
 
-        # Build query using ILIKE for keyword matching
-        conditions = []
-        for term in search_terms:
-            conditions.append(EmbeddingChunk.text.ilike(f"%{term}%"))
+        Matches the GIN-indexed ``text_search`` tsvector column. The query
+        supports quoted phrases and ``prefix*`` terms; required keywords are
+        ANDed in as phrases and excluded keywords are negated.
+        """
+        terms, tsquery = self._keyword_tsquery(query)
+        highlight_terms = [t.text for t in terms] + list(keywords or [])
+        if tsquery is None:
+            if not keywords:
+                return []
+            # Keywords alone still form a valid full-text query
+            terms, tsquery = self._keyword_tsquery(" ".join(f'"{k}"' for k in keywords))
+            if tsquery is None:
+                return []
+
+        rank_col = fulltext.rank(EmbeddingChunk.text_search, tsquery).label("rank")
+        headline_col = fulltext.headline(EmbeddingChunk.text, tsquery).label("headline")
 
         search_query = (
-            select(EmbeddingChunk)
-            .options(
-                selectinload(EmbeddingChunk.document_version).selectinload(
-                    DocumentVersion.document
-                ),
-                selectinload(EmbeddingChunk.span),
-            )
-            .where(and_(*conditions))
-            .limit(limit * 2)  # Fetch extra for filtering
+            self._chunk_query(rank_col, headline_col)
+            .where(fulltext.matches(EmbeddingChunk.text_search, tsquery), *filters)
+            .order_by(rank_col.desc(), EmbeddingChunk.id)
+            .offset(offset)
+            .limit(limit)
         )
 
-        # Apply spans_only filter
-        if spans_only:
-            search_query = search_query.where(EmbeddingChunk.span_id.isnot(None))
-
-        # Apply span type filter
-        if span_types:
-            span_type_subquery = select(Span.id).where(
-                Span.span_type.in_(span_types)
-            )
-            if spans_only:
-                search_query = search_query.where(
-                    EmbeddingChunk.span_id.in_(span_type_subquery)
-                )
-            else:
-                search_query = search_query.where(
-                    or_(
-                        EmbeddingChunk.span_id.in_(span_type_subquery),
-                        EmbeddingChunk.span_id.is_(None),
-                    )
-                )
-
-        # Apply project filter
-        if project_id:
-            doc_ids_subquery = select(ProjectDocument.document_id).where(
-                ProjectDocument.project_id == project_id
-            )
-            version_ids_subquery = select(DocumentVersion.id).where(
-                DocumentVersion.document_id.in_(doc_ids_subquery)
-            )
-            search_query = search_query.where(
-                EmbeddingChunk.document_version_id.in_(version_ids_subquery)
-            )
-
-        # Apply document filter
-        if document_ids:
-            version_ids_subquery = select(DocumentVersion.id).where(
-                DocumentVersion.document_id.in_(document_ids)
-            )
-            search_query = search_query.where(
-                EmbeddingChunk.document_version_id.in_(version_ids_subquery)
-            )
-
         # Execute search
         result = await self.db.execute(search_query)
-        chunks = result.scalars().all()
+        rows = result.fetchall()
 
-        # Build results with exclude filtering and scoring
         results = []
-        for chunk in chunks:
-            if len(results) >= limit:
-                break
-
+        for chunk, rank, marked_text in rows:
             text = chunk.text
             span = chunk.span
 
-            # Apply exclude keyword filter
-            if exclude_keywords:
-                if not self._passes_keyword_filter(text, None, exclude_keywords):
-                    continue
-
-            # Calculate relevance score based on keyword matches
-            relevance = self._calculate_keyword_relevance(text, search_terms)
-
             # Build citation
             citation = self._build_citation(chunk, span)
 
-            # Calculate highlight ranges
-            highlight_ranges = self._calculate_highlights(text, search_terms)
-
             results.append(
                 SearchResultItem(
                     result_id=span.id if span else chunk.id,
-                    similarity=relevance,
+                    similarity=float(rank),
                     citation=citation,
                     matched_text=text,
-                    highlight_ranges=highlight_ranges,
+                    highlight_ranges=self._keyword_highlights(
+                        marked_text, text, highlight_terms
+                    ),
                     metadata=chunk.metadata_,
                 )
             )
 
-        # Sort by relevance
-        results.sort(key=lambda x: x.similarity, reverse=True)
-        return results[:limit]
+        return results
 
     async def _hybrid_search(
         self,
         query: str,
         limit: int,
+        offset: int,
         similarity_threshold: float,
-        project_id: uuid.UUID | None,
-        document_ids: list[uuid.UUID] | None,
-        span_types: list[SpanType] | None,
+        filters: list[ColumnElement],
         keywords: list[str] | None,
-        exclude_keywords: list[str] | None,
-        spans_only: bool,
+        ef_search: int | None = None,
     ) -> list[SearchResultItem]:
-        """Perform combined semantic + keyword search with score fusion."""
-        # Get semantic results
-        semantic_results = await self._semantic_search(
-            query=query,
-            limit=limit,
-            similarity_threshold=similarity_threshold,
-            project_id=project_id,
-            document_ids=document_ids,
-            span_types=span_types,
-            keywords=keywords,
-            exclude_keywords=exclude_keywords,
-            spans_only=spans_only,
-        )
+        """Perform combined semantic + keyword search fused in SQL.
 
-        # Get keyword results
-        keyword_results = await self._keyword_search(
-            query=query,
-            limit=limit,
-            project_id=project_id,
-            document_ids=document_ids,
-            span_types=span_types,
-            keywords=keywords,
-            exclude_keywords=exclude_keywords,
-            spans_only=spans_only,
+        A single statement computes the vector top-k and the full-text top-k
+        as CTEs (k = settings.hybrid_candidate_depth), fuses them with
+        weighted reciprocal rank fusion and returns only the requested page.
+        Candidate depth does not depend on the page, and ties break on chunk
+        ID, so pages are stable and never overlap.
+        """
+        settings = self._settings
+        depth = settings.hybrid_candidate_depth
+        rrf_k = settings.hybrid_rrf_k
+        semantic_weight = settings.hybrid_semantic_weight
+        keyword_weight = settings.hybrid_keyword_weight
+
+        if offset >= 2 * depth:
+            return []
+
+        query_embedding = await self.embedding_client.embed_text(query)
+        terms, tsquery = self._keyword_tsquery(query)
+
+        # The semantic leg needs ef_search >= depth to return a full top-k
+        await apply_ef_search(
+            self.db, max(ef_search or settings.hnsw_ef_search or 0, depth)
+        )
+        if filters:
+            # Candidates are re-ranked by fusion, so relaxed order is enough
+            await apply_iterative_scan(self.db, "relaxed_order")
+
+        # Vector top-k (ordered by raw distance for HNSW index use)
+        distance_col = EmbeddingChunk.embedding.cosine_distance(query_embedding)
+        semantic_top = (
+            select(EmbeddingChunk.id.label("id"), distance_col.label("distance"))
+            .where((1 - distance_col) >= similarity_threshold, *filters)
+            .order_by(distance_col, EmbeddingChunk.id)
+            .limit(depth)
+            .subquery("semantic_top")
         )
+        semantic = select(
+            semantic_top.c.id,
+            func.row_number()
+            .over(order_by=(semantic_top.c.distance, semantic_top.c.id))
+            .label("rank"),
+        ).cte("semantic")
+
+        def rrf(weight: float, rank_col) -> ColumnElement:
+            return func.coalesce(
+                cast(weight, Float) / (rrf_k + rank_col),
+                0.0,
+            )
 
-        # Merge and deduplicate using Reciprocal Rank Fusion (RRF)
-        k = 60  # RRF constant
-        scores: dict[uuid.UUID, float] = {}
-        results_map: dict[uuid.UUID, SearchResultItem] = {}
+        if tsquery is not None:
+            # Full-text top-k (GIN-indexed match, ranked by ts_rank_cd)
+            rank_expr = fulltext.rank(EmbeddingChunk.text_search, tsquery)
+            keyword_top = (
+                select(EmbeddingChunk.id.label("id"), rank_expr.label("score"))
+                .where(fulltext.matches(EmbeddingChunk.text_search, tsquery), *filters)
+                .order_by(rank_expr.desc(), EmbeddingChunk.id)
+                .limit(depth)
+                .subquery("keyword_top")
+            )
+            keyword = select(
+                keyword_top.c.id,
+                func.row_number()
+                .over(order_by=(keyword_top.c.score.desc(), keyword_top.c.id))
+                .label("rank"),
+            ).cte("keyword")
+
+            fused = (
+                select(
+                    func.coalesce(semantic.c.id, keyword.c.id).label("id"),
+                    (
+                        rrf(semantic_weight, semantic.c.rank)
+                        + rrf(keyword_weight, keyword.c.rank)
+                    ).label("score"),
+                    semantic.c.rank.label("semantic_rank"),
+                    keyword.c.rank.label("keyword_rank"),
+                )
+                .select_from(
+                    semantic.join(keyword, semantic.c.id == keyword.c.id, full=True)
+                )
+                .cte("fused")
+            )
+            headline_col = fulltext.headline(EmbeddingChunk.text, tsquery)
+        else:
+            # Nothing to match on the keyword side; fuse the semantic leg alone
+            fused = select(
+                semantic.c.id.label("id"),
+                rrf(semantic_weight, semantic.c.rank).label("score"),
+                semantic.c.rank.label("semantic_rank"),
+                null().label("keyword_rank"),
+            ).cte("fused")
+            headline_col = null()
 
-        for rank, result in enumerate(semantic_results):
-            rrf_score = 1.0 / (k + rank + 1)
-            scores[result.result_id] = scores.get(result.result_id, 0) + rrf_score
-            results_map[result.result_id] = result
+        search_query = (
+            self._chunk_query(
+                fused.c.score,
+                fused.c.semantic_rank,
+                fused.c.keyword_rank,
+                headline_col.label("headline"),
+            )
+            .join(fused, EmbeddingChunk.id == fused.c.id)
+            .order_by(fused.c.score.desc(), EmbeddingChunk.id)
+            .offset(offset)
+            .limit(limit)
+        )
 
-        for rank, result in enumerate(keyword_results):
-            rrf_score = 1.0 / (k + rank + 1)
-            scores[result.result_id] = scores.get(result.result_id, 0) + rrf_score
-            if result.result_id not in results_map:
-                results_map[result.result_id] = result
+        result = await self.db.execute(search_query)
+        rows = result.fetchall()
 
-        # Sort by combined score and return top results
-        sorted_ids = sorted(scores.keys(), key=lambda x: scores[x], reverse=True)
+        # Normalize so a top-ranked hit in both legs scores 1.0
+        max_score = (semantic_weight + keyword_weight) / (rrf_k + 1)
+        highlight_terms = [t.text for t in terms] + list(keywords or [])
 
         results = []
-        for result_id in sorted_ids[:limit]:
-            result = results_map[result_id]
-            # Update similarity to reflect combined score
-            result.similarity = min(1.0, scores[result_id] * 10)  # Normalize
-            results.append(result)
+        for chunk, score, semantic_rank, keyword_rank, marked_text in rows:
+            text = chunk.text
+            span = chunk.span
+
+            results.append(
+                SearchResultItem(
+                    result_id=span.id if span else chunk.id,
+                    similarity=min(1.0, float(score) / max_score) if max_score else 0.0,
+                    citation=self._build_citation(chunk, span),
+                    matched_text=text,
+                    highlight_ranges=self._keyword_highlights(
+                        marked_text, text, highlight_terms
+                    ),
+                    metadata={
+                        **(chunk.metadata_ or {}),
+                        "fusion": {
+                            "score": float(score),
+                            "semantic_rank": semantic_rank,
+                            "keyword_rank": keyword_rank,
+                        },
+                    },
+                )
+            )
 
         return results
 
@@ -537,50 +623,6 @@ class SearchService:
                 text_excerpt=chunk.text[:500] if chunk.text else "",
             )
 
-    def _passes_keyword_filter(
-        self,
-        text: str,
-        keywords: list[str] | None,
-        exclude_keywords: list[str] | None,
-    ) -> bool:
-        """Check if text passes keyword inclusion/exclusion filters."""
-        text_lower = text.lower()
-
-        # Check required keywords (AND logic)
-        if keywords:
-            for keyword in keywords:
-                if keyword.lower() not in text_lower:
-                    return False
-
-        # Check excluded keywords
-        if exclude_keywords:
-            for keyword in exclude_keywords:
-                if keyword.lower() in text_lower:
-                    return False
-
-        return True
-
-    def _calculate_keyword_relevance(
-        self, text: str, keywords: list[str]
-    ) -> float:
-        """Calculate relevance score based on keyword frequency."""
-        if not keywords:
-            return 0.5
-
-        text_lower = text.lower()
-        total_matches = 0
-        total_possible = len(keywords)
-
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            # Count occurrences
-            count = text_lower.count(keyword_lower)
-            if count > 0:
-                total_matches += min(count, 3)  # Cap at 3 matches per keyword
-
-        # Normalize to 0-1 range
-        return min(1.0, total_matches / (total_possible * 2))
-
     def _calculate_highlights(
         self, text: str, keywords: list[str] | None
     ) -> list[dict[str, int]] | None:
@@ -656,10 +698,9 @@ class SearchService:
                 timestamp=datetime.utcnow(),
             )
 
-        # Search using source embedding
-        similarity_col = (
-            1 - EmbeddingChunk.embedding.cosine_distance(source_chunk.embedding)
-        ).label("similarity")
+        # Search using source embedding (ordered by distance for index use)
+        distance_col = EmbeddingChunk.embedding.cosine_distance(source_chunk.embedding)
+        similarity_col = (1 - distance_col).label("similarity")
 
         search_query = (
             select(EmbeddingChunk, similarity_col)
@@ -673,7 +714,7 @@ class SearchService:
                 EmbeddingChunk.id != chunk_id,  # Exclude source
                 similarity_col >= 0.5,  # Minimum threshold
             )
-            .order_by(similarity_col.desc())
+            .order_by(distance_col)
             .limit(limit)
         )
 
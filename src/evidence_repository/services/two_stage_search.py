@@ -34,6 +34,7 @@ from evidence_repository.config import get_settings
 from evidence_repository.models.document import Document, DocumentVersion
 from evidence_repository.models.embedding import EmbeddingChunk
 from evidence_repository.models.evidence import Span, SpanType
+from evidence_repository.services.vector_index_service import apply_iterative_scan
 
 logger = logging.getLogger(__name__)
 
@@ -315,10 +316,9 @@ class TwoStageSearch:
         # Generate query embedding
         query_embedding = await self.embedding_client.embed_text(query)
 
-        # Build similarity query
-        similarity_col = (
-            1 - EmbeddingChunk.embedding.cosine_distance(query_embedding)
-        ).label("similarity")
+        # Build similarity query (ordered by raw distance for HNSW index use)
+        distance_col = EmbeddingChunk.embedding.cosine_distance(query_embedding)
+        similarity_col = (1 - distance_col).label("similarity")
 
         stmt = (
             select(EmbeddingChunk, similarity_col)
@@ -328,26 +328,19 @@ class TwoStageSearch:
                 selectinload(EmbeddingChunk.span),
             )
             .where(similarity_col >= threshold)
-            .order_by(similarity_col.desc())
+            .order_by(distance_col)
             .limit(limit)
         )
 
-        # Apply scope filters
+        # Apply scope filters (denormalized onto the chunk row)
         if filters.project_id:
-            from evidence_repository.models.project import ProjectDocument
-            doc_ids = select(ProjectDocument.document_id).where(
-                ProjectDocument.project_id == filters.project_id
-            )
-            version_ids = select(DocumentVersion.id).where(
-                DocumentVersion.document_id.in_(doc_ids)
-            )
-            stmt = stmt.where(EmbeddingChunk.document_version_id.in_(version_ids))
+            stmt = stmt.where(EmbeddingChunk.project_ids.contains([filters.project_id]))
 
         if filters.document_ids:
-            version_ids = select(DocumentVersion.id).where(
-                DocumentVersion.document_id.in_(filters.document_ids)
-            )
-            stmt = stmt.where(EmbeddingChunk.document_version_id.in_(version_ids))
+            stmt = stmt.where(EmbeddingChunk.document_id.in_(filters.document_ids))
+
+        if filters.project_id or filters.document_ids:
+            await apply_iterative_scan(self.db, "strict_order")
 
         result = await self.db.execute(stmt)
         rows = result.fetchall()
@@ -406,17 +399,10 @@ class TwoStageSearch:
 
         query_embedding = await self.embedding_client.embed_text(query)
 
-        similarity_col = (
-            1 - EmbeddingChunk.embedding.cosine_distance(query_embedding)
-        ).label("similarity")
-
-        # Get version IDs for candidates
-        version_stmt = select(DocumentVersion.id).where(
-            DocumentVersion.document_id.in_(candidate_doc_ids)
-        )
-        version_result = await self.db.execute(version_stmt)
-        candidate_version_ids = [row[0] for row in version_result.fetchall()]
+        distance_col = EmbeddingChunk.embedding.cosine_distance(query_embedding)
+        similarity_col = (1 - distance_col).label("similarity")
 
+        # Candidates filter directly on the denormalized document_id
         stmt = (
             select(EmbeddingChunk, similarity_col)
             .options(
@@ -425,13 +411,15 @@ class TwoStageSearch:
                 selectinload(EmbeddingChunk.span),
             )
             .where(
-                EmbeddingChunk.document_version_id.in_(candidate_version_ids),
+                EmbeddingChunk.document_id.in_(candidate_doc_ids),
                 similarity_col >= threshold,
             )
-            .order_by(similarity_col.desc())
+            .order_by(distance_col)
             .limit(limit * 2)  # Get extra for combined scoring
         )
 
+        # Re-ranked by combined score below, so relaxed order is enough
+        await apply_iterative_scan(self.db, "relaxed_order")
         result = await self.db.execute(stmt)
         rows = result.fetchall()
 
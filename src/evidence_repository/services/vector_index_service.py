@@ -0,0 +1,462 @@
+"""Vector index lifecycle management for embedding chunks.
+
+Manages the pgvector HNSW indexes on ``embedding_chunks``:
+
+- A global HNSW index covering every chunk (replaces the IVFFlat index
+  created by the initial schema).
+- Optional per-project partial HNSW indexes whose predicate restricts the
+  index to the document versions attached to a project. Project-scoped
+  searches use the partial index when its version set still matches the
+  project, so pgvector can walk a small graph instead of post-filtering
+  (or brute-forcing) the global one.
+
+Index DDL runs with ``CONCURRENTLY`` on an autocommit connection so builds
+never block writers. Rebuilds create the replacement under a temporary
+name and swap it in, so searches always have an index to use.
+"""
+
+import hashlib
+import json
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from evidence_repository.config import get_settings
+from evidence_repository.db.engine import get_engine
+from evidence_repository.models.document import DocumentVersion
+from evidence_repository.models.project import ProjectDocument
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_TABLE = "embedding_chunks"
+GLOBAL_INDEX_NAME = "ix_embedding_chunks_embedding_hnsw"
+PROJECT_INDEX_PREFIX = "ix_embedding_chunks_hnsw_p_"
+LEGACY_IVFFLAT_INDEX_NAME = "ix_embedding_chunks_embedding"
+
+# pgvector limits for HNSW build parameters
+MIN_M, MAX_M = 2, 100
+MIN_EF_CONSTRUCTION, MAX_EF_CONSTRUCTION = 4, 1000
+MIN_EF_SEARCH, MAX_EF_SEARCH = 1, 1000
+DEFAULT_EF_SEARCH = 40  # pgvector's default hnsw.ef_search
+ITERATIVE_SCAN_MODES = ("relaxed_order", "strict_order")
+
+
+class VectorIndexError(Exception):
+    """Vector index operation failed."""
+
+    pass
+
+
+@dataclass
+class VectorIndexInfo:
+    """Report entry for a vector index on embedding_chunks."""
+
+    name: str
+    method: str  # "hnsw" or "ivfflat"
+    scope: str  # "global" or "project"
+    size_bytes: int
+    is_valid: bool
+    definition: str
+    project_id: uuid.UUID | None = None
+    version_count: int | None = None
+    stale: bool | None = None
+    build_params: dict = field(default_factory=dict)
+    built_at: str | None = None
+
+
+@dataclass
+class ProjectSearchScope:
+    """Resolved scope for a project-filtered vector search."""
+
+    project_id: uuid.UUID
+    index_predicate: str | None = None  # Set when a current partial index exists
+
+
+def project_index_name(project_id: uuid.UUID) -> str:
+    """Name of the partial HNSW index for a project (fits in 63 chars)."""
+    return f"{PROJECT_INDEX_PREFIX}{project_id.hex}"
+
+
+def project_id_from_index_name(name: str) -> uuid.UUID | None:
+    """Extract the project ID from a partial index name, if it is one."""
+    if not name.startswith(PROJECT_INDEX_PREFIX):
+        return None
+    try:
+        return uuid.UUID(hex=name[len(PROJECT_INDEX_PREFIX):])
+    except ValueError:
+        return None
+
+
+def is_managed_index(name: str) -> bool:
+    """Check whether an index name belongs to this subsystem."""
+    return name == GLOBAL_INDEX_NAME or project_id_from_index_name(name) is not None
+
+
+def version_set_fingerprint(version_ids: list[uuid.UUID]) -> str:
+    """Order-independent fingerprint of a set of version IDs."""
+    joined = ",".join(sorted(str(v) for v in set(version_ids)))
+    return hashlib.sha256(joined.encode()).hexdigest()[:32]
+
+
+def project_predicate_sql(version_ids: list[uuid.UUID]) -> str:
+    """Build the partial index predicate for a set of versions.
+
+    The same function renders the index predicate and the query clause, so
+    both are textually identical and the planner can prove the query is
+    covered by the partial index. UUIDs are normalized through ``uuid.UUID``
+    so the literals are always safe to inline.
+    """
+    if not version_ids:
+        raise VectorIndexError("Cannot build a project predicate without versions")
+    literals = ", ".join(
+        f"'{uuid.UUID(str(v))}'::uuid" for v in sorted(set(version_ids), key=str)
+    )
+    return f"document_version_id IN ({literals})"
+
+
+def validate_build_params(m: int, ef_construction: int) -> None:
+    """Validate HNSW build parameters against pgvector limits."""
+    if not MIN_M <= m <= MAX_M:
+        raise VectorIndexError(f"m must be between {MIN_M} and {MAX_M}, got {m}")
+    if not MIN_EF_CONSTRUCTION <= ef_construction <= MAX_EF_CONSTRUCTION:
+        raise VectorIndexError(
+            f"ef_construction must be between {MIN_EF_CONSTRUCTION} and "
+            f"{MAX_EF_CONSTRUCTION}, got {ef_construction}"
+        )
+    if ef_construction < 2 * m:
+        raise VectorIndexError(
+            f"ef_construction ({ef_construction}) must be at least 2 * m ({2 * m})"
+        )
+
+
+def build_index_sql(
+    name: str,
+    m: int,
+    ef_construction: int,
+    predicate: str | None = None,
+) -> str:
+    """Render the CREATE INDEX statement for an HNSW index."""
+    validate_build_params(m, ef_construction)
+    sql = (
+        f"CREATE INDEX CONCURRENTLY {name} ON {EMBEDDING_TABLE} "
+        f"USING hnsw (embedding vector_cosine_ops) "
+        f"WITH (m = {int(m)}, ef_construction = {int(ef_construction)})"
+    )
+    if predicate:
+        sql += f" WHERE {predicate}"
+    return sql
+
+
+def ef_search_sql(ef_search: int) -> str:
+    """Render the transaction-local ``hnsw.ef_search`` setting.
+
+    SET does not accept bind parameters, so the value is validated and
+    inlined as an integer.
+    """
+    value = int(ef_search)
+    if not MIN_EF_SEARCH <= value <= MAX_EF_SEARCH:
+        raise VectorIndexError(
+            f"ef_search must be between {MIN_EF_SEARCH} and {MAX_EF_SEARCH}, got {value}"
+        )
+    return f"SET LOCAL hnsw.ef_search = {value}"
+
+
+def iterative_scan_sql(mode: str) -> str:
+    """Render the transaction-local ``hnsw.iterative_scan`` setting."""
+    if mode not in ITERATIVE_SCAN_MODES:
+        raise VectorIndexError(f"Unknown iterative scan mode: {mode}")
+    return f"SET LOCAL hnsw.iterative_scan = {mode}"
+
+
+def parse_index_comment(comment: str | None) -> dict:
+    """Parse the JSON build record stored in an index comment."""
+    if not comment:
+        return {}
+    try:
+        data = json.loads(comment)
+    except (TypeError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+async def apply_ef_search(db: AsyncSession, ef_search: int) -> None:
+    """Set ``hnsw.ef_search`` for the rest of the current transaction."""
+    await db.execute(text(ef_search_sql(ef_search)))
+
+
+async def apply_iterative_scan(db: AsyncSession, mode: str = "relaxed_order") -> None:
+    """Let a filtered HNSW scan continue past its first ef_search candidates.
+
+    pgvector applies WHERE filters after the graph scan, so a small project
+    in a large corpus can match none of the ef_search nearest chunks.
+    Iterative scans (pgvector >= 0.8) keep scanning until the query's LIMIT
+    is filled. ``strict_order`` keeps results in exact distance order, for
+    queries that page straight off the index; ``relaxed_order`` is cheaper
+    when the caller re-ranks. No-op when ``hnsw_iterative_scan`` is off.
+    """
+    if get_settings().hnsw_iterative_scan:
+        await db.execute(text(iterative_scan_sql(mode)))
+
+
+class VectorIndexService:
+    """Build, rebuild, drop and report on HNSW indexes.
+
+    Usage:
+        service = VectorIndexService(db)
+        await service.build_global_index()
+        await service.build_project_index(project_id)
+        report = await service.list_indexes()
+    """
+
+    def __init__(self, db: AsyncSession, engine: AsyncEngine | None = None):
+        """Initialize vector index service.
+
+        Args:
+            db: Database session used for catalog reads and scope lookups.
+            engine: Engine used for autocommit DDL (defaults to app engine).
+        """
+        self.db = db
+        self._engine = engine
+        self._settings = get_settings()
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Engine used for index DDL."""
+        if self._engine is None:
+            self._engine = get_engine()
+        return self._engine
+
+    # -------------------------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------------------------
+
+    async def list_indexes(self) -> list[VectorIndexInfo]:
+        """Report all vector indexes on embedding_chunks.
+
+        Project indexes are flagged ``stale`` when the project's current
+        version set no longer matches the one the index was built for.
+        """
+        result = await self.db.execute(
+            text(
+                """
+                SELECT c.relname, am.amname, pg_relation_size(c.oid),
+                       i.indisvalid, pg_get_indexdef(c.oid),
+                       obj_description(c.oid, 'pg_class')
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                JOIN pg_class t ON t.oid = i.indrelid
+                JOIN pg_am am ON am.oid = c.relam
+                WHERE t.relname = :table AND am.amname IN ('hnsw', 'ivfflat')
+                ORDER BY c.relname
+                """
+            ),
+            {"table": EMBEDDING_TABLE},
+        )
+
+        indexes = []
+        for name, method, size, is_valid, definition, comment in result.fetchall():
+            record = parse_index_comment(comment)
+            project_id = project_id_from_index_name(name)
+            info = VectorIndexInfo(
+                name=name,
+                method=method,
+                scope="project" if project_id else "global",
+                size_bytes=int(size or 0),
+                is_valid=bool(is_valid),
+                definition=definition,
+                project_id=project_id,
+                version_count=record.get("version_count"),
+                build_params={
+                    k: record[k] for k in ("m", "ef_construction") if k in record
+                },
+                built_at=record.get("built_at"),
+            )
+            if project_id:
+                current = await self.get_project_version_ids(project_id)
+                info.stale = record.get("fingerprint") != version_set_fingerprint(current)
+            indexes.append(info)
+
+        return indexes
+
+    async def get_project_version_ids(self, project_id: uuid.UUID) -> list[uuid.UUID]:
+        """Get all version IDs of documents attached to a project."""
+        result = await self.db.execute(
+            select(DocumentVersion.id)
+            .join(ProjectDocument, ProjectDocument.document_id == DocumentVersion.document_id)
+            .where(ProjectDocument.project_id == project_id)
+        )
+        return [row[0] for row in result.fetchall()]
+
+    async def resolve_project_scope(self, project_id: uuid.UUID) -> ProjectSearchScope:
+        """Resolve a project filter to a usable partial index, if any.
+
+        Searches filter on ``embedding_chunks.project_ids`` by default, so
+        the project's version IDs are only fetched when a partial index
+        exists and its fingerprint has to be checked. When it matches, the
+        scope carries the predicate that lets the planner select the index.
+        """
+        scope = ProjectSearchScope(project_id=project_id)
+
+        result = await self.db.execute(
+            text("SELECT obj_description(to_regclass(:name), 'pg_class')"),
+            {"name": project_index_name(project_id)},
+        )
+        record = parse_index_comment(result.scalar())
+        if not record:
+            return scope
+
+        version_ids = await self.get_project_version_ids(project_id)
+        if version_ids and record.get("fingerprint") == version_set_fingerprint(version_ids):
+            scope.index_predicate = project_predicate_sql(version_ids)
+        else:
+            logger.info(
+                f"Partial vector index for project {project_id} is stale; "
+                "falling back to the global index"
+            )
+        return scope
+
+    # -------------------------------------------------------------------------
+    # Build / rebuild / drop
+    # -------------------------------------------------------------------------
+
+    async def build_global_index(
+        self,
+        m: int | None = None,
+        ef_construction: int | None = None,
+        rebuild: bool = False,
+    ) -> VectorIndexInfo:
+        """Build (or rebuild) the global HNSW index.
+
+        Args:
+            m: Max connections per graph layer.
+            ef_construction: Candidate list size during build.
+            rebuild: Replace the index if it already exists.
+
+        Returns:
+            Report entry for the built index.
+        """
+        m = m or self._settings.hnsw_m
+        ef_construction = ef_construction or self._settings.hnsw_ef_construction
+        record = {"scope": "global", "m": m, "ef_construction": ef_construction}
+
+        await self._create_index(GLOBAL_INDEX_NAME, m, ef_construction, None, record, rebuild)
+        return await self._get_index_info(GLOBAL_INDEX_NAME)
+
+    async def build_project_index(
+        self,
+        project_id: uuid.UUID,
+        m: int | None = None,
+        ef_construction: int | None = None,
+        rebuild: bool = False,
+    ) -> VectorIndexInfo:
+        """Build (or rebuild) a partial HNSW index for one project.
+
+        The index covers the versions currently attached to the project.
+        Attaching or detaching documents marks it stale; searches then fall
+        back to the global index until it is rebuilt.
+
+        Args:
+            project_id: Project to index.
+            m: Max connections per graph layer.
+            ef_construction: Candidate list size during build.
+            rebuild: Replace the index if it already exists.
+
+        Returns:
+            Report entry for the built index.
+        """
+        version_ids = await self.get_project_version_ids(project_id)
+        if not version_ids:
+            raise VectorIndexError(f"Project {project_id} has no document versions to index")
+
+        m = m or self._settings.hnsw_m
+        ef_construction = ef_construction or self._settings.hnsw_ef_construction
+        record = {
+            "scope": "project",
+            "project_id": str(project_id),
+            "fingerprint": version_set_fingerprint(version_ids),
+            "version_count": len(set(version_ids)),
+            "m": m,
+            "ef_construction": ef_construction,
+        }
+
+        name = project_index_name(project_id)
+        await self._create_index(
+            name, m, ef_construction, project_predicate_sql(version_ids), record, rebuild
+        )
+        return await self._get_index_info(name)
+
+    async def drop_index(self, name: str) -> bool:
+        """Drop a managed vector index.
+
+        Args:
+            name: Index name (must be the global or a project index).
+
+        Returns:
+            True if an index was dropped.
+        """
+        if not is_managed_index(name):
+            raise VectorIndexError(f"Index {name} is not managed by the vector index service")
+
+        if not await self._index_exists(name):
+            return False
+
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+        logger.info(f"Dropped vector index {name}")
+        return True
+
+    async def _create_index(
+        self,
+        name: str,
+        m: int,
+        ef_construction: int,
+        predicate: str | None,
+        record: dict,
+        rebuild: bool,
+    ) -> None:
+        """Create an index, swapping it in under ``name`` when rebuilding."""
+        exists = await self._index_exists(name)
+        if exists and not rebuild:
+            raise VectorIndexError(f"Index {name} already exists (use rebuild to replace it)")
+
+        build_name = f"{name[:58]}_next" if exists else name
+        record = {**record, "built_at": datetime.now(timezone.utc).isoformat()}
+
+        logger.info(
+            f"Building vector index {name} (m={m}, ef_construction={ef_construction}"
+            f"{', partial' if predicate else ''})"
+        )
+
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            # Leftover from an interrupted build (CONCURRENTLY leaves INVALID indexes)
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {build_name}"))
+            await conn.execute(text(build_index_sql(build_name, m, ef_construction, predicate)))
+            if exists:
+                await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+                await conn.execute(text(f"ALTER INDEX {build_name} RENAME TO {name}"))
+            # COMMENT cannot take bind parameters; JSON is quoted as a literal
+            comment = json.dumps(record).replace("'", "''")
+            await conn.execute(text(f"COMMENT ON INDEX {name} IS '{comment}'"))
+
+        logger.info(f"Vector index {name} ready")
+
+    async def _index_exists(self, name: str) -> bool:
+        """Check whether an index exists."""
+        result = await self.db.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+        )
+        return bool(result.scalar())
+
+    async def _get_index_info(self, name: str) -> VectorIndexInfo:
+        """Get the report entry for a single index."""
+        for info in await self.list_indexes():
+            if info.name == name:
+                return info
+        raise VectorIndexError(f"Index {name} not found after build")
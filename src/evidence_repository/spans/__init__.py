@@ -2,6 +2,7 @@
 
 Provides span generators for various document types:
 - TextSpanGenerator: PDF/text documents with character offsets
+- PageSpanStream: text spans built incrementally as PDF pages arrive
 - CsvSpanGenerator: CSV files with row/column ranges
 - ExcelSpanGenerator: Excel workbooks with sheet/cell ranges
 - ImageSpanGenerator: Images with OCR text if available
@@ -19,7 +20,7 @@ from evidence_repository.spans.csv_span_generator import CsvSpanGenerator
 from evidence_repository.spans.excel_span_generator import ExcelSpanGenerator
 from evidence_repository.spans.image_span_generator import ImageSpanGenerator
 from evidence_repository.spans.service import SpanGenerationService
-from evidence_repository.spans.text_span_generator import TextSpanGenerator
+from evidence_repository.spans.text_span_generator import PageSpanStream, TextSpanGenerator
 
 __all__ = [
     # Base classes
@@ -35,6 +36,7 @@ __all__ = [
     "CsvSpanGenerator",
     "ExcelSpanGenerator",
     "ImageSpanGenerator",
+    "PageSpanStream",
     # Service
     "SpanGenerationService",
 ]
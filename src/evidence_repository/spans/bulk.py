@@ -0,0 +1,83 @@
+"""Bulk span persistence.
+
+Spans are written with multi-row ``INSERT ... ON CONFLICT DO NOTHING`` on the
+``uq_spans_version_hash`` constraint instead of one hash lookup per span.
+Existing spans are left untouched (no dead tuples from no-op updates); the
+caller re-selects by hash when it needs the full set of rows.
+
+Statements are built here and executed by both the async service
+(``SpanGenerationService``) and the sync worker tasks.
+"""
+
+import uuid
+from typing import Any, Iterator, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from evidence_repository.models.evidence import Span, SpanType
+
+# Rows per INSERT (8 bind parameters each, well under the 32767 limit)
+INSERT_BATCH_SIZE = 1000
+
+# Hashes per SELECT ... IN (...)
+SELECT_BATCH_SIZE = 5000
+
+
+def chunked(items: Sequence, size: int) -> Iterator[Sequence]:
+    """Yield consecutive slices of ``items``."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def build_span_row(
+    version_id: uuid.UUID,
+    span_hash: str,
+    text_content: str,
+    locator: dict[str, Any],
+    span_type: SpanType,
+    metadata: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build an insert row for the spans table."""
+    return {
+        "id": uuid.uuid4(),
+        "document_version_id": version_id,
+        "span_hash": span_hash,
+        "start_locator": locator,
+        "end_locator": None,
+        "text_content": text_content,
+        "span_type": span_type,
+        "metadata": metadata or {},
+    }
+
+
+def dedupe_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop rows repeating a span_hash (first wins, order preserved).
+
+    Postgres rejects a single INSERT ... ON CONFLICT that touches the same
+    key twice, and duplicate hashes describe the same span anyway.
+    """
+    seen: set[str] = set()
+    unique = []
+    for row in rows:
+        if row["span_hash"] not in seen:
+            seen.add(row["span_hash"])
+            unique.append(row)
+    return unique
+
+
+def insert_spans_statement(rows: list[dict[str, Any]]):
+    """Multi-row insert that skips spans already present for the version."""
+    return (
+        pg_insert(Span.__table__)
+        .values(rows)
+        .on_conflict_do_nothing(constraint="uq_spans_version_hash")
+    )
+
+
+def select_spans_statement(version_id: uuid.UUID, span_hashes: Sequence[str]):
+    """Select spans of a version by hash."""
+    return select(Span).where(
+        Span.document_version_id == version_id,
+        Span.span_hash.in_(span_hashes),
+    )
@@ -1,6 +1,6 @@
 """CSV span generator for CSV files."""
 
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from evidence_repository.spans.base import BaseSpanGenerator, SpanData
 
@@ -73,61 +73,106 @@ class CsvSpanGenerator(BaseSpanGenerator):
         spans: list[SpanData] = []
 
         for table_idx, table in enumerate(tables):
-            headers = table.get("headers", [])
             rows = table.get("rows", [])
 
             if not rows:
                 continue
 
-            total_rows = len(rows)
-            total_cols = len(headers) if headers else (len(rows[0]) if rows else 0)
-
-            # Generate spans for row ranges
-            row_start = 0
-            while row_start < total_rows:
-                row_end = min(row_start + self.rows_per_span, total_rows)
-
-                # Ensure minimum span size unless at end
-                if row_end - row_start < self.min_rows_per_span and row_end < total_rows:
-                    row_end = min(row_start + self.min_rows_per_span, total_rows)
-
-                # Extract rows for this span
-                span_rows = rows[row_start:row_end]
-
-                # Build text representation
-                span_text = self._build_span_text(headers, span_rows)
-
-                # Create locator
-                locator: dict[str, Any] = {
-                    "type": "csv",
-                    "row_start": row_start,
-                    "row_end": row_end,
-                    "col_start": 0,
-                    "col_end": total_cols,
-                }
-
-                if table.get("sheet_name"):
-                    locator["sheet_name"] = table["sheet_name"]
-                if len(tables) > 1:
-                    locator["table_index"] = table_idx
-
-                # Create span data
-                span = SpanData(
-                    text_content=span_text,
-                    locator=locator,
-                    span_type="table",
-                    metadata={
-                        "row_count": row_end - row_start,
-                        "col_count": total_cols,
-                        "headers": headers,
-                    },
+            spans.extend(
+                self.iter_table_spans(
+                    table.get("headers", []),
+                    rows,
+                    sheet_name=table.get("sheet_name"),
+                    table_index=table_idx if len(tables) > 1 else None,
                 )
-                spans.append(span)
-
-                row_start = row_end
+            )
 
         return spans
 
+    def iter_table_spans(
+        self,
+        headers: list[str],
+        rows: Iterable[list[Any]],
+        sheet_name: str | None = None,
+        table_index: int | None = None,
+    ) -> Iterator[SpanData]:
+        """Yield spans for one table while its rows are being read.
+
+        Only the rows of the span being built are held, so ``rows`` can come
+        straight from ChunkedCsvReader.rows(). Spans are the same as
+        generate_spans over the materialized table.
+
+        Args:
+            headers: Column headers.
+            rows: Data rows (any iterable).
+            sheet_name: Optional sheet name for the locator.
+            table_index: Table index for the locator (multi-table inputs).
+
+        Yields:
+            SpanData for consecutive row ranges.
+        """
+        # Rows per span (min_rows_per_span wins if it is larger)
+        step = max(self.rows_per_span, self.min_rows_per_span)
+        total_cols = len(headers) if headers else None
+        span_rows: list[list[Any]] = []
+        row_start = 0
+
+        for row in rows:
+            if total_cols is None:
+                total_cols = len(row)
+            span_rows.append(row)
+            if len(span_rows) == step:
+                yield self._make_span(
+                    headers, span_rows, row_start, total_cols, sheet_name, table_index
+                )
+                row_start += len(span_rows)
+                span_rows = []
+
+        if span_rows:
+            yield self._make_span(
+                headers, span_rows, row_start, total_cols, sheet_name, table_index
+            )
+
+    def _make_span(
+        self,
+        headers: list[str],
+        span_rows: list[list[Any]],
+        row_start: int,
+        total_cols: int,
+        sheet_name: str | None,
+        table_index: int | None,
+    ) -> SpanData:
+        """Create the span for data rows [row_start, row_start + len(span_rows))."""
+        row_end = row_start + len(span_rows)
+
+        # Build text representation
+        span_text = self._build_span_text(headers, span_rows)
+
+        # Create locator
+        locator: dict[str, Any] = {
+            "type": "csv",
+            "row_start": row_start,
+            "row_end": row_end,
+            "col_start": 0,
+            "col_end": total_cols,
+        }
+
+        if sheet_name:
+            locator["sheet_name"] = sheet_name
+        if table_index is not None:
+            locator["table_index"] = table_index
+
+        return SpanData(
+            text_content=span_text,
+            locator=locator,
+            span_type="table",
+            metadata={
+                "row_count": row_end - row_start,
+                "col_count": total_cols,
+                "headers": headers,
+            },
+        )
+
     def _build_span_text(
         self,
         headers: list[str],
@@ -1,6 +1,6 @@
 """Excel span generator for Excel workbooks."""
 
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from evidence_repository.spans.base import BaseSpanGenerator, SpanData
 
@@ -16,6 +16,7 @@ class ExcelSpanGenerator(BaseSpanGenerator):
     - Spans are defined by cell ranges (e.g., "A1:D10")
     - Default: 25 rows per span
     - Preserves sheet context
+    - Streams rows (iter_sheet_spans) for large workbooks
     """
 
     def __init__(
@@ -70,66 +71,101 @@ class ExcelSpanGenerator(BaseSpanGenerator):
         spans: list[SpanData] = []
 
         for table in tables:
-            sheet_name = table.get("sheet_name", "Sheet1")
-            headers = table.get("headers", [])
             rows = table.get("rows", [])
-
             if not rows:
                 continue
 
-            total_rows = len(rows)
-            total_cols = len(headers) if headers else (len(rows[0]) if rows else 0)
-
-            # Generate spans for row ranges within this sheet
-            row_start = 0
-            while row_start < total_rows:
-                row_end = min(row_start + self.rows_per_span, total_rows)
-
-                # Ensure minimum span size
-                if row_end - row_start < self.min_rows_per_span and row_end < total_rows:
-                    row_end = min(row_start + self.min_rows_per_span, total_rows)
-
-                # Extract rows for this span
-                span_rows = rows[row_start:row_end]
-
-                # Build text representation
-                span_text = self._build_span_text(headers, span_rows)
-
-                # Convert to Excel cell range notation
-                # Row indices are 0-based in data, 1-based in Excel (+ 1 for header)
-                excel_row_start = row_start + 2  # +1 for header, +1 for 1-indexing
-                excel_row_end = row_end + 1  # +1 for header
-                col_start_letter = self._col_index_to_letter(0)
-                col_end_letter = self._col_index_to_letter(total_cols - 1)
-                cell_range = f"{col_start_letter}{excel_row_start}:{col_end_letter}{excel_row_end}"
-
-                # Create locator
-                locator: dict[str, Any] = {
-                    "type": "excel",
-                    "sheet": sheet_name,
-                    "cell_range": cell_range,
-                }
-
-                # Create span data
-                span = SpanData(
-                    text_content=span_text,
-                    locator=locator,
-                    span_type="table",
-                    metadata={
-                        "sheet_name": sheet_name,
-                        "row_count": row_end - row_start,
-                        "col_count": total_cols,
-                        "headers": headers,
-                        "row_start": row_start,
-                        "row_end": row_end,
-                    },
+            spans.extend(
+                self.iter_sheet_spans(
+                    table.get("sheet_name", "Sheet1"),
+                    table.get("headers", []),
+                    rows,
                 )
-                spans.append(span)
-
-                row_start = row_end
+            )
 
         return spans
 
+    def iter_sheet_spans(
+        self,
+        sheet_name: str,
+        headers: list[str],
+        rows: Iterable[list[Any]],
+    ) -> Iterator[SpanData]:
+        """Yield spans for one sheet while its rows are being read.
+
+        Only the rows of the span being built are held, so ``rows`` can come
+        straight from a read-only worksheet. Spans are the same as
+        generate_spans over the materialized table.
+
+        Args:
+            sheet_name: Sheet name.
+            headers: Column headers.
+            rows: Data rows (any iterable).
+
+        Yields:
+            SpanData for consecutive row ranges.
+        """
+        # Rows per span (min_rows_per_span wins if it is larger)
+        step = max(self.rows_per_span, self.min_rows_per_span)
+        total_cols = len(headers) if headers else None
+        span_rows: list[list[Any]] = []
+        row_start = 0
+
+        for row in rows:
+            if total_cols is None:
+                total_cols = len(row)
+            span_rows.append(row)
+            if len(span_rows) == step:
+                yield self._make_span(sheet_name, headers, span_rows, row_start, total_cols)
+                row_start += len(span_rows)
+                span_rows = []
+
+        if span_rows:
+            yield self._make_span(sheet_name, headers, span_rows, row_start, total_cols)
+
+    def _make_span(
+        self,
+        sheet_name: str,
+        headers: list[str],
+        span_rows: list[list[Any]],
+        row_start: int,
+        total_cols: int,
+    ) -> SpanData:
+        """Create the span for data rows [row_start, row_start + len(span_rows))."""
+        row_end = row_start + len(span_rows)
+
+        # Build text representation
+        span_text = self._build_span_text(headers, span_rows)
+
+        # Convert to Excel cell range notation
+        # Row indices are 0-based in data, 1-based in Excel (+ 1 for header)
+        excel_row_start = row_start + 2  # +1 for header, +1 for 1-indexing
+        excel_row_end = row_end + 1  # +1 for header
+        col_start_letter = self._col_index_to_letter(0)
+        col_end_letter = self._col_index_to_letter(total_cols - 1)
+        cell_range = f"{col_start_letter}{excel_row_start}:{col_end_letter}{excel_row_end}"
+
+        # Create locator
+        locator: dict[str, Any] = {
+            "type": "excel",
+            "sheet": sheet_name,
+            "cell_range": cell_range,
+        }
+
+        return SpanData(
+            text_content=span_text,
+            locator=locator,
+            span_type="table",
+            metadata={
+                "sheet_name": sheet_name,
+                "row_count": row_end - row_start,
+                "col_count": total_cols,
+                "headers": headers,
+                "row_start": row_start,
+                "row_end": row_end,
+            },
+        )
+
     def _build_span_text(
         self,
         headers: list[str],
@@ -1,8 +1,10 @@
 """Span generation service for orchestrating span creation."""
 
+import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Any
+from itertools import chain, islice
+from typing import Any, Iterator
 from uuid import UUID
 
 from sqlalchemy import select
@@ -13,6 +15,15 @@ from evidence_repository.extraction.base import ExtractionArtifact
 from evidence_repository.models.document import DocumentVersion
 from evidence_repository.models.evidence import Span, SpanType
 from evidence_repository.spans.base import BaseSpanGenerator, SpanData
+from evidence_repository.spans.bulk import (
+    INSERT_BATCH_SIZE,
+    SELECT_BATCH_SIZE,
+    build_span_row,
+    chunked,
+    dedupe_rows,
+    insert_spans_statement,
+    select_spans_statement,
+)
 from evidence_repository.spans.csv_span_generator import CsvSpanGenerator
 from evidence_repository.spans.excel_span_generator import ExcelSpanGenerator
 from evidence_repository.spans.image_span_generator import ImageSpanGenerator
@@ -20,6 +31,9 @@ from evidence_repository.spans.text_span_generator import TextSpanGenerator
 
 logger = logging.getLogger(__name__)
 
+EXCEL_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+CSV_CONTENT_TYPE = "text/csv"
+
 
 class SpanGenerationService:
     """Service for generating and persisting document spans.
@@ -171,65 +185,163 @@ class SpanGenerationService:
         version_id: UUID,
         span_data_list: list[SpanData],
     ) -> list[Span]:
-        """Persist spans to database with idempotent upsert.
+        """Persist spans to database with idempotent bulk upsert.
 
-        Uses span_hash for duplicate detection. If a span with the same
-        version_id and span_hash exists, it's skipped.
+        Inserts in multi-row batches with ON CONFLICT DO NOTHING on
+        (document_version_id, span_hash), then loads the resulting rows by
+        hash, so the round trips scale with batches rather than spans.
 
         Args:
             version_id: Document version ID.
             span_data_list: List of SpanData to persist.
 
         Returns:
-            List of Span records (created or existing).
+            List of Span records (created or existing), in input order.
         """
-        spans: list[Span] = []
-
-        for span_data in span_data_list:
-            # Check for existing span with same hash
-            existing = await self._get_span_by_hash(version_id, span_data.span_hash)
-
-            if existing:
-                spans.append(existing)
-                continue
-
-            # Create new span
-            span = Span(
-                document_version_id=version_id,
-                span_hash=span_data.span_hash,
-                start_locator=span_data.locator,
-                end_locator=None,
-                text_content=span_data.text_content,
-                span_type=self._parse_span_type(span_data.span_type),
-                metadata_=span_data.metadata,
-            )
-            self.db.add(span)
-            spans.append(span)
+        rows = dedupe_rows([
+            self._span_row(version_id, span_data) for span_data in span_data_list
+        ])
+        if not rows:
+            return []
 
-        await self.db.flush()
-        return spans
+        inserted = 0
+        for batch in chunked(rows, INSERT_BATCH_SIZE):
+            result = await self.db.execute(insert_spans_statement(list(batch)))
+            inserted += max(result.rowcount or 0, 0)
 
-    async def _get_span_by_hash(
+        hashes = [row["span_hash"] for row in rows]
+        by_hash: dict[str, Span] = {}
+        for batch in chunked(hashes, SELECT_BATCH_SIZE):
+            result = await self.db.execute(select_spans_statement(version_id, batch))
+            by_hash.update((span.span_hash, span) for span in result.scalars())
+
+        logger.debug(
+            f"Persisted spans for version {version_id}: "
+            f"{inserted} inserted, {len(rows) - inserted} existing"
+        )
+        return [by_hash[h] for h in hashes if h in by_hash]
+
+    async def generate_excel_spans_streaming(
         self,
         version_id: UUID,
-        span_hash: str,
-    ) -> Span | None:
-        """Get existing span by version and hash.
+        data: bytes,
+        batch_size: int = INSERT_BATCH_SIZE,
+    ) -> int:
+        """Generate and persist spans for a workbook without loading it whole.
+
+        Rows stream from the read-only workbook into the Excel generator and
+        spans are inserted ``batch_size`` at a time, so memory is bounded by
+        one batch regardless of workbook size.
 
         Args:
             version_id: Document version ID.
-            span_hash: Span hash.
+            data: Raw Excel bytes.
+            batch_size: Spans per INSERT.
 
         Returns:
-            Existing Span or None.
+            Number of spans inserted (existing spans are skipped).
         """
-        result = await self.db.execute(
-            select(Span).where(
-                Span.document_version_id == version_id,
-                Span.span_hash == span_hash,
-            )
+        from evidence_repository.extraction.excel_extractor import ExcelExtractor
+
+        generator = self.get_generator(EXCEL_CONTENT_TYPE)
+        if not isinstance(generator, ExcelSpanGenerator):
+            generator = ExcelSpanGenerator()
+
+        def iter_spans() -> Iterator[SpanData]:
+            for sheet_name, headers, rows in ExcelExtractor().iter_sheets(data):
+                yield from generator.iter_sheet_spans(sheet_name, headers, rows)
+
+        inserted = await self.persist_span_stream(version_id, iter_spans(), batch_size)
+        logger.info(f"Streamed {inserted} Excel spans for version {version_id}")
+        return inserted
+
+    async def generate_csv_spans_streaming(
+        self,
+        version_id: UUID,
+        data: bytes,
+        batch_size: int = INSERT_BATCH_SIZE,
+    ) -> int:
+        """Generate and persist spans for a CSV file without materializing it.
+
+        Rows are decoded and typed chunk by chunk (extraction.csv_columnar)
+        and fed to the CSV generator; spans are inserted ``batch_size`` at a
+        time, so memory is bounded by one chunk and one batch.
+
+        Args:
+            version_id: Document version ID.
+            data: Raw CSV bytes.
+            batch_size: Spans per INSERT.
+
+        Returns:
+            Number of spans inserted (existing spans are skipped).
+        """
+        from evidence_repository.extraction.csv_extractor import CsvExtractor
+
+        generator = self.get_generator(CSV_CONTENT_TYPE)
+        if not isinstance(generator, CsvSpanGenerator):
+            generator = CsvSpanGenerator()
+
+        def iter_spans() -> Iterator[SpanData]:
+            reader = CsvExtractor().read_chunks(data)
+            rows = reader.rows()
+            # Headers are known once the first chunk has been read
+            first = next(rows, None)
+            if first is None:
+                return
+            headers = reader.headers or [f"Column_{i + 1}" for i in range(len(first))]
+            yield from generator.iter_table_spans(headers, chain([first], rows))
+            for warning in reader.warnings:
+                logger.warning(f"CSV spans for version {version_id}: {warning}")
+
+        inserted = await self.persist_span_stream(version_id, iter_spans(), batch_size)
+        logger.info(f"Streamed {inserted} CSV spans for version {version_id}")
+        return inserted
+
+    async def persist_span_stream(
+        self,
+        version_id: UUID,
+        spans: Iterator[SpanData],
+        batch_size: int = INSERT_BATCH_SIZE,
+    ) -> int:
+        """Persist spans from a blocking iterator in bounded batches.
+
+        Each batch is pulled from ``spans`` in a worker thread (the iterator
+        may parse files) and inserted with ON CONFLICT DO NOTHING before the
+        next is read. Rows are not re-selected.
+
+        Args:
+            version_id: Document version ID.
+            spans: Iterator of SpanData, e.g. a generator over a file.
+            batch_size: Spans per INSERT.
+
+        Returns:
+            Number of spans inserted.
+        """
+        inserted = 0
+        try:
+            while True:
+                batch = await asyncio.to_thread(lambda: list(islice(spans, batch_size)))
+                if not batch:
+                    break
+                rows = dedupe_rows([self._span_row(version_id, span) for span in batch])
+                result = await self.db.execute(insert_spans_statement(rows))
+                inserted += max(result.rowcount or 0, 0)
+        finally:
+            close = getattr(spans, "close", None)
+            if close is not None:
+                close()
+        return inserted
+
+    def _span_row(self, version_id: UUID, span_data: SpanData) -> dict[str, Any]:
+        """Build a spans insert row from SpanData."""
+        return build_span_row(
+            version_id=version_id,
+            span_hash=span_data.span_hash,
+            text_content=span_data.text_content,
+            locator=span_data.locator,
+            span_type=self._parse_span_type(span_data.span_type),
+            metadata=span_data.metadata,
         )
-        return result.scalar_one_or_none()
 
     def _parse_span_type(self, type_str: str) -> SpanType:
         """Parse span type string to enum.
@@ -1,6 +1,7 @@
 """Text span generator for PDF and plain text documents."""
 
 import re
+from bisect import bisect_right
 from typing import Any
 
 from evidence_repository.spans.base import BaseSpanGenerator, SpanData
@@ -76,58 +77,40 @@ class TextSpanGenerator(BaseSpanGenerator):
         if not text or not text.strip():
             return []
 
-        spans: list[SpanData] = []
-        text_length = len(text)
-
         # Detect page boundaries if available in metadata
-        page_breaks = metadata.get("page_breaks", [])
-
-        position = 0
-        while position < text_length:
-            # Calculate end position
-            end_pos = min(position + self.max_span_size, text_length)
+        cursor = _SpanCursor(self, metadata.get("page_breaks", []))
+        cursor.feed(text)
+        return cursor.advance(complete=True)
 
-            # Try to find a good break point
-            if end_pos < text_length:
-                end_pos = self._find_break_point(text, position, end_pos)
-
-            # Extract span text
-            span_text = text[position:end_pos].strip()
-
-            if span_text and len(span_text) >= self.min_span_size // 2:
-                # Determine page hint
-                page_hint = self._get_page_hint(position, page_breaks)
-
-                # Create locator
-                locator: dict[str, Any] = {
-                    "type": "text",
-                    "offset_start": position,
-                    "offset_end": end_pos,
-                }
-                if page_hint is not None:
-                    locator["page_hint"] = page_hint
-
-                # Create span data
-                span = SpanData(
-                    text_content=span_text,
-                    locator=locator,
-                    span_type="text",
-                    metadata={
-                        "char_count": len(span_text),
-                        "word_count": len(span_text.split()),
-                    },
-                )
-                spans.append(span)
-
-            # Move position with overlap
-            if end_pos >= text_length:
-                break
-
-            position = end_pos - self.overlap_size
-            if position <= spans[-1].locator.get("offset_start", 0) if spans else 0:
-                position = end_pos  # Prevent infinite loop
-
-        return spans
+    def _make_span(
+        self,
+        span_text: str,
+        position: int,
+        end_pos: int,
+        page_breaks: list[int],
+    ) -> SpanData:
+        """Create a text span for text[position:end_pos]."""
+        # Determine page hint
+        page_hint = self._get_page_hint(position, page_breaks)
+
+        # Create locator
+        locator: dict[str, Any] = {
+            "type": "text",
+            "offset_start": position,
+            "offset_end": end_pos,
+        }
+        if page_hint is not None:
+            locator["page_hint"] = page_hint
+
+        return SpanData(
+            text_content=span_text,
+            locator=locator,
+            span_type="text",
+            metadata={
+                "char_count": len(span_text),
+                "word_count": len(span_text.split()),
+            },
+        )
 
     def _find_break_point(self, text: str, start: int, max_end: int) -> int:
         """Find a good break point for the span.
@@ -176,7 +159,8 @@ class TextSpanGenerator(BaseSpanGenerator):
 
         Args:
             position: Character position.
-            page_breaks: List of character positions where pages start.
+            page_breaks: Sorted character positions where each page starts
+                (page 1 at 0).
 
         Returns:
             Page number (1-indexed) or None.
@@ -184,12 +168,126 @@ class TextSpanGenerator(BaseSpanGenerator):
         if not page_breaks:
             return None
 
-        # Find which page this position is on
-        page = 1
-        for break_pos in page_breaks:
-            if position >= break_pos:
-                page += 1
-            else:
+        # Pages starting at or before this position
+        return max(bisect_right(page_breaks, position), 1)
+
+
+class _SpanCursor:
+    """Span generation state over text that may still be growing.
+
+    Only the text from the current position onward is buffered; offsets in
+    spans are absolute. A span is only cut once ``max_span_size`` characters
+    past its start are available (or the text is complete), so spans are
+    the same as a single pass over the full text.
+    """
+
+    def __init__(self, generator: TextSpanGenerator, page_breaks: list[int]):
+        self.generator = generator
+        self.page_breaks = page_breaks
+        self.buffer = ""
+        self.base = 0  # Absolute offset of buffer[0]
+        self.position = 0
+        self.last_start: int | None = None
+        self.done = False
+
+    def feed(self, text: str) -> None:
+        self.buffer += text
+
+    def advance(self, complete: bool) -> list[SpanData]:
+        g = self.generator
+        spans: list[SpanData] = []
+        text = self.buffer
+        text_length = len(text)
+
+        while not self.done:
+            position = self.position - self.base
+            if position >= text_length:
+                if complete:
+                    self.done = True
+                break
+
+            # Calculate end position; wait for more text unless complete
+            if position + g.max_span_size >= text_length and not complete:
                 break
+            end_pos = min(position + g.max_span_size, text_length)
 
-        return page
+            # Try to find a good break point
+            if end_pos < text_length:
+                end_pos = g._find_break_point(text, position, end_pos)
+
+            # Extract span text
+            span_text = text[position:end_pos].strip()
+
+            if span_text and len(span_text) >= g.min_span_size // 2:
+                spans.append(
+                    g._make_span(
+                        span_text,
+                        self.base + position,
+                        self.base + end_pos,
+                        self.page_breaks,
+                    )
+                )
+                self.last_start = self.base + position
+
+            # Move position with overlap
+            if end_pos >= text_length:
+                self.done = True
+                break
+
+            next_position = self.base + end_pos - g.overlap_size
+            if self.last_start is not None and next_position <= self.last_start:
+                next_position = self.base + end_pos  # Prevent infinite loop
+            self.position = next_position
+
+        if not complete:
+            # Drop text no future span can start in
+            self.buffer = self.buffer[self.position - self.base:]
+            self.base = self.position
+
+        return spans
+
+
+class PageSpanStream:
+    """Generate text spans from pages as they are extracted.
+
+    Pages are joined with ``separator`` and page_breaks are tracked as
+    pages arrive, so the spans (offsets, page hints, hashes) are identical
+    to ``TextSpanGenerator.generate_spans`` over the joined text with the
+    same page_breaks.
+
+    Usage:
+        stream = PageSpanStream()
+        async for page in iter_pdf_pages(path, page_count):
+            persist(stream.add_page(page.text))
+        persist(stream.finish())
+    """
+
+    def __init__(
+        self,
+        generator: TextSpanGenerator | None = None,
+        separator: str = "\n\n",
+    ):
+        self.separator = separator
+        self.page_breaks: list[int] = []
+        self._length = 0
+        self._pages = 0
+        self._has_text = False
+        self._cursor = _SpanCursor(generator or TextSpanGenerator(), self.page_breaks)
+
+    def add_page(self, text: str) -> list[SpanData]:
+        """Append a page; returns spans that are now complete."""
+        if self._pages:
+            self._cursor.feed(self.separator)
+            self._length += len(self.separator)
+        self.page_breaks.append(self._length)
+        self._cursor.feed(text)
+        self._length += len(text)
+        self._pages += 1
+        self._has_text = self._has_text or bool(text.strip())
+        return self._cursor.advance(complete=False)
+
+    def finish(self) -> list[SpanData]:
+        """Return the remaining spans after the last page."""
+        if not self._has_text:
+            return []
+        return self._cursor.advance(complete=True)
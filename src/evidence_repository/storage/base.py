@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from pathlib import Path
 from typing import AsyncIterator
 
 
@@ -87,6 +88,44 @@ class StorageBackend(ABC):
         """
         ...
 
+    async def put_stream(
+        self,
+        path_key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        metadata: dict[str, str] | None = None,
+    ) -> str:
+        """Upload content from an async iterator of chunks.
+
+        Memory use stays bounded by the chunk size. Default implementation
+        spools to a temporary file and calls put_file; backends override it
+        to stream directly.
+
+        Args:
+            path_key: Path key (e.g., "{doc_id}/{version_id}/original.pdf").
+            chunks: File content in chunks.
+            content_type: MIME type of the file.
+            metadata: Optional key-value metadata to store with the file.
+
+        Returns:
+            File URI (e.g., "file:///path/to/file" or "s3://bucket/key").
+
+        Raises:
+            StorageUploadError: If upload fails.
+        """
+        import asyncio
+        import os
+        import tempfile
+
+        fd, temp_path = tempfile.mkstemp(prefix="upload_")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async for chunk in chunks:
+                    await asyncio.to_thread(f.write, chunk)
+            return await self.put_file(path_key, temp_path, content_type, metadata)
+        finally:
+            os.unlink(temp_path)
+
     # =========================================================================
     # Core Read Operations
     # =========================================================================
@@ -109,7 +148,11 @@ class StorageBackend(ABC):
 
     @abstractmethod
     async def get_stream(
-        self, file_uri: str, chunk_size: int = 8192
+        self,
+        file_uri: str,
+        chunk_size: int = 8192,
+        start: int = 0,
+        end: int | None = None,
     ) -> AsyncIterator[bytes]:
         """Stream file content in chunks.
 
@@ -118,6 +161,8 @@ class StorageBackend(ABC):
         Args:
             file_uri: File URI (e.g., "file:///path" or "s3://bucket/key").
             chunk_size: Size of each chunk in bytes.
+            start: First byte offset to stream.
+            end: Last byte offset to stream, inclusive (None for end of file).
 
         Yields:
             Chunks of file content.
@@ -128,6 +173,17 @@ class StorageBackend(ABC):
         """
         ...
 
+    def local_path(self, file_uri: str) -> Path | None:
+        """Filesystem path of a stored file, for zero-copy serving.
+
+        Args:
+            file_uri: File URI.
+
+        Returns:
+            Path on the local filesystem, or None for remote backends.
+        """
+        return None
+
     # =========================================================================
     # File Management Operations
     # =========================================================================
@@ -260,19 +316,21 @@ class StorageBackend(ABC):
 
         Deprecated: Use get_bytes() instead.
         """
-        # Handle both URI and raw key for backwards compatibility
-        if not key.startswith(("file://", "s3://")):
-            key = self._key_to_uri(key)
-        return await self.get_bytes(key)
+        return await self.get_bytes(self.resolve_uri(key))
 
     async def get_url(self, key: str, expires_in: int = 3600) -> str:
         """Generate URL to access file (legacy method).
 
         Deprecated: Use sign_download_url() instead.
         """
-        if not key.startswith(("file://", "s3://")):
-            key = self._key_to_uri(key)
-        return await self.sign_download_url(key, expires_in)
+        return await self.sign_download_url(self.resolve_uri(key), expires_in)
+
+    def resolve_uri(self, key: str) -> str:
+        """Return a file URI for a stored key or URI (e.g. a version's storage_path)."""
+        # Handle both URI and raw key for backwards compatibility
+        if key.startswith(("file://", "s3://")):
+            return key
+        return self._key_to_uri(key)
 
     def _key_to_uri(self, key: str) -> str:
         """Convert a storage key to a URI. Override in subclasses."""
@@ -234,6 +234,53 @@ class LocalFilesystemStorage(StorageBackend):
         except OSError as e:
             raise StorageUploadError(f"Failed to upload {path_key}: {e}") from e
 
+    async def put_stream(
+        self,
+        path_key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        metadata: dict[str, str] | None = None,
+    ) -> str:
+        """Upload content from an async iterator of chunks.
+
+        Chunks are written to a sibling ``.part`` file that is renamed into
+        place once complete, so readers never see a partial file.
+
+        Args:
+            path_key: Path key (e.g., "{doc_id}/{version_id}/original.pdf").
+            chunks: File content in chunks.
+            content_type: MIME type of the file.
+            metadata: Optional metadata to store in sidecar file.
+
+        Returns:
+            File URI (e.g., "file:///absolute/path/to/file").
+        """
+        try:
+            full_path = self._get_full_path(path_key)
+            part_path = full_path.parent / f".{full_path.name}.part"
+
+            # Create parent directories
+            await aiofiles.os.makedirs(full_path.parent, exist_ok=True)
+
+            size = 0
+            try:
+                async with aiofiles.open(part_path, "wb") as f:
+                    async for chunk in chunks:
+                        await f.write(chunk)
+                        size += len(chunk)
+                await aiofiles.os.replace(part_path, full_path)
+            finally:
+                if part_path.exists():
+                    part_path.unlink()
+
+            # Store metadata in sidecar file
+            await self._write_metadata(full_path, content_type, size, metadata)
+
+            return self._path_to_uri(full_path)
+
+        except OSError as e:
+            raise StorageUploadError(f"Failed to upload {path_key}: {e}") from e
+
     # =========================================================================
     # Core Read Operations
     # =========================================================================
@@ -259,13 +306,19 @@ class LocalFilesystemStorage(StorageBackend):
             raise StorageDownloadError(f"Failed to download {file_uri}: {e}") from e
 
     async def get_stream(
-        self, file_uri: str, chunk_size: int = 8192
+        self,
+        file_uri: str,
+        chunk_size: int = 8192,
+        start: int = 0,
+        end: int | None = None,
     ) -> AsyncIterator[bytes]:
         """Stream file content in chunks.
 
         Args:
             file_uri: File URI (e.g., "file:///path/to/file").
             chunk_size: Size of each chunk in bytes.
+            start: First byte offset to stream.
+            end: Last byte offset to stream, inclusive (None for end of file).
 
         Yields:
             Chunks of file content.
@@ -275,16 +328,33 @@ class LocalFilesystemStorage(StorageBackend):
         if not full_path.exists():
             raise FileNotFoundError(f"File not found: {file_uri}")
 
+        remaining = None if end is None else end - start + 1
         try:
             async with aiofiles.open(full_path, "rb") as f:
-                while True:
-                    chunk = await f.read(chunk_size)
+                if start:
+                    await f.seek(start)
+                while remaining is None or remaining > 0:
+                    size = chunk_size if remaining is None else min(chunk_size, remaining)
+                    chunk = await f.read(size)
                     if not chunk:
                         break
+                    if remaining is not None:
+                        remaining -= len(chunk)
                     yield chunk
         except OSError as e:
             raise StorageDownloadError(f"Failed to stream {file_uri}: {e}") from e
 
+    def local_path(self, file_uri: str) -> Path | None:
+        """Filesystem path of a stored file, for zero-copy serving.
+
+        Args:
+            file_uri: File URI (e.g., "file:///path/to/file").
+
+        Returns:
+            Path on the local filesystem.
+        """
+        return self._uri_to_path(file_uri)
+
     # =========================================================================
     # File Management Operations
     # =========================================================================
@@ -28,6 +28,9 @@ class S3Storage(StorageBackend):
 
     URI_SCHEME = "s3://"
 
+    # Part size for streamed multipart uploads (S3 minimum is 5 MB)
+    MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
     def __init__(
         self,
         bucket_name: str,
@@ -206,6 +209,76 @@ class S3Storage(StorageBackend):
         )
         return f"{self.URI_SCHEME}{self.bucket_name}/{full_key}"
 
+    async def put_stream(
+        self,
+        path_key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        metadata: dict[str, str] | None = None,
+    ) -> str:
+        """Upload chunks to S3/R2 as a multipart upload.
+
+        At most one part (MULTIPART_PART_SIZE) is buffered at a time. Content
+        smaller than one part is sent with a single put_object.
+        """
+        full_key = self._get_full_key(path_key)
+        buffer = bytearray()
+        upload_id: str | None = None
+        parts: list[dict] = []
+
+        async def upload_part() -> None:
+            part_number = len(parts) + 1
+            response = await asyncio.to_thread(
+                self._client.upload_part,
+                Bucket=self.bucket_name,
+                Key=full_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=bytes(buffer),
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+            buffer.clear()
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                if len(buffer) < self.MULTIPART_PART_SIZE:
+                    continue
+                if upload_id is None:
+                    response = await asyncio.to_thread(
+                        self._client.create_multipart_upload,
+                        Bucket=self.bucket_name,
+                        Key=full_key,
+                        ContentType=content_type,
+                        Metadata=metadata or {},
+                    )
+                    upload_id = response["UploadId"]
+                await upload_part()
+
+            if upload_id is None:
+                return await self.put_bytes(path_key, bytes(buffer), content_type, metadata)
+
+            if buffer:
+                await upload_part()
+            await asyncio.to_thread(
+                self._client.complete_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=full_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            if upload_id is not None:
+                await asyncio.to_thread(
+                    self._client.abort_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=full_key,
+                    UploadId=upload_id,
+                )
+            raise
+
+        return f"{self.URI_SCHEME}{self.bucket_name}/{full_key}"
+
     # =========================================================================
     # Core Read Operations
     # =========================================================================
@@ -224,14 +297,22 @@ class S3Storage(StorageBackend):
         return data
 
     async def get_stream(
-        self, file_uri: str, chunk_size: int = 8192
+        self,
+        file_uri: str,
+        chunk_size: int = 8192,
+        start: int = 0,
+        end: int | None = None,
     ) -> AsyncIterator[bytes]:
-        """Stream file content from S3/R2 in chunks."""
+        """Stream file content (or an inclusive byte range) from S3/R2 in chunks."""
         key = self._uri_to_key(file_uri)
+        extra: dict = {}
+        if start or end is not None:
+            extra["Range"] = f"bytes={start}-{'' if end is None else end}"
         response = await asyncio.to_thread(
             self._client.get_object,
             Bucket=self.bucket_name,
             Key=key,
+            **extra,
         )
         body = response['Body']
         try:
@@ -0,0 +1,152 @@
+"""CLI entry point for managing pgvector HNSW indexes.
+
+Usage:
+    python -m evidence_repository.vector_index status
+    python -m evidence_repository.vector_index build
+    python -m evidence_repository.vector_index build --project-id <uuid> --m 24
+    python -m evidence_repository.vector_index build --rebuild
+    python -m evidence_repository.vector_index rebuild-stale
+    python -m evidence_repository.vector_index drop <index_name>
+
+Builds run with CREATE INDEX CONCURRENTLY and never block ingestion.
+"""
+
+import asyncio
+import logging
+import sys
+import uuid
+
+from evidence_repository.db.engine import dispose_engine
+from evidence_repository.db.session import get_session_factory
+from evidence_repository.services.vector_index_service import (
+    VectorIndexError,
+    VectorIndexInfo,
+    VectorIndexService,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _format_index(info: VectorIndexInfo) -> str:
+    """Format a report line for one index."""
+    size_mb = info.size_bytes / (1024 * 1024)
+    flags = []
+    if not info.is_valid:
+        flags.append("INVALID")
+    if info.stale:
+        flags.append("STALE")
+    scope = f"project {info.project_id}" if info.project_id else "global"
+    params = ", ".join(f"{k}={v}" for k, v in info.build_params.items())
+    line = f"{info.name:<62} {info.method:<8} {scope:<46} {size_mb:>10.1f} MB"
+    if params:
+        line += f"  ({params})"
+    if flags:
+        line += f"  [{' '.join(flags)}]"
+    return line
+
+
+async def _run(args) -> int:
+    """Execute the requested command."""
+    session_factory = get_session_factory()
+
+    try:
+        async with session_factory() as session:
+            service = VectorIndexService(session)
+
+            if args.command == "status":
+                indexes = await service.list_indexes()
+                if not indexes:
+                    print("No vector indexes on embedding_chunks")
+                for info in indexes:
+                    print(_format_index(info))
+
+            elif args.command == "build":
+                if args.project_id:
+                    info = await service.build_project_index(
+                        args.project_id,
+                        m=args.m,
+                        ef_construction=args.ef_construction,
+                        rebuild=args.rebuild,
+                    )
+                else:
+                    info = await service.build_global_index(
+                        m=args.m,
+                        ef_construction=args.ef_construction,
+                        rebuild=args.rebuild,
+                    )
+                print(_format_index(info))
+
+            elif args.command == "rebuild-stale":
+                stale = [i for i in await service.list_indexes() if i.stale]
+                if not stale:
+                    print("No stale project indexes")
+                for info in stale:
+                    rebuilt = await service.build_project_index(
+                        info.project_id,
+                        m=info.build_params.get("m"),
+                        ef_construction=info.build_params.get("ef_construction"),
+                        rebuild=True,
+                    )
+                    print(_format_index(rebuilt))
+
+            elif args.command == "drop":
+                if await service.drop_index(args.index_name):
+                    print(f"Dropped {args.index_name}")
+                else:
+                    print(f"Index {args.index_name} not found")
+                    return 1
+
+    except VectorIndexError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        await dispose_engine()
+
+    return 0
+
+
+def main() -> None:
+    """CLI entry point for vector index management."""
+    import argparse
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+
+    parser = argparse.ArgumentParser(description="Evidence Repository Vector Index Manager")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("status", help="Report vector indexes")
+
+    build_parser = subparsers.add_parser("build", help="Build an HNSW index")
+    build_parser.add_argument(
+        "--project-id",
+        "-p",
+        type=uuid.UUID,
+        help="Build a partial index for this project (default: global index)",
+    )
+    build_parser.add_argument("--m", type=int, help="Max graph connections per layer")
+    build_parser.add_argument(
+        "--ef-construction",
+        type=int,
+        help="Build-time candidate list size",
+    )
+    build_parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Replace the index if it already exists",
+    )
+
+    subparsers.add_parser("rebuild-stale", help="Rebuild stale project indexes")
+
+    drop_parser = subparsers.add_parser("drop", help="Drop a managed index")
+    drop_parser.add_argument("index_name", help="Index name")
+
+    args = parser.parse_args()
+    sys.exit(asyncio.run(_run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,7 @@ os.environ["STORAGE_BACKEND"] = "local"
 os.environ["FILE_STORAGE_ROOT"] = "./data/test_files"
 os.environ["API_KEYS"] = "test-api-key"
 os.environ["DEBUG"] = "true"
+os.environ["LLM_CACHE_ENABLED"] = "false"
 
 from evidence_repository.db.session import get_db_session
 from evidence_repository.main import app
@@ -0,0 +1,166 @@
+"""Tests for the buffered audit log writer."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from evidence_repository.api.middleware import AuditLoggingMiddleware
+from evidence_repository.models.audit import AuditAction
+from evidence_repository.services.audit_sink import AuditSink
+
+
+class RecordingWriter:
+    """Audit writer that records batches."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.batches: list[list[dict]] = []
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self, entries: list[dict]) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append(list(entries))
+
+    @property
+    def entries(self) -> list[dict]:
+        return [entry for batch in self.batches for entry in batch]
+
+
+def entry(n: int) -> dict:
+    return {"action": AuditAction.SEARCH_EXECUTE, "entity_type": "search", "details": {"n": n}}
+
+
+class TestAuditSink:
+    """Tests for batching, backpressure and shutdown drain."""
+
+    async def test_flushes_full_batches(self):
+        writer = RecordingWriter()
+        sink = AuditSink(writer, batch_size=3, flush_interval_seconds=60)
+        sink.start()
+
+        for n in range(6):
+            assert sink.offer(entry(n))
+        await asyncio.sleep(0.01)
+
+        assert [len(b) for b in writer.batches] == [3, 3]
+        await sink.drain()
+
+    async def test_flushes_partial_batch_after_interval(self):
+        writer = RecordingWriter()
+        sink = AuditSink(writer, batch_size=100, flush_interval_seconds=0.02)
+        sink.start()
+
+        sink.offer(entry(1))
+        sink.offer(entry(2))
+        await asyncio.sleep(0.1)
+
+        assert [len(b) for b in writer.batches] == [2]
+        await sink.drain()
+
+    async def test_full_queue_drops_and_counts(self):
+        writer = RecordingWriter()
+        sink = AuditSink(writer, max_queue_size=2, batch_size=10, flush_interval_seconds=60)
+        sink.start()
+
+        # The flusher has not run yet, so the queue fills up
+        results = [sink.offer(entry(n)) for n in range(5)]
+
+        assert results == [True, True, False, False, False]
+        stats = sink.get_stats()
+        assert stats["enqueued"] == 2
+        assert stats["dropped"] == 3
+        await sink.drain()
+
+    async def test_drain_writes_queued_and_collecting_entries(self):
+        writer = RecordingWriter()
+        sink = AuditSink(writer, batch_size=10, flush_interval_seconds=60)
+        sink.start()
+
+        for n in range(25):
+            sink.offer(entry(n))
+        # Flusher writes 10 + 10 and is collecting the rest
+        await asyncio.sleep(0.01)
+        await sink.drain()
+
+        assert sorted(e["details"]["n"] for e in writer.entries) == list(range(25))
+        assert not sink.running
+        assert sink.get_stats()["written"] == 25
+
+    async def test_drain_waits_for_started_write_without_duplicates(self):
+        writer = RecordingWriter(delay=0.05)
+        sink = AuditSink(writer, batch_size=2, flush_interval_seconds=60)
+        sink.start()
+
+        for n in range(3):
+            sink.offer(entry(n))
+        await asyncio.sleep(0.01)  # First batch is being written
+        await sink.drain()
+
+        assert sorted(e["details"]["n"] for e in writer.entries) == [0, 1, 2]
+
+    async def test_write_failures_are_counted(self):
+        sink = AuditSink(RecordingWriter(fail=True), batch_size=2, flush_interval_seconds=60)
+        sink.start()
+
+        sink.offer(entry(1))
+        sink.offer(entry(2))
+        await asyncio.sleep(0.01)
+
+        assert sink.running
+        assert sink.get_stats()["failed"] == 2
+        await sink.drain()
+
+    async def test_offer_when_not_started(self):
+        sink = AuditSink(RecordingWriter())
+
+        assert not sink.offer(entry(1))
+        await sink.drain()
+
+
+class TestAuditMiddlewareSink:
+    """Tests for the middleware's use of the audit sink."""
+
+    def make_request(self) -> MagicMock:
+        request = MagicMock()
+        request.method = "POST"
+        request.url.path = "/api/v1/search"
+        request.query_params = {}
+        request.client.host = "10.0.0.1"
+        request.headers = {"user-agent": "pytest"}
+        request.state.user = None
+        request.state.request_id = "req-1"
+        return request
+
+    async def test_enqueues_when_sink_running(self):
+        sink = MagicMock()
+        sink.running = True
+        middleware = AuditLoggingMiddleware(app=MagicMock())
+
+        with patch("evidence_repository.api.middleware.get_audit_sink", return_value=sink), \
+                patch("evidence_repository.api.middleware.write_audit_entries", new=AsyncMock()) as inline:
+            await middleware._log_audit(
+                self.make_request(), AuditAction.SEARCH_EXECUTE, {}, 200, 12.345
+            )
+
+        queued = sink.offer.call_args.args[0]
+        assert queued["action"] == AuditAction.SEARCH_EXECUTE
+        assert queued["entity_type"] == "search"
+        assert queued["timestamp"] is not None
+        assert queued["details"]["duration_ms"] == 12.35
+        inline.assert_not_called()
+
+    async def test_writes_inline_when_sink_stopped(self):
+        sink = MagicMock()
+        sink.running = False
+        middleware = AuditLoggingMiddleware(app=MagicMock())
+
+        with patch("evidence_repository.api.middleware.get_audit_sink", return_value=sink), \
+                patch("evidence_repository.api.middleware.write_audit_entries", new=AsyncMock()) as inline:
+            await middleware._log_audit(
+                self.make_request(), AuditAction.SEARCH_EXECUTE, {}, 200, 1.0
+            )
+
+        sink.offer.assert_not_called()
+        assert inline.await_args.args[0][0]["ip_address"] == "10.0.0.1"
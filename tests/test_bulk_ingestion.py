@@ -407,7 +407,7 @@ class TestBulkIngestionService:
         service = BulkIngestionService(storage=mock_storage, db=mock_db_session)
 
         import asyncio
-        files = asyncio.get_event_loop().run_until_complete(
+        files = asyncio.run(
             service.scan_folder(
                 folder_path=str(tmp_path),
                 recursive=False,
@@ -436,13 +436,13 @@ class TestBulkIngestionService:
         import asyncio
 
         # Recursive
-        files_recursive = asyncio.get_event_loop().run_until_complete(
+        files_recursive = asyncio.run(
             service.scan_folder(str(tmp_path), recursive=True, allowed_types=["pdf"])
         )
         assert len(files_recursive) == 2
 
         # Non-recursive
-        files_flat = asyncio.get_event_loop().run_until_complete(
+        files_flat = asyncio.run(
             service.scan_folder(str(tmp_path), recursive=False, allowed_types=["pdf"])
         )
         assert len(files_flat) == 1
@@ -0,0 +1,77 @@
+"""Tests for chunked, columnar CSV reading."""
+
+from evidence_repository.extraction.csv_columnar import (
+    ChunkedCsvReader,
+    build_column,
+    detect_encoding,
+    iter_text_lines,
+    parse_cell,
+)
+
+ENCODINGS = ["utf-8", "utf-8-sig", "latin-1", "cp1252"]
+
+
+class TestBuildColumn:
+    """Tests for per-chunk column type inference."""
+
+    def test_int_column_with_nulls(self):
+        column = build_column(["1", " 2 ", "", "-3"])
+
+        assert column.kind == "int"
+        assert column.values.typecode == "q"
+        assert column.to_list() == [1, 2, None, -3]
+
+    def test_float_column(self):
+        column = build_column(["1.5", "2e3", "nan"])
+
+        assert column.kind == "float"
+        assert column.to_list()[:2] == [1.5, 2000.0]
+
+    def test_mixed_column_matches_parse_cell(self):
+        cells = ["1", "2.5", "text", "", "99999999999999999999", "1e3"]
+        column = build_column(cells)
+
+        assert column.kind == "object"
+        assert column.to_list() == [parse_cell(cell) for cell in cells]
+        assert isinstance(column.to_list()[0], int)
+
+
+class TestTextLines:
+    """Tests for block-wise decoding."""
+
+    def test_lines_split_across_blocks(self):
+        data = "a,b\r\nçé,ü\r\nx,y".encode("utf-8")
+
+        for block_size in (1, 2, 3, 5, 64):
+            assert list(iter_text_lines(data, "utf-8", block_size)) == [
+                "a,b\r\n",
+                "çé,ü\r\n",
+                "x,y",
+            ]
+
+    def test_detect_encoding(self):
+        assert detect_encoding(b"\xef\xbb\xbfa,b", ENCODINGS) == "utf-8-sig"
+        assert detect_encoding("a,é".encode("utf-8"), ENCODINGS) == "utf-8"
+        assert detect_encoding("a,é".encode("latin-1"), ENCODINGS, block_size=2) == "latin-1"
+
+
+class TestChunkedCsvReader:
+    """Tests for ChunkedCsvReader."""
+
+    def test_chunks_and_rows(self):
+        data = b"id,name\n" + b"".join(f"{i},n{i}\n".encode() for i in range(7))
+        reader = ChunkedCsvReader(data, ",", "utf-8", chunk_rows=3, block_size=8)
+
+        chunks = list(reader.chunks())
+
+        assert reader.headers == ["id", "name"]
+        assert [(c.row_start, c.row_count) for c in chunks] == [(0, 3), (3, 3), (6, 1)]
+        assert chunks[0].columns[0].kind == "int"
+        assert [row for c in chunks for row in c.rows()][6] == [6, "n6"]
+        assert reader.row_count == 7
+
+    def test_quoted_newline_and_ragged_rows(self):
+        data = b'a,b,c\n"multi\nline",2\n1,2,3,4\n'
+        reader = ChunkedCsvReader(data, ",", "utf-8", block_size=4)
+
+        assert list(reader.rows()) == [["multi\nline", 2, None], [1, 2, 3]]
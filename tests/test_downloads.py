@@ -0,0 +1,203 @@
+"""Tests for streaming, range-aware document downloads."""
+
+import hashlib
+import shutil
+import tempfile
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from evidence_repository.api.downloads import (
+    RangeNotSatisfiableError,
+    etag_matches,
+    file_download_response,
+    make_etag,
+    parse_range,
+)
+from evidence_repository.storage.base import StorageBackend
+from evidence_repository.storage.local import LocalFilesystemStorage
+
+CONTENT = bytes(range(256)) * 40  # 10240 bytes
+FILE_HASH = hashlib.sha256(CONTENT).hexdigest()
+ETAG = make_etag(FILE_HASH)
+
+
+class TestParseRange:
+    """Tests for Range header parsing."""
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ("bytes=0-99", (0, 99)),
+            ("bytes=100-", (100, 999)),
+            ("bytes=-100", (900, 999)),
+            ("bytes=-5000", (0, 999)),
+            ("bytes=900-5000", (900, 999)),
+            (None, None),
+            ("bytes=5-1", None),
+            ("bytes=0-1,5-6", None),
+            ("items=0-1", None),
+            ("bytes=a-b", None),
+            ("bytes=-", None),
+        ],
+    )
+    def test_parse(self, header, expected):
+        """Single ranges are clamped; anything else serves the full file."""
+        assert parse_range(header, 1000) == expected
+
+    @pytest.mark.parametrize("header", ["bytes=1000-", "bytes=-0"])
+    def test_unsatisfiable(self, header):
+        """Ranges past the end of the file are rejected."""
+        with pytest.raises(RangeNotSatisfiableError):
+            parse_range(header, 1000)
+
+    def test_etag_matches(self):
+        """If-None-Match accepts lists, weak tags and the wildcard."""
+        assert etag_matches(ETAG, ETAG)
+        assert etag_matches(f'"other", W/{ETAG}', ETAG)
+        assert etag_matches("*", ETAG)
+        assert not etag_matches('"other"', ETAG)
+        assert not etag_matches(None, ETAG)
+
+
+class RemoteStorage(StorageBackend):
+    """In-memory backend without a local path (exercises the streaming path)."""
+
+    def __init__(self, files: dict[str, bytes]):
+        self.files = files
+        self.streamed: list[tuple[int, int | None]] = []
+
+    def _key_to_uri(self, key: str) -> str:
+        return f"s3://bucket/{key}"
+
+    async def get_stream(self, file_uri, chunk_size=8192, start=0, end=None):
+        if file_uri not in self.files:
+            raise FileNotFoundError(file_uri)
+        self.streamed.append((start, end))
+        data = self.files[file_uri]
+        data = data[start:] if end is None else data[start:end + 1]
+        for i in range(0, len(data), chunk_size):
+            yield data[i:i + chunk_size]
+
+    async def put_bytes(self, *args, **kwargs): ...
+    async def put_file(self, *args, **kwargs): ...
+    async def get_bytes(self, file_uri): ...
+    async def delete(self, file_uri): ...
+    async def exists(self, file_uri): ...
+    async def sign_download_url(self, file_uri, ttl_seconds=3600): ...
+    async def get_metadata(self, file_uri): ...
+    async def list_keys(self, prefix=""): ...
+
+
+def _client(storage: StorageBackend, storage_path: str) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/download")
+    async def download(request: Request):
+        try:
+            return await file_download_response(
+                request,
+                storage,
+                storage_path,
+                size=len(CONTENT),
+                file_hash=FILE_HASH,
+                media_type="application/pdf",
+                filename="report.pdf",
+            )
+        except FileNotFoundError:
+            return {"missing": True}
+
+    return TestClient(app)
+
+
+class TestStreamingDownload:
+    """Tests for the streamed (remote storage) path."""
+
+    @pytest.fixture
+    def storage(self):
+        return RemoteStorage({"s3://bucket/doc/v1/report.pdf": CONTENT})
+
+    def test_full_download(self, storage):
+        """Full downloads stream the file with ETag and length."""
+        response = _client(storage, "doc/v1/report.pdf").get("/download")
+
+        assert response.status_code == 200
+        assert response.content == CONTENT
+        assert response.headers["etag"] == ETAG
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-length"] == str(len(CONTENT))
+
+    def test_range_request(self, storage):
+        """A single range streams only those bytes from storage."""
+        response = _client(storage, "doc/v1/report.pdf").get(
+            "/download", headers={"Range": "bytes=100-199"}
+        )
+
+        assert response.status_code == 206
+        assert response.content == CONTENT[100:200]
+        assert response.headers["content-range"] == f"bytes 100-199/{len(CONTENT)}"
+        assert storage.streamed == [(100, 199)]
+
+    def test_if_range_mismatch_serves_full_file(self, storage):
+        """A stale If-Range validator ignores the Range header."""
+        response = _client(storage, "doc/v1/report.pdf").get(
+            "/download", headers={"Range": "bytes=100-199", "If-Range": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert response.content == CONTENT
+
+    def test_unsatisfiable_range(self, storage):
+        """Ranges past the end answer 416 without reading storage."""
+        response = _client(storage, "doc/v1/report.pdf").get(
+            "/download", headers={"Range": "bytes=999999-"}
+        )
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(CONTENT)}"
+        assert storage.streamed == []
+
+    def test_if_none_match(self, storage):
+        """A matching ETag answers 304 without reading storage."""
+        response = _client(storage, "doc/v1/report.pdf").get(
+            "/download", headers={"If-None-Match": ETAG}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert storage.streamed == []
+
+    def test_missing_file(self, storage):
+        """Missing objects surface before the response starts."""
+        response = _client(storage, "doc/v1/missing.pdf").get("/download")
+        assert response.json() == {"missing": True}
+
+
+class TestLocalDownload:
+    """Tests for the local FileResponse path."""
+
+    @pytest.fixture
+    def storage(self):
+        temp_dir = tempfile.mkdtemp(prefix="test_downloads_")
+        yield LocalFilesystemStorage(base_path=temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    async def test_local_range_request(self, storage):
+        """Local files are served from disk with ranges and our ETag."""
+        await storage.put_bytes("doc/v1/report.pdf", CONTENT, "application/pdf")
+        client = _client(storage, "doc/v1/report.pdf")
+
+        full = client.get("/download")
+        assert full.status_code == 200
+        assert full.content == CONTENT
+        assert full.headers["etag"] == ETAG
+
+        partial = client.get("/download", headers={"Range": "bytes=-10", "If-Range": ETAG})
+        assert partial.status_code == 206
+        assert partial.content == CONTENT[-10:]
+
+    def test_local_missing_file(self, storage):
+        """Missing local files raise FileNotFoundError."""
+        response = _client(storage, "doc/v1/missing.pdf").get("/download")
+        assert response.json() == {"missing": True}
@@ -0,0 +1,186 @@
+"""Tests for the query embedding cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from evidence_repository.embeddings.cache import (
+    EmbeddingCache,
+    InMemoryEmbeddingCache,
+    TieredEmbeddingCache,
+    make_cache_key,
+    normalize_text,
+    pack_embedding,
+    unpack_embedding,
+)
+from evidence_repository.embeddings.openai_client import OpenAIEmbeddingClient
+
+
+class FakeSharedCache(EmbeddingCache):
+    """Dict-backed shared tier for testing."""
+
+    def __init__(self):
+        super().__init__()
+        self.data: dict[str, list[float]] = {}
+
+    async def get(self, key):
+        if key in self.data:
+            self.stats.hits += 1
+            return self.data[key]
+        self.stats.misses += 1
+        return None
+
+    async def set(self, key, embedding):
+        self.data[key] = embedding
+        self.stats.sets += 1
+
+
+class TestCacheKeys:
+    """Tests for cache key construction."""
+
+    def test_normalize_collapses_whitespace(self):
+        """Whitespace differences do not change the key."""
+        assert normalize_text("  revenue \n growth\t") == "revenue growth"
+
+    def test_normalize_preserves_case(self):
+        """Case is significant for embeddings."""
+        assert normalize_text("ARR") != normalize_text("arr")
+
+    def test_key_includes_model_and_dimensions(self):
+        """Different models or dimensions never share a key."""
+        base = make_cache_key("text-embedding-3-small", 1536, "query")
+        assert base != make_cache_key("text-embedding-3-large", 1536, "query")
+        assert base != make_cache_key("text-embedding-3-small", 512, "query")
+
+    def test_key_ignores_whitespace(self):
+        """Normalized-equal texts share a key."""
+        assert make_cache_key("m", 8, "a  b") == make_cache_key("m", 8, " a b ")
+
+    def test_pack_round_trip(self):
+        """Packed float32 vectors round-trip within float32 precision."""
+        embedding = [0.25, -0.5, 0.125]
+        assert unpack_embedding(pack_embedding(embedding)) == embedding
+
+
+class TestInMemoryEmbeddingCache:
+    """Tests for the LRU/TTL memory tier."""
+
+    @pytest.mark.asyncio
+    async def test_hit_and_miss_counters(self):
+        """Counters track hits and misses."""
+        cache = InMemoryEmbeddingCache(max_entries=10)
+        assert await cache.get("k") is None
+        await cache.set("k", [1.0])
+        assert await cache.get("k") == [1.0]
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Least recently used entries are evicted first."""
+        cache = InMemoryEmbeddingCache(max_entries=2)
+        await cache.set("a", [1.0])
+        await cache.set("b", [2.0])
+        await cache.get("a")  # a is now most recent
+        await cache.set("c", [3.0])
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == [1.0]
+        assert cache.stats.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_stored_packed(self):
+        """Vectors are held as float32 bytes and unpacked on get."""
+        cache = InMemoryEmbeddingCache()
+        await cache.set("k", [0.1] * 1536)
+
+        _, packed = cache._entries["k"]
+        assert isinstance(packed, bytes)
+        assert len(packed) == 1536 * 4
+        assert await cache.get("k") == pytest.approx([0.1] * 1536, rel=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        """Expired entries are treated as misses."""
+        cache = InMemoryEmbeddingCache(ttl_seconds=10)
+        with patch("evidence_repository.embeddings.cache.time.monotonic", return_value=100.0):
+            await cache.set("k", [1.0])
+        with patch("evidence_repository.embeddings.cache.time.monotonic", return_value=111.0):
+            assert await cache.get("k") is None
+        assert len(cache) == 0
+
+
+class TestTieredEmbeddingCache:
+    """Tests for the memory + shared tiered cache."""
+
+    @pytest.mark.asyncio
+    async def test_shared_hit_is_promoted(self):
+        """Shared-tier hits populate the memory tier."""
+        memory = InMemoryEmbeddingCache()
+        shared = FakeSharedCache()
+        shared.data["k"] = [1.0]
+        cache = TieredEmbeddingCache(memory, shared)
+
+        assert await cache.get("k") == [1.0]
+        assert await memory.get("k") == [1.0]
+        assert cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_set_writes_both_tiers(self):
+        """Writes go through to both tiers."""
+        memory = InMemoryEmbeddingCache()
+        shared = FakeSharedCache()
+        cache = TieredEmbeddingCache(memory, shared)
+
+        await cache.set("k", [2.0])
+
+        assert shared.data["k"] == [2.0]
+        assert await memory.get("k") == [2.0]
+
+
+class TestClientCaching:
+    """Tests for embed_text cache integration."""
+
+    def _client(self, cache):
+        with patch.object(OpenAIEmbeddingClient, "client", new_callable=MagicMock):
+            client = OpenAIEmbeddingClient(api_key="test-key", cache=cache)
+        client.embed_texts = AsyncMock(return_value=[[0.25, 0.5]])
+        return client
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_hits_cache(self):
+        """Second identical query does not call the API."""
+        client = self._client(InMemoryEmbeddingCache())
+
+        first = await client.embed_text("revenue growth")
+        second = await client.embed_text("revenue  growth")
+
+        assert first == second == [0.25, 0.5]
+        assert client.embed_texts.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_bypass_cache(self):
+        """use_cache=False always calls the API."""
+        with patch.object(OpenAIEmbeddingClient, "client", new_callable=MagicMock):
+            client = OpenAIEmbeddingClient(api_key="test-key", use_cache=False)
+        client.embed_texts = AsyncMock(return_value=[[0.25, 0.5]])
+
+        await client.embed_text("q")
+        await client.embed_text("q")
+
+        assert client.cache is None
+        assert client.embed_texts.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_text_not_cached(self):
+        """Empty text is never cached."""
+        cache = InMemoryEmbeddingCache()
+        client = self._client(cache)
+
+        await client.embed_text("   ")
+
+        assert len(cache) == 0
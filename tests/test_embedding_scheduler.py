@@ -0,0 +1,149 @@
+"""Tests for the concurrent embedding scheduler."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from evidence_repository.embeddings.openai_client import OpenAIEmbeddingClient
+from evidence_repository.embeddings.scheduler import (
+    AdaptiveConcurrencyLimiter,
+    EmbeddingScheduler,
+    estimate_tokens,
+    pack_batches,
+)
+
+
+class TestPackBatches:
+    """Tests for token-aware batch packing."""
+
+    def test_estimate_tokens(self):
+        """Roughly four characters per token, never zero."""
+        assert estimate_tokens("") == 1
+        assert estimate_tokens("a" * 40) == 10
+
+    def test_packs_by_tokens(self):
+        """Batches close when the token budget would be exceeded."""
+        texts = ["a" * 40, "b" * 40, "c" * 40]  # 10 tokens each
+        assert pack_batches(texts, max_batch_tokens=25, max_batch_items=100) == [
+            [0, 1],
+            [2],
+        ]
+
+    def test_packs_by_items(self):
+        """Batches close at the item limit."""
+        assert pack_batches(["x"] * 5, max_batch_tokens=1000, max_batch_items=2) == [
+            [0, 1],
+            [2, 3],
+            [4],
+        ]
+
+    def test_oversized_text_gets_own_batch(self):
+        """A text above the budget is still sent, alone."""
+        texts = ["a", "b" * 400, "c"]
+        assert pack_batches(texts, max_batch_tokens=10, max_batch_items=100) == [
+            [0],
+            [1],
+            [2],
+        ]
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AIMD concurrency control."""
+
+    def test_rate_limit_halves_limit(self):
+        """429s halve the limit down to the minimum."""
+        limiter = AdaptiveConcurrencyLimiter(initial=8, maximum=8)
+
+        limiter.record_rate_limit(None)
+        assert limiter.limit == 4
+        limiter.record_rate_limit(None)
+        limiter.record_rate_limit(None)
+        limiter.record_rate_limit(None)
+        assert limiter.limit == 1
+        assert limiter.stats.rate_limited == 4
+
+    def test_success_grows_limit(self):
+        """A full window of successes adds one slot, up to the maximum."""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=3)
+
+        limiter.record_success()
+        assert limiter.limit == 2
+        limiter.record_success()
+        assert limiter.limit == 3
+        for _ in range(10):
+            limiter.record_success()
+        assert limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_bounds_in_flight(self):
+        """No more than ``limit`` slots are held at once."""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=2)
+
+        async def request():
+            async with limiter.slot():
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert limiter.stats.max_in_flight == 2
+        assert limiter.stats.requests == 6
+        assert limiter.stats.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_new_requests(self):
+        """After a 429 with retry-after, new requests wait out the pause."""
+        limiter = AdaptiveConcurrencyLimiter(initial=2)
+        limiter.record_rate_limit(0.05)
+
+        start = time.monotonic()
+        async with limiter.slot():
+            pass
+
+        assert time.monotonic() - start >= 0.04
+
+
+class TestEmbeddingScheduler:
+    """Tests for concurrent batch execution."""
+
+    @pytest.mark.asyncio
+    async def test_runs_batches_concurrently_in_order(self):
+        """Batches run in parallel and results keep input order."""
+        limiter = AdaptiveConcurrencyLimiter(initial=4, maximum=4)
+        scheduler = EmbeddingScheduler(limiter, max_batch_tokens=1000, max_batch_items=2)
+
+        async def embed_batch(batch):
+            async with limiter.slot():
+                await asyncio.sleep(0.01)
+            return [[float(t)] for t in batch]
+
+        texts = [str(i) for i in range(8)]
+        embeddings = await scheduler.run(texts, embed_batch)
+
+        assert embeddings == [[float(i)] for i in range(8)]
+        assert limiter.stats.max_in_flight == 4
+
+    @pytest.mark.asyncio
+    async def test_client_uses_scheduler(self):
+        """embed_texts packs requests and reassembles zero vectors for empties."""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=2)
+        scheduler = EmbeddingScheduler(limiter, max_batch_tokens=1000, max_batch_items=2)
+        with patch.object(OpenAIEmbeddingClient, "client", new_callable=MagicMock):
+            client = OpenAIEmbeddingClient(
+                api_key="test-key", dimensions=1, use_cache=False, scheduler=scheduler
+            )
+
+        calls = []
+
+        async def fake_api(batch):
+            calls.append(list(batch))
+            return [[float(len(t))] for t in batch]
+
+        client._call_embedding_api = fake_api
+
+        embeddings = await client.embed_texts(["a", "", "bb", "ccc", "dddd"])
+
+        assert embeddings == [[1.0], [0.0], [2.0], [3.0], [4.0]]
+        assert calls == [["a", "bb"], ["ccc", "dddd"]]
+        assert limiter.stats.requests == 2
@@ -0,0 +1,103 @@
+"""Tests for the content-addressed embedding store."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from evidence_repository.embeddings.openai_client import OpenAIEmbeddingClient
+from evidence_repository.embeddings.store import (
+    EmbeddingStore,
+    content_hash,
+    plan_embeddings,
+)
+
+
+def _mock_client():
+    client = AsyncMock(spec=OpenAIEmbeddingClient)
+    client.model = "text-embedding-3-small"
+    client.dimensions = 3
+
+    async def embed_texts(texts):
+        return [[float(len(t)), 0.0, 0.0] for t in texts]
+
+    client.embed_texts.side_effect = embed_texts
+    return client
+
+
+def _mock_db(rows):
+    db = AsyncMock()
+    lookup_result = MagicMock()
+    lookup_result.all.return_value = rows
+    db.execute.return_value = lookup_result
+    return db
+
+
+class TestPlanEmbeddings:
+    """Tests for working out which texts need embedding."""
+
+    def test_content_hash_ignores_whitespace(self):
+        """Whitespace-only differences share a hash."""
+        assert content_hash("Total  revenue\n") == content_hash("Total revenue")
+
+    def test_known_texts_are_skipped(self):
+        """Texts with stored vectors are not planned."""
+        known = {content_hash("a"): [1.0]}
+        hashes, missing = plan_embeddings(["a", "b"], known)
+
+        assert hashes == [content_hash("a"), content_hash("b")]
+        assert list(missing.values()) == ["b"]
+
+    def test_duplicates_planned_once(self):
+        """Repeated boilerplate is embedded once per batch."""
+        _, missing = plan_embeddings(["footer", "body", "footer"], {})
+        assert list(missing.values()) == ["footer", "body"]
+
+
+class TestEmbeddingStore:
+    """Tests for EmbeddingStore.embed_texts."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_stored_vectors(self):
+        """Only texts missing from the store are sent to the API."""
+        client = _mock_client()
+        db = _mock_db([(content_hash("unchanged"), [9.0, 9.0, 9.0])])
+        store = EmbeddingStore(client, enabled=True)
+
+        embeddings = await store.embed_texts(db, ["unchanged", "new", "new"])
+
+        assert embeddings == [[9.0, 9.0, 9.0], [3.0, 0.0, 0.0], [3.0, 0.0, 0.0]]
+        client.embed_texts.assert_awaited_once_with(["new"])
+        assert store.stats.to_dict() == {
+            "total": 3,
+            "reused": 1,
+            "deduplicated": 1,
+            "embedded": 1,
+        }
+        # Lookup + insert of the new vector
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_all_reused_skips_api(self):
+        """A fully stored batch makes no API call and no insert."""
+        client = _mock_client()
+        db = _mock_db([(content_hash("a"), [1.0, 0.0, 0.0])])
+        store = EmbeddingStore(client, enabled=True)
+
+        embeddings = await store.embed_texts(db, ["a"])
+
+        assert embeddings == [[1.0, 0.0, 0.0]]
+        client.embed_texts.assert_not_awaited()
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_calls_api_directly(self):
+        """With reuse disabled the store is not queried."""
+        client = _mock_client()
+        db = _mock_db([])
+        store = EmbeddingStore(client, enabled=False)
+
+        await store.embed_texts(db, ["a", "a"])
+
+        db.execute.assert_not_awaited()
+        client.embed_texts.assert_awaited_once_with(["a", "a"])
+        assert store.stats.embedded == 2
@@ -0,0 +1,187 @@
+"""Tests for the binary COPY embedding chunk writer."""
+
+import json
+import struct
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from evidence_repository.embeddings.writer import (
+    COPY_COLUMNS,
+    COPY_HEADER,
+    COPY_SQL,
+    COPY_TRAILER,
+    chunk_row,
+    encode_copy_rows,
+    encode_vector,
+    row_to_chunk,
+    write_chunks,
+    write_chunks_sync,
+)
+from evidence_repository.models.evidence import SpanType
+
+
+def _decode_stream(data: bytes) -> list[list[bytes | None]]:
+    """Decode a binary COPY stream into raw field values."""
+    assert data.startswith(COPY_HEADER)
+    assert data.endswith(COPY_TRAILER)
+    pos = len(COPY_HEADER)
+    tuples = []
+    while True:
+        (count,) = struct.unpack_from(">h", data, pos)
+        pos += 2
+        if count == -1:
+            break
+        fields = []
+        for _ in range(count):
+            (length,) = struct.unpack_from(">i", data, pos)
+            pos += 4
+            if length == -1:
+                fields.append(None)
+            else:
+                fields.append(data[pos:pos + length])
+                pos += length
+        tuples.append(fields)
+    assert pos == len(data)
+    return tuples
+
+
+@pytest.fixture
+def row():
+    return chunk_row(
+        document_version_id=uuid.uuid4(),
+        span_id=uuid.uuid4(),
+        span_type=SpanType.TEXT,
+        chunk_index=3,
+        text="Revenue grew 12% — année",
+        embedding=[0.5, -1.0, 2.25],
+        metadata={"span_hash": "abc"},
+    )
+
+
+class TestEncoding:
+    """Tests for binary encoding."""
+
+    def test_encode_vector(self):
+        """pgvector binary layout: dim, unused, big-endian float32s."""
+        data = encode_vector([1.0, -2.5])
+        assert struct.unpack(">hh", data[:4]) == (2, 0)
+        assert struct.unpack(">2f", data[4:]) == (1.0, -2.5)
+
+    def test_encode_copy_rows(self, row):
+        """Each tuple carries every column; NULLs use length -1."""
+        data = b"".join(encode_copy_rows([row]))
+        (fields,) = _decode_stream(data)
+
+        values = dict(zip(COPY_COLUMNS, fields))
+        assert len(fields) == len(COPY_COLUMNS)
+        assert uuid.UUID(bytes=values["id"]) == row["id"]
+        assert uuid.UUID(bytes=values["span_id"]) == row["span_id"]
+        assert values["document_id"] is None
+        assert values["char_start"] is None
+        assert values["span_type"] == b"text"
+        assert struct.unpack(">i", values["chunk_index"]) == (3,)
+        assert values["text"].decode("utf-8") == row["text"]
+        assert values["embedding"] == encode_vector([0.5, -1.0, 2.25])
+        assert json.loads(values["metadata"]) == {"span_hash": "abc"}
+
+    def test_encode_copy_rows_blocks(self, row):
+        """Large inputs are yielded in several blocks forming one stream."""
+        rows = [dict(row, id=uuid.uuid4()) for _ in range(50)]
+        blocks = list(encode_copy_rows(rows, buffer_bytes=256))
+
+        assert len(blocks) > 1
+        assert len(_decode_stream(b"".join(blocks))) == 50
+
+    def test_encode_empty(self):
+        """An empty input is just header and trailer."""
+        assert b"".join(encode_copy_rows([])) == COPY_HEADER + COPY_TRAILER
+
+    def test_copy_sql(self):
+        """COPY targets embedding_chunks in binary format."""
+        assert COPY_SQL.startswith("COPY embedding_chunks (id, document_version_id,")
+        assert COPY_SQL.endswith("FROM STDIN (FORMAT BINARY)")
+
+    def test_row_to_chunk(self, row):
+        """Transient chunks mirror the written row."""
+        chunk = row_to_chunk(row)
+        assert chunk.id == row["id"]
+        assert chunk.metadata_ == {"span_hash": "abc"}
+        assert chunk.span_type == SpanType.TEXT
+
+
+class _AsyncpgConnection:
+    """Stand-in recognised as an asyncpg driver connection."""
+
+    __module__ = "asyncpg.connection"
+
+    def __init__(self):
+        self.calls = []
+        self.data = b""
+
+    async def copy_to_table(self, table, *, source, columns, format):
+        async for block in source:
+            self.data += block
+        self.calls.append((table, columns, format))
+
+
+def _async_session(driver) -> AsyncMock:
+    raw = MagicMock(driver_connection=driver)
+    connection = AsyncMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+    db = AsyncMock()
+    db.connection = AsyncMock(return_value=connection)
+    return db
+
+
+class TestWriteChunks:
+    """Tests for driver dispatch."""
+
+    async def test_asyncpg_uses_copy(self, row):
+        """asyncpg sessions stream rows through copy_to_table."""
+        driver = _AsyncpgConnection()
+        db = _async_session(driver)
+
+        written = await write_chunks(db, [row])
+
+        assert written == 1
+        db.flush.assert_awaited_once()
+        assert driver.calls == [("embedding_chunks", list(COPY_COLUMNS), "binary")]
+        assert len(_decode_stream(driver.data)) == 1
+        db.execute.assert_not_called()
+
+    async def test_other_driver_falls_back_to_insert(self, row):
+        """Unknown drivers get an executemany INSERT of the same rows."""
+        db = _async_session(MagicMock())
+
+        assert await write_chunks(db, [row]) == 1
+        stmt, params = db.execute.await_args.args
+        assert stmt.table.name == "embedding_chunks"
+        assert params == [row]
+
+    async def test_empty_is_noop(self):
+        """Nothing is flushed or written for an empty batch."""
+        db = AsyncMock()
+        assert await write_chunks(db, []) == 0
+        db.flush.assert_not_called()
+
+    def test_sync_psycopg_uses_copy(self, row):
+        """psycopg 3 sessions write blocks through cursor.copy."""
+
+        class Psycopg:
+            __module__ = "psycopg.connection"
+
+            def __init__(self):
+                self.cursor = MagicMock()
+
+        driver = Psycopg()
+        db = MagicMock()
+        db.connection.return_value.connection.driver_connection = driver
+        copy = driver.cursor.return_value.__enter__.return_value.copy
+        writer = copy.return_value.__enter__.return_value
+
+        assert write_chunks_sync(db, [row]) == 1
+        copy.assert_called_once_with(COPY_SQL)
+        data = b"".join(c.args[0] for c in writer.write.call_args_list)
+        assert len(_decode_stream(data)) == 1
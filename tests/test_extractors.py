@@ -11,6 +11,7 @@ from evidence_repository.extraction.base import (
 )
 from evidence_repository.extraction.text_extractor import TextExtractor
 from evidence_repository.extraction.csv_extractor import CsvExtractor
+from evidence_repository.extraction.excel_extractor import ExcelExtractor
 from evidence_repository.extraction.image_extractor import ImageExtractor
 
 
@@ -321,3 +322,94 @@ class TestTableData:
         assert data["rows"] == [[1]]
         assert data["sheet_name"] == "Test"
         assert data["metadata"]["source"] == "excel"
+
+
+class TestExcelExtractor:
+    """Tests for ExcelExtractor."""
+
+    @pytest.fixture
+    def extractor(self):
+        return ExcelExtractor()
+
+    @pytest.fixture
+    def workbook_bytes(self):
+        import io
+
+        import openpyxl
+
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Data"
+        sheet.append(["Name", "Score", "Note"])
+        sheet.append(["Alice", 90])
+        sheet.append([None, None, None])
+        sheet.append(["Bob", 85, "late"])
+        workbook.create_sheet("Empty")
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        return buffer.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_extract_tables(self, extractor, workbook_bytes):
+        """Sheets become tables; empty rows skipped and rows padded."""
+        artifact = await extractor.extract(
+            workbook_bytes,
+            "book.xlsx",
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+
+        assert len(artifact.tables) == 1
+        table = artifact.tables[0]
+        assert table.headers == ["Name", "Score", "Note"]
+        assert table.rows == [["Alice", 90, None], ["Bob", 85, "late"]]
+        assert artifact.metadata["sheet_names"] == ["Data", "Empty"]
+
+    def test_iter_sheets_streams_rows(self, extractor, workbook_bytes):
+        """iter_sheets yields headers and a lazy row iterator per sheet."""
+        sheets = []
+        for sheet_name, headers, rows in extractor.iter_sheets(workbook_bytes):
+            assert not isinstance(rows, list)
+            sheets.append((sheet_name, headers, list(rows)))
+
+        assert sheets[0] == ("Data", ["Name", "Score", "Note"], [["Alice", 90, None], ["Bob", 85, "late"]])
+        assert sheets[1] == ("Empty", [], [])
+
+    @pytest.fixture
+    def stale_dimension_bytes(self):
+        """A 5x3 sheet whose <dimension> claims only A1."""
+        import io
+        import re
+        import zipfile
+
+        import openpyxl
+
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        for r in range(1, 6):
+            sheet.append([f"r{r}c{c}" for c in range(1, 4)])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+
+        source = zipfile.ZipFile(io.BytesIO(buffer.getvalue()))
+        output = io.BytesIO()
+        with zipfile.ZipFile(output, "w") as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1"', data)
+                target.writestr(item, data)
+        return output.getvalue()
+
+    def test_stale_dimension_reads_all_rows(self, extractor, stale_dimension_bytes):
+        """A stale declared dimension does not truncate any read path."""
+        from evidence_repository.digestion.parsers import _parse_xlsx
+        from evidence_repository.queue.tasks import _extract_xlsx_text
+
+        [(_, headers, rows)] = list(extractor.iter_sheets(stale_dimension_bytes))
+        assert headers == ["r1c1", "r1c2", "r1c3"]
+        assert list(rows)[-1] == ["r5c1", "r5c2", "r5c3"]
+
+        text, _ = _parse_xlsx(stale_dimension_bytes, "stale.xlsx")
+        assert "r5c1\tr5c2\tr5c3" in text
+
+        assert "r5c1\tr5c2\tr5c3" in _extract_xlsx_text(stale_dimension_bytes)
@@ -0,0 +1,157 @@
+"""Tests for folder tree construction and caching."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from evidence_repository.schemas.folder import FolderTreeResponse
+from evidence_repository.services.folder_tree import (
+    FolderTreeCache,
+    FolderTreeService,
+    build_folder_tree,
+)
+
+
+def folder_row(name: str, parent_id: uuid.UUID | None = None, order: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        name=name,
+        description=None,
+        parent_folder_id=parent_id,
+        display_order=order,
+        color=None,
+        icon=None,
+    )
+
+
+def rows_result(rows: list) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+class TestBuildFolderTree:
+    """Tests for linking folders into a tree."""
+
+    def test_links_children_in_row_order(self):
+        legal = folder_row("Legal")
+        finance = folder_row("Finance")
+        contracts = folder_row("Contracts", legal.id)
+        ndas = folder_row("NDAs", contracts.id)
+        leases = folder_row("Leases", legal.id)
+
+        roots = build_folder_tree(
+            [legal, finance, contracts, ndas, leases],
+            {contracts.id: 3, finance.id: 1},
+        )
+
+        assert [r.name for r in roots] == ["Legal", "Finance"]
+        assert [c.name for c in roots[0].children] == ["Contracts", "Leases"]
+        assert roots[0].children[0].children[0].name == "NDAs"
+        assert roots[0].children[0].document_count == 3
+        assert roots[1].document_count == 1
+        assert roots[0].document_count == 0
+
+    def test_child_listed_before_parent(self):
+        parent = folder_row("Parent")
+        child = folder_row("Child", parent.id)
+
+        roots = build_folder_tree([child, parent], {})
+
+        assert [r.name for r in roots] == ["Parent"]
+        assert roots[0].children[0].name == "Child"
+
+    def test_orphans_are_unreachable(self):
+        orphan = folder_row("Orphan", uuid.uuid4())
+
+        assert build_folder_tree([orphan], {}) == []
+
+    def test_deep_tree_without_recursion(self):
+        rows = [folder_row("level-0")]
+        for depth in range(1, 3000):
+            rows.append(folder_row(f"level-{depth}", rows[-1].id))
+
+        node = build_folder_tree(rows, {})[0]
+        depth = 0
+        while node.children:
+            node = node.children[0]
+            depth += 1
+
+        assert depth == 2999
+
+
+class TestFolderTreeService:
+    """Tests for the two-query tree build and per-project cache."""
+
+    @pytest.mark.asyncio
+    async def test_builds_from_two_queries_and_caches(self):
+        project_id = uuid.uuid4()
+        root = folder_row("Root")
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            rows_result([root]),
+            rows_result([(None, 7), (root.id, 2)]),
+        ])
+        service = FolderTreeService(db, cache=FolderTreeCache())
+
+        tree = await service.get_tree(project_id)
+        again = await service.get_tree(project_id)
+
+        assert isinstance(tree, FolderTreeResponse)
+        assert tree.root_document_count == 7
+        assert tree.folders[0].document_count == 2
+        assert again is tree
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_rebuilds(self):
+        project_id = uuid.uuid4()
+        cache = FolderTreeCache()
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            rows_result([]), rows_result([]),
+            rows_result([folder_row("New")]), rows_result([]),
+        ])
+        service = FolderTreeService(db, cache=cache)
+
+        assert (await service.get_tree(project_id)).folders == []
+        cache.invalidate(project_id)
+        assert [f.name for f in (await service.get_tree(project_id)).folders] == ["New"]
+
+
+class TestFolderTreeCache:
+    """Tests for cache expiry and eviction."""
+
+    def test_lru_eviction(self):
+        cache = FolderTreeCache(max_projects=2)
+        trees = {uuid.uuid4(): FolderTreeResponse(project_id=uuid.uuid4()) for _ in range(3)}
+        a, b, c = trees
+
+        cache.set(a, trees[a])
+        cache.set(b, trees[b])
+        cache.get(a)
+        cache.set(c, trees[c])
+
+        assert cache.get(a) is trees[a]
+        assert cache.get(b) is None
+        assert cache.get(c) is trees[c]
+
+    def test_expired_entry_is_miss(self):
+        cache = FolderTreeCache(ttl_seconds=60)
+        project_id = uuid.uuid4()
+
+        with patch("evidence_repository.services.folder_tree.time.monotonic", side_effect=[0, 30, 61]):
+            cache.set(project_id, FolderTreeResponse(project_id=project_id))
+            assert cache.get(project_id) is not None
+            assert cache.get(project_id) is None
+
+    def test_default_ttl_expires_within_seconds(self):
+        """Changes invalidated in another process show up after a few seconds."""
+        cache = FolderTreeCache()
+        project_id = uuid.uuid4()
+
+        with patch("evidence_repository.services.folder_tree.time.monotonic", side_effect=[0, 6]):
+            cache.set(project_id, FolderTreeResponse(project_id=project_id))
+            assert cache.get(project_id) is None
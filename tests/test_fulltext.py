@@ -0,0 +1,112 @@
+"""Tests for Postgres full-text search helpers."""
+
+from sqlalchemy.dialects import postgresql
+
+from evidence_repository.models.embedding import EmbeddingChunk
+from evidence_repository.services.fulltext import (
+    HEADLINE_START,
+    HEADLINE_STOP,
+    QueryTerm,
+    build_tsquery,
+    matches,
+    parse_headline,
+    parse_query,
+)
+
+
+def _sql(expr) -> str:
+    return str(
+        expr.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+def _mark(text: str) -> str:
+    return f"{HEADLINE_START}{text}{HEADLINE_STOP}"
+
+
+class TestParseQuery:
+    """Tests for query parsing."""
+
+    def test_words(self):
+        """Bare tokens become word terms."""
+        assert parse_query("revenue growth") == [
+            QueryTerm("revenue"),
+            QueryTerm("growth"),
+        ]
+
+    def test_phrase(self):
+        """Quoted text becomes a phrase term."""
+        assert parse_query('"annual recurring revenue" churn') == [
+            QueryTerm("annual recurring revenue", "phrase"),
+            QueryTerm("churn"),
+        ]
+
+    def test_prefix(self):
+        """Trailing * marks a prefix term with a sanitized lexeme."""
+        assert parse_query("recur*") == [QueryTerm("recur", "prefix")]
+        assert parse_query("re'cur:*") == [QueryTerm("recur", "prefix")]
+
+    def test_punctuation_only_is_dropped(self):
+        """Tokens without word characters are ignored."""
+        assert parse_query('- * ""') == []
+
+
+class TestBuildTsquery:
+    """Tests for tsquery construction."""
+
+    def test_empty(self):
+        """No terms means no query."""
+        assert build_tsquery([]) is None
+
+    def test_combines_terms(self):
+        """Terms are ANDed with the right tsquery constructors."""
+        tsquery = build_tsquery(parse_query('revenue "net retention" recur*'))
+        sql = _sql(tsquery)
+
+        assert "plainto_tsquery('english'::regconfig, 'revenue')" in sql
+        assert "phraseto_tsquery('english'::regconfig, 'net retention')" in sql
+        assert "to_tsquery('english'::regconfig, 'recur:*')" in sql
+        assert sql.count("&&") == 2
+
+    def test_matches_uses_tsvector_column(self):
+        """Matching targets the indexed tsvector column."""
+        tsquery = build_tsquery([QueryTerm("revenue")])
+        sql = _sql(matches(EmbeddingChunk.text_search, tsquery))
+
+        assert "embedding_chunks.text_search @@" in sql
+
+
+class TestParseHeadline:
+    """Tests for converting ts_headline output to ranges."""
+
+    def test_ranges(self):
+        """Markers become offsets into the original text."""
+        text = "Revenue grew; revenue targets met"
+        marked = f"{_mark('Revenue')} grew; {_mark('revenue')} targets met"
+
+        assert parse_headline(marked, text) == [
+            {"start": 0, "end": 7},
+            {"start": 14, "end": 21},
+        ]
+
+    def test_adjacent_ranges_merge(self):
+        """Adjacent phrase words merge into one range."""
+        text = "net retention"
+        marked = f"{_mark('net')} {_mark('retention')}"
+
+        assert parse_headline(marked, text) == [{"start": 0, "end": 3}, {"start": 4, "end": 13}]
+        assert parse_headline(_mark("net") + _mark(" retention"), text) == [
+            {"start": 0, "end": 13}
+        ]
+
+    def test_mismatch_returns_none(self):
+        """Headlines that do not reproduce the text are rejected."""
+        assert parse_headline(_mark("Revenue"), "Revenues") is None
+
+    def test_no_highlights(self):
+        """Unmarked or missing headlines have no ranges."""
+        assert parse_headline("plain text", "plain text") is None
+        assert parse_headline(None, "plain text") is None
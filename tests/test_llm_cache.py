@@ -0,0 +1,123 @@
+"""Tests for the persistent LLM response cache."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from evidence_repository.embeddings.scheduler import AdaptiveConcurrencyLimiter
+from evidence_repository.extraction import llm_cache
+from evidence_repository.extraction.llm_cache import (
+    LlmResponseCache,
+    get_cached_response,
+    llm_cache_key,
+    store_response,
+)
+from evidence_repository.extraction.structured_extraction import StructuredExtractionService
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache in a temporary file, installed as the process-wide cache."""
+    cache = LlmResponseCache(tmp_path / "llm.sqlite3", max_bytes=1024 * 1024)
+    with patch.object(llm_cache, "get_llm_cache", return_value=cache):
+        yield cache
+
+
+class TestCacheKeys:
+    """Tests for cache key construction."""
+
+    def test_key_covers_every_input(self):
+        base = ("gpt-4o", 0.1, "system", "user", "v1")
+        key = llm_cache_key(*base)
+
+        assert llm_cache_key(*base) == key
+        for index, value in enumerate(["gpt-4o-mini", 0.2, "system!", "user!", "v2"]):
+            changed = list(base)
+            changed[index] = value
+            assert llm_cache_key(*changed) != key
+
+
+class TestLlmResponseCache:
+    """Tests for the SQLite-backed cache."""
+
+    async def test_hit_and_miss_counters(self, cache):
+        assert await cache.get("k") is None
+        await cache.set("k", "gpt-4o", '{"metrics": []}')
+
+        assert await cache.get("k") == '{"metrics": []}'
+        assert cache.stats.to_dict()["hit_rate"] == 0.5
+
+    async def test_persists_across_instances(self, cache):
+        await cache.set("k", "gpt-4o", "content")
+
+        reopened = LlmResponseCache(cache.path, max_bytes=cache.max_bytes)
+        assert await reopened.get("k") == "content"
+
+    async def test_lru_eviction_bounds_size(self, tmp_path):
+        cache = LlmResponseCache(tmp_path / "llm.sqlite3", max_bytes=350)
+        for key in "abc":
+            await cache.set(key, "m", key * 100)
+        await cache.get("a")  # a is now more recent than b
+        await cache.set("d", "m", "d" * 100)
+
+        assert cache.stats.evictions == 1
+        assert await cache.get("b") is None
+        assert await cache.get("a") == "a" * 100
+        assert await cache.get("d") == "d" * 100
+
+    async def test_unwritable_path_is_counted_not_raised(self, tmp_path):
+        (tmp_path / "file").write_text("")
+        cache = LlmResponseCache(tmp_path / "file" / "llm.sqlite3", max_bytes=1024)
+
+        await cache.set("k", "m", "content")
+        assert await cache.get("k") is None
+        assert cache.stats.errors == 2
+
+    async def test_bypass_skips_lookup(self, cache):
+        await store_response("k", "m", "content")
+
+        assert await get_cached_response("k", bypass=True) is None
+        assert await get_cached_response("k") == "content"
+        assert cache.stats.bypassed == 1
+
+
+class TestStructuredExtractionCaching:
+    """Tests for cached chat completions in StructuredExtractionService."""
+
+    def make_service(self, **kwargs) -> StructuredExtractionService:
+        service = StructuredExtractionService(
+            db=AsyncMock(),
+            api_key="test-key",
+            limiter=AdaptiveConcurrencyLimiter(initial=2, maximum=2),
+            **kwargs,
+        )
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content=json.dumps({"metrics": []})))]
+        service._client = MagicMock()
+        service._client.chat.completions.create = AsyncMock(return_value=response)
+        return service
+
+    async def test_identical_prompt_served_from_cache(self, cache):
+        first = self.make_service()
+        second = self.make_service()
+
+        assert await first._complete("prompt") == await second._complete("prompt")
+        first.client.chat.completions.create.assert_awaited_once()
+        second.client.chat.completions.create.assert_not_called()
+
+    async def test_bypass_calls_api_and_refreshes(self, cache):
+        await self.make_service()._complete("prompt")
+        service = self.make_service(bypass_cache=True)
+
+        await service._complete("prompt")
+
+        service.client.chat.completions.create.assert_awaited_once()
+        assert cache.stats.sets == 2
+
+    async def test_invalid_json_not_cached(self, cache):
+        service = self.make_service()
+        service.client.chat.completions.create.return_value.choices[0].message.content = "not json"
+
+        await service._complete("prompt")
+        assert cache.stats.sets == 0
@@ -0,0 +1,152 @@
+"""Tests for the audit logging and error handling middleware."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from evidence_repository.api.middleware import (
+    AUDIT_ACTION_MAP,
+    AuditLoggingMiddleware,
+    AuditRouteTrie,
+    match_route_pattern,
+    setup_middleware,
+)
+from evidence_repository.models.audit import AuditAction
+
+
+class TestAuditRouteTrie:
+    """Tests for precompiled audit route matching."""
+
+    def test_matches_literal_route(self):
+        assert match_route_pattern("POST", "/api/v1/documents") == (
+            AuditAction.DOCUMENT_UPLOAD,
+            {},
+        )
+
+    def test_extracts_path_params(self):
+        action, params = match_route_pattern(
+            "DELETE", "/api/v1/projects/p-1/documents/d-2"
+        )
+
+        assert action == AuditAction.DOCUMENT_DETACH
+        assert params == {"id": "p-1", "doc_id": "d-2"}
+
+    def test_method_must_match(self):
+        assert match_route_pattern("GET", "/api/v1/documents") == (None, {})
+        assert match_route_pattern("PUT", "/api/v1/projects/p-1") == (None, {})
+
+    def test_segment_count_must_match(self):
+        assert match_route_pattern("DELETE", "/api/v1/documents") == (None, {})
+        assert match_route_pattern("DELETE", "/api/v1/documents/d-1/extra") == (None, {})
+
+    def test_literal_takes_precedence_over_placeholder(self):
+        trie = AuditRouteTrie({
+            ("GET", "/packs/{id}"): AuditAction.EVIDENCE_PACK_UPDATE,
+            ("GET", "/packs/latest"): AuditAction.EVIDENCE_PACK_EXPORT,
+        })
+
+        assert trie.match("GET", "/packs/latest") == (AuditAction.EVIDENCE_PACK_EXPORT, {})
+        assert trie.match("GET", "/packs/p-1") == (
+            AuditAction.EVIDENCE_PACK_UPDATE,
+            {"id": "p-1"},
+        )
+
+    def test_backtracks_from_literal_branch(self):
+        trie = AuditRouteTrie({
+            ("POST", "/projects/search/run"): AuditAction.SEARCH_EXECUTE,
+            ("POST", "/projects/{id}/documents"): AuditAction.DOCUMENT_ATTACH,
+        })
+
+        assert trie.match("POST", "/projects/search/documents") == (
+            AuditAction.DOCUMENT_ATTACH,
+            {"id": "search"},
+        )
+
+    def test_every_mapped_route_matches(self):
+        for (method, pattern), action in AUDIT_ACTION_MAP.items():
+            path = pattern.replace("{id}", "x-1").replace("{doc_id}", "y-2")
+            assert match_route_pattern(method, path)[0] == action
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/v1/search")
+    async def search(request: Request):
+        return {"request_id": request.state.request_id}
+
+    @app.post("/api/v1/projects/{project_id}")
+    async def not_found():
+        raise HTTPException(status_code=404)
+
+    @app.get("/api/v1/evidence-packs/{pack_id}/export")
+    async def export():
+        async def chunks():
+            yield b"first\n"
+            yield b"second\n"
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    @app.get("/api/v1/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    setup_middleware(app)
+    return app
+
+
+class TestMiddlewareStack:
+    """Tests for the pure ASGI middleware stack."""
+
+    async def request(self, method: str, path: str):
+        transport = ASGITransport(app=build_app(), raise_app_exceptions=False)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path)
+
+    async def test_audits_successful_request(self):
+        with patch.object(AuditLoggingMiddleware, "_log_audit", new=AsyncMock()) as log_audit:
+            response = await self.request("POST", "/api/v1/search")
+
+        assert response.status_code == 200
+        kwargs = log_audit.await_args.kwargs
+        assert kwargs["action"] == AuditAction.SEARCH_EXECUTE
+        assert kwargs["response_status"] == 200
+        assert kwargs["request"].state.request_id == response.json()["request_id"]
+
+    async def test_skips_failed_and_unaudited_requests(self):
+        with patch.object(AuditLoggingMiddleware, "_log_audit", new=AsyncMock()) as log_audit:
+            not_found = await self.request("POST", "/api/v1/projects/p-1")
+            unaudited = await self.request("GET", "/api/v1/evidence-packs")
+
+        assert not_found.status_code == 404
+        assert unaudited.status_code == 404
+        log_audit.assert_not_awaited()
+
+    async def test_streaming_response_passes_through(self):
+        with patch.object(AuditLoggingMiddleware, "_log_audit", new=AsyncMock()) as log_audit:
+            response = await self.request("GET", "/api/v1/evidence-packs/p-1/export")
+
+        assert response.status_code == 200
+        assert response.text == "first\nsecond\n"
+        assert log_audit.await_args.kwargs["action"] == AuditAction.EVIDENCE_PACK_EXPORT
+        assert log_audit.await_args.kwargs["path_params"] == {"id": "p-1"}
+
+    async def test_unhandled_exception_returns_json_error(self):
+        response = await self.request("GET", "/api/v1/boom")
+
+        assert response.status_code == 500
+        body = response.json()
+        assert body["error"] == "internal_server_error"
+        assert body["details"]["request_id"]
+
+    async def test_non_http_scope_passes_through(self):
+        app = AsyncMock()
+        middleware = AuditLoggingMiddleware(app)
+        scope = {"type": "lifespan"}
+
+        await middleware(scope, MagicMock(), MagicMock())
+
+        app.assert_awaited_once()
+        assert "state" not in scope
@@ -680,3 +680,198 @@ class TestJurisIntegration:
 
         assert "profile_code" in params
         assert "process_context" in params
+
+
+class TestSpanWindows:
+    """Tests for map-reduce extraction over span windows."""
+
+    @staticmethod
+    def make_spans(count: int, chars: int = 400) -> list[dict]:
+        return [
+            {"id": f"span-{i}", "text": f"Span {i} " + "x" * chars, "page": i // 2 + 1, "type": "text"}
+            for i in range(count)
+        ]
+
+    def test_windows_are_token_bounded_and_ordered(self):
+        """Test spans are packed into windows in document order."""
+        from evidence_repository.extraction.multilevel.windows import build_span_windows
+
+        spans = self.make_spans(10)  # ~100 tokens each
+        windows = build_span_windows(spans, max_tokens=300)
+
+        assert [w.index for w in windows] == list(range(len(windows)))
+        assert all(len(w.spans) <= 3 for w in windows)
+        assert [s["id"] for w in windows for s in w.spans] == [s["id"] for s in spans]
+        assert windows[1].labels["S1"] == windows[1].spans[0]["id"]
+        assert windows[0].text.startswith("[S1]\nSpan 0")
+
+    def test_span_order_key(self):
+        """Test document order from text and table locators."""
+        from evidence_repository.extraction.multilevel.windows import span_order_key
+
+        assert span_order_key({"page_hint": 2, "offset_start": 10}) < span_order_key(
+            {"page_hint": 3, "offset_start": 0}
+        )
+        assert span_order_key({"row_start": 5}) < span_order_key({"row_start": 50})
+        assert span_order_key(None) == (0, 0)
+
+    def test_resolve_span_refs(self):
+        """Test window labels are replaced with span IDs."""
+        from evidence_repository.extraction.multilevel.windows import (
+            SpanWindow,
+            resolve_span_refs,
+        )
+
+        window = SpanWindow(
+            index=0,
+            spans=[
+                {"id": "span-a", "text": "Revenue grew to $10M in 2024."},
+                {"id": "span-b", "text": "The company is SOC2 certified."},
+            ],
+        )
+        result = MultiLevelExtractionResult(
+            profile_code="general",
+            level=2,
+            metrics=[
+                ExtractedFactMetric(metric_name="revenue", span_refs=["S1", "[S1]", "S9"]),
+                ExtractedFactMetric(
+                    metric_name="growth", span_refs=[], evidence_quote="revenue  grew to $10M"
+                ),
+            ],
+            claims=[
+                ExtractedFactClaim(
+                    subject={"name": "Acme"},
+                    predicate="has_certification",
+                    object={"name": "SOC2"},
+                    claim_type="security",
+                    span_refs=["s2", "span-a"],
+                )
+            ],
+        )
+
+        resolve_span_refs(result, window)
+
+        assert result.metrics[0].span_refs == ["span-a"]
+        assert result.metrics[1].span_refs == ["span-a"]
+        assert result.claims[0].span_refs == ["span-b", "span-a"]
+
+    def test_merge_dedups_and_unions_refs(self):
+        """Test facts repeated across windows are merged."""
+        from evidence_repository.extraction.multilevel.windows import merge_results
+
+        def claim(refs, confidence):
+            return ExtractedFactClaim(
+                subject={"name": "Acme"},
+                predicate="has_certification",
+                object={"name": "SOC2"},
+                claim_type="security",
+                span_refs=refs,
+                extraction_confidence=confidence,
+            )
+
+        first = MultiLevelExtractionResult(
+            profile_code="general",
+            level=2,
+            claims=[claim(["span-a"], 0.6)],
+            open_questions=[ExtractedQualityQuestion(question="Who is the auditor?")],
+        )
+        second = MultiLevelExtractionResult(
+            profile_code="general",
+            level=2,
+            claims=[claim(["span-c", "span-a"], 0.9)],
+            open_questions=[ExtractedQualityQuestion(question="who is the  auditor?")],
+        )
+
+        merged = merge_results([first, second], "vc", 3)
+
+        assert merged.profile_code == "vc"
+        assert merged.level == 3
+        assert len(merged.claims) == 1
+        assert merged.claims[0].extraction_confidence == 0.9
+        assert merged.claims[0].span_refs == ["span-a", "span-c"]
+        assert len(merged.open_questions) == 1
+        assert first.claims[0].span_refs == ["span-a"]
+
+    def test_merge_reports_conflicting_metrics(self):
+        """Test different values for the same metric and period become a conflict."""
+        from datetime import date
+
+        from evidence_repository.extraction.multilevel.windows import merge_results
+
+        def metric(value, refs):
+            return ExtractedFactMetric(
+                metric_name="ARR",
+                entity_id="Acme",
+                value_numeric=value,
+                value_raw=f"${value:g}M",
+                period_end=date(2024, 12, 31),
+                span_refs=refs,
+            )
+
+        results = [
+            MultiLevelExtractionResult(profile_code="vc", level=2, metrics=[metric(10, ["a"])]),
+            MultiLevelExtractionResult(profile_code="vc", level=2, metrics=[metric(10, ["b"])]),
+            MultiLevelExtractionResult(profile_code="vc", level=2, metrics=[metric(12, ["c"])]),
+        ]
+
+        merged = merge_results(results, "vc", 2)
+
+        assert len(merged.metrics) == 2
+        assert merged.metrics[0].span_refs == ["a", "b"]
+        assert len(merged.conflicts) == 1
+        assert merged.conflicts[0].topic == "arr (acme)"
+        assert "$10M" in merged.conflicts[0].reason and "$12M" in merged.conflicts[0].reason
+
+    @pytest.mark.asyncio
+    async def test_extract_windows_tolerates_failed_window(self):
+        """Test windows run through the LLM and one failure does not fail the run."""
+        from evidence_repository.extraction.multilevel import service as service_module
+        from evidence_repository.extraction.multilevel.service import (
+            MultiLevelExtractionService,
+        )
+
+        calls = []
+
+        async def call_llm(system_prompt, user_prompt, schema_version="1.0"):
+            calls.append(user_prompt)
+            if "Span 2 " in user_prompt:
+                raise ValueError("Invalid JSON response from LLM")
+            return MultiLevelExtractionResult(
+                profile_code="general",
+                level=2,
+                risks=[
+                    ExtractedFactRisk(
+                        risk_type="key_person", statement="Depends on founder", span_refs=["S1"]
+                    )
+                ],
+            )
+
+        service = MultiLevelExtractionService(openai_client=MagicMock())
+        service._call_llm = call_llm
+        settings = MagicMock(multilevel_window_tokens=150, multilevel_window_concurrency=2)
+
+        with patch.object(service_module, "settings", settings):
+            result, stats = await service._extract_windows(
+                "system", self.make_spans(3), None, "1.0", "general", 2
+            )
+
+        assert len(calls) == 3
+        assert "## Available Span References" in calls[0]
+        assert stats == {"extraction_mode": "map_reduce", "windows": 3, "failed_windows": 1}
+        assert len(result.risks) == 1
+        assert result.risks[0].span_refs == ["span-0", "span-1"]
+
+    @pytest.mark.asyncio
+    async def test_extract_windows_all_failed_raises(self):
+        """Test extraction fails when every window fails."""
+        from evidence_repository.extraction.multilevel.service import (
+            MultiLevelExtractionService,
+        )
+
+        service = MultiLevelExtractionService(openai_client=MagicMock())
+        service._call_llm = AsyncMock(side_effect=ValueError("boom"))
+
+        with pytest.raises(ValueError, match="extraction windows failed"):
+            await service._extract_windows(
+                "system", self.make_spans(2), None, "1.0", "general", 2
+            )
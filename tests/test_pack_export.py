@@ -0,0 +1,179 @@
+"""Tests for streaming evidence pack export."""
+
+import io
+import json
+import uuid
+import zipfile
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from evidence_repository.models.evidence import SpanType
+from evidence_repository.services.pack_export import PackExporter
+
+VERSION_A = uuid.uuid4()
+VERSION_B = uuid.uuid4()
+
+
+def make_pack() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        name="IC pack",
+        description=None,
+        project_id=uuid.uuid4(),
+        created_at=datetime(2026, 1, 1),
+        created_by="analyst",
+    )
+
+
+def make_item(order: int, version_id: uuid.UUID) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        order_index=order,
+        notes=None,
+        span=SimpleNamespace(
+            id=uuid.uuid4(),
+            text_content=f"Span text {order}",
+            span_type=SpanType.TEXT,
+            start_locator={"type": "text", "offset_start": order},
+            document_version_id=version_id,
+        ),
+        claim=None,
+        metric=SimpleNamespace(id=uuid.uuid4(), metric_name="arr", metric_value="10M", unit="USD")
+        if order == 0 else None,
+    )
+
+
+def page_result(items: list) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = items
+    return result
+
+
+def sources_result(rows: list) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+class FakeStorage:
+    """Storage returning fixed content per URI."""
+
+    def __init__(self, files: dict[str, bytes]):
+        self.files = files
+
+    def resolve_uri(self, path: str) -> str:
+        return f"mem://{path}"
+
+    async def get_stream(self, file_uri, chunk_size=8192, start=0, end=None):
+        if file_uri not in self.files:
+            raise FileNotFoundError(file_uri)
+        data = self.files[file_uri]
+        for offset in range(0, len(data), chunk_size):
+            yield data[offset:offset + chunk_size]
+
+
+async def collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+class TestPackExporter:
+    """Tests for NDJSON and ZIP pack export."""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_pages_with_keyset(self):
+        items = [make_item(i, VERSION_A) for i in range(5)]
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            page_result(items[:2]),
+            page_result(items[2:4]),
+            page_result(items[4:]),
+        ])
+        exporter = PackExporter(db, make_pack(), page_size=2)
+
+        lines = (await collect(exporter.ndjson())).decode().splitlines()
+        records = [json.loads(line) for line in lines]
+
+        assert records[0]["type"] == "pack"
+        assert [r["order"] for r in records[1:-1]] == [0, 1, 2, 3, 4]
+        assert records[1]["metric"]["name"] == "arr"
+        assert records[-1]["type"] == "summary"
+        assert records[-1]["item_count"] == 5
+
+        # Pages after the first continue from the last (order_index, id)
+        second = db.execute.await_args_list[1].args[0]
+        params = second.compile(dialect=postgresql.dialect()).params
+        assert "(evidence_pack_items.order_index, evidence_pack_items.id) >" in str(second)
+        assert items[1].id in params.values()
+
+    @pytest.mark.asyncio
+    async def test_zip_bundle_with_sources(self):
+        items = [make_item(0, VERSION_A), make_item(1, VERSION_B), make_item(2, VERSION_A)]
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            page_result(items),
+            sources_result([
+                SimpleNamespace(id=VERSION_A, storage_path="a/report.pdf", original_filename="report.pdf"),
+                SimpleNamespace(id=VERSION_B, storage_path="b/missing.pdf", original_filename="../missing.pdf"),
+            ]),
+        ])
+        content = b"%PDF-1.4 " + b"x" * 200000
+        storage = FakeStorage({"mem://a/report.pdf": content})
+        exporter = PackExporter(db, make_pack(), page_size=10)
+
+        chunks = [chunk async for chunk in exporter.zip(storage)]
+        bundle = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+        assert len(chunks) > 3
+        assert json.loads(bundle.read("pack.json"))["name"] == "IC pack"
+        item_lines = bundle.read("items.ndjson").decode().splitlines()
+        assert [json.loads(line)["order"] for line in item_lines] == [0, 1, 2]
+        assert bundle.read(f"sources/{VERSION_A}/report.pdf") == content
+
+        manifest = json.loads(bundle.read("manifest.json"))
+        assert manifest["item_count"] == 3
+        assert manifest["sources"][0]["path"] == f"sources/{VERSION_A}/report.pdf"
+        assert "error" in manifest["sources"][1]
+        assert not any(name.startswith(f"sources/{VERSION_B}") for name in bundle.namelist())
+
+    @pytest.mark.asyncio
+    async def test_zip_without_sources(self):
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[page_result([make_item(0, VERSION_A)])])
+        exporter = PackExporter(db, make_pack())
+
+        data = await collect(exporter.zip(FakeStorage({}), include_sources=False))
+        bundle = zipfile.ZipFile(io.BytesIO(data))
+
+        assert bundle.namelist() == ["pack.json", "items.ndjson", "manifest.json"]
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_uses_its_own_session(self):
+        request_db = MagicMock()
+        request_db.execute = AsyncMock()
+        stream_db = MagicMock()
+        stream_db.execute = AsyncMock(return_value=page_result([make_item(0, VERSION_A)]))
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__ = AsyncMock(return_value=stream_db)
+        session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        exporter = PackExporter(request_db, make_pack(), page_size=2)
+
+        stream = exporter.stream(session_factory, PackExporter.ndjson)
+        session_factory.assert_not_called()
+        lines = (await collect(stream)).decode().splitlines()
+
+        assert len(lines) == 3
+        assert exporter.item_count == 1
+        request_db.execute.assert_not_called()
+        session_factory.return_value.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_open_missing_pack(self):
+        db = MagicMock()
+        db.get = AsyncMock(return_value=None)
+
+        assert await PackExporter.open(db, uuid.uuid4()) is None
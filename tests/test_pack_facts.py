@@ -0,0 +1,140 @@
+"""Tests for batched evidence pack fact loading."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from evidence_repository.models.extraction_level import ProcessContext
+from evidence_repository.models.facts import (
+    FactCertainty,
+    FactClaim,
+    FactMetric,
+    SourceReliability,
+)
+from evidence_repository.services import pack_facts
+from evidence_repository.services.pack_facts import (
+    PackFactLoader,
+    clear_extraction_id_cache,
+    resolve_extraction_ids,
+)
+
+
+def scalars_result(rows: list) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+
+def scalar_result(value) -> MagicMock:
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = value
+    return result
+
+
+def make_claim(version_id: uuid.UUID) -> FactClaim:
+    return FactClaim(
+        id=uuid.uuid4(),
+        version_id=version_id,
+        subject={"type": "company", "name": "Acme"},
+        predicate="has_soc2",
+        object={"value": True},
+        claim_type="security",
+        certainty=FactCertainty.DEFINITE,
+        source_reliability=SourceReliability.OFFICIAL,
+        process_context=ProcessContext.VC_IC_DECISION,
+    )
+
+
+def make_metric(version_id: uuid.UUID) -> FactMetric:
+    return FactMetric(
+        id=uuid.uuid4(),
+        version_id=version_id,
+        metric_name="arr",
+        value_numeric=10000000.0,
+        value_raw="$10M",
+        certainty=FactCertainty.PROBABLE,
+        source_reliability=SourceReliability.OFFICIAL,
+        process_context=ProcessContext.VC_IC_DECISION,
+    )
+
+
+class TestPackFactLoader:
+    """Tests for loading facts for many versions at once."""
+
+    @pytest.mark.asyncio
+    async def test_one_query_per_fact_type(self):
+        versions = [uuid.uuid4() for _ in range(3)]
+        claims = [make_claim(versions[0]), make_claim(versions[0]), make_claim(versions[2])]
+        metrics = [make_metric(versions[1])]
+
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            scalars_result(claims),
+            scalars_result(metrics),
+            scalars_result([]),
+            scalars_result([]),
+        ])
+        loader = PackFactLoader(db, uuid.uuid4(), uuid.uuid4(), ProcessContext.VC_IC_DECISION)
+
+        # 300 pack items spread over three versions
+        facts = await loader.load(versions[i % 3] for i in range(300))
+
+        assert db.execute.await_count == 4
+        assert set(facts) == set(versions)
+        assert [c["id"] for c in facts[versions[0]]["claims"]] == [str(c.id) for c in claims[:2]]
+        assert facts[versions[1]]["metrics"][0]["value_raw"] == "$10M"
+        assert facts[versions[1]]["claims"] == []
+        assert facts[versions[2]]["claims"][0]["process_context"] == "vc.ic_decision"
+
+    @pytest.mark.asyncio
+    async def test_query_limits_rows_per_version(self):
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=scalars_result([]))
+        loader = PackFactLoader(db, uuid.uuid4(), uuid.uuid4(), ProcessContext.UNSPECIFIED)
+
+        await loader.load([uuid.uuid4(), uuid.uuid4()])
+
+        sql = str(db.execute.await_args_list[0].args[0].compile(dialect=postgresql.dialect()))
+        assert "IN (" in sql
+        assert "row_number() OVER (PARTITION BY facts_claims.version_id" in sql
+
+    @pytest.mark.asyncio
+    async def test_no_versions_no_queries(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+        loader = PackFactLoader(db, uuid.uuid4(), uuid.uuid4(), ProcessContext.UNSPECIFIED)
+
+        assert await loader.load([]) == {}
+        db.execute.assert_not_awaited()
+
+
+class TestResolveExtractionIds:
+    """Tests for cached profile/level ID resolution."""
+
+    def setup_method(self):
+        clear_extraction_id_cache()
+
+    def teardown_method(self):
+        clear_extraction_id_cache()
+
+    @pytest.mark.asyncio
+    async def test_resolved_ids_are_cached(self):
+        profile_id, level_id = uuid.uuid4(), uuid.uuid4()
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[scalar_result(profile_id), scalar_result(level_id)])
+
+        assert await resolve_extraction_ids(db, "vc", 3) == (profile_id, level_id)
+        assert await resolve_extraction_ids(db, "vc", 3) == (profile_id, level_id)
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_ids_not_cached(self):
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=scalar_result(None))
+
+        assert await resolve_extraction_ids(db, "unknown", 9) == (None, None)
+        assert await resolve_extraction_ids(db, "unknown", 9) == (None, None)
+        assert db.execute.await_count == 4
+        assert pack_facts._extraction_ids == {}
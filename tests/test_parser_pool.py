@@ -0,0 +1,203 @@
+"""Tests for the parser process pool."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from evidence_repository.digestion import parsers
+from evidence_repository.digestion.parser_pool import (
+    ParserPool,
+    ParserPoolError,
+    ParserPoolStats,
+    ParserPoolUnavailableError,
+    ParserTimeoutError,
+    run_job,
+)
+
+CSV_DATA = b"Name,Age\nJohn,30\nJane,25"
+
+
+class TestRunJob:
+    """Tests for the worker-side job function."""
+
+    def test_returns_outcome(self):
+        outcome = run_job(parsers.SYNC_PARSERS["csv"], (CSV_DATA, "data.csv"), timeout=5)
+
+        text, metadata = outcome.result
+        assert "John" in text
+        assert metadata["row_count"] == 3
+        assert outcome.run_seconds >= 0
+        assert outcome.peak_rss_mb > 0
+
+    def test_deadline_not_swallowed_by_parser(self):
+        def slow_parser(file_data, filename):
+            try:
+                time.sleep(5)
+            except Exception:
+                return "swallowed", {}
+            return "finished", {}
+
+        started = time.perf_counter()
+        with pytest.raises(ParserTimeoutError):
+            run_job(slow_parser, (CSV_DATA, "slow.csv"), timeout=0.1)
+        assert time.perf_counter() - started < 2
+
+
+class TestParserPoolStats:
+    """Tests for pool statistics."""
+
+    def test_record_separates_queue_wait_and_parse_time(self):
+        stats = ParserPoolStats(workers=2)
+        stats.record(queue_wait=0.5, parse_seconds=1.0, peak_rss_mb=100)
+        stats.record(queue_wait=0.1, parse_seconds=3.0, peak_rss_mb=80)
+
+        data = stats.to_dict()
+        assert data["jobs"]["completed"] == 2
+        assert data["timing"]["avg_queue_wait_ms"] == 300.0
+        assert data["timing"]["avg_parse_ms"] == 2000.0
+        assert data["timing"]["max_queue_wait_ms"] == 500.0
+        assert data["timing"]["max_parse_ms"] == 3000.0
+        assert data["workers_lifecycle"]["peak_rss_mb"] == 100.0
+
+    def test_empty_stats(self):
+        data = ParserPoolStats().to_dict()
+        assert data["timing"]["avg_parse_ms"] == 0.0
+
+
+class TestParserPool:
+    """Tests for ParserPool against real worker processes."""
+
+    @pytest.fixture
+    def pool(self):
+        pool = ParserPool(max_workers=1, timeout=30, max_rss_mb=4096, max_tasks_per_worker=10)
+        yield pool
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_parse_in_worker(self, pool):
+        text, metadata = await pool.parse("csv", CSV_DATA, "data.csv")
+
+        assert "Jane" in text
+        assert metadata["columns"] == ["Name", "Age"]
+        assert pool.stats.submitted == 1
+        assert pool.stats.completed == 1
+        assert pool.stats.in_flight == 0
+        assert pool.stats.pool_starts == 1
+
+    @pytest.mark.asyncio
+    async def test_recycles_pool_over_rss_limit(self, pool):
+        pool.max_rss_mb = 0.001
+
+        await pool.parse("csv", CSV_DATA, "data.csv")
+        assert pool.stats.rss_recycles == 1
+
+        await pool.parse("csv", CSV_DATA, "data.csv")
+        assert pool.stats.pool_starts == 2
+
+    @pytest.mark.asyncio
+    async def test_worker_timeout_is_counted(self, pool):
+        pool._executor = MagicMock()
+        with patch(
+            "asyncio.BaseEventLoop.run_in_executor",
+            AsyncMock(side_effect=ParserTimeoutError("too slow")),
+        ):
+            with pytest.raises(ParserTimeoutError):
+                await pool.parse("pdf", b"%PDF", "big.pdf")
+
+        assert pool.stats.timeouts == 1
+        assert pool.stats.failed == 1
+        assert pool.stats.in_flight == 0
+        pool._executor = None
+
+    @pytest.mark.asyncio
+    async def test_deadline_starts_when_worker_is_free(self, pool):
+        pool.timeout = 0.6
+        await pool.run(time.sleep, 0, label="warm-up")
+
+        # Four 0.3s jobs on one worker take 1.2s in total, well past the
+        # parent's 0.8s deadline if it counted time spent queued
+        with patch("evidence_repository.digestion.parser_pool.TIMEOUT_GRACE_SECONDS", 0.2):
+            await asyncio.gather(*(pool.run(time.sleep, 0.3, label=f"job {n}") for n in range(4)))
+
+        assert pool.stats.timeouts == 0
+        assert pool.stats.pool_starts == 1
+        assert pool.stats.max_queue_wait_seconds > 0.5
+
+
+class TestParseDocumentDispatch:
+    """Tests for routing parse_document through the pool."""
+
+    @pytest.mark.asyncio
+    async def test_pooled_format_uses_pool(self):
+        pool = MagicMock()
+        pool.parse = AsyncMock(return_value=("html text", {"page_count": None}))
+
+        with patch.object(parsers, "get_parser_pool", return_value=pool):
+            text, metadata = await parsers.parse_document(b"PK", "text/html", "doc.html")
+
+        pool.parse.assert_awaited_once_with("html", b"PK", "doc.html")
+        assert text == "html text"
+        assert metadata["parser"] == "html"
+
+    @pytest.mark.asyncio
+    async def test_text_stays_in_process(self):
+        with patch.object(parsers, "get_parser_pool") as get_pool:
+            text, metadata = await parsers.parse_document(b"hello", "text/plain", "a.txt")
+
+        get_pool.assert_not_called()
+        assert text == "hello"
+
+    @pytest.mark.asyncio
+    async def test_pool_error_becomes_parse_error_text(self):
+        pool = MagicMock()
+        pool.run = AsyncMock(return_value={"page_count": 3})
+        pool.parse = AsyncMock(side_effect=ParserTimeoutError("exceeded 120s"))
+
+        with patch.object(parsers, "get_parser_pool", return_value=pool):
+            text, metadata = await parsers.parse_document(
+                b"%PDF", "application/pdf", "doc.pdf"
+            )
+
+        assert text == "[PDF parsing error: exceeded 120s]"
+        assert metadata["parser"] == "pdf"
+
+    @pytest.mark.asyncio
+    async def test_unavailable_pool_parses_in_process(self):
+        pool = MagicMock()
+        pool.parse = AsyncMock(side_effect=ParserPoolUnavailableError("no /dev/shm"))
+
+        with patch.object(parsers, "get_parser_pool", return_value=pool):
+            text, metadata = await parsers.parse_document(
+                b"<p>hello</p>", "text/html", "doc.html"
+            )
+
+        assert "hello" in text
+        assert metadata["parser"] == "html"
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_job_parses_in_process(self):
+        pool = MagicMock()
+        pool.parse = AsyncMock(side_effect=TypeError("cannot pickle"))
+
+        with patch.object(parsers, "get_parser_pool", return_value=pool):
+            text, _ = await parsers.parse_document(b"<p>hello</p>", "text/html", "doc.html")
+
+        assert "hello" in text
+
+    @pytest.mark.asyncio
+    async def test_executor_start_failure_is_unavailable(self):
+        pool = ParserPool(max_workers=1, timeout=30, max_rss_mb=4096, max_tasks_per_worker=10)
+        with patch(
+            "evidence_repository.digestion.parser_pool.ProcessPoolExecutor",
+            side_effect=OSError("[Errno 38] Function not implemented"),
+        ):
+            with pytest.raises(ParserPoolUnavailableError):
+                await pool.run(time.sleep, 0, label="doc.pdf")
+
+        assert pool.stats.failed == 1
+        assert pool.stats.in_flight == 0
+
+    def test_timeout_is_pool_error(self):
+        assert issubclass(ParserTimeoutError, ParserPoolError)
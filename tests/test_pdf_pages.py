@@ -0,0 +1,133 @@
+"""Tests for page-sharded PDF extraction."""
+
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pypdf
+import pytest
+
+from evidence_repository.digestion import parsers
+from evidence_repository.digestion.parser_pool import ParserPool
+from evidence_repository.digestion.pdf_pages import (
+    extract_page_texts,
+    iter_pdf_pages,
+    join_pages,
+    page_shards,
+    pdf_on_disk,
+    read_pdf_info,
+)
+
+
+def blank_pdf(pages: int) -> bytes:
+    writer = pypdf.PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=200, height=200)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def fake_pool(pages: dict[int, str]) -> MagicMock:
+    """Pool whose run() returns page texts for extract_page_texts jobs."""
+
+    async def run(fn, *args, label):
+        if fn is extract_page_texts:
+            _, start, end = args
+            return [pages[index + 1] for index in range(start, end)]
+        return {"page_count": len(pages)}
+
+    pool = MagicMock()
+    pool.run = AsyncMock(side_effect=run)
+    return pool
+
+
+class TestPageShards:
+    """Tests for page range splitting and joining."""
+
+    def test_shards_cover_all_pages(self):
+        assert page_shards(120, 50) == [(0, 50), (50, 100), (100, 120)]
+        assert page_shards(50, 50) == [(0, 50)]
+        assert page_shards(0, 50) == []
+
+    def test_join_pages_offsets(self):
+        text, page_breaks = join_pages(["abc", "", "de"])
+
+        assert text == "abc\n\n\n\nde"
+        assert page_breaks == [0, 5, 7]
+        assert text[page_breaks[2]:] == "de"
+
+
+class TestIterPdfPages:
+    """Tests for streaming pages out of shards."""
+
+    @pytest.mark.asyncio
+    async def test_pages_in_order_with_offsets(self, tmp_path):
+        texts = {n: f"page {n} text" for n in range(1, 8)}
+        pool = fake_pool(texts)
+
+        pages = [
+            page async for page in iter_pdf_pages(tmp_path / "doc.pdf", 7, pool, shard_size=3)
+        ]
+
+        assert [p.number for p in pages] == list(range(1, 8))
+        assert pool.run.await_count == 3
+        text, page_breaks = join_pages([p.text for p in pages])
+        assert [p.offset for p in pages] == page_breaks
+        assert all(text[p.offset:].startswith(p.text) for p in pages)
+
+    @pytest.mark.asyncio
+    async def test_real_pool_extracts_pages(self):
+        pool = ParserPool(max_workers=2, timeout=30, max_rss_mb=4096, max_tasks_per_worker=10)
+        try:
+            async with pdf_on_disk(blank_pdf(5)) as path:
+                info = await pool.run(read_pdf_info, str(path), label="blank.pdf")
+                pages = [
+                    page async for page in iter_pdf_pages(path, info["page_count"], pool, 2)
+                ]
+        finally:
+            pool.shutdown()
+
+        assert info["page_count"] == 5
+        assert [p.number for p in pages] == [1, 2, 3, 4, 5]
+        assert pool.stats.completed == 4
+        assert not path.exists()
+
+
+class TestParseDocumentSharding:
+    """Tests for page-parallel PDFs in parse_document."""
+
+    @pytest.mark.asyncio
+    async def test_large_pdf_is_sharded(self):
+        texts = {n: f"Text of page {n}. " * 10 for n in range(1, 6)}
+        pool = fake_pool(texts)
+        settings = MagicMock(parser_pool_enabled=True, pdf_parallel_min_pages=3, pdf_pages_per_shard=2)
+
+        with patch.object(parsers, "get_parser_pool", return_value=pool), \
+                patch("evidence_repository.digestion.pdf_pages.get_settings", return_value=settings):
+            text, metadata = await parsers.parse_document(b"%PDF", "application/pdf", "big.pdf")
+
+        assert metadata["page_count"] == 5
+        assert text.startswith("--- Page 1 ---\nText of page 1.")
+        assert "--- Page 5 ---" in text
+        assert len(metadata["page_breaks"]) == 5
+        for number, start in enumerate(metadata["page_breaks"], 1):
+            assert text[start:].startswith(f"--- Page {number} ---")
+        pool.parse.assert_not_called()
+
+    def test_page_breaks_skip_empty_pages(self):
+        metadata = {"page_count": 4}
+        text = parsers._join_pdf_pages(["", "one", "", "three"], metadata, "a.pdf")
+
+        assert text == "--- Page 2 ---\none\n\n--- Page 4 ---\nthree"
+        assert metadata["page_breaks"] == [0, 0, 20, 20]
+
+    @pytest.mark.asyncio
+    async def test_small_pdf_parsed_whole(self):
+        pool = fake_pool({1: "only page"})
+        pool.parse = AsyncMock(return_value=("--- Page 1 ---\nonly page", {"page_count": 1}))
+
+        with patch.object(parsers, "get_parser_pool", return_value=pool):
+            text, metadata = await parsers.parse_document(b"%PDF", "application/pdf", "a.pdf")
+
+        pool.parse.assert_awaited_once_with("pdf", b"%PDF", "a.pdf")
+        assert metadata["page_count"] == 1
@@ -626,3 +626,91 @@ class TestValuesDiffer:
         m2 = self._create_metric(value_raw="$10M")
 
         assert service._values_differ(m1, m2) is False
+
+
+class TestConflictIndex:
+    """Tests for the interval sweep behind metric conflict detection."""
+
+    @staticmethod
+    def _observation(value_numeric=None, value_raw=None, period_start=None,
+                     period_end=None, as_of=None, period_type=None):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            value_numeric=value_numeric,
+            value_raw=value_raw,
+            period_start=period_start,
+            period_end=period_end,
+            as_of=as_of,
+            period_type=period_type,
+        )
+
+    def _pairwise(self, observations):
+        service = QualityAnalysisService.__new__(QualityAnalysisService)
+        return [
+            (i, j)
+            for i, m1 in enumerate(observations)
+            for j in range(i + 1, len(observations))
+            if service._periods_overlap(m1, observations[j])
+            and service._values_differ(m1, observations[j])
+        ]
+
+    def test_matches_pairwise_comparison(self):
+        """Test the sweep finds exactly the pairs a pairwise scan finds."""
+        import random
+
+        from evidence_repository.services.conflict_index import find_conflicting_pairs
+
+        rng = random.Random(20)
+        base = date(2023, 1, 1)
+        values = [None, 0.0, 100.0, 100.5, 102.0, 150.0, -100.0, -100.4, 1e-9]
+        raws = [None, "$100", "$150", "n/a"]
+
+        for _ in range(200):
+            observations = []
+            for _ in range(rng.randint(0, 25)):
+                start = base + timedelta(days=rng.randint(0, 360))
+                kind = rng.choice(["undated", "as_of", "range", "both", "start_only"])
+                observations.append(self._observation(
+                    value_numeric=rng.choice(values),
+                    value_raw=rng.choice(raws),
+                    as_of=start if kind in ("as_of", "both") else None,
+                    period_start=start if kind in ("range", "both", "start_only") else None,
+                    period_end=(
+                        start + timedelta(days=rng.choice([0, 30, 90, 365]))
+                        if kind in ("range", "both") else None
+                    ),
+                    period_type=rng.choice([None, "annual"]),
+                ))
+
+            assert find_conflicting_pairs(observations) == self._pairwise(observations)
+
+    def test_near_equal_values_not_conflicting(self):
+        """Test values within 1% in one period produce no pairs."""
+        from evidence_repository.services.conflict_index import find_conflicting_pairs
+
+        observations = [
+            self._observation(value_numeric=1000 + i * 0.001, as_of=date(2024, 12, 31))
+            for i in range(2000)
+        ]
+        observations.append(self._observation(value_numeric=2000, as_of=date(2024, 12, 31)))
+
+        pairs = find_conflicting_pairs(observations)
+
+        assert len(pairs) == 2000
+        assert all(j == 2000 for _, j in pairs)
+
+    def test_disjoint_periods_not_conflicting(self):
+        """Test yearly values for different years produce no pairs."""
+        from evidence_repository.services.conflict_index import find_conflicting_pairs
+
+        observations = [
+            self._observation(
+                value_numeric=float(year),
+                period_start=date(year, 1, 1),
+                period_end=date(year, 12, 31),
+            )
+            for year in range(1900, 2024)
+        ]
+
+        assert find_conflicting_pairs(observations) == []
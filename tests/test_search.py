@@ -14,145 +14,6 @@ from evidence_repository.services.search_service import (
 )
 
 
-class TestKeywordFiltering:
-    """Tests for keyword filtering logic."""
-
-    def _create_service(self):
-        """Create a service instance for testing helper methods."""
-        return SearchService.__new__(SearchService)
-
-    def test_passes_filter_with_no_keywords(self):
-        """Test that text passes when no keywords specified."""
-        service = self._create_service()
-        text = "This is some sample text about revenue and metrics."
-
-        result = service._passes_keyword_filter(text, None, None)
-
-        assert result is True
-
-    def test_passes_filter_with_matching_keywords(self):
-        """Test that text passes when all keywords are present."""
-        service = self._create_service()
-        text = "The company reported revenue of $10M and ARR growth of 50%."
-
-        result = service._passes_keyword_filter(
-            text,
-            keywords=["revenue", "ARR"],
-            exclude_keywords=None,
-        )
-
-        assert result is True
-
-    def test_fails_filter_with_missing_keyword(self):
-        """Test that text fails when a required keyword is missing."""
-        service = self._create_service()
-        text = "The company reported revenue of $10M."
-
-        result = service._passes_keyword_filter(
-            text,
-            keywords=["revenue", "ARR"],  # ARR not in text
-            exclude_keywords=None,
-        )
-
-        assert result is False
-
-    def test_fails_filter_with_excluded_keyword(self):
-        """Test that text fails when an excluded keyword is present."""
-        service = self._create_service()
-        text = "The company is confidential and reported revenue of $10M."
-
-        result = service._passes_keyword_filter(
-            text,
-            keywords=["revenue"],
-            exclude_keywords=["confidential"],
-        )
-
-        assert result is False
-
-    def test_passes_filter_without_excluded_keyword(self):
-        """Test that text passes when excluded keywords are absent."""
-        service = self._create_service()
-        text = "The company reported revenue of $10M."
-
-        result = service._passes_keyword_filter(
-            text,
-            keywords=["revenue"],
-            exclude_keywords=["confidential", "secret"],
-        )
-
-        assert result is True
-
-    def test_keyword_matching_is_case_insensitive(self):
-        """Test that keyword matching is case-insensitive."""
-        service = self._create_service()
-        text = "The company reported REVENUE of $10M."
-
-        result = service._passes_keyword_filter(
-            text,
-            keywords=["revenue"],  # lowercase
-            exclude_keywords=None,
-        )
-
-        assert result is True
-
-    def test_exclude_keyword_matching_is_case_insensitive(self):
-        """Test that exclude keyword matching is case-insensitive."""
-        service = self._create_service()
-        text = "This is CONFIDENTIAL information."
-
-        result = service._passes_keyword_filter(
-            text,
-            keywords=None,
-            exclude_keywords=["confidential"],  # lowercase
-        )
-
-        assert result is False
-
-
-class TestKeywordRelevance:
-    """Tests for keyword relevance scoring."""
-
-    def _create_service(self):
-        """Create a service instance for testing helper methods."""
-        return SearchService.__new__(SearchService)
-
-    def test_relevance_with_no_keywords(self):
-        """Test default relevance when no keywords."""
-        service = self._create_service()
-
-        relevance = service._calculate_keyword_relevance("Some text", [])
-
-        assert relevance == 0.5
-
-    def test_relevance_increases_with_matches(self):
-        """Test relevance increases with keyword matches."""
-        service = self._create_service()
-        text = "Revenue revenue REVENUE growth"
-
-        relevance = service._calculate_keyword_relevance(text, ["revenue"])
-
-        # 3 matches (capped), normalized
-        assert relevance > 0.5
-
-    def test_relevance_with_multiple_keywords(self):
-        """Test relevance with multiple keywords."""
-        service = self._create_service()
-        text = "Revenue growth and ARR metrics"
-
-        relevance = service._calculate_keyword_relevance(text, ["revenue", "arr"])
-
-        assert relevance > 0
-
-    def test_relevance_zero_with_no_matches(self):
-        """Test relevance is zero with no matches."""
-        service = self._create_service()
-        text = "Some unrelated text about nothing"
-
-        relevance = service._calculate_keyword_relevance(text, ["revenue", "arr"])
-
-        assert relevance == 0
-
-
 class TestHighlightCalculation:
     """Tests for keyword highlight range calculation."""
 
@@ -411,6 +272,37 @@ class TestSearchSchemas:
         assert query.keywords is None
         assert query.document_ids is None
 
+    def test_search_query_ef_search(self):
+        """Test SearchQuery ef_search is optional and bounded."""
+        from pydantic import ValidationError
+
+        from evidence_repository.schemas.search import SearchQuery
+
+        assert SearchQuery(query="test").ef_search is None
+        assert SearchQuery(query="test", ef_search=200).ef_search == 200
+
+        with pytest.raises(ValidationError):
+            SearchQuery(query="test", ef_search=0)
+        with pytest.raises(ValidationError):
+            SearchQuery(query="test", ef_search=5000)
+
+    def test_search_offset_bounded(self):
+        """Test offset cannot push a page past the HNSW candidate cap."""
+        from pydantic import ValidationError
+
+        from evidence_repository.schemas.search import (
+            MAX_SEARCH_OFFSET,
+            ProjectSearchQuery,
+            SearchQuery,
+        )
+
+        assert SearchQuery(query="test", offset=MAX_SEARCH_OFFSET, limit=100).offset == 900
+
+        with pytest.raises(ValidationError):
+            SearchQuery(query="test", offset=MAX_SEARCH_OFFSET + 1)
+        with pytest.raises(ValidationError):
+            ProjectSearchQuery(query="test", offset=MAX_SEARCH_OFFSET + 1)
+
     def test_citation_schema(self):
         """Test Citation Pydantic model."""
         from evidence_repository.schemas.search import Citation, SpanLocator
@@ -470,3 +362,205 @@ class TestSearchSchemas:
         assert result.mode == SearchMode.SEMANTIC
         assert result.total == 1
         assert len(result.results) == 1
+
+
+class TestHybridSearchQuery:
+    """Tests for the single-statement hybrid search."""
+
+    def _create_service(self):
+        """Create a service with mocked DB and embedding client."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from evidence_repository.config import get_settings
+
+        service = SearchService.__new__(SearchService)
+        service._settings = get_settings()
+        service.embedding_client = AsyncMock()
+        service.embedding_client.embed_text.return_value = [0.0] * 1536
+
+        result = MagicMock()
+        result.fetchall.return_value = []
+        service.db = AsyncMock()
+        service.db.execute.return_value = result
+        return service
+
+    @pytest.mark.asyncio
+    async def test_fuses_in_one_statement(self):
+        """Both legs and the fusion run in a single CTE query."""
+        from sqlalchemy.dialects import postgresql
+
+        service = self._create_service()
+
+        results = await service._hybrid_search(
+            query='revenue "net retention"',
+            limit=10,
+            offset=20,
+            similarity_threshold=0.5,
+            filters=[],
+            keywords=None,
+        )
+
+        assert results == []
+        # SET LOCAL ef_search + the search statement
+        assert service.db.execute.await_count == 2
+        statement = service.db.execute.await_args_list[-1].args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("WITH semantic AS")
+        assert "keyword AS" in sql
+        assert "fused AS" in sql
+        assert "FULL OUTER JOIN keyword" in sql
+        assert "ORDER BY fused.score DESC, embedding_chunks.id" in sql
+        assert "LIMIT" in sql and "OFFSET" in sql
+
+    @pytest.mark.asyncio
+    async def test_offset_past_candidates_short_circuits(self):
+        """Pages beyond both candidate lists are empty without querying."""
+        service = self._create_service()
+        depth = service._settings.hybrid_candidate_depth
+
+        results = await service._hybrid_search(
+            query="revenue",
+            limit=10,
+            offset=2 * depth,
+            similarity_threshold=0.5,
+            filters=[],
+            keywords=None,
+        )
+
+        assert results == []
+        service.db.execute.assert_not_awaited()
+        service.embedding_client.embed_text.assert_not_awaited()
+
+
+class TestSemanticSearchQuery:
+    """Tests for HNSW session settings in semantic search."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "ef_search, offset, expected",
+        [(None, 0, 40), (None, 60, 70), (200, 0, 200), (None, 900, 910)],
+    )
+    async def test_ef_search_covers_page_end(self, ef_search, offset, expected):
+        """ef_search is always set and never below offset + limit."""
+        service = TestHybridSearchQuery()._create_service()
+        service._settings = service._settings.model_copy(update={"hnsw_ef_search": None})
+
+        await service._semantic_search(
+            query="revenue",
+            limit=10,
+            offset=offset,
+            similarity_threshold=0.5,
+            filters=[],
+            keywords=None,
+            ef_search=ef_search,
+        )
+
+        statement = service.db.execute.await_args_list[0].args[0]
+        assert str(statement) == f"SET LOCAL hnsw.ef_search = {expected}"
+
+    @staticmethod
+    def _settings_sql(service) -> list[str]:
+        return [
+            str(call.args[0])
+            for call in service.db.execute.await_args_list
+            if str(call.args[0]).startswith("SET LOCAL")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_filtered_search_uses_iterative_scan(self):
+        """Filtered searches keep scanning the graph until the page fills."""
+        from evidence_repository.models.embedding import EmbeddingChunk
+
+        service = TestHybridSearchQuery()._create_service()
+        project_filter = EmbeddingChunk.project_ids.contains([uuid.uuid4()])
+
+        await service._semantic_search(
+            query="revenue",
+            limit=10,
+            offset=0,
+            similarity_threshold=0.5,
+            filters=[project_filter],
+            keywords=None,
+        )
+        assert "SET LOCAL hnsw.iterative_scan = strict_order" in self._settings_sql(service)
+
+        service = TestHybridSearchQuery()._create_service()
+        await service._hybrid_search(
+            query="revenue",
+            limit=10,
+            offset=0,
+            similarity_threshold=0.5,
+            filters=[project_filter],
+            keywords=None,
+        )
+        assert "SET LOCAL hnsw.iterative_scan = relaxed_order" in self._settings_sql(service)
+
+    @pytest.mark.asyncio
+    async def test_unfiltered_search_skips_iterative_scan(self):
+        """Unfiltered searches keep the plain HNSW scan."""
+        service = TestHybridSearchQuery()._create_service()
+
+        await service._semantic_search(
+            query="revenue",
+            limit=10,
+            offset=0,
+            similarity_threshold=0.5,
+            filters=[],
+            keywords=None,
+        )
+
+        assert not any("iterative_scan" in sql for sql in self._settings_sql(service))
+
+
+class TestSearchFilters:
+    """Tests for filter pushdown onto denormalized chunk columns."""
+
+    def _compile(self, filters):
+        from sqlalchemy import and_
+        from sqlalchemy.dialects import postgresql
+
+        return str(and_(*filters).compile(dialect=postgresql.dialect()))
+
+    def test_project_filter_uses_membership_array(self):
+        """Without a current partial index, projects filter on project_ids."""
+        from evidence_repository.services.vector_index_service import ProjectSearchScope
+
+        service = SearchService.__new__(SearchService)
+        scope = ProjectSearchScope(project_id=uuid.uuid4())
+
+        sql = self._compile(
+            service._build_filters(
+                project_scope=scope,
+                document_ids=[uuid.uuid4()],
+                span_types=None,
+                keywords=None,
+                exclude_keywords=None,
+                spans_only=False,
+            )
+        )
+
+        assert "embedding_chunks.project_ids @>" in sql
+        assert "embedding_chunks.document_id IN" in sql
+        assert "project_documents" not in sql
+        assert "document_versions" not in sql
+
+    def test_span_type_filter_is_column_predicate(self):
+        """Span type filters compare the chunk's own span_type."""
+        from evidence_repository.models.evidence import SpanType
+
+        service = SearchService.__new__(SearchService)
+
+        sql = self._compile(
+            service._build_filters(
+                project_scope=None,
+                document_ids=None,
+                span_types=[SpanType.TABLE],
+                keywords=None,
+                exclude_keywords=None,
+                spans_only=True,
+            )
+        )
+
+        assert "embedding_chunks.span_type IN" in sql
+        assert "FROM spans" not in sql
@@ -0,0 +1,212 @@
+"""Tests for bulk span persistence."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from evidence_repository.models.evidence import Span, SpanType
+from evidence_repository.spans.base import SpanData
+from evidence_repository.spans.bulk import (
+    build_span_row,
+    chunked,
+    dedupe_rows,
+    insert_spans_statement,
+    select_spans_statement,
+)
+from evidence_repository.spans.service import SpanGenerationService
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _row(version_id, span_hash, text="Some span text"):
+    return build_span_row(
+        version_id=version_id,
+        span_hash=span_hash,
+        text_content=text,
+        locator={"type": "text", "offset_start": 0, "offset_end": len(text)},
+        span_type=SpanType.TEXT,
+    )
+
+
+class TestSpanRows:
+    """Tests for row building helpers."""
+
+    def test_build_span_row(self):
+        """Rows carry table column names and a fresh id."""
+        version_id = uuid.uuid4()
+        row = _row(version_id, "a" * 64)
+
+        assert row["document_version_id"] == version_id
+        assert row["span_hash"] == "a" * 64
+        assert row["start_locator"]["type"] == "text"
+        assert row["end_locator"] is None
+        assert row["metadata"] == {}
+        assert isinstance(row["id"], uuid.UUID)
+
+    def test_dedupe_rows_keeps_first(self):
+        """Repeated hashes are dropped, order preserved."""
+        version_id = uuid.uuid4()
+        rows = [
+            _row(version_id, "h1", "first"),
+            _row(version_id, "h2"),
+            _row(version_id, "h1", "second"),
+        ]
+
+        unique = dedupe_rows(rows)
+
+        assert [r["span_hash"] for r in unique] == ["h1", "h2"]
+        assert unique[0]["text_content"] == "first"
+
+    def test_chunked(self):
+        """Slices cover all items in order."""
+        assert [list(c) for c in chunked([1, 2, 3, 4, 5], 2)] == [[1, 2], [3, 4], [5]]
+        assert list(chunked([], 3)) == []
+
+
+class TestSpanStatements:
+    """Tests for generated SQL."""
+
+    def test_insert_uses_on_conflict_do_nothing(self):
+        """Insert is a single multi-row statement skipping existing hashes."""
+        version_id = uuid.uuid4()
+        stmt = insert_spans_statement([_row(version_id, "h1"), _row(version_id, "h2")])
+        sql = _compile(stmt)
+
+        assert sql.startswith("INSERT INTO spans")
+        assert "ON CONFLICT ON CONSTRAINT uq_spans_version_hash DO NOTHING" in sql
+        assert "DO UPDATE" not in sql
+
+    def test_select_by_hashes(self):
+        """Reload filters by version and hash list."""
+        sql = _compile(select_spans_statement(uuid.uuid4(), ["h1", "h2"]))
+
+        assert "spans.document_version_id =" in sql
+        assert "spans.span_hash IN" in sql
+
+
+class TestPersistSpans:
+    """Tests for SpanGenerationService._persist_spans."""
+
+    async def test_persist_spans_batches_and_preserves_order(self):
+        """One insert and one select for a small batch; results follow input order."""
+        version_id = uuid.uuid4()
+        span_data = [
+            SpanData(text_content=f"Paragraph number {i}", locator={"type": "text", "i": i})
+            for i in range(3)
+        ]
+        # Duplicate of the first span must not be inserted twice
+        span_data.append(span_data[0])
+
+        stored = [
+            Span(
+                document_version_id=version_id,
+                span_hash=sd.span_hash,
+                start_locator=sd.locator,
+                text_content=sd.text_content,
+                span_type=SpanType.TEXT,
+            )
+            for sd in reversed(span_data[:3])
+        ]
+
+        insert_result = MagicMock(rowcount=2)
+        select_result = MagicMock()
+        select_result.scalars.return_value = stored
+
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[insert_result, select_result])
+
+        service = SpanGenerationService(db)
+        spans = await service._persist_spans(version_id, span_data)
+
+        assert db.execute.await_count == 2
+        insert_sql = _compile(db.execute.await_args_list[0].args[0])
+        assert "ON CONFLICT ON CONSTRAINT uq_spans_version_hash DO NOTHING" in insert_sql
+        assert [s.span_hash for s in spans] == [sd.span_hash for sd in span_data[:3]]
+
+    async def test_persist_spans_empty(self):
+        """No statements are issued for an empty input."""
+        db = AsyncMock()
+        service = SpanGenerationService(db)
+
+        assert await service._persist_spans(uuid.uuid4(), []) == []
+        db.execute.assert_not_called()
+
+
+class TestPersistSpanStream:
+    """Tests for SpanGenerationService.persist_span_stream."""
+
+    async def test_inserts_in_bounded_batches(self):
+        """The iterator is drained batch by batch, one INSERT per batch."""
+        version_id = uuid.uuid4()
+        pulled = []
+
+        def spans():
+            for i in range(5):
+                pulled.append(i)
+                yield SpanData(text_content=f"Row block {i}", locator={"type": "excel", "i": i})
+
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=2))
+
+        service = SpanGenerationService(db)
+        inserted = await service.persist_span_stream(version_id, spans(), batch_size=2)
+
+        assert inserted == 6
+        assert db.execute.await_count == 3
+        assert pulled == [0, 1, 2, 3, 4]
+        batch_sizes = [len(call.args[0].compile().params) // 8 for call in db.execute.await_args_list]
+        assert batch_sizes == [2, 2, 1]
+
+    async def test_excel_spans_streamed_from_workbook(self):
+        """Workbook rows become row-range spans without a full table load."""
+        import io
+
+        import openpyxl
+
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Ledger"
+        sheet.append(["Account", "Amount"])
+        for i in range(60):
+            sheet.append([f"acct-{i}", i])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+
+        service = SpanGenerationService(db)
+        inserted = await service.generate_excel_spans_streaming(
+            uuid.uuid4(), buffer.getvalue(), batch_size=2
+        )
+
+        # 60 rows / 25 per span = 3 spans, in 2 batches
+        assert db.execute.await_count == 2
+        assert inserted == 2
+        first_batch = db.execute.await_args_list[0].args[0].compile().params
+        assert any(
+            isinstance(value, dict) and value.get("cell_range") == "A2:B26"
+            for value in first_batch.values()
+        )
+
+    async def test_csv_spans_streamed_from_chunks(self):
+        """CSV rows become row-range spans chunk by chunk."""
+        data = b"Account;Amount\n" + b"".join(f"acct-{i};{i}\n".encode() for i in range(60))
+
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+
+        service = SpanGenerationService(db)
+        inserted = await service.generate_csv_spans_streaming(uuid.uuid4(), data, batch_size=2)
+
+        # 60 rows / 25 per span = 3 spans, in 2 batches
+        assert db.execute.await_count == 2
+        assert inserted == 2
+        first_batch = db.execute.await_args_list[0].args[0].compile().params
+        assert any(
+            isinstance(value, str) and value.startswith("Account | Amount\n")
+            for value in first_batch.values()
+        )
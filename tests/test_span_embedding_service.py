@@ -5,6 +5,7 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+from evidence_repository.embeddings.scheduler import WINDOW_SIZE
 from evidence_repository.embeddings.span_embedding_service import SpanEmbeddingService
 from evidence_repository.embeddings.openai_client import (
     OpenAIEmbeddingClient,
@@ -229,7 +230,7 @@ class TestBatchProcessing:
         """Test default batch size."""
         mock_db = AsyncMock()
         service = SpanEmbeddingService(db=mock_db)
-        assert service.batch_size == 50
+        assert service.batch_size == WINDOW_SIZE
 
 
 class TestTaskEmbedDocument:
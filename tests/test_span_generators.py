@@ -3,7 +3,7 @@
 import pytest
 
 from evidence_repository.spans.base import BaseSpanGenerator, SpanData
-from evidence_repository.spans.text_span_generator import TextSpanGenerator
+from evidence_repository.spans.text_span_generator import PageSpanStream, TextSpanGenerator
 from evidence_repository.spans.csv_span_generator import CsvSpanGenerator
 from evidence_repository.spans.excel_span_generator import ExcelSpanGenerator
 from evidence_repository.spans.image_span_generator import ImageSpanGenerator
@@ -243,6 +243,24 @@ class TestCsvSpanGenerator:
         assert locator["col_start"] == 0
         assert locator["col_end"] == 3
 
+    def test_streamed_rows_match_table_spans(self):
+        """iter_table_spans over a row iterator equals generate_spans."""
+        generator = CsvSpanGenerator(rows_per_span=4, min_rows_per_span=6)
+        headers = ["A", "B"]
+        rows = [[i, i * 2] for i in range(17)]
+
+        expected = generator.generate_spans(
+            text=None,
+            tables=[{"headers": headers, "rows": rows}],
+            images=None,
+            metadata={},
+        )
+        streamed = list(generator.iter_table_spans(headers, iter(rows)))
+
+        assert [s.locator for s in streamed] == [s.locator for s in expected]
+        assert [s.span_hash for s in streamed] == [s.span_hash for s in expected]
+        assert [s.metadata["row_count"] for s in streamed] == [6, 6, 5]
+
 
 class TestExcelSpanGenerator:
     """Tests for ExcelSpanGenerator."""
@@ -309,6 +327,25 @@ class TestExcelSpanGenerator:
         assert generator._col_index_to_letter(27) == "AB"
 
 
+    def test_streamed_rows_match_table_spans(self):
+        """iter_sheet_spans over a row iterator equals generate_spans."""
+        generator = ExcelSpanGenerator(rows_per_span=4, min_rows_per_span=6)
+        headers = ["A", "B"]
+        rows = [[i, i * 2] for i in range(17)]
+
+        expected = generator.generate_spans(
+            text=None,
+            tables=[{"sheet_name": "S", "headers": headers, "rows": rows}],
+            images=None,
+            metadata={},
+        )
+        streamed = list(generator.iter_sheet_spans("S", headers, iter(rows)))
+
+        assert [s.locator for s in streamed] == [s.locator for s in expected]
+        assert [s.span_hash for s in streamed] == [s.span_hash for s in expected]
+        assert [s.metadata["row_count"] for s in streamed] == [6, 6, 5]
+
+
 class TestImageSpanGenerator:
     """Tests for ImageSpanGenerator."""
 
@@ -426,3 +463,59 @@ class TestSpanHashIdempotency:
         spans2 = generator.generate_spans(text=None, tables=[table], images=None, metadata={})
 
         assert spans1[0].span_hash == spans2[0].span_hash
+
+
+class TestPageSpanStream:
+    """Tests for incremental span generation from pages."""
+
+    @pytest.fixture
+    def generator(self):
+        return TextSpanGenerator(min_span_size=50, max_span_size=120, overlap_size=20)
+
+    @pytest.fixture
+    def pages(self):
+        sentence = "The filing reports revenue. Margins improved! Costs fell? "
+        return [
+            f"Page {n}. " + sentence * (n % 4 + 1) + ("\n\nNew section. " if n % 3 else "")
+            for n in range(1, 12)
+        ] + ["", "Last page."]
+
+    def test_matches_full_text_generation(self, generator, pages):
+        from evidence_repository.digestion.pdf_pages import join_pages
+
+        stream = PageSpanStream(generator)
+        streamed = []
+        for page in pages:
+            streamed.extend(stream.add_page(page))
+        streamed.extend(stream.finish())
+
+        text, page_breaks = join_pages(pages)
+        expected = generator.generate_spans(
+            text=text, tables=None, images=None, metadata={"page_breaks": page_breaks}
+        )
+
+        assert stream.page_breaks == page_breaks
+        assert [s.locator for s in streamed] == [s.locator for s in expected]
+        assert [s.span_hash for s in streamed] == [s.span_hash for s in expected]
+
+    def test_spans_emitted_before_finish(self, generator, pages):
+        stream = PageSpanStream(generator)
+        early = []
+        for page in pages[:6]:
+            early.extend(stream.add_page(page))
+
+        assert early
+        assert all(s.locator["offset_end"] <= sum(map(len, pages[:6])) + 10 for s in early)
+
+    def test_page_hints_follow_page_starts(self, generator):
+        stream = PageSpanStream(generator)
+        spans = stream.add_page("A" * 200) + stream.add_page("B" * 200) + stream.finish()
+
+        assert stream.page_breaks == [0, 202]
+        assert spans[0].locator["page_hint"] == 1
+        assert spans[-1].locator["page_hint"] == 2
+
+    def test_whitespace_only_pages(self, generator):
+        stream = PageSpanStream(generator)
+        assert stream.add_page("   ") == []
+        assert stream.finish() == []
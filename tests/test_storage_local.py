@@ -174,6 +174,42 @@ class TestPutFile:
             await local_storage.put_file(path_key, "/nonexistent/file.txt", "text/plain")
 
 
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+class TestPutStream:
+    """Tests for the put_stream method."""
+
+    @pytest.mark.asyncio
+    async def test_writes_chunks(self, local_storage, sample_document_id):
+        """Should write all chunks and record the total size."""
+        path_key = f"{sample_document_id}/v1/original.txt"
+        file_uri = await local_storage.put_stream(
+            path_key, _chunks(b"first ", b"second ", b"third"), "text/plain"
+        )
+
+        assert await local_storage.get_bytes(file_uri) == b"first second third"
+        metadata = await local_storage.get_metadata(file_uri)
+        assert metadata.size == len(b"first second third")
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_leaves_no_file(self, local_storage, sample_document_id):
+        """Should not leave a partial file when the source fails."""
+
+        async def failing():
+            yield b"partial"
+            raise RuntimeError("client disconnected")
+
+        path_key = f"{sample_document_id}/v1/original.txt"
+        with pytest.raises(RuntimeError):
+            await local_storage.put_stream(path_key, failing(), "text/plain")
+
+        directory = local_storage._get_full_path(path_key).parent
+        assert list(directory.iterdir()) == []
+
+
 class TestGetBytes:
     """Tests for the get_bytes method."""
 
@@ -1,5 +1,8 @@
 """Tests for structured extraction service."""
 
+import asyncio
+import json
+
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -13,7 +16,10 @@ from evidence_repository.extraction.structured_extraction import (
     StructuredExtractionService,
     SYSTEM_PROMPT,
     USER_PROMPT_TEMPLATE,
+    build_batch_prompt,
+    parse_batch_response,
 )
+from evidence_repository.embeddings.scheduler import AdaptiveConcurrencyLimiter
 from evidence_repository.models.evidence import (
     Certainty,
     ClaimType,
@@ -227,6 +233,123 @@ class TestStructuredExtractionService:
                 _ = service.client
 
 
+
+METRIC = {
+    "metric_type": "arr",
+    "metric_name": "ARR",
+    "metric_value": "$1M",
+    "extraction_confidence": 0.9,
+    "evidence_quote": "ARR is $1M",
+}
+
+
+def make_span(text: str) -> MagicMock:
+    return MagicMock(id=uuid4(), text_content=text)
+
+
+def completion(content: dict, tokens: int = 100) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=json.dumps(content)))]
+    response.usage.total_tokens = tokens
+    return response
+
+
+class TestBatchedExtraction:
+    """Tests for packed, concurrent extraction in extract_from_version."""
+
+    def make_service(self, create, limit: int = 4, **kwargs) -> StructuredExtractionService:
+        service = StructuredExtractionService(
+            db=AsyncMock(),
+            api_key="test-key",
+            limiter=AdaptiveConcurrencyLimiter(initial=limit, maximum=limit),
+            **kwargs,
+        )
+        service._client = MagicMock()
+        service._client.chat.completions.create = AsyncMock(side_effect=create)
+        return service
+
+    def inserted_rows(self, service, table: str) -> list[dict]:
+        rows = []
+        for call in service.db.execute.await_args_list:
+            statement = call.args[0]
+            if getattr(statement, "table", None) is not None and statement.table.name == table:
+                rows.extend(statement._multi_values[0])
+        return rows
+
+    def test_parse_batch_response_attributes_sections(self):
+        data = {
+            "sections": [
+                {"section": "S2", "metrics": [METRIC], "claims": []},
+                {"section": "S9", "metrics": [METRIC]},
+                {"section": "S1", "metrics": [{"metric_name": "broken"}]},
+            ]
+        }
+
+        results = parse_batch_response(data, 2)
+
+        assert [len(r.metrics) for r in results] == [0, 1]
+        assert "=== S2 ===\nsecond" in build_batch_prompt(["first", "second"])
+
+    @pytest.mark.asyncio
+    async def test_short_spans_packed_with_attribution(self):
+        spans = [make_span(f"Span {i} mentions that ARR is $1M.") for i in range(5)]
+
+        async def create(**kwargs):
+            # Report a metric for the second section of every packed prompt
+            return completion({"sections": [{"section": "S2", "metrics": [METRIC]}]})
+
+        service = self.make_service(create, batch_tokens=1000, batch_max_spans=3)
+        service._get_extractable_spans = AsyncMock(return_value=spans)
+
+        stats = await service.extract_from_version(uuid4(), uuid4())
+
+        assert service.client.chat.completions.create.await_count == 2
+        assert stats.spans_processed == 5
+        assert stats.metrics_extracted == 2
+        assert stats.tokens_used == 200
+        rows = self.inserted_rows(service, "metrics")
+        assert [row["span_id"] for row in rows] == [spans[1].id, spans[4].id]
+        assert rows[0]["metric_type"] == MetricType.ARR
+
+    @pytest.mark.asyncio
+    async def test_requests_run_concurrently_within_limit(self):
+        spans = [make_span("A long enough span about revenue " * 3) for _ in range(6)]
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return completion({"metrics": [], "claims": []})
+
+        service = self.make_service(create, limit=2, batch_max_spans=1)
+        service._get_extractable_spans = AsyncMock(return_value=spans)
+
+        stats = await service.extract_from_version(uuid4(), uuid4())
+
+        assert stats.spans_processed == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_request_counts_its_spans(self):
+        spans = [make_span("tiny"), *(make_span("Another span about ARR growth.") for _ in range(3))]
+
+        async def create(**kwargs):
+            raise RuntimeError("boom")
+
+        service = self.make_service(create, batch_tokens=1000, batch_max_spans=2)
+        service._get_extractable_spans = AsyncMock(return_value=spans)
+
+        stats = await service.extract_from_version(uuid4(), uuid4())
+
+        assert stats.errors == 3
+        assert stats.spans_processed == 1
+        assert self.inserted_rows(service, "metrics") == []
+
+
 class TestTaskFunctions:
     """Tests for worker task functions."""
 
@@ -0,0 +1,160 @@
+"""Tests for streaming uploads (spooled hashing and storage streaming)."""
+
+import hashlib
+import tempfile
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from evidence_repository.ingestion.service import (
+    IngestionService,
+    UploadTooLargeError,
+    spool_upload,
+)
+from evidence_repository.storage.s3 import S3Storage
+
+
+def _upload(data: bytes, size: int | None = None) -> UploadFile:
+    spool = tempfile.SpooledTemporaryFile(max_size=1024)
+    spool.write(data)
+    spool.seek(0)
+    return UploadFile(file=spool, filename="report.pdf", size=size)
+
+
+async def _collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+class TestSpoolUpload:
+    """Tests for spool_upload."""
+
+    async def test_hash_and_size_computed_incrementally(self):
+        """Hash matches the full content even when read in small chunks."""
+        data = b"evidence " * 1000
+        upload = await spool_upload(_upload(data), max_size=1_000_000, chunk_size=100)
+
+        assert upload.size == len(data)
+        assert upload.file_hash == hashlib.sha256(data).hexdigest()
+        assert await _collect(upload.iter_chunks(chunk_size=333)) == data
+
+    async def test_rejects_declared_size_up_front(self):
+        """A declared size over the limit is rejected before reading."""
+        upload = _upload(b"x" * 10, size=5000)
+        upload.read = AsyncMock()
+
+        with pytest.raises(UploadTooLargeError) as exc_info:
+            await spool_upload(upload, max_size=1000)
+
+        assert exc_info.value.size == 5000
+        upload.read.assert_not_called()
+
+    async def test_rejects_once_limit_exceeded(self):
+        """Reading stops at the first chunk past the limit."""
+        upload = _upload(b"x" * 5000)
+
+        with pytest.raises(UploadTooLargeError) as exc_info:
+            await spool_upload(upload, max_size=1000, chunk_size=600)
+
+        assert exc_info.value.size == 1200
+
+    async def test_empty_upload(self):
+        """Empty files report size zero."""
+        upload = await spool_upload(_upload(b""), max_size=1000)
+        assert upload.size == 0
+
+
+class TestIngestionStreaming:
+    """Tests for IngestionService with spooled uploads."""
+
+    async def test_create_version_streams_to_storage(self):
+        """Spooled content goes through put_stream, not an in-memory upload."""
+        data = b"%PDF-1.4 content"
+        spooled = await spool_upload(_upload(data), max_size=1000)
+
+        streamed = []
+
+        async def put_stream(path_key, chunks, content_type, metadata=None):
+            streamed.append(await _collect(chunks))
+            return f"file:///{path_key}"
+
+        storage = MagicMock()
+        storage.put_stream = AsyncMock(side_effect=put_stream)
+        storage.upload = AsyncMock()
+
+        result = MagicMock()
+        result.scalar.return_value = None
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=result)
+        db.add = MagicMock()
+
+        document = MagicMock(id=uuid.uuid4(), filename="report.pdf")
+        version = await IngestionService(storage=storage, db=db).create_version(
+            document=document,
+            data=spooled,
+            content_type="application/pdf",
+        )
+
+        assert streamed == [data]
+        storage.upload.assert_not_called()
+        assert version.file_size == len(data)
+        assert version.file_hash == hashlib.sha256(data).hexdigest()
+
+
+class TestS3PutStream:
+    """Tests for S3Storage.put_stream multipart uploads."""
+
+    def _storage(self) -> S3Storage:
+        storage = S3Storage.__new__(S3Storage)
+        storage.bucket_name = "bucket"
+        storage.prefix = ""
+        storage.MULTIPART_PART_SIZE = 10
+        storage._client = MagicMock()
+        storage._client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        storage._client.upload_part.side_effect = lambda **kw: {"ETag": f"etag-{kw['PartNumber']}"}
+        return storage
+
+    async def _chunks(self, *parts):
+        for part in parts:
+            yield part
+
+    async def test_multipart_for_large_content(self):
+        """Content over one part is sent as numbered parts and completed."""
+        storage = self._storage()
+
+        uri = await storage.put_stream(
+            "doc/v1/file.pdf", self._chunks(b"a" * 6, b"b" * 6, b"c" * 3), "application/pdf"
+        )
+
+        assert uri == "s3://bucket/doc/v1/file.pdf"
+        bodies = [c.kwargs["Body"] for c in storage._client.upload_part.call_args_list]
+        assert bodies == [b"a" * 6 + b"b" * 6, b"c" * 3]
+        complete = storage._client.complete_multipart_upload.call_args.kwargs
+        assert complete["MultipartUpload"]["Parts"] == [
+            {"ETag": "etag-1", "PartNumber": 1},
+            {"ETag": "etag-2", "PartNumber": 2},
+        ]
+
+    async def test_small_content_uses_put_object(self):
+        """Content under one part skips the multipart protocol."""
+        storage = self._storage()
+
+        await storage.put_stream("doc/v1/file.pdf", self._chunks(b"tiny"), "application/pdf")
+
+        storage._client.create_multipart_upload.assert_not_called()
+        assert storage._client.put_object.call_args.kwargs["Body"] == b"tiny"
+
+    async def test_failure_aborts_multipart(self):
+        """A failing source aborts the multipart upload."""
+        storage = self._storage()
+
+        async def failing():
+            yield b"x" * 20
+            raise RuntimeError("client disconnected")
+
+        with pytest.raises(RuntimeError):
+            await storage.put_stream("doc/v1/file.pdf", failing(), "application/pdf")
+
+        storage._client.abort_multipart_upload.assert_called_once()
+        storage._client.complete_multipart_upload.assert_not_called()
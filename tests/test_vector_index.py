@@ -0,0 +1,195 @@
+"""Tests for vector index lifecycle management."""
+
+import json
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from evidence_repository.services.vector_index_service import (
+    GLOBAL_INDEX_NAME,
+    PROJECT_INDEX_PREFIX,
+    VectorIndexError,
+    VectorIndexService,
+    build_index_sql,
+    ef_search_sql,
+    is_managed_index,
+    iterative_scan_sql,
+    parse_index_comment,
+    project_id_from_index_name,
+    project_index_name,
+    project_predicate_sql,
+    validate_build_params,
+    version_set_fingerprint,
+)
+
+
+class TestIndexNaming:
+    """Tests for managed index names."""
+
+    def test_project_index_name_fits_postgres_limit(self):
+        """Project index names must fit in 63 characters."""
+        name = project_index_name(uuid.uuid4())
+        assert name.startswith(PROJECT_INDEX_PREFIX)
+        assert len(name) <= 63
+
+    def test_project_id_round_trip(self):
+        """Project ID can be recovered from the index name."""
+        project_id = uuid.uuid4()
+        assert project_id_from_index_name(project_index_name(project_id)) == project_id
+
+    def test_project_id_from_unrelated_name(self):
+        """Unrelated index names yield no project."""
+        assert project_id_from_index_name("ix_embedding_chunks_document_version") is None
+        assert project_id_from_index_name(f"{PROJECT_INDEX_PREFIX}not-a-uuid") is None
+
+    def test_is_managed_index(self):
+        """Only the global and project HNSW indexes are managed."""
+        assert is_managed_index(GLOBAL_INDEX_NAME)
+        assert is_managed_index(project_index_name(uuid.uuid4()))
+        assert not is_managed_index("ix_embedding_chunks_embedding")
+        assert not is_managed_index("pg_class")
+
+
+class TestProjectPredicate:
+    """Tests for partial index predicates."""
+
+    def test_fingerprint_is_order_independent(self):
+        """Fingerprint ignores ordering and duplicates."""
+        a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        assert version_set_fingerprint([a, b, c]) == version_set_fingerprint([c, a, b, a])
+
+    def test_fingerprint_changes_with_membership(self):
+        """Adding a version changes the fingerprint."""
+        a, b = uuid.uuid4(), uuid.uuid4()
+        assert version_set_fingerprint([a]) != version_set_fingerprint([a, b])
+
+    def test_predicate_is_deterministic(self):
+        """Index and query predicates render identically regardless of order."""
+        a, b = uuid.uuid4(), uuid.uuid4()
+        assert project_predicate_sql([a, b]) == project_predicate_sql([b, a])
+
+    def test_predicate_contains_uuid_literals(self):
+        """Predicate inlines normalized UUID literals."""
+        version_id = uuid.uuid4()
+        sql = project_predicate_sql([version_id])
+        assert sql == f"document_version_id IN ('{version_id}'::uuid)"
+
+    def test_predicate_requires_versions(self):
+        """An empty version set cannot form a predicate."""
+        with pytest.raises(VectorIndexError):
+            project_predicate_sql([])
+
+
+class TestBuildParameters:
+    """Tests for HNSW build parameter validation and DDL rendering."""
+
+    def test_valid_params(self):
+        """Defaults used by pgvector are accepted."""
+        validate_build_params(16, 64)
+
+    @pytest.mark.parametrize("m,ef_construction", [(1, 64), (101, 400), (16, 2000), (32, 40)])
+    def test_invalid_params(self, m, ef_construction):
+        """Out-of-range values and ef_construction < 2*m are rejected."""
+        with pytest.raises(VectorIndexError):
+            validate_build_params(m, ef_construction)
+
+    def test_build_index_sql_global(self):
+        """Global index DDL uses HNSW with cosine ops and no predicate."""
+        sql = build_index_sql(GLOBAL_INDEX_NAME, 16, 64)
+        assert "CREATE INDEX CONCURRENTLY" in sql
+        assert "USING hnsw (embedding vector_cosine_ops)" in sql
+        assert "WITH (m = 16, ef_construction = 64)" in sql
+        assert "WHERE" not in sql
+
+    def test_build_index_sql_partial(self):
+        """Partial index DDL appends the predicate."""
+        predicate = project_predicate_sql([uuid.uuid4()])
+        sql = build_index_sql("ix_test", 16, 64, predicate)
+        assert sql.endswith(f"WHERE {predicate}")
+
+    def test_ef_search_sql(self):
+        """ef_search is rendered as a transaction-local setting."""
+        assert ef_search_sql(100) == "SET LOCAL hnsw.ef_search = 100"
+
+    @pytest.mark.parametrize("value", [0, 1001])
+    def test_ef_search_out_of_range(self, value):
+        """ef_search outside pgvector limits is rejected."""
+        with pytest.raises(VectorIndexError):
+            ef_search_sql(value)
+
+    def test_iterative_scan_sql(self):
+        """Iterative scan modes are rendered as transaction-local settings."""
+        assert iterative_scan_sql("relaxed_order") == "SET LOCAL hnsw.iterative_scan = relaxed_order"
+        with pytest.raises(VectorIndexError):
+            iterative_scan_sql("off; DROP TABLE x")
+
+
+class TestIndexComment:
+    """Tests for the build record stored in index comments."""
+
+    def test_parse_valid_comment(self):
+        """JSON comments are parsed into dicts."""
+        record = {"fingerprint": "abc", "m": 16}
+        assert parse_index_comment(json.dumps(record)) == record
+
+    @pytest.mark.parametrize("comment", [None, "", "not json", "[1, 2]"])
+    def test_parse_invalid_comment(self, comment):
+        """Missing or malformed comments yield an empty record."""
+        assert parse_index_comment(comment) == {}
+
+
+class TestResolveProjectScope:
+    """Tests for project scope resolution."""
+
+    def _service(self, version_ids, comment):
+        db = MagicMock()
+        comment_result = MagicMock()
+        comment_result.scalar.return_value = comment
+        version_result = MagicMock()
+        version_result.fetchall.return_value = [(v,) for v in version_ids]
+        db.execute = AsyncMock(side_effect=[comment_result, version_result])
+        return VectorIndexService(db, engine=MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_uses_current_partial_index(self):
+        """A matching fingerprint enables the partial index predicate."""
+        versions = [uuid.uuid4(), uuid.uuid4()]
+        comment = json.dumps({"fingerprint": version_set_fingerprint(versions)})
+        service = self._service(versions, comment)
+
+        scope = await service.resolve_project_scope(uuid.uuid4())
+
+        assert scope.index_predicate == project_predicate_sql(versions)
+
+    @pytest.mark.asyncio
+    async def test_stale_partial_index_is_ignored(self):
+        """A fingerprint mismatch falls back to the membership filter."""
+        versions = [uuid.uuid4(), uuid.uuid4()]
+        comment = json.dumps({"fingerprint": version_set_fingerprint(versions[:1])})
+        service = self._service(versions, comment)
+
+        scope = await service.resolve_project_scope(uuid.uuid4())
+
+        assert scope.index_predicate is None
+
+    @pytest.mark.asyncio
+    async def test_no_partial_index_skips_version_lookup(self):
+        """Without a partial index the project's versions are never fetched."""
+        service = self._service([uuid.uuid4()], None)
+
+        scope = await service.resolve_project_scope(uuid.uuid4())
+
+        assert scope.index_predicate is None
+        assert service.db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_emptied_project_ignores_partial_index(self):
+        """An index left over from detached documents is not used."""
+        comment = json.dumps({"fingerprint": version_set_fingerprint([uuid.uuid4()])})
+        service = self._service([], comment)
+
+        scope = await service.resolve_project_scope(uuid.uuid4())
+
+        assert scope.index_predicate is None
+        assert service.db.execute.await_count == 2
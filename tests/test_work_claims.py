@@ -0,0 +1,250 @@
+"""Tests for SKIP LOCKED work claiming of document versions."""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from evidence_repository.digestion.claims import (
+    LeaseHeartbeat,
+    claim_statement,
+    claim_versions,
+    fail_exhausted_claims,
+    finish_claim,
+    make_worker_id,
+    release_claim,
+    renew_lease,
+    unclaim_versions,
+)
+from evidence_repository.digestion.pipeline import DigestResult
+from evidence_repository.digestion.polling_worker import PollingWorker
+from evidence_repository.models.document import DocumentVersion, ExtractionStatus
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _db(rowcount: int = 1) -> AsyncMock:
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=MagicMock(rowcount=rowcount))
+    return db
+
+
+class TestClaimStatement:
+    """Tests for the claim SQL."""
+
+    def test_claim_is_single_update_with_skip_locked(self):
+        """Candidates are locked with SKIP LOCKED inside the UPDATE."""
+        sql = _compile(claim_statement("worker-1", 5, 300, 3))
+
+        assert sql.startswith("UPDATE document_versions SET extraction_status=")
+        assert "WHERE document_versions.id IN (SELECT document_versions.id" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "ORDER BY document_versions.created_at" in sql
+        assert "RETURNING" in sql
+
+    def test_claim_sets_lease_and_attempts(self):
+        """Claims record the worker, a lease and bump the attempt counter."""
+        sql = _compile(claim_statement("worker-1", 5, 300, 3))
+
+        assert "claimed_by=" in sql
+        assert "lease_expires_at=(now() +" in sql
+        assert "claim_attempts=(document_versions.claim_attempts +" in sql
+
+    def test_claim_reclaims_only_expired_leases(self):
+        """PROCESSING versions are claimable only once their lease expired."""
+        sql = _compile(claim_statement("worker-1", 5, 300, 3))
+
+        assert "document_versions.lease_expires_at < now()" in sql
+        assert "document_versions.claim_attempts <" in sql
+
+
+class TestClaimHelpers:
+    """Tests for claim helpers."""
+
+    def test_make_worker_id_unique(self):
+        """Worker ids include the prefix and differ per call."""
+        first = make_worker_id("cron")
+        assert first.startswith("cron:")
+        assert first != make_worker_id("cron")
+
+    async def test_claim_versions_commits(self):
+        """Claims are committed and returned oldest first."""
+        older = DocumentVersion(id=uuid.uuid4(), claim_attempts=1)
+        older.created_at = 1
+        newer = DocumentVersion(id=uuid.uuid4(), claim_attempts=1)
+        newer.created_at = 2
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [newer, older]
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=result)
+
+        versions = await claim_versions(db, "worker-1", limit=2)
+
+        assert versions == [older, newer]
+        db.commit.assert_awaited_once()
+
+    async def test_renew_lease(self):
+        """Renewal reports whether this worker still holds the claim."""
+        assert await renew_lease(_db(1), uuid.uuid4(), "worker-1") is True
+        assert await renew_lease(_db(0), uuid.uuid4(), "worker-1") is False
+
+    async def test_renew_lease_scoped_to_worker(self):
+        """Renewal only touches rows claimed by the same worker."""
+        db = _db(1)
+        await renew_lease(db, uuid.uuid4(), "worker-1")
+
+        sql = _compile(db.execute.await_args.args[0])
+        assert "document_versions.claimed_by =" in sql
+
+    async def test_fail_exhausted_claims(self):
+        """Expired claims past the attempt limit are failed."""
+        db = _db(2)
+
+        assert await fail_exhausted_claims(db, max_attempts=3) == 2
+        sql = _compile(db.execute.await_args.args[0])
+        assert "document_versions.claim_attempts >=" in sql
+        db.commit.assert_awaited_once()
+
+    async def test_unclaim_empty(self):
+        """Nothing is issued when there is nothing to hand back."""
+        db = _db()
+        assert await unclaim_versions(db, [], "worker-1") == 0
+        db.execute.assert_not_called()
+
+    async def test_finish_claim_scoped_to_worker(self):
+        """Final status is written only while this worker holds the claim."""
+        db = _db(1)
+        assert await finish_claim(
+            db, uuid.uuid4(), "worker-1", ExtractionStatus.COMPLETED
+        ) is True
+
+        sql = _compile(db.execute.await_args.args[0])
+        assert "document_versions.claimed_by =" in sql
+        assert "claim_attempts=" in sql
+        db.commit.assert_not_called()
+
+        assert await finish_claim(
+            _db(0), uuid.uuid4(), "worker-1", ExtractionStatus.FAILED, "boom"
+        ) is False
+
+    def test_release_claim(self):
+        """Releasing clears the lease; completion resets attempts."""
+        version = DocumentVersion(
+            claimed_by="worker-1",
+            claim_attempts=2,
+            extraction_status=ExtractionStatus.PROCESSING,
+        )
+
+        release_claim(version)
+        assert version.claimed_by is None
+        assert version.lease_expires_at is None
+        assert version.claim_attempts == 2
+
+        release_claim(version, completed=True)
+        assert version.claim_attempts == 0
+
+
+def _session_factory(db: AsyncMock) -> MagicMock:
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=db)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory
+
+
+class TestLeaseHeartbeat:
+    """Tests for background lease renewal."""
+
+    async def test_heartbeat_renews(self):
+        """Leases are renewed on the interval until the block exits."""
+        async with LeaseHeartbeat(
+            _session_factory(_db(1)), uuid.uuid4(), "worker-1", interval=0.01
+        ) as heartbeat:
+            await asyncio.sleep(0.05)
+
+        assert heartbeat.renewals >= 2
+        assert heartbeat.lost is False
+
+    async def test_heartbeat_detects_lost_claim(self):
+        """A failed renewal marks the claim as lost and stops renewing."""
+        db = _db(0)
+        async with LeaseHeartbeat(
+            _session_factory(db), uuid.uuid4(), "worker-1", interval=0.01
+        ) as heartbeat:
+            await asyncio.sleep(0.05)
+
+        assert heartbeat.lost is True
+        assert db.execute.await_count == 1
+
+
+class TestPollingWorkerClaims:
+    """Tests for how the polling worker finishes claimed versions."""
+
+    def _worker(self, lost: bool) -> PollingWorker:
+        worker = PollingWorker()
+        worker._session_maker = MagicMock()
+        worker._run_pipeline = AsyncMock(
+            side_effect=lambda session, version: DigestResult(
+                document_id=uuid.uuid4(), version_id=version.id
+            )
+        )
+        heartbeat = MagicMock(lost=lost)
+        heartbeat.__aenter__ = AsyncMock(return_value=heartbeat)
+        heartbeat.__aexit__ = AsyncMock(return_value=False)
+        self._heartbeat = patch(
+            "evidence_repository.digestion.polling_worker.LeaseHeartbeat",
+            return_value=heartbeat,
+        )
+        return worker
+
+    async def test_lost_claim_leaves_nothing_to_commit(self):
+        """A lost claim rolls back the run's pending work and is not counted."""
+        worker = self._worker(lost=True)
+        session = _db()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=False)
+        worker._get_session = AsyncMock(return_value=session)
+        versions = [DocumentVersion(id=uuid.uuid4())]
+
+        with self._heartbeat, patch(
+            "evidence_repository.digestion.polling_worker.fail_exhausted_claims",
+            AsyncMock(return_value=0),
+        ), patch(
+            "evidence_repository.digestion.polling_worker.claim_versions",
+            AsyncMock(return_value=versions),
+        ):
+            processed = await worker._poll_and_process()
+
+        assert processed == 0
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_called()
+        session.execute.assert_not_called()
+        assert worker._stats["claims_lost"] == 1
+        assert worker._stats["documents_processed"] == 0
+
+    async def test_reclaimed_before_completion_rolls_back(self):
+        """Losing the claim between heartbeats is caught by the final update."""
+        worker = self._worker(lost=False)
+        session = _db(rowcount=0)
+        version = DocumentVersion(id=uuid.uuid4())
+
+        with self._heartbeat:
+            assert await worker._process_version(session, version) is None
+
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_called()
+
+    async def test_completion_commits_with_claim(self):
+        """Completed versions are committed with the conditional status update."""
+        worker = self._worker(lost=False)
+        session = _db(rowcount=1)
+        version = DocumentVersion(id=uuid.uuid4())
+
+        with self._heartbeat:
+            result = await worker._process_version(session, version)
+
+        assert result.status == "ready"
+        session.commit.assert_awaited_once()
+        session.rollback.assert_not_called()